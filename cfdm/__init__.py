@@ -57,15 +57,26 @@ from .functions import (
     abspath,
     atol,
     axis_dropping_index,
+    chunk_cache,
+    chunk_cache_statistics,
     chunksize,
     configuration,
     dirname,
     display_data,
     environment,
+    file_handle_pool,
+    file_handle_pool_statistics,
     integer_dtype,
     log_level,
+    metadata_cache,
+    metadata_cache_statistics,
     parse_indices,
     persist_data,
+    remote_cache,
+    remote_cache_statistics,
+    remote_disk_cache,
+    remote_disk_cache_directory,
+    remote_disk_cache_statistics,
     rtol,
     unique_constructs,
     _disable_logging,
@@ -165,7 +176,7 @@ from .fieldancillary import FieldAncillary
 from .abstract import Implementation
 from .cfdmimplementation import CFDMImplementation, implementation
 
-from .read_write import read, write
+from .read_write import iread, read, write
 from .read_write.netcdf.flatten import dataset_flatten
 
 from .examplefield import example_field, example_fields, example_domain
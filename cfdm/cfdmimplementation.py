@@ -1594,6 +1594,22 @@ class CFDMImplementation(Implementation):
         # metadata constucts.
         return self._get_domain_compression_variable("index", construct)
 
+    def get_feature_offsets(self, array):
+        """Return the offsets index of a ragged array.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            array: `RaggedArray`
+
+        :Returns:
+
+            `dict`
+
+        """
+        return array.feature_offsets()
+
     def get_inherited_properties(self, parent):
         """Return all inherited properties.
 
@@ -2721,6 +2737,7 @@ class CFDMImplementation(Implementation):
         shape=None,
         size=None,
         count_variable=None,
+        feature_offsets=None,
     ):
         """Return a ragged contigous array instance.
 
@@ -2738,6 +2755,10 @@ class CFDMImplementation(Implementation):
 
             count_variable: optional
 
+            feature_offsets: `dict`, optional
+
+                .. versionadded:: (cfdm) NEXTVERSION
+
         :Returns:
 
             `RaggedContigousArray`
@@ -2748,6 +2769,7 @@ class CFDMImplementation(Implementation):
             compressed_array=compressed_array,
             shape=shape,
             count_variable=count_variable,
+            feature_offsets=feature_offsets,
         )
 
     def initialise_RaggedIndexedArray(
@@ -2757,6 +2779,7 @@ class CFDMImplementation(Implementation):
         shape=None,
         size=None,
         index_variable=None,
+        feature_offsets=None,
     ):
         """Return a ragged indexed array instance.
 
@@ -2774,6 +2797,10 @@ class CFDMImplementation(Implementation):
 
             index_variable: optional
 
+            feature_offsets: `dict`, optional
+
+                .. versionadded:: (cfdm) NEXTVERSION
+
         :Returns:
 
             `RaggedIndexedArray`
@@ -2786,6 +2813,7 @@ class CFDMImplementation(Implementation):
             shape=shape,
             #            size=size,
             index_variable=index_variable,
+            feature_offsets=feature_offsets,
         )
 
     def initialise_RaggedIndexedContiguousArray(
@@ -2796,6 +2824,7 @@ class CFDMImplementation(Implementation):
         size=None,
         count_variable=None,
         index_variable=None,
+        feature_offsets=None,
     ):
         """Return a ragged indexed contiguous array instance.
 
@@ -2815,6 +2844,10 @@ class CFDMImplementation(Implementation):
 
             index_variable: optional
 
+            feature_offsets: `dict`, optional
+
+                .. versionadded:: (cfdm) NEXTVERSION
+
         :Returns:
 
              `RaggedIndexedContiguousArray`
@@ -2826,6 +2859,7 @@ class CFDMImplementation(Implementation):
             shape=shape,
             count_variable=count_variable,
             index_variable=index_variable,
+            feature_offsets=feature_offsets,
         )
 
     def is_climatology(self, coordinate):
@@ -3496,11 +3530,13 @@ class CFDMImplementation(Implementation):
         # definitions. Currently cfdm doesn't need to do this, but it
         # doesn't do any harm, and downstream applications (like
         # cf-python) may not be able to correctly instantiate the data
-        # when all of its elements have not been set.
+        # when all of its elements have not been set. The original
+        # dask chunks are retained.
         data = construct._Data(
             source,
             units=data.get_units(None),
             calendar=data.get_calendar(None),
+            chunks=data.chunks,
         )
         construct.set_data(data)
 
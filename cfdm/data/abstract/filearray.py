@@ -2,8 +2,12 @@ from copy import deepcopy
 from os import sep
 from os.path import join
 
+import numpy as np
+
 from cfdm.functions import abspath, dirname
 
+from ..filehandlepool import handle_pool
+from ..remotefile import RemoteFile, cached_mapper, remote_cache_enabled
 from . import Array
 
 
@@ -26,6 +30,7 @@ class FileArray(Array):
         storage_protocol=None,
         storage_options=None,
         variable=None,
+        unpack_dtype=None,
         source=None,
         copy=True,
     ):
@@ -73,6 +78,15 @@ class FileArray(Array):
 
                 .. versionadded:: (cfdm) 1.13.1.0
 
+            unpack_dtype: data-type or `None`, optional
+                The data type of unpacked data. If `None`, the
+                default, then the data type is that given by applying
+                the ``scale_factor`` and ``add_offset`` attributes to
+                the packed data. Ignored if the data are not unpacked.
+                See `{{package}}.netcdf_indexer` for details.
+
+                .. versionadded:: (cfdm) NEXTVERSION
+
             {{init source: optional}}
 
             {{init copy: `bool`, optional}}
@@ -135,6 +149,11 @@ class FileArray(Array):
             except AttributeError:
                 variable = None
 
+            try:
+                unpack_dtype = source._get_component("unpack_dtype", None)
+            except AttributeError:
+                unpack_dtype = None
+
         if shape is not None:
             self._set_component("shape", shape, copy=False)
 
@@ -148,6 +167,11 @@ class FileArray(Array):
         self._set_component("mask", bool(mask), copy=False)
         self._set_component("unpack", bool(unpack), copy=False)
 
+        if unpack_dtype is not None:
+            unpack_dtype = np.dtype(unpack_dtype)
+
+        self._set_component("unpack_dtype", unpack_dtype, copy=False)
+
         if storage_protocol is not None:
             self._set_component(
                 "storage_protocol", storage_protocol, copy=False
@@ -206,11 +230,31 @@ class FileArray(Array):
             self.get_address(),
             self.get_mask(),
             self.get_unpack(),
+            self.get_unpack_dtype(),
             self.get_attributes(copy=False),
             self.get_storage_protocol(),
             self.get_storage_options(),
         )
 
+    def __getstate__(self):
+        """Return the state of the object for pickling.
+
+        Any cached open dataset variable is omitted, since it can not
+        be pickled. It is re-retrieved from the dataset when the data
+        are next accessed.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        state = self.__dict__.copy()
+        components = state.get("_components")
+        if components is not None and "variable" in components:
+            components = components.copy()
+            del components["variable"]
+            state["_components"] = components
+
+        return state
+
     def _get_array(self, index=None):
         """Returns a subspace of the dataset variable.
 
@@ -271,6 +315,29 @@ class FileArray(Array):
             f"Must implement {self.__class__.__name__}.close"
         )  # pragma: no cover
 
+    def _close(self, dataset):
+        """Close the dataset, or return it to the file handle pool.
+
+        If the dataset was borrowed from the file handle pool then it
+        is returned to the pool rather than being closed.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `close`, `open`
+
+        :Parameters:
+
+            dataset:
+                The dataset to be closed.
+
+        :Returns:
+
+            `None`
+
+        """
+        if not handle_pool.release(dataset):
+            dataset.close()
+
     def get_address(self, default=AttributeError()):
         """The name of the file containing the array.
 
@@ -472,6 +539,12 @@ class FileArray(Array):
     def open(self, func, *args, **kwargs):
         """Return a dataset file object and address.
 
+        If the file handle pool is enabled (see
+        `{{package}}.file_handle_pool`) then an idle open dataset is
+        borrowed from the pool, if one is available, and a newly
+        opened dataset is registered with the pool so that `close`
+        may return it.
+
         .. versionadded:: (cfdm) 1.10.1.0
 
         :Parameters:
@@ -490,6 +563,23 @@ class FileArray(Array):
 
         """
         filename = self.get_filename(normalise=True)
+
+        # Try to borrow an open dataset from the file handle pool
+        key = None
+        local = False
+        if isinstance(filename, str) and handle_pool.maxsize:
+            local = not self.has_remote_storage_protocol()
+            key = handle_pool.key(
+                func,
+                filename,
+                storage_options=self.get_storage_options(),
+                args=args,
+                **kwargs,
+            )
+            dataset = handle_pool.acquire(key, local=local)
+            if dataset is not None:
+                return dataset, self.get_address()
+
         if isinstance(filename, str):
             if self.has_remote_storage_protocol():
                 from urllib.parse import urlparse
@@ -505,7 +595,11 @@ class FileArray(Array):
                     **self.get_storage_options(),
                 )
                 try:
-                    filename = fs.open(filename, "rb")
+                    if remote_cache_enabled():
+                        # Read the remote dataset via the block caches
+                        filename = RemoteFile(fs, filename)
+                    else:
+                        filename = fs.open(filename, "rb")
                 except Exception:
                     # Something went wrong with the filesystem open
                     raise
@@ -516,6 +610,11 @@ class FileArray(Array):
                 except ValueError:
                     filename = abspath(filename)
 
+        elif remote_cache_enabled():
+            # Read the remote byte ranges of a Kerchunk dataset via
+            # the block caches
+            filename = cached_mapper(filename)
+
         try:
             dataset = func(filename, *args, **kwargs)
         except FileNotFoundError:
@@ -523,6 +622,11 @@ class FileArray(Array):
         except RuntimeError as error:
             raise RuntimeError(f"{error}: {filename}")
 
+        if key is not None:
+            # Register the new dataset with the file handle pool, so
+            # that it may be returned to the pool by `close`
+            handle_pool.register(key, dataset, local=local)
+
         # Successfully opened a dataset, so return.
         return dataset, self.get_address()
 
@@ -690,6 +794,28 @@ class FileArray(Array):
         """
         return self._get_component("unpack")
 
+    def get_unpack_dtype(self):
+        """The data type of unpacked data.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Returns:
+
+            `numpy.dtype` or `None`
+                The data type of unpacked data, or `None` if it is
+                that given by the packing attributes.
+
+        **Examples**
+
+        >>> a.get_unpack_dtype()
+        dtype('float32')
+
+        >>> print(a.get_unpack_dtype())
+        None
+
+        """
+        return self._get_component("unpack_dtype", None)
+
     def has_remote_storage_protocol(self):
         """Whether or not there is a remote file system protocol.
 
@@ -1,6 +1,10 @@
-from itertools import accumulate
+from functools import partial
+from itertools import accumulate, product
 from numbers import Number
 
+import numpy as np
+
+from ..netcdfindexer import netcdf_indexer
 from ..subarray import RaggedSubarray
 from .compressedarray import CompressedArray
 
@@ -37,6 +41,7 @@ class RaggedArray(CompressedArray):
         compressed_dimensions=None,
         count_variable=None,
         index_variable=None,
+        feature_offsets=None,
         source=None,
         copy=True,
     ):
@@ -72,6 +77,14 @@ class RaggedArray(CompressedArray):
                 corresponding to a CF-netCDF count variable, if
                 required by the decompression method.
 
+            feature_offsets: `dict`, optional
+                The offsets index that locates each feature in the
+                compressed array, as returned by `feature_offsets`. If
+                not set then it is created from the count and index
+                variables when it is first needed.
+
+                .. versionadded:: (cfdm) NEXTVERSION
+
             {{init source: optional}}
 
             {{init copy: `bool`, optional}}
@@ -107,12 +120,233 @@ class RaggedArray(CompressedArray):
             except AttributeError:
                 count_variable = None
 
+            try:
+                feature_offsets = source._get_component(
+                    "feature_offsets", None
+                )
+            except AttributeError:
+                feature_offsets = None
+
         if index_variable is not None:
             self._set_component("index_variable", index_variable, copy=copy)
 
         if count_variable is not None:
             self._set_component("count_variable", count_variable, copy=copy)
 
+        if feature_offsets is not None:
+            # The offsets index is never modified in-place, so it can
+            # be shared between copies
+            self._set_component("feature_offsets", feature_offsets, copy=False)
+
+    def __getitem__(self, indices):
+        """Return a subspace of the uncompressed data.
+
+        x.__getitem__(indices) <==> x[indices]
+
+        Returns a subspace of the uncompressed array as an independent
+        numpy array.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        # ------------------------------------------------------------
+        # Method: Uncompress only the smallest range of features that
+        #         contains the requested features, and then subspace
+        #         it
+        # ------------------------------------------------------------
+        if not isinstance(indices, tuple):
+            indices = (indices,)
+
+        Subarray = self.get_Subarray()
+
+        d1, u_dims = self.compressed_dimensions().popitem()
+        instance_dimension = u_dims[0]
+        start, stop, indices = Subarray._feature_range(
+            indices, instance_dimension, self.shape[instance_dimension]
+        )
+
+        # Use the offsets index to find the elements of the
+        # compressed array that belong to the selected features
+        c_index, counts = self._feature_descriptors(start, stop)
+
+        c_indices = [slice(0, size) for size in self.source().shape]
+        c_indices[d1] = c_index
+
+        u_shape = list(self.shape)
+        u_shape[instance_dimension] = stop - start
+
+        subarray = Subarray(
+            indices=tuple(c_indices),
+            shape=tuple(u_shape),
+            counts=counts,
+            **self.conformed_data(),
+            **self.subarray_parameters(),
+        )
+
+        u = netcdf_indexer(
+            subarray[...],
+            mask=False,
+            unpack=False,
+            always_masked_array=False,
+            orthogonal_indexing=True,
+            copy=False,
+        )
+        return u[indices]
+
+    @staticmethod
+    def _compressed_index(positions):
+        """Return an index of the compressed array for a subarray.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            positions: `numpy.ndarray`
+                The positions of the subarray's elements in the
+                compressed array, in the order in which they are
+                uncompressed.
+
+        :Returns:
+
+            `slice` or `numpy.ndarray`
+                A slice if the positions are contiguous and
+                increasing, otherwise the positions.
+
+        **Examples**
+
+        >>> a._compressed_index(np.array([3, 4, 5]))
+        slice(3, 6, None)
+        >>> a._compressed_index(np.array([], dtype=int))
+        slice(0, 0, None)
+        >>> a._compressed_index(np.array([5, 3, 4]))
+        array([5, 3, 4])
+
+        """
+        if not positions.size:
+            return slice(0, 0)
+
+        if (np.diff(positions) == 1).all():
+            start = int(positions[0])
+            return slice(start, start + positions.size)
+
+        return positions
+
+    def _create_feature_offsets(self):
+        """Create the offsets index of the features.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `feature_offsets`
+
+        :Returns:
+
+            `dict`
+                The offsets index.
+
+        """
+        raise NotImplementedError(
+            "Must implement "
+            f"{self.__class__.__name__}._create_feature_offsets"
+        )  # pragma: no cover
+
+    def _feature_descriptors(self, start, stop):
+        """Locate a range of features in the compressed array.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `feature_offsets`, `subarrays`
+
+        :Parameters:
+
+            start: `int`
+                The position of the first feature.
+
+            stop: `int`
+                The position after the last feature.
+
+        :Returns:
+
+            2-`tuple`
+                The index of the compressed dimension of the
+                compressed array that selects the elements of the
+                features, and the number of elements of each feature
+                (or of each profile of each feature).
+
+        """
+        raise NotImplementedError(
+            f"Must implement {self.__class__.__name__}._feature_descriptors"
+        )  # pragma: no cover
+
+    def _subarray_descriptors(self, shapes, c_indices, counts):
+        """Create descriptors of all subarrays.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `subarrays`
+
+        :Parameters:
+
+            shapes: sequence of `tuple`
+                The subarray shapes along each uncompressed
+                dimension, as output by `subarray_shapes`.
+
+            c_indices: `list`
+                For each group of features along the instance
+                dimension, the index of the compressed dimension of
+                the compressed array.
+
+            counts: `list`
+                For each group of features along the instance
+                dimension, the number of elements of each feature (or
+                of each profile of each feature).
+
+        :Returns:
+
+            5-`tuple` of iterators
+                See `subarrays` for details.
+
+        """
+        d1, u_dims = self.compressed_dimensions().popitem()
+
+        # The indices of the uncompressed array that correspond to
+        # each subarray, the shape of each uncompressed subarray, and
+        # the location of each subarray
+        locations, u_shapes, u_indices = self._uncompressed_descriptors(
+            u_dims, shapes
+        )
+
+        # The indices of the compressed array that correspond to each
+        # subarray
+        n = len(u_dims) - 1
+        compressed_indices = []
+        for d in range(self.source().ndim):
+            if d == d1:
+                compressed_indices.append(c_indices)
+            else:
+                if d > d1:
+                    c = shapes[d + n]
+                else:
+                    c = shapes[d]
+
+                c = tuple(accumulate((0,) + c))
+                compressed_indices.append(
+                    [slice(i, j) for i, j in zip(c[:-1], c[1:])]
+                )
+
+        # The counts of each subarray depend only on its location
+        # along the instance dimension
+        instance_dimension = u_dims[0]
+        return (
+            product(*u_indices),
+            product(*u_shapes),
+            product(*compressed_indices),
+            (
+                counts[location[instance_dimension]]
+                for location in product(*locations)
+            ),
+            product(*locations),
+        )
+
     def _uncompressed_descriptors(self, u_dims, shapes):
         """Create descriptors of uncompressed subarrays.
 
@@ -145,11 +379,7 @@ class RaggedArray(CompressedArray):
         u_shapes = []
         u_indices = []
         for d, (size, c) in enumerate(zip(self.shape, shapes)):
-            if d in u_dims[:-1]:
-                locations.append([i for i in range(len(c))])
-                u_shapes.append(c)
-                u_indices.append([slice(i, i + 1) for i in range(len(c))])
-            elif d == u_dims[-1]:
+            if d == u_dims[-1]:
                 locations.append((0,))
                 u_shapes.append((size,))
                 u_indices.append((slice(0, size),))
@@ -167,6 +397,52 @@ class RaggedArray(CompressedArray):
         """Data-type of the uncompressed data."""
         return self.source().dtype
 
+    def feature_offsets(self):
+        """Return the offsets index that locates each feature.
+
+        The offsets index is created from the count and index
+        variables when it is first needed, and is then stored on the
+        array (and on any copies of it), so that any range of features
+        may be located in the compressed array without reading the
+        count and index variables again.
+
+        For a contiguous ragged array the index comprises the
+        cumulative element counts of the features. For an indexed
+        ragged array it comprises the permutation that sorts the
+        elements by feature, and where each feature starts in the
+        sorted elements. For an indexed contiguous ragged array it
+        comprises the number of elements in each profile, where each
+        profile starts, the permutation that sorts the profiles by
+        feature, and where each feature starts in the sorted
+        profiles.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Returns:
+
+            `dict`
+                The offsets index, as a dictionary of `numpy` arrays.
+
+        **Examples**
+
+        >>> r.get_count().data.array
+        array([3, 7, 5, 9])
+        >>> r.feature_offsets()
+        {'offsets': array([ 0,  3, 10, 15, 24])}
+
+        >>> r.get_index().data.array
+        array([1, 0, 1, 1, 0])
+        >>> r.feature_offsets()
+        {'order': array([1, 4, 0, 2, 3]), 'offsets': array([0, 2, 5])}
+
+        """
+        offsets = self._get_component("feature_offsets", None)
+        if offsets is None:
+            offsets = self._create_feature_offsets()
+            self._set_component("feature_offsets", offsets, copy=False)
+
+        return offsets
+
     def get_count(self, default=ValueError()):
         """Return the count variable for the compressed array.
 
@@ -212,6 +488,12 @@ class RaggedArray(CompressedArray):
     def subarray_shapes(self, shapes):
         """Create the subarray shapes along each uncompressed dimension.
 
+        Each subarray may contain any number of features, but always
+        spans the whole of the other compressed dimensions. For
+        instance, when *shapes* is ``'auto'`` then the number of
+        features in each subarray is such that the uncompressed
+        subarray size is close to `{{package}}.chunksize`.
+
         .. versionadded:: (cfdm) 1.10.0.0
 
         .. seealso:: `subarray`
@@ -232,56 +514,42 @@ class RaggedArray(CompressedArray):
         >>> a.compressed_dimensions()
         {0: (0, 1)}
         >>> a.subarray_shapes(-1)
-        [(1, 1), (3,), (4,)]
+        [(2,), (3,), (4,)]
         >>> a.subarray_shapes("auto")
-        [(1, 1), (3,), "auto"]
-        >>> a.subarray_shapes(2)
-        [(1, 1), (3,), 2]
+        ['auto', (3,), 'auto']
+        >>> a.subarray_shapes(1)
+        [1, (3,), 1]
         >>> a.subarray_shapes("60B")
-        [(1, 1), (3,), "60B"]
+        ['60B', (3,), '60B']
         >>> a.subarray_shapes((None, None, 2))
-        [(1, 1), (3,), 2]
-        >>> a.subarray_shapes((None, None, (1, 3)))
+        [None, (3,), 2]
+        >>> a.subarray_shapes(((1, 1), None, (1, 3)))
         [(1, 1), (3,), (1, 3)]
-        >>> a.subarray_shapes((None, None, "auto"))
-        [(1, 1), (3,), "auto"]
-        >>> a.subarray_shapes((None, None, "60B"))
-        [(1, 1), (3,), "60B"]
         >>> a.subarray_shapes({2: (1, 3)})
-        [(1, 1), (3,), (1, 3)]
+        [None, (3,), (1, 3)]
 
         >>> import dask.array as da
         >>> da.core.normalize_chunks(
         ...   a.subarray_shapes("auto"), shape=a.shape, dtype=a.dtype
         ... )
-        [(1, 1), (3,), (4,)]
+        ((2,), (3,), (4,))
         >>> da.core.normalize_chunks(
-        ...   a.subarray_shapes(2, shape=a.shape, dtype=a.dtype
+        ...   a.subarray_shapes(1), shape=a.shape, dtype=a.dtype
         ... )
-        [(1, 1), (3,), (2, 2)]
+        ((1, 1), (3,), (1, 1, 1, 1))
 
         >>> a.shape
         (2, 3, 3, 4)
         >>> a.compressed_dimensions()
         {0: (0, 1, 2)}
         >>> a.subarray_shapes(-1)
-        [(1, 1), (1, 1, 1), (3,), (4,)]
+        [(2,), (3,), (3,), (4,)]
         >>> a.subarray_shapes("auto")
-        [(1, 1), (1, 1, 1), (3,), "auto"]
-         >>> a.subarray_shapes(2)
-        [(1, 1), (1, 1, 1), (3,), 2]
-         >>> a.subarray_shapes("60B")
-        [(1, 1), (1, 1, 1), (3,), "60B"]
-        >>> a.subarray_shapes((None, None, None, 2))
-        [(1, 1), (1, 1, 1), (3,), 2]
-        >>> a.subarray_shapes((None, None, None, (1, 3)))
-        [(1, 1), (1, 1, 1), (3,), (1, 3)]
-        >>> a.subarray_shapes((None, None, None, "auto"))
-        [(1, 1), (1, 1, 1), (3,), "auto"]
-        >>> a.subarray_shapes((None, None, None, "60B"))
-        [(1, 1), (1, 1, 1), (3,), "60B"]
+        ['auto', (3,), (3,), 'auto']
+        >>> a.subarray_shapes(1)
+        [1, (3,), (3,), 1]
         >>> a.subarray_shapes({3: (1, 3)})
-        [(1, 1), (1, 1, 1), (3,), (1, 3)]
+        [None, (3,), (3,), (1, 3)]
 
         """
         u_dims = self.get_compressed_axes()
@@ -289,20 +557,11 @@ class RaggedArray(CompressedArray):
         uncompressed_shape = self.shape
 
         if shapes == -1:
-            return [
-                (1,) * size if i in u_dims[:-1] else (size,)
-                for i, size in enumerate(uncompressed_shape)
-            ]
+            return [(size,) for size in uncompressed_shape]
 
         if isinstance(shapes, (str, Number)):
-            shapes = [
-                (1,) * size if i in u_dims[:-1] else shapes
-                for i, size in enumerate(uncompressed_shape)
-            ]
-            shapes[u_dims[-1]] = (uncompressed_shape[u_dims[-1]],)
-            return shapes
-
-        if isinstance(shapes, dict):
+            shapes = [shapes] * self.ndim
+        elif isinstance(shapes, dict):
             shapes = [
                 shapes[i] if i in shapes else None for i in range(self.ndim)
             ]
@@ -311,15 +570,87 @@ class RaggedArray(CompressedArray):
                 f"Wrong number of 'shapes' elements in {shapes}: "
                 f"Got {len(shapes)}, expected {self.ndim}"
             )
+        else:
+            shapes = list(shapes)
+
+        # Subarrays span the whole of each compressed dimension other
+        # than the instance dimension
+        for i in u_dims[1:]:
+            shapes[i] = (uncompressed_shape[i],)
 
-        # chunks is a sequence
-        shapes = list(shapes)
-        shapes[u_dims[0] : u_dims[-1]] = [
-            (1,) * size for size in uncompressed_shape[u_dims[0] : u_dims[-1]]
-        ]
-        shapes[u_dims[-1]] = (uncompressed_shape[u_dims[-1]],)
         return shapes
 
+    def to_dask_array(self, chunks="auto"):
+        """Convert the data to a `dask` array.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            chunks: `int`, `tuple`, `dict` or `str`, optional
+                Specify the chunking of the returned dask array.
+
+                Any value accepted by the *chunks* parameter of the
+                `dask.array.from_array` function is allowed.
+
+                The chunk sizes implied by *chunks* for a compressed
+                dimension other than the instance dimension are
+                ignored, and each chunk spans the whole of such
+                dimensions.
+
+        :Returns:
+
+            `dask.array.Array`
+                The `dask` array representation.
+
+        """
+        import dask.array as da
+        from dask import config
+        from dask.base import tokenize
+
+        from ..utils import normalize_chunks
+
+        getter = da.core.getter
+
+        name = (f"{self.__class__.__name__}-{tokenize(self)}",)
+
+        dtype = self.dtype
+
+        context = partial(config.set, scheduler="synchronous")
+
+        conformed_data = self.conformed_data()
+        subarray_kwargs = {**conformed_data, **self.subarray_parameters()}
+
+        # Get the (cfdm) subarray class
+        Subarray = self.get_Subarray()
+        subarray_name = Subarray().__class__.__name__
+
+        # Set the chunk sizes for the dask array
+        chunks = normalize_chunks(
+            self.subarray_shapes(chunks),
+            shape=self.shape,
+            dtype=dtype,
+        )
+
+        dsk = {}
+        for u_indices, u_shape, c_indices, counts, chunk_location in zip(
+            *self.subarrays(chunks)
+        ):
+            subarray = Subarray(
+                indices=c_indices,
+                shape=u_shape,
+                counts=counts,
+                context_manager=context,
+                **subarray_kwargs,
+            )
+
+            key = f"{subarray_name}-{tokenize(subarray)}"
+            dsk[key] = subarray
+            dsk[name + chunk_location] = (getter, key, Ellipsis, False, False)
+
+        # Return the dask array
+        return da.Array(dsk, name[0], chunks=chunks, dtype=dtype)
+
     def to_memory(self):
         """Bring data on disk into memory.
 
@@ -0,0 +1,327 @@
+import os
+from collections import OrderedDict
+from functools import wraps
+from stat import S_ISDIR
+from threading import RLock
+
+import numpy as np
+
+
+class ChunkCache:
+    """A process-wide, memory-bounded cache of decoded data chunks.
+
+    The arrays returned by `FileArray._get_array` (i.e. the subspaces
+    of dataset variables, after any masking and unpacking) may be
+    stored in the cache, so that repeated computations on the same
+    lazily-read data don't need to re-read and re-decode the same
+    dataset chunks.
+
+    Arrays are stored in least-recently-used order, and least
+    recently used arrays are evicted whenever the total size of the
+    cached arrays exceeds the maximum size of the cache, which is
+    given by `cfdm.chunk_cache`. A maximum size of zero disables the
+    cache.
+
+    An array is identified in the cache by its dataset, the variable
+    within the dataset, the index of the subspace, and the masking
+    and unpacking options. Arrays from local files are not reused if
+    the file's modification time or size have changed since they were
+    cached. Arrays from local directory stores (such as Zarr datasets)
+    are not cached, since overwriting a chunk in place does not change
+    the modification time or size of the directory.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    """
+
+    def __init__(self):
+        """**Initialisation**"""
+        self._lock = RLock()
+
+        # The cached arrays, in least-recently-used order, keyed by
+        # (dataset name, token) tuples
+        self._arrays = OrderedDict()
+
+        # The total size in bytes of the cached arrays
+        self._nbytes = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self):
+        """The number of arrays in the cache.
+
+        x.__len__() <==> len(x)
+
+        """
+        return len(self._arrays)
+
+    @property
+    def maxsize(self):
+        """The maximum total size in bytes of the cached arrays.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        from ..functions import chunk_cache
+
+        return chunk_cache().value
+
+    @staticmethod
+    def _nbytes_of(array):
+        """Return the size in bytes of an array, including any mask.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            array: `numpy.ndarray`
+                The array.
+
+        :Returns:
+
+            `int`
+                The size in bytes.
+
+        """
+        nbytes = array.nbytes
+        if np.ma.isMA(array):
+            nbytes += np.ma.getmaskarray(array).nbytes
+
+        return nbytes
+
+    def key(self, array, index):
+        """Return the cache key for a subspace of a file array.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            array: `FileArray`
+                The file array.
+
+            index: `tuple`
+                The index of the subspace of the dataset variable.
+
+        :Returns:
+
+            `tuple` or `None`
+                The key, or `None` if the subspace can't be cached
+                because the array has no dataset name, or its dataset
+                is a local directory store.
+
+        """
+        from dask.base import tokenize
+
+        from .filehandlepool import FileHandlePool
+
+        filename = array.get_filename(normalise=True, default=None)
+        if not isinstance(filename, str):
+            return None
+
+        signature = None
+        if not array.has_remote_storage_protocol():
+            filename = FileHandlePool._local_path(filename)
+            try:
+                st = os.stat(filename)
+            except (OSError, ValueError):
+                pass
+            else:
+                if S_ISDIR(st.st_mode):
+                    # Overwriting a chunk of a directory store
+                    # (e.g. Zarr) doesn't change the directory's
+                    # modification time or size, so stale arrays
+                    # could not be detected
+                    return None
+
+                signature = (st.st_mtime_ns, st.st_size)
+
+        return (filename, tokenize(array, index, signature))
+
+    def get(self, key):
+        """Return a cached array.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            key: `tuple`
+                The cache key, as returned by `key`.
+
+        :Returns:
+
+            `numpy.ndarray` or `None`
+                A copy of the cached array, or `None` if it is not in
+                the cache.
+
+        """
+        with self._lock:
+            array = self._arrays.get(key)
+            if array is None:
+                self._misses += 1
+                return None
+
+            self._arrays.move_to_end(key)
+            self._hits += 1
+
+        return array.copy()
+
+    def put(self, key, array):
+        """Add an array to the cache.
+
+        An array that is larger than the maximum size of the cache is
+        not stored.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            key: `tuple`
+                The cache key, as returned by `key`.
+
+            array: `numpy.ndarray`
+                The array to cache. A copy is stored, so that
+                subsequent in-place changes to *array* don't affect
+                the cache.
+
+        :Returns:
+
+            `None`
+
+        """
+        maxsize = self.maxsize
+        nbytes = self._nbytes_of(array)
+        if nbytes > maxsize:
+            return
+
+        array = array.copy()
+        with self._lock:
+            old = self._arrays.pop(key, None)
+            if old is not None:
+                self._nbytes -= self._nbytes_of(old)
+
+            self._arrays[key] = array
+            self._nbytes += nbytes
+            self._trim(maxsize)
+
+    def discard(self, filename=None):
+        """Remove cached arrays.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            filename: `str` or `None`, optional
+                Only remove the arrays from this dataset. By default
+                all arrays are removed.
+
+        :Returns:
+
+            `None`
+
+        """
+        from .filehandlepool import FileHandlePool
+
+        if filename is not None:
+            filename = FileHandlePool._local_path(filename)
+
+        with self._lock:
+            for key in tuple(self._arrays):
+                if filename is None or key[0] == filename:
+                    self._nbytes -= self._nbytes_of(self._arrays.pop(key))
+
+    def statistics(self, reset=False):
+        """Return the cache statistics.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            reset: `bool`, optional
+                If True then reset the counters to zero after they
+                have been returned.
+
+        :Returns:
+
+            `dict`
+                The number of hits, misses and evictions, the number
+                and total size of the cached arrays, and the maximum
+                size of the cache.
+
+        """
+        with self._lock:
+            out = {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "chunks": len(self._arrays),
+                "size": self._nbytes,
+                "maxsize": self.maxsize,
+            }
+            if reset:
+                self._hits = 0
+                self._misses = 0
+                self._evictions = 0
+
+        return out
+
+    def _trim(self, maxsize):
+        """Evict least recently used arrays beyond a maximum size.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            maxsize: `int`
+                The maximum total size in bytes of the arrays to
+                retain.
+
+        :Returns:
+
+            `None`
+
+        """
+        with self._lock:
+            while self._arrays and self._nbytes > max(maxsize, 0):
+                _, array = self._arrays.popitem(last=False)
+                self._nbytes -= self._nbytes_of(array)
+                self._evictions += 1
+
+
+chunk_store = ChunkCache()
+
+
+def cached_chunks(get_array):
+    """A decorator that caches the arrays returned by `_get_array`.
+
+    When the chunk cache is enabled (see `cfdm.chunk_cache`), the
+    subspace returned by the decorated `FileArray._get_array` method
+    is stored in the process-wide chunk cache, and a subsequent
+    request for the same subspace of the same dataset variable is
+    satisfied from the cache.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    """
+
+    @wraps(get_array)
+    def wrapper(self, index=None):
+        if chunk_store.maxsize <= 0:
+            return get_array(self, index)
+
+        if index is None:
+            index = self.index()
+
+        key = chunk_store.key(self, index)
+        if key is None:
+            return get_array(self, index)
+
+        array = chunk_store.get(key)
+        if array is None:
+            array = get_array(self, index)
+            chunk_store.put(key, array)
+
+        return array
+
+    return wrapper
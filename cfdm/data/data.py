@@ -389,9 +389,14 @@ class Data(
                 except AttributeError:
                     pass
 
-            # Cached elements
+            # Cached elements. Note: Deferred cached elements are
+            #       copied without being computed.
             try:
-                self._set_cached_elements(source._get_cached_elements())
+                cache = source._get_component("cached_elements", None)
+                if not callable(cache):
+                    cache = source._get_cached_elements()
+
+                self._set_cached_elements(cache)
             except AttributeError:
                 pass
 
@@ -2084,7 +2089,22 @@ class Data(
         {0: 273.15, 1: 274.56, -1: 269.95}
 
         """
-        return self._get_component("cached_elements", {})
+        cache = self._get_component("cached_elements", {})
+        if callable(cache):
+            # Compute deferred cached elements, now that they are
+            # needed for the first time
+            self._del_cached_elements()
+            try:
+                elements = cache()
+            except OSError:
+                # The elements can't be retrieved from the dataset
+                # (e.g. it has been moved)
+                return {}
+
+            self._set_cached_elements(elements)
+            cache = self._get_component("cached_elements", {})
+
+        return cache
 
     def _is_abstract_Array_subclass(self, array):
         """Whether or not an array is a type of Array.
@@ -2273,12 +2293,20 @@ class Data(
 
         :Parameters:
 
-            elements: `dict`
+            elements: `dict` or callable
                Zero or more element values to be cached, each keyed by
                a unique identifier to allow unambiguous retrieval.
                Existing cached elements not specified by *elements*
                will not be removed.
 
+               Alternatively, a callable that takes no arguments and
+               returns such a dictionary, in which case the computation
+               of the cached elements is deferred until they are first
+               required by `_get_cached_elements`. Any existing cached
+               elements are removed.
+
+               .. versionadded:: (cfdm) NEXTVERSION
+
         :Returns:
 
             `None`
@@ -2288,6 +2316,10 @@ class Data(
         >>> d._set_cached_elements({0: 273.15})
 
         """
+        if callable(elements):
+            self._set_component("cached_elements", elements, copy=False)
+            return
+
         if not elements:
             return
 
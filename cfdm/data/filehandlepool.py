@@ -0,0 +1,423 @@
+import os
+from collections import OrderedDict
+from threading import RLock
+
+
+class FileHandlePool:
+    """A process-wide, size-bounded pool of open dataset handles.
+
+    Datasets that are opened by `FileArray.open` may be borrowed from,
+    and returned to, the pool, rather than being opened and closed
+    for every access of the data. This avoids the repeated cost of
+    opening and closing the same dataset, which can be considerable
+    on parallel and remote file systems.
+
+    Idle handles are stored in least-recently-used order, and the
+    least recently used idle handle is closed whenever the number of
+    idle handles exceeds the maximum size of the pool, which is given
+    by `cfdm.file_handle_pool`. A maximum size of zero disables the
+    pool.
+
+    A handle that has been borrowed is never lent to another caller
+    until it has been returned, so a handle is only ever used by one
+    thread at a time.
+
+    Handles to local files are discarded if the file's modification
+    time or size have changed since it was opened, and all handles
+    are discarded (without being closed) in a child process created
+    by `os.fork`.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    """
+
+    def __init__(self):
+        """**Initialisation**"""
+        self._lock = RLock()
+
+        # Idle handles, in least-recently-used order. Each key is a
+        # (pool key, handle identifier) 2-tuple and each value is a
+        # (handle, file signature) 2-tuple.
+        self._idle = OrderedDict()
+
+        # Borrowed handles, keyed by handle identifier. Each value is
+        # a (pool key, handle, file signature) 3-tuple.
+        self._borrowed = {}
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self):
+        """The number of idle handles in the pool.
+
+        x.__len__() <==> len(x)
+
+        """
+        return len(self._idle)
+
+    @staticmethod
+    def _freeze(value):
+        """Return a hashable version of a value.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            value:
+                The value to be converted.
+
+        :Returns:
+
+                The hashable value.
+
+        """
+        if isinstance(value, dict):
+            return tuple(
+                sorted(
+                    (str(k), FileHandlePool._freeze(v))
+                    for k, v in value.items()
+                )
+            )
+
+        if isinstance(value, (list, tuple)):
+            return tuple(FileHandlePool._freeze(v) for v in value)
+
+        try:
+            hash(value)
+        except TypeError:
+            return repr(value)
+
+        return value
+
+    @staticmethod
+    def _signature(filename):
+        """Return a signature that identifies a local file's contents.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            filename: `str`
+                The local file name.
+
+        :Returns:
+
+            `tuple` or `None`
+                The file's modification time and size, or `None` if
+                the file could not be inspected.
+
+        """
+        try:
+            st = os.stat(filename)
+        except (OSError, ValueError):
+            return
+
+        return (st.st_mtime_ns, st.st_size)
+
+    @staticmethod
+    def _local_path(filename):
+        """Return the absolute local path of a dataset name.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            filename: `str`
+                The dataset name.
+
+        :Returns:
+
+            `str`
+                The absolute local path, or *filename* unchanged if it
+                is not a local file.
+
+        """
+        from ..functions import abspath
+
+        try:
+            return abspath(filename, uri=False)
+        except ValueError:
+            return filename
+
+    @property
+    def maxsize(self):
+        """The maximum number of idle handles in the pool.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        from ..functions import file_handle_pool
+
+        return file_handle_pool().value
+
+    def key(self, func, filename, storage_options=None, **kwargs):
+        """Return the pool key for a dataset.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            func: callable
+                The function that opens the dataset, which identifies
+                the backend.
+
+            filename: `str`
+                The dataset name.
+
+            storage_options: `dict` or `None`, optional
+                The file system options used to open the dataset.
+
+            kwargs: optional
+                The keyword arguments passed to *func*.
+
+        :Returns:
+
+            `tuple`
+                The key.
+
+        """
+        backend = (
+            getattr(func, "__module__", None),
+            getattr(func, "__qualname__", repr(func)),
+        )
+        return (
+            backend,
+            filename,
+            self._freeze(storage_options),
+            self._freeze(kwargs),
+        )
+
+    def acquire(self, key, local=False):
+        """Borrow an idle handle from the pool.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            key: `tuple`
+                The pool key, as returned by `key`.
+
+            local: `bool`, optional
+                If True then the dataset is a local file, and an idle
+                handle is only returned if the file has not changed
+                since the handle was opened.
+
+        :Returns:
+
+                The borrowed dataset handle, or `None` if there is no
+                suitable idle handle in the pool.
+
+        """
+        with self._lock:
+            for idle_key in reversed(self._idle):
+                if idle_key[0] != key:
+                    continue
+
+                dataset, signature = self._idle.pop(idle_key)
+                if local and signature != self._signature(key[1]):
+                    # The file has changed since it was opened
+                    self._close(dataset)
+                    break
+
+                self._borrowed[id(dataset)] = (key, dataset, signature)
+                self._hits += 1
+                return dataset
+
+            self._misses += 1
+
+    def register(self, key, dataset, local=False):
+        """Register a newly opened handle as borrowed from the pool.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            key: `tuple`
+                The pool key, as returned by `key`.
+
+            dataset:
+                The newly opened dataset handle.
+
+            local: `bool`, optional
+                If True then the dataset is a local file.
+
+        :Returns:
+
+            `None`
+
+        """
+        signature = self._signature(key[1]) if local else None
+        with self._lock:
+            self._borrowed[id(dataset)] = (key, dataset, signature)
+
+    def release(self, dataset):
+        """Return a borrowed handle to the pool.
+
+        If the handle was not borrowed from the pool, or the pool is
+        disabled, then the handle is not accepted and the caller is
+        responsible for closing it.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            dataset:
+                The dataset handle to return.
+
+        :Returns:
+
+            `bool`
+                True if the handle was accepted by the pool, otherwise
+                False.
+
+        """
+        with self._lock:
+            borrowed = self._borrowed.pop(id(dataset), None)
+            if borrowed is None:
+                return False
+
+            maxsize = self.maxsize
+            if maxsize <= 0:
+                return False
+
+            key, dataset, signature = borrowed
+            self._idle[(key, id(dataset))] = (dataset, signature)
+            self._trim(maxsize)
+
+        return True
+
+    def discard(self, filename=None):
+        """Close idle handles.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            filename: `str` or `None`, optional
+                Only close the idle handles for this dataset. By
+                default all idle handles are closed.
+
+        :Returns:
+
+            `None`
+
+        """
+        if filename is not None:
+            filename = self._local_path(filename)
+
+        with self._lock:
+            for idle_key in tuple(self._idle):
+                if (
+                    filename is None
+                    or self._local_path(idle_key[0][1]) == filename
+                ):
+                    dataset, _ = self._idle.pop(idle_key)
+                    self._close(dataset)
+
+    def statistics(self, reset=False):
+        """Return the pool statistics.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            reset: `bool`, optional
+                If True then reset the counters to zero after they
+                have been returned.
+
+        :Returns:
+
+            `dict`
+                The number of hits, misses and evictions, the number
+                of idle and borrowed handles, and the maximum size of
+                the pool.
+
+        """
+        with self._lock:
+            out = {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "idle": len(self._idle),
+                "borrowed": len(self._borrowed),
+                "maxsize": self.maxsize,
+            }
+            if reset:
+                self._hits = 0
+                self._misses = 0
+                self._evictions = 0
+
+        return out
+
+    def _close(self, dataset):
+        """Close a dataset handle, ignoring any errors.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            dataset:
+                The dataset handle to close.
+
+        :Returns:
+
+            `None`
+
+        """
+        close = getattr(dataset, "close", None)
+        if close is None:
+            # E.g. `zarr.Group` objects don't need closing
+            return
+
+        try:
+            close()
+        except Exception:
+            pass
+
+    def _trim(self, maxsize):
+        """Close least recently used idle handles beyond a maximum.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            maxsize: `int`
+                The maximum number of idle handles to retain.
+
+        :Returns:
+
+            `None`
+
+        """
+        with self._lock:
+            while len(self._idle) > max(maxsize, 0):
+                _, (dataset, _) = self._idle.popitem(last=False)
+                self._close(dataset)
+                self._evictions += 1
+
+    def _after_fork(self):
+        """Reset the pool in a child process.
+
+        Handles inherited from the parent process are dropped without
+        being closed, since they are still in use by the parent.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        # Keep references to the inherited handles so that they are
+        # not closed by garbage collection
+        self._inherited = (self._idle, self._borrowed)
+
+        self._lock = RLock()
+        self._idle = OrderedDict()
+        self._borrowed = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+
+handle_pool = FileHandlePool()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=handle_pool._after_fork)
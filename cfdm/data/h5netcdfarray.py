@@ -1,7 +1,8 @@
 import logging
 
 from . import abstract
-from .locks import netcdf_lock
+from .chunkcache import cached_chunks
+from .locks import dataset_lock
 from .mixin import IndexMixin
 from .netcdfindexer import netcdf_indexer
 
@@ -12,7 +13,8 @@ class H5netcdfArray(IndexMixin, abstract.FileArray):
     """A netCDF array accessed with `h5netcdf` using the `h5py` backend.
 
     * Accesses local and remote (http and s3) netCDF-4 datasets.
-    * Parallelised reading is not possible.
+    * Allows parallelised reading of different datasets, but not of
+      the same dataset.
 
     .. versionadded:: (cfdm) 1.11.2.0
 
@@ -22,14 +24,17 @@ class H5netcdfArray(IndexMixin, abstract.FileArray):
     def _lock(self):
         """Return the lock used for netCDF file access.
 
-        Returns a lock object that prevents concurrent reads of netCDF
-        files, which are not currently supported by `h5netcdf` with
-        the `h5py` backend.
+        Returns a lock object that prevents concurrent reads of the
+        same netCDF file, which are not currently supported by
+        `h5netcdf` with the `h5py` backend. Reads of different files
+        use different locks, and so may run concurrently.
 
         .. versionadded:: (cfdm) 1.11.2.0
 
         """
-        return netcdf_lock
+        return dataset_lock(
+            "h5netcdf", self.get_filename(normalise=True, default=None)
+        )
 
     def _attributes(self, var):
         """Get the netCDF variable attributes.
@@ -59,6 +64,7 @@ class H5netcdfArray(IndexMixin, abstract.FileArray):
 
         return attributes
 
+    @cached_chunks
     def _get_array(self, index=None):
         """Returns a subspace of the dataset variable.
 
@@ -87,27 +93,31 @@ class H5netcdfArray(IndexMixin, abstract.FileArray):
         with self._lock:
             dataset, address = self.open()
             dataset0 = dataset
-
-            groups, address = self.get_groups(address)
-            if groups:
-                dataset = self._group(dataset, groups)
-
-            # Get the variable by netCDF name
-            variable = dataset.variables[address]
-
-            # Get the data, applying masking and scaling as required.
-            array = netcdf_indexer(
-                variable,
-                mask=self.get_mask(),
-                unpack=self.get_unpack(),
-                always_masked_array=False,
-                orthogonal_indexing=True,
-                attributes=self._attributes(variable),
-                copy=False,
-            )
-            array = array[index]
-
-            self.close(dataset0)
+            try:
+                groups, address = self.get_groups(address)
+                if groups:
+                    dataset = self._group(dataset, groups)
+
+                # Get the variable by netCDF name
+                variable = dataset.variables[address]
+
+                # Get the data, applying masking and scaling as
+                # required.
+                array = netcdf_indexer(
+                    variable,
+                    mask=self.get_mask(),
+                    unpack=self.get_unpack(),
+                    unpack_dtype=self.get_unpack_dtype(),
+                    always_masked_array=False,
+                    orthogonal_indexing=True,
+                    attributes=self._attributes(variable),
+                    copy=False,
+                )
+                array = array[index]
+            finally:
+                # Close the dataset, or return it to the file handle
+                # pool, even if the data could not be read
+                self.close(dataset0)
 
         return array
 
@@ -154,7 +164,7 @@ class H5netcdfArray(IndexMixin, abstract.FileArray):
 
         """
         if self._get_component("close"):
-            dataset.close()
+            self._close(dataset)
 
     def get_groups(self, address):
         """The netCDF4 group structure of a netCDF variable.
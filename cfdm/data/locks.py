@@ -1,3 +1,147 @@
+import os
 from threading import Lock
 
+# The global lock for all datasets accessed by the netCDF-C library,
+# which does not support concurrent access, even to different files.
 netcdf_lock = Lock()
+
+# How access to datasets is serialised for each backend library:
+#
+# * 'global': All datasets share the single `netcdf_lock`.
+# * 'file': Each dataset has its own lock, so that independent
+#           datasets may be accessed concurrently.
+# * 'hdf5': As 'file', unless the netCDF-C library has been used in
+#           this process, in which case as 'global'.
+# * None: No lock is required.
+#
+# 'h5netcdf' is the `h5netcdf` library with the `h5py` backend. `h5py`
+# and netCDF-C may be linked to the same process-wide HDF5 library,
+# which is often built without thread safety, so once `netCDF4` has
+# been used, `h5netcdf` shares its lock.
+lock_policies = {
+    "netCDF4": "global",
+    "h5netcdf": "hdf5",
+    "pyfive": None,
+    "zarr": None,
+    "scipy": None,
+}
+
+# The per-dataset locks, keyed by dataset name
+_file_locks = {}
+_file_locks_lock = Lock()
+
+# Whether or not the netCDF-C library has been used in this process
+_netCDF4_in_use = False
+
+
+def dataset_lock(backend, filename=None):
+    """Return the lock for accessing a dataset.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    :Parameters:
+
+        backend: `str`
+            The backend library used to access the dataset. One of
+            the keys of `lock_policies`. The ``'h5netcdf-h5py'``,
+            ``'h5netcdf-pyfive'`` and ``'netcdf_file'`` backend names
+            are also accepted.
+
+        filename: `str` or `None`, optional
+            The dataset name, which should be normalised (e.g. with
+            `cfdm.abspath`) so that the same dataset always has the
+            same name. If `None` or not a string (e.g. an open file
+            handle) then the ``'file'`` policy falls back to the
+            global lock.
+
+    :Returns:
+
+        `threading.Lock` or `None`
+            The lock, or `None` if no lock is required.
+
+    **Examples**
+
+    >>> dataset_lock("netCDF4", "/data/file1.nc") is netcdf_lock
+    True
+    >>> l1 = dataset_lock("h5netcdf", "/data/file1.nc")
+    >>> l1 is netcdf_lock
+    True
+
+    If `netCDF4` had not been used in the process:
+
+    >>> l1 = dataset_lock("h5netcdf", "/data/file1.nc")
+    >>> l2 = dataset_lock("h5netcdf", "/data/file2.nc")
+    >>> l1 is l2
+    False
+    >>> l1 is dataset_lock("h5netcdf", "/data/file1.nc")
+    True
+    >>> print(dataset_lock("pyfive", "/data/file1.nc"))
+    None
+
+    """
+    match backend:
+        case "h5netcdf-h5py":
+            backend = "h5netcdf"
+        case "h5netcdf-pyfive":
+            backend = "pyfive"
+        case "netcdf_file":
+            backend = "scipy"
+
+    policy = lock_policies.get(backend, "global")
+    if policy is None:
+        return
+
+    if backend == "netCDF4":
+        set_netCDF4_in_use()
+
+    if policy == "hdf5":
+        policy = "global" if _netCDF4_in_use else "file"
+
+    if policy == "global" or not isinstance(filename, str):
+        return netcdf_lock
+
+    with _file_locks_lock:
+        lock = _file_locks.get(filename)
+        if lock is None:
+            lock = Lock()
+            _file_locks[filename] = lock
+
+    return lock
+
+
+def set_netCDF4_in_use():
+    """Record that the netCDF-C library has been used in this process.
+
+    Thereafter, datasets with the ``'hdf5'`` lock policy share the
+    global `netcdf_lock`, so that `h5py` and netCDF-C never call the
+    HDF5 library at the same time.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    :Returns:
+
+        `None`
+
+    """
+    global _netCDF4_in_use
+
+    _netCDF4_in_use = True
+
+
+def _after_fork():
+    """Reset the per-dataset locks in a child process.
+
+    Locks held by other threads of the parent process at the time of
+    the fork would otherwise never be released in the child.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    """
+    global _file_locks_lock
+
+    _file_locks.clear()
+    _file_locks_lock = Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork)
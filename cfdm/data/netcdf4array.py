@@ -1,5 +1,6 @@
 from . import abstract
-from .locks import netcdf_lock
+from .chunkcache import cached_chunks
+from .locks import dataset_lock
 from .mixin import IndexMixin
 from .netcdfindexer import netcdf_indexer
 
@@ -19,12 +20,14 @@ class NetCDF4Array(IndexMixin, abstract.FileArray):
         """Return the lock used for netCDF file access.
 
         Returns a lock object that prevents concurrent reads of netCDF
-        files, which are not currently supported by `netCDF4`.
+        files, which are not currently supported by `netCDF4`. The
+        same lock is used for all files, because the netCDF-C library
+        does not support concurrent access to different files.
 
         .. versionadded:: (cfdm) 1.11.2.0
 
         """
-        return netcdf_lock
+        return dataset_lock("netCDF4")
 
     def _attributes(self, var):
         """Get the netCDF variable attributes.
@@ -54,6 +57,7 @@ class NetCDF4Array(IndexMixin, abstract.FileArray):
 
         return attributes
 
+    @cached_chunks
     def _get_array(self, index=None):
         """Returns a subspace of the dataset variable.
 
@@ -82,35 +86,40 @@ class NetCDF4Array(IndexMixin, abstract.FileArray):
         with self._lock:
             netcdf, address = self.open()
             dataset = netcdf
-
-            groups, address = self.get_groups(address)
-            if groups:
-                # Traverse the group structure, if there is one (CF>=1.8).
-                netcdf = self._group(netcdf, groups)
-
-            if isinstance(address, str):
-                # Get the variable by netCDF name
-                variable = netcdf.variables[address]
-            else:
-                # Get the variable by netCDF integer ID
-                for variable in netcdf.variables.values():
-                    if variable._varid == address:
-                        break
-
-            # Get the data, applying masking and scaling as required.
-            array = netcdf_indexer(
-                variable,
-                mask=self.get_mask(),
-                unpack=self.get_unpack(),
-                always_masked_array=False,
-                orthogonal_indexing=True,
-                attributes=self._attributes(variable),
-                copy=False,
-            )
-            array = array[index]
-
-            self.close(dataset)
-            del netcdf, dataset
+            try:
+                groups, address = self.get_groups(address)
+                if groups:
+                    # Traverse the group structure, if there is one
+                    # (CF>=1.8).
+                    netcdf = self._group(netcdf, groups)
+
+                if isinstance(address, str):
+                    # Get the variable by netCDF name
+                    variable = netcdf.variables[address]
+                else:
+                    # Get the variable by netCDF integer ID
+                    for variable in netcdf.variables.values():
+                        if variable._varid == address:
+                            break
+
+                # Get the data, applying masking and scaling as
+                # required.
+                array = netcdf_indexer(
+                    variable,
+                    mask=self.get_mask(),
+                    unpack=self.get_unpack(),
+                    unpack_dtype=self.get_unpack_dtype(),
+                    always_masked_array=False,
+                    orthogonal_indexing=True,
+                    attributes=self._attributes(variable),
+                    copy=False,
+                )
+                array = array[index]
+            finally:
+                # Close the dataset, or return it to the file handle
+                # pool, even if the data could not be read
+                self.close(dataset)
+                del netcdf, dataset
 
         if not self.ndim:
             # Hmm netCDF4 has a thing for making scalar size 1, 1d
@@ -161,7 +170,7 @@ class NetCDF4Array(IndexMixin, abstract.FileArray):
 
         """
         if self._get_component("close"):
-            dataset.close()
+            self._close(dataset)
 
     def get_groups(self, address):
         """The netCDF4 group structure of a netCDF variable.
@@ -107,6 +107,10 @@ class netcdf_indexer:
 
     """
 
+    # The number of elements in each of the blocks that are masked
+    # and unpacked in turn by `_mask_and_unpack`
+    _block_size = 1048576
+
     def __init__(
         self,
         variable,
@@ -116,6 +120,7 @@ class netcdf_indexer:
         orthogonal_indexing=False,
         attributes=None,
         copy=False,
+        unpack_dtype=None,
     ):
         """**Initialisation**
 
@@ -189,6 +194,19 @@ class netcdf_indexer:
                 *variable* will depend on how subspacing is
                 implemented by *variable*.
 
+            unpack_dtype: data-type, optional
+                The data type of unpacked data. If `None`, the
+                default, then the data type is that given by applying
+                the ``scale_factor`` and ``add_offset`` attributes to
+                the packed data, according to the `numpy` type
+                promotion rules. Otherwise unpacked data are created
+                with the given data type, which for instance allows
+                data packed as 8 or 16-bit integers to be unpacked to
+                ``float32`` rather than ``float64`` values, halving
+                their memory use.
+
+                .. versionadded:: (cfdm) NEXTVERSION
+
         """
         self.variable = variable
         self.mask = bool(mask)
@@ -197,6 +215,7 @@ class netcdf_indexer:
         self._attributes = attributes
         self._copy = bool(copy)
         self._orthogonal_indexing = bool(orthogonal_indexing)
+        self._unpack_dtype = unpack_dtype
 
     def __getitem__(self, index):
         """Return a subspace of the variable as a `numpy` array.
@@ -312,16 +331,11 @@ class netcdf_indexer:
                 data = data.view(dtype_unsigned_int)
 
         # ------------------------------------------------------------
-        # Mask the data
-        # ------------------------------------------------------------
-        if self.mask:
-            data = self._mask(data, dtype, attributes, dtype_unsigned_int)
-
+        # Mask and unpack the data
         # ------------------------------------------------------------
-        # Unpack the data
-        # ------------------------------------------------------------
-        if unpack:
-            data = self._unpack(data, attributes)
+        data = self._mask_and_unpack(
+            data, dtype, attributes, dtype_unsigned_int
+        )
 
         # Make sure all strings are unicode
         if data.dtype.kind == "S":
@@ -393,6 +407,154 @@ class netcdf_indexer:
 
         return safe, attvalue
 
+    @classmethod
+    def _chunk_runs(cls, index, size, chunksize):
+        """Plan the reads for a list index along a chunked axis.
+
+        The sorted, unique index values are partitioned into runs
+        that each span one or more consecutive storage chunks which
+        contain at least one selected element, so that storage chunks
+        that contain no selected elements are never read, and each
+        storage chunk is read at most once.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `_index_chunked`
+
+        :Parameter:
+
+            index: 1-d array_like of `int` or `bool`
+                The list index.
+
+            size: `int`
+                The size of the axis.
+
+            chunksize: `int`
+                The storage chunk size of the axis.
+
+        :Returns:
+
+            3-`tuple`
+                The sorted unique index values; the indices that
+                reconstruct the original index from the sorted unique
+                values, or `None` if the original index is already
+                strictly increasing; and the runs, as a list of
+                ``(start, stop, i0, i1)`` tuples, where ``start:stop``
+                is the slice of the axis to be read and ``i0:i1`` is
+                the slice of the sorted unique values that it
+                contains.
+
+        **Examples**
+
+        >>> n._chunk_runs([25, 3, 2, 9, 3], 30, 4)
+        (array([ 2,  3,  9, 25]),
+         array([3, 1, 0, 2, 1]),
+         [(2, 4, 0, 2), (9, 10, 2, 3), (25, 26, 3, 4)])
+        >>> n._chunk_runs([2, 5, 9], 30, 4)
+        (array([2, 5, 9]), None, [(2, 10, 0, 3)])
+
+        """
+        index = np.asanyarray(index)
+        if index.dtype == bool:
+            index = np.flatnonzero(index)
+        else:
+            index = np.where(index < 0, index + size, index)
+
+        unique, inverse = np.unique(index, return_inverse=True)
+        if unique.size == index.size and (np.diff(index) > 0).all():
+            inverse = None
+
+        # Start a new run wherever there is at least one unselected
+        # storage chunk between consecutive selected elements
+        chunk_positions = unique // chunksize
+        bounds = np.flatnonzero(np.diff(chunk_positions) > 1) + 1
+        bounds = [0, *bounds.tolist(), unique.size]
+
+        runs = [
+            (int(unique[i0]), int(unique[i1 - 1]) + 1, i0, i1)
+            for i0, i1 in zip(bounds[:-1], bounds[1:])
+        ]
+
+        return unique, inverse, runs
+
+    def _index_chunked(self, data, index, axes, chunks):
+        """Orthogonally index a chunked variable with list indices.
+
+        Rather than applying each list index in turn, which reads
+        whole hyperslabs of the variable for every axis that has not
+        yet been indexed, the list indices are converted to runs of
+        slices that are aligned to the variable's storage chunks
+        (see `_chunk_runs`). The variable is read once for each
+        combination of runs, which reads each selected storage chunk
+        once and no unselected storage chunks, and the selected
+        elements of each read are scattered into the result.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `_chunk_runs`, `_index`
+
+        :Parameter:
+
+            data:
+                The variable to be indexed.
+
+            index: sequence
+                The index, with no integer elements, and at least one
+                list/1-d array element.
+
+            axes: sequence of `int`
+                The positions of the list/1-d array elements of
+                *index*.
+
+            chunks: `tuple` of `int`
+                The storage chunk sizes of the variable.
+
+        :Returns:
+
+            `numpy.ndarray`
+                The subspace of the variable.
+
+        """
+        from itertools import product
+
+        shape = data.shape
+        plans = {
+            n: self._chunk_runs(index[n], shape[n], chunks[n]) for n in axes
+        }
+
+        out = None
+        for runs in product(*[plans[n][2] for n in axes]):
+            read_index = list(index)
+            out_index = [slice(None)] * len(index)
+            for n, (start, stop, i0, i1) in zip(axes, runs):
+                read_index[n] = slice(start, stop)
+                out_index[n] = slice(i0, i1)
+
+            block = np.asanyarray(data[tuple(read_index)])
+
+            # Select the wanted elements from the block
+            for n, (start, stop, i0, i1) in zip(axes, runs):
+                if i1 - i0 < stop - start:
+                    block = np.take(block, plans[n][0][i0:i1] - start, axis=n)
+
+            if out is None:
+                out_shape = list(block.shape)
+                for n in axes:
+                    out_shape[n] = plans[n][0].size
+
+                out = np.empty_like(block, shape=out_shape)
+
+            out[tuple(out_index)] = block
+
+        # Reorder (and duplicate) elements to match the original
+        # list indices
+        for n in axes:
+            inverse = plans[n][1]
+            if inverse is not None:
+                out = np.take(out, inverse, axis=n)
+
+        return out
+
     def _default_FillValue(self, dtype):
         """Return the default ``_FillValue`` for the given data type.
 
@@ -490,7 +652,29 @@ class netcdf_indexer:
             slice(i, i + 1) if axis_dropping_index(i) else i for i in index
         ]
 
-        if data_orthogonal_indexing or len(axes_with_list_indices) <= 1:
+        chunks = None
+        if axes_with_list_indices and not data_orthogonal_indexing:
+            chunks = self._storage_chunks(data)
+            if chunks is not None and not all(
+                len(index[i]) for i in axes_with_list_indices
+            ):
+                chunks = None
+
+        if chunks is not None:
+            # There is at least one list/1-d array index, and the
+            # variable is chunked but does not natively support
+            # orthogonal indexing => read only the storage chunks
+            # that contain selected elements. This is also done when
+            # only one axis has a list/1-d array index, since then
+            # the index may still be unsorted or contain repeated
+            # values, which `h5py` does not support.
+            #
+            # Note: `h5netcdf.File`, `h5py.File`, `pyfive.File`, and
+            #       `zarr.Array` variables may be chunked.
+            data = self._index_chunked(
+                data, index0, axes_with_list_indices, chunks
+            )
+        elif data_orthogonal_indexing or len(axes_with_list_indices) <= 1:
             # There is at most one list/1-d array index, and/or the
             # variable natively supports orthogonal indexing.
             #
@@ -556,6 +740,8 @@ class netcdf_indexer:
 
         .. versionadded:: (cfdm) 1.11.2.0
 
+        .. seealso:: `_mask_and_unpack`, `_mask_values`
+
         :Parameter:
 
             data: `numpy.ndarray`
@@ -578,18 +764,319 @@ class netcdf_indexer:
                 The masked data.
 
         """
+        missing_values, _FillValue, validmin, validmax = self._mask_values(
+            dtype, attributes, dtype_unsigned_int
+        )
+
         # The Boolean mask accounting for all methods of specification
         totalmask = None
         # The fill value for the returned numpy array
         fill_value = None
 
+        # ------------------------------------------------------------
+        # Create mask from missing_value
+        # ------------------------------------------------------------
+        for m in missing_values:
+            mask = self._equal(data, m)
+            if mask.any():
+                if totalmask is None:
+                    totalmask = mask
+                else:
+                    totalmask |= mask
+
+        if totalmask is not None:
+            fill_value = missing_values[0]
+
+        # ------------------------------------------------------------
+        # Create mask from _FillValue
+        # ------------------------------------------------------------
+        if _FillValue is not None:
+            # Must use `np.asanyarray` here, to ensure that 'mask' is
+            # a never a `bool`, which would make the following
+            # 'mask.any' call fail.
+            mask = np.asanyarray(self._equal(data, _FillValue))
+            if mask.any():
+                if fill_value is None:
+                    fill_value = _FillValue
+
+                if totalmask is None:
+                    totalmask = mask
+                else:
+                    totalmask |= mask
+
+        # ------------------------------------------------------------
+        # Create mask from valid_min. valid_max, valid_range
+        # ------------------------------------------------------------
+        if validmin is not None:
+            mask = data < validmin
+            if totalmask is None:
+                totalmask = mask
+            else:
+                totalmask |= mask
+
+        if validmax is not None:
+            mask = data > validmax
+            if totalmask is None:
+                totalmask = mask
+            else:
+                totalmask |= mask
+
+        # ------------------------------------------------------------
+        # Mask the data
+        # ------------------------------------------------------------
+        if totalmask is not None and totalmask.any():
+            data = np.ma.masked_array(
+                data, mask=totalmask, fill_value=fill_value, copy=False
+            )
+            if not data.ndim:
+                # Return a scalar numpy masked constant not a 0-d
+                # masked array, so that data == np.ma.masked.
+                data = data[()]
+        elif np.ma.isMA(data):
+            if not (self.always_masked_array or np.ma.is_masked(data)):
+                # Return a non-masked array
+                data = np.array(data)
+        elif self.always_masked_array:
+            # Return a masked array
+            data = np.ma.masked_array(data)
+
+        return data
+
+    def _mask_and_unpack(self, data, dtype, attributes, dtype_unsigned_int):
+        """Mask and unpack the data in a single pass.
+
+        Numeric data are processed in contiguous blocks of
+        `_block_size` elements, with all of the masking comparisons
+        and the unpacking arithmetic being applied to one block before
+        moving on to the next. Compared with masking the whole array
+        and then unpacking it, this needs no full-size temporary
+        arrays other than the Boolean mask and the unpacked result,
+        and each block is read from memory only once. When the
+        unpacked data type is the same as that of the packed data,
+        and the packed data are not a view of another array, then the
+        data are unpacked in-place.
+
+        Masked arrays and non-numeric data are masked and unpacked
+        with `_mask` and `_unpack`.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `_mask`, `_unpack`
+
+        :Parameter:
+
+            data: `numpy.ndarray`
+                The unmasked and (possibly) packed data.
+
+            dtype: `numpy.dtype`
+                The data type of the variable (which may be different
+                to that of *data*).
+
+            attributes: `dict`
+                The variable attributes.
+
+            dtype_unsigned_int: `dtype` or `None`
+                The data type when the data have been cast to unsigned
+                integers, otherwise `None`.
+
+        :Returns:
+
+            `numpy.ndarray`
+                The masked and unpacked data.
+
+        """
+        mask = self.mask
+        unpack = self.unpack
+        if np.ma.isMA(data) or data.dtype.kind not in "iuf":
+            if mask:
+                data = self._mask(data, dtype, attributes, dtype_unsigned_int)
+
+            if unpack:
+                data = self._unpack(data, attributes)
+
+            return data
+
+        # The masking tests, as (ufunc, value) pairs
+        tests = []
+        n_missing_values = 0
+        if mask:
+            missing_values, _FillValue, validmin, validmax = self._mask_values(
+                dtype, attributes, dtype_unsigned_int
+            )
+            fill_values = list(missing_values)
+            n_missing_values = len(fill_values)
+            if _FillValue is not None:
+                fill_values.append(_FillValue)
+
+            for value in fill_values:
+                if self._isnan(value):
+                    tests.append((np.isnan, None))
+                else:
+                    tests.append((np.equal, value))
+
+            if validmin is not None:
+                tests.append((np.less, validmin))
+
+            if validmax is not None:
+                tests.append((np.greater, validmax))
+
+        parameters = None
+        if unpack:
+            parameters = self._unpack_parameters(data, attributes)
+
+        if not tests and parameters is None:
+            return data
+
+        shape = data.shape
+        if not data.flags.c_contiguous:
+            data = np.ascontiguousarray(data)
+        flat = data.reshape(-1)
+        size = flat.size
+
+        if parameters is None:
+            out = data
+        else:
+            scale_factor, add_offset, unpacked_dtype = parameters
+            if (
+                unpacked_dtype == data.dtype
+                and data.base is None
+                and data.flags.writeable
+            ):
+                # Unpack in-place
+                out = data
+            else:
+                out = np.empty(shape, unpacked_dtype)
+
+            self._copy = False
+
+        out_flat = out.reshape(-1)
+        in_place = out is data
+
+        totalmask = None
+        if tests:
+            totalmask = np.zeros(shape, bool)
+            mask_flat = totalmask.reshape(-1)
+            scratch = np.empty(min(size, self._block_size), bool)
+
+        # Which masking tests have found at least one value
+        found = [False] * len(tests)
+
+        for start in range(0, size, self._block_size):
+            stop = start + self._block_size
+            d = flat[start:stop]
+
+            # --------------------------------------------------------
+            # Mask the block
+            # --------------------------------------------------------
+            masked = False
+            if tests:
+                m = mask_flat[start:stop]
+                s = scratch[: d.size]
+                for i, (ufunc, value) in enumerate(tests):
+                    if value is None:
+                        ufunc(d, out=s)
+                    else:
+                        ufunc(d, value, out=s)
+
+                    if s.any():
+                        found[i] = True
+                        masked = True
+                        m |= s
+
+            if parameters is None:
+                continue
+
+            # --------------------------------------------------------
+            # Unpack the block
+            # --------------------------------------------------------
+            o = out_flat[start:stop]
+            if masked:
+                # Don't unpack masked elements, which retain their
+                # packed values
+                where = np.logical_not(m, out=s)
+                if not in_place:
+                    np.copyto(o, d, casting="unsafe", where=m)
+            else:
+                where = True
+
+            if scale_factor is None and add_offset is None:
+                if not in_place:
+                    np.copyto(o, d, casting="unsafe")
+
+                continue
+
+            x = d
+            if scale_factor is not None:
+                np.multiply(
+                    x, scale_factor, out=o, where=where, casting="unsafe"
+                )
+                x = o
+
+            if add_offset is not None:
+                np.add(x, add_offset, out=o, where=where, casting="unsafe")
+
+        data = out
+
+        # ------------------------------------------------------------
+        # Mask the data
+        # ------------------------------------------------------------
+        if any(found):
+            if any(found[:n_missing_values]):
+                fill_value = missing_values[0]
+            elif found[n_missing_values]:
+                fill_value = _FillValue
+            else:
+                fill_value = None
+
+            data = np.ma.masked_array(
+                data, mask=totalmask, fill_value=fill_value, copy=False
+            )
+            if not data.ndim:
+                # Return a scalar numpy masked constant not a 0-d
+                # masked array, so that data == np.ma.masked.
+                data = data[()]
+        elif parameters is not None and not data.ndim:
+            # Return a numpy scalar not a 0-d array, as is done when
+            # 0-d data are unpacked with `_unpack`
+            data = data[()]
+        elif mask and self.always_masked_array:
+            # Return a masked array
+            data = np.ma.masked_array(data)
+
+        return data
+
+    def _mask_values(self, dtype, attributes, dtype_unsigned_int):
+        """Return the values that define the mask.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `_mask`, `_mask_and_unpack`
+
+        :Parameter:
+
+            dtype: `numpy.dtype`
+                The data type of the variable.
+
+            attributes: `dict`
+                The variable attributes.
+
+            dtype_unsigned_int: `dtype` or `None`
+                The data type when the data have been cast to unsigned
+                integers, otherwise `None`.
+
+        :Returns:
+
+            4-`tuple`
+                The missing values, as a sequence that may be empty;
+                and the fill value, the valid minimum, and the valid
+                maximum, each of which is `None` if not applicable.
+
+        """
+        missing_values = ()
         safe_missval, missing_value = self._check_safecast(
             "missing_value", dtype, attributes
         )
         if safe_missval:
-            # --------------------------------------------------------
-            # Create mask from missing_value
-            # --------------------------------------------------------
             mval = np.array(missing_value, dtype)
             if dtype_unsigned_int is not None:
                 mval = mval.view(dtype_unsigned_int)
@@ -597,26 +1084,7 @@ class netcdf_indexer:
             if not mval.ndim:
                 mval = (mval,)
 
-            for m in mval:
-                try:
-                    mvalisnan = np.isnan(m)
-                except TypeError:
-                    # isnan fails on some dtypes
-                    mvalisnan = False
-
-                if mvalisnan:
-                    mask = np.isnan(data)
-                else:
-                    mask = data == m
-
-                if mask.any():
-                    if totalmask is None:
-                        totalmask = mask
-                    else:
-                        totalmask += mask
-
-            if totalmask is not None:
-                fill_value = mval[0]
+            missing_values = mval
 
         # Set mask=True for data == fill value
         safe_fillval, _FillValue = self._check_safecast(
@@ -624,42 +1092,14 @@ class netcdf_indexer:
         )
         if not safe_fillval:
             _FillValue = self._default_FillValue(dtype)
-            safe_fillval = True
-
-        if safe_fillval:
-            # --------------------------------------------------------
-            # Create mask from _FillValue
-            # --------------------------------------------------------
-            fval = np.array(_FillValue, dtype)
-            if dtype_unsigned_int is not None:
-                fval = fval.view(dtype_unsigned_int)
-
-            if fval.ndim == 1:
-                # _FillValue must be a scalar
-                fval = fval[0]
-
-            try:
-                fvalisnan = np.isnan(fval)
-            except Exception:
-                # isnan fails on some dtypes
-                fvalisnan = False
-
-            if fvalisnan:
-                mask = np.isnan(data)
-            else:
-                # Must use `np.asanyarray` here, to ensure that
-                # 'mask' is a never a `bool`, which would make the
-                # following 'mask.any' call fail.
-                mask = np.asanyarray(data == fval)
 
-            if mask.any():
-                if fill_value is None:
-                    fill_value = fval
+        fval = np.array(_FillValue, dtype)
+        if dtype_unsigned_int is not None:
+            fval = fval.view(dtype_unsigned_int)
 
-                if totalmask is None:
-                    totalmask = mask
-                else:
-                    totalmask += mask
+        if fval.ndim == 1:
+            # _FillValue must be a scalar
+            fval = fval[0]
 
         # Set mask=True for data outside [valid_min, valid_max]
         #
@@ -668,6 +1108,15 @@ class netcdf_indexer:
         # described in the netCDF documentation.
         validmin = None
         validmax = None
+        if dtype.kind == "S":
+            # Don't set validmin/validmax mask for character data
+            #
+            # Setting valid_min/valid_max to the _FillVaue is too
+            # surprising for many users (despite the netcdf docs
+            # attribute best practices suggesting clients should do
+            # this).
+            return missing_values, fval, validmin, validmax
+
         safe_validrange, valid_range = self._check_safecast(
             "valid_range", dtype, attributes
         )
@@ -687,65 +1136,72 @@ class netcdf_indexer:
             if safe_validmax:
                 validmax = np.array(valid_max, dtype)
 
-        if dtype_unsigned_int is not None:
-            if validmin is not None:
+        if validmin is not None:
+            if dtype_unsigned_int is not None:
                 validmin = validmin.view(dtype_unsigned_int)
 
-            if validmax is not None:
+            if validmin.ndim == 1:
+                # valid min must be a scalar
+                validmin = validmin[0]
+
+        if validmax is not None:
+            if dtype_unsigned_int is not None:
                 validmax = validmax.view(dtype_unsigned_int)
 
-        if dtype.kind != "S":
-            # --------------------------------------------------------
-            # Create mask from valid_min. valid_max, valid_range
-            # --------------------------------------------------------
-            # Don't set validmin/validmax mask for character data
-            #
-            # Setting valid_min/valid_max to the _FillVaue is too
-            # surprising for many users (despite the netcdf docs
-            # attribute best practices suggesting clients should do
-            # this).
-            if validmin is not None:
-                if validmin.ndim == 1:
-                    # valid min must be a scalar
-                    validmin = validmin[0]
+            if validmax.ndim == 1:
+                # valid max must be a scalar
+                validmax = validmax[0]
 
-                mask = data < validmin
-                if totalmask is None:
-                    totalmask = mask
-                else:
-                    totalmask += mask
+        return missing_values, fval, validmin, validmax
 
-            if validmax is not None:
-                if validmax.ndim == 1:
-                    # valid max must be a scalar
-                    validmax = validmax[0]
+    @staticmethod
+    def _isnan(value):
+        """Whether or not a value is NaN.
 
-                mask = data > validmax
-                if totalmask is None:
-                    totalmask = mask
-                else:
-                    totalmask += mask
+        .. versionadded:: (cfdm) NEXTVERSION
 
-        # ------------------------------------------------------------
-        # Mask the data
-        # ------------------------------------------------------------
-        if totalmask is not None and totalmask.any():
-            data = np.ma.masked_array(
-                data, mask=totalmask, fill_value=fill_value, copy=False
-            )
-            if not data.ndim:
-                # Return a scalar numpy masked constant not a 0-d
-                # masked array, so that data == np.ma.masked.
-                data = data[()]
-        elif np.ma.isMA(data):
-            if not (self.always_masked_array or np.ma.is_masked(data)):
-                # Return a non-masked array
-                data = np.array(data)
-        elif self.always_masked_array:
-            # Return a masked array
-            data = np.ma.masked_array(data)
+        :Parameter:
 
-        return data
+            value:
+                The value.
+
+        :Returns:
+
+            `bool`
+                True if the value is NaN, otherwise False, including
+                for values with a data type that doesn't support NaN.
+
+        """
+        try:
+            return bool(np.isnan(value))
+        except TypeError:
+            # isnan fails on some dtypes
+            return False
+
+    @classmethod
+    def _equal(cls, data, value):
+        """Find where data are equal to a value.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameter:
+
+            data: `numpy.ndarray`
+                The data.
+
+            value:
+                The value, which may be NaN.
+
+        :Returns:
+
+            `numpy.ndarray` or `bool`
+                True where the data are equal to the value.
+
+        """
+        if cls._isnan(value):
+            return np.isnan(data)
+
+        return data == value
 
     def _unpack(self, data, attributes):
         """Unpack the data.
@@ -756,6 +1212,8 @@ class netcdf_indexer:
 
         .. versionadded:: (cfdm) 1.11.2.0
 
+        .. seealso:: `_mask_and_unpack`, `_unpack_parameters`
+
         :Parameter:
 
             data: `numpy.ndarray`
@@ -769,6 +1227,48 @@ class netcdf_indexer:
             `numpy.ndarray`
                 The unpacked data.
 
+        """
+        parameters = self._unpack_parameters(data, attributes)
+        if parameters is None:
+            return data
+
+        scale_factor, add_offset, dtype = parameters
+        if scale_factor is not None:
+            if add_offset is not None:
+                data = data * scale_factor + add_offset
+            else:
+                data = data * scale_factor
+
+            self._copy = False
+        elif add_offset is not None:
+            data = data + add_offset
+            self._copy = False
+
+        return data.astype(dtype, copy=False)
+
+    def _unpack_parameters(self, data, attributes):
+        """Return the parameters that define the unpacking.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `_mask_and_unpack`, `_unpack`
+
+        :Parameter:
+
+            data: `numpy.ndarray`
+                The packed data.
+
+            attributes: `dict`
+                The variable attributes.
+
+        :Returns:
+
+            3-`tuple` or `None`
+                The scale factor and the add offset, either of which
+                is `None` if it is not to be applied, and the data
+                type of the unpacked data. `None` is returned if no
+                unpacking is to be done.
+
         """
         scale_factor = attributes.get("scale_factor")
         add_offset = attributes.get("add_offset")
@@ -786,7 +1286,7 @@ class netcdf_indexer:
                 "No unpacking done: 'scale_factor' attribute "
                 f"{scale_factor!r} can't be converted to a float"
             )  # pragma: no cover
-            return data
+            return
 
         try:
             if add_offset is not None:
@@ -801,32 +1301,77 @@ class netcdf_indexer:
                 "No unpacking done: 'add_offset' attribute "
                 f"{add_offset!r} can't be converted to a float"
             )  # pragma: no cover
-            return data
+            return
 
         if scale_factor is not None:
             if add_offset is not None:
                 # scale_factor and add_offset
                 if add_offset != 0.0 or scale_factor != 1.0:
-                    data = data * scale_factor + add_offset
-                    self._copy = False
+                    dtype = np.result_type(data, scale_factor, add_offset)
                 else:
-                    data = data.astype(np.array(scale_factor).dtype)
+                    dtype = scale_factor.dtype
+                    scale_factor = None
+                    add_offset = None
             else:
                 # scale_factor with no add_offset
                 if scale_factor != 1.0:
-                    data = data * scale_factor
-                    self._copy = False
+                    dtype = np.result_type(data, scale_factor)
                 else:
-                    data = data.astype(scale_factor.dtype)
+                    dtype = scale_factor.dtype
+                    scale_factor = None
         elif add_offset is not None:
             # add_offset with no scale_factor
             if add_offset != 0.0:
-                data = data + add_offset
-                self._copy = False
+                dtype = np.result_type(data, add_offset)
             else:
-                data = data.astype(np.array(add_offset).dtype)
+                dtype = add_offset.dtype
+                add_offset = None
+        else:
+            return
 
-        return data
+        if self._unpack_dtype is not None:
+            dtype = self._unpack_dtype
+
+        return scale_factor, add_offset, np.dtype(dtype)
+
+    @staticmethod
+    def _storage_chunks(data):
+        """Return the storage chunk sizes of a variable.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `_index_chunked`
+
+        :Parameter:
+
+            data:
+                The variable.
+
+        :Returns:
+
+            `tuple` of `int` or `None`
+                The storage chunk sizes, or `None` if the variable is
+                not chunked or its chunks are not known.
+
+        """
+        if isinstance(data, np.ndarray):
+            return None
+
+        # h5py, pyfive, zarr
+        chunks = getattr(data, "chunks", None)
+        if not chunks:
+            return None
+
+        try:
+            chunks = tuple(int(c) for c in chunks)
+        except TypeError:
+            # E.g. dask chunks
+            return None
+
+        if len(chunks) != len(data.shape) or min(chunks) < 1:
+            return None
+
+        return chunks
 
     def _size_1_axis(self):
         """Find the position of a unique size 1 index.
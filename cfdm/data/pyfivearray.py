@@ -1,4 +1,5 @@
 from .abstract import FileArray
+from .chunkcache import cached_chunks
 from .mixin import IndexMixin
 from .netcdfindexer import netcdf_indexer
 
@@ -44,6 +45,7 @@ class PyfiveArray(IndexMixin, FileArray):
 
         return attributes
 
+    @cached_chunks
     def _get_array(self, index=None):
         """Returns a subspace of the dataset variable.
 
@@ -67,35 +69,39 @@ class PyfiveArray(IndexMixin, FileArray):
         # Get the variable for subspacing
         variable = self.get_variable(None)
 
-        dataset = None
-        if variable is None:
-            # The variable has not been provided, so get it.
-            dataset, address = self.open()
-            dataset0 = dataset
-
-            groups, address = self.get_groups(address)
-            if groups:
-                dataset = self._group(dataset, groups)
-
-            variable = dataset.variables[address]
-
-            # Cache the variable
-            self._set_component("variable", variable, copy=False)
-
-        # Get the data, applying masking and scaling as required.
-        array = netcdf_indexer(
-            variable,
-            mask=self.get_mask(),
-            unpack=self.get_unpack(),
-            always_masked_array=False,
-            orthogonal_indexing=True,
-            attributes=self._attributes(variable),
-            copy=False,
-        )
-        array = array[index]
-
-        if dataset is not None:
-            self.close(dataset0)
+        dataset0 = None
+        try:
+            if variable is None:
+                # The variable has not been provided, so get it.
+                dataset, address = self.open()
+                dataset0 = dataset
+
+                groups, address = self.get_groups(address)
+                if groups:
+                    dataset = self._group(dataset, groups)
+
+                variable = dataset.variables[address]
+
+                # Cache the variable
+                self._set_component("variable", variable, copy=False)
+
+            # Get the data, applying masking and scaling as required.
+            array = netcdf_indexer(
+                variable,
+                mask=self.get_mask(),
+                unpack=self.get_unpack(),
+                unpack_dtype=self.get_unpack_dtype(),
+                always_masked_array=False,
+                orthogonal_indexing=True,
+                attributes=self._attributes(variable),
+                copy=False,
+            )
+            array = array[index]
+        finally:
+            # Close the dataset, or return it to the file handle pool,
+            # even if the data could not be read
+            if dataset0 is not None:
+                self.close(dataset0)
 
         return array
 
@@ -142,7 +148,7 @@ class PyfiveArray(IndexMixin, FileArray):
 
         """
         if self._get_component("close"):
-            dataset.close()
+            self._close(dataset)
 
     def get_groups(self, address):
         """The netCDF4 group structure of a netCDF variable.
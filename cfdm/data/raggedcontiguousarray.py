@@ -1,12 +1,11 @@
-from itertools import accumulate, product
+from itertools import accumulate
 
 import numpy as np
 
 from .abstract import RaggedArray
-from .mixin import CompressedArrayMixin
 
 
-class RaggedContiguousArray(CompressedArrayMixin, RaggedArray):
+class RaggedContiguousArray(RaggedArray):
     """An underlying contiguous ragged array.
 
     A collection of features stored using a contiguous ragged array
@@ -33,6 +32,7 @@ class RaggedContiguousArray(CompressedArrayMixin, RaggedArray):
         size=None,
         ndim=None,
         count_variable=None,
+        feature_offsets=None,
         source=None,
         copy=True,
     ):
@@ -50,6 +50,14 @@ class RaggedContiguousArray(CompressedArrayMixin, RaggedArray):
                 The count variable required to uncompress the data,
                 corresponding to a CF-netCDF count variable.
 
+            feature_offsets: `dict`, optional
+                The offsets index that locates each feature in the
+                compressed array, as returned by `feature_offsets`. If
+                not set then it is created from the count variable when it is
+                first needed.
+
+                .. versionadded:: (cfdm) NEXTVERSION
+
             {{init source: optional}}
 
                 .. versionadded:: (cfdm) 1.10.0.0
@@ -74,6 +82,7 @@ class RaggedContiguousArray(CompressedArrayMixin, RaggedArray):
             shape=shape,
             count_variable=count_variable,
             compressed_dimensions={0: (0, 1)},
+            feature_offsets=feature_offsets,
             source=source,
             copy=copy,
         )
@@ -91,7 +100,7 @@ class RaggedContiguousArray(CompressedArrayMixin, RaggedArray):
 
         :Returns:
 
-             4-`tuple` of iterators
+             5-`tuple` of iterators
                 Each iterable iterates over a particular descriptor
                 from each subarray.
 
@@ -103,7 +112,10 @@ class RaggedContiguousArray(CompressedArrayMixin, RaggedArray):
                 3. The indices of the compressed array that correspond
                    to each subarray.
 
-                4. The location of each subarray on the uncompressed
+                4. The number of elements of each feature in each
+                   subarray.
+
+                5. The location of each subarray on the uncompressed
                    dimensions.
 
         **Examples**
@@ -112,64 +124,106 @@ class RaggedContiguousArray(CompressedArrayMixin, RaggedArray):
         timeSeries features has been compressed as a contiguous ragged
         array. The features have counts of 2, 5, and 4 elements.
 
-        >>> u_indices, u_shapes, c_indices, locations = x.subarrays()
+        >>> u_indices, u_shapes, c_indices, counts, locations = (
+        ...     x.subarrays(shapes=((2, 1), (5,)))
+        ... )
         >>> for i in u_indices:
         ...    print(i)
         ...
-        (slice(0, 1, None), slice(0, 5, None))
-        (slice(1, 2, None), slice(0, 5, None))
+        (slice(0, 2, None), slice(0, 5, None))
         (slice(2, 3, None), slice(0, 5, None))
         >>> for i in u_shapes
         ...    print(i)
         ...
-        (1, 5)
-        (1, 5)
+        (2, 5)
         (1, 5)
         >>> for i in c_indices:
         ...    print(i)
         ...
-        (slice(0, 2, None),)
-        (slice(2, 7, None),)
+        (slice(0, 7, None),)
         (slice(7, 11, None),)
+        >>> for i in counts:
+        ...    print(i)
+        ...
+        [2 5]
+        [4]
         >>> for i in locations:
         ...    print(i)
         ...
         (0, 0)
         (1, 0)
-        (2, 0)
 
         """
-        d1, u_dims = self.compressed_dimensions().popitem()
+        from .utils import normalize_chunks
 
-        shapes = self.subarray_shapes(shapes)
-
-        # The indices of the uncompressed array that correspond to
-        # each subarray, the shape of each uncompressed subarray, and
-        # the location of each subarray
-        locations, u_shapes, u_indices = self._uncompressed_descriptors(
-            u_dims, shapes
+        shapes = normalize_chunks(
+            self.subarray_shapes(shapes), shape=self.shape, dtype=self.dtype
         )
 
-        # The indices of the compressed array that correspond to each
-        # subarray
+        u_dims = self.get_compressed_axes()
+
+        # The index of the compressed dimension, and the number of
+        # elements of each feature, for each group of features
         c_indices = []
-        for d, size in enumerate(self.source().shape):
-            if d == d1:
-                count = np.array(self.get_count()).tolist()
-                c = tuple(accumulate([0] + count))
-            else:
-                if d < d1:
-                    c = shapes[d]
-                else:
-                    c = shapes[d + 1]
-
-                c = tuple(accumulate((0,) + c))
-
-            c_indices.append([slice(i, j) for i, j in zip(c[:-1], c[1:])])
-
-        return (
-            product(*u_indices),
-            product(*u_shapes),
-            product(*c_indices),
-            product(*locations),
-        )
+        counts = []
+        f = tuple(accumulate((0,) + shapes[u_dims[0]]))
+        for i, j in zip(f[:-1], f[1:]):
+            c_index, count = self._feature_descriptors(i, j)
+            c_indices.append(c_index)
+            counts.append(count)
+
+        return self._subarray_descriptors(shapes, c_indices, counts)
+
+    def _create_feature_offsets(self):
+        """Create the offsets index of the features.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `feature_offsets`
+
+        :Returns:
+
+            `dict`
+                The offsets index, with key ``'offsets'`` for where
+                each feature starts in the compressed array, followed
+                by the size of the compressed array.
+
+        """
+        count = np.array(self.get_count()).astype(int, copy=False)
+        offsets = np.empty((count.size + 1,), dtype=int)
+        offsets[0] = 0
+        np.cumsum(count, out=offsets[1:])
+        return {"offsets": offsets}
+
+    def _feature_descriptors(self, start, stop):
+        """Locate a range of features in the compressed array.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `feature_offsets`, `subarrays`
+
+        :Parameters:
+
+            start: `int`
+                The position of the first feature.
+
+            stop: `int`
+                The position after the last feature.
+
+        :Returns:
+
+            2-`tuple`
+                The slice of the compressed dimension of the
+                compressed array that selects the elements of the
+                features, and the number of elements of each feature.
+
+        **Examples**
+
+        >>> r.get_count().data.array
+        array([3, 7, 5, 9])
+        >>> r._feature_descriptors(1, 3)
+        (slice(3, 15, None), array([7, 5]))
+
+        """
+        offsets = self.feature_offsets()["offsets"][start : stop + 1]
+        return slice(int(offsets[0]), int(offsets[-1])), np.diff(offsets)
@@ -1,12 +1,11 @@
-from itertools import accumulate, product
+from itertools import accumulate
 
 import numpy as np
 
 from .abstract import RaggedArray
-from .mixin import CompressedArrayMixin
 
 
-class RaggedIndexedArray(CompressedArrayMixin, RaggedArray):
+class RaggedIndexedArray(RaggedArray):
     """An underlying indexed ragged array.
 
     A collection of features stored using an indexed ragged array
@@ -34,6 +33,7 @@ class RaggedIndexedArray(CompressedArrayMixin, RaggedArray):
         size=None,
         ndim=None,
         index_variable=None,
+        feature_offsets=None,
         source=None,
         copy=True,
     ):
@@ -51,6 +51,14 @@ class RaggedIndexedArray(CompressedArrayMixin, RaggedArray):
                 The index variable required to uncompress the data,
                 corresponding to a CF-netCDF index variable.
 
+            feature_offsets: `dict`, optional
+                The offsets index that locates each feature in the
+                compressed array, as returned by `feature_offsets`. If
+                not set then it is created from the index variable when it is
+                first needed.
+
+                .. versionadded:: (cfdm) NEXTVERSION
+
             {{init source: optional}}
 
                 .. versionadded:: (cfdm) 1.10.0.0
@@ -75,6 +83,7 @@ class RaggedIndexedArray(CompressedArrayMixin, RaggedArray):
             shape=shape,
             index_variable=index_variable,
             compressed_dimensions={0: (0, 1)},
+            feature_offsets=feature_offsets,
             source=source,
             copy=copy,
         )
@@ -92,7 +101,7 @@ class RaggedIndexedArray(CompressedArrayMixin, RaggedArray):
 
         :Returns:
 
-             4-`tuple` of iterators
+             5-`tuple` of iterators
                 Each iterable iterates over a particular descriptor
                 from each subarray.
 
@@ -104,7 +113,10 @@ class RaggedIndexedArray(CompressedArrayMixin, RaggedArray):
                 3. The indices of the compressed array that correspond
                    to each subarray.
 
-                4. The location of each subarray on the uncompressed
+                4. The number of elements of each feature in each
+                   subarray.
+
+                5. The location of each subarray on the uncompressed
                    dimensions.
 
         **Examples**
@@ -115,64 +127,113 @@ class RaggedIndexedArray(CompressedArrayMixin, RaggedArray):
         elements, at compressed locations (5, 8), (1, 3, 4, 7, 10),
         and (0, 2, 6, 9) respectively.
 
-        >>> u_indices, u_shapes, c_indices, locations = x.subarrays()
+        >>> u_indices, u_shapes, c_indices, counts, locations = (
+        ...     x.subarrays(shapes=((2, 1), (5,)))
+        ... )
         >>> for i in u_indices:
         ...    print(i)
         ...
-        (slice(0, 1, None), slice(0, 5, None))
-        (slice(1, 2, None), slice(0, 5, None))
+        (slice(0, 2, None), slice(0, 5, None))
         (slice(2, 3, None), slice(0, 5, None))
         >>> for i in u_shapes
         ...    print(i)
         ...
-        (1, 12)
-        (1, 12)
-        (1, 12)
+        (2, 5)
+        (1, 5)
         >>> for i in c_indices:
         ...    print(i)
         ...
-        (array([5, 8]),)
-        (array([1, 3, 4, 7, 10]),)
+        (array([ 5,  8,  1,  3,  4,  7, 10]),)
         (array([0, 2, 6, 9]),)
+        >>> for i in counts:
+        ...    print(i)
+        ...
+        [2 5]
+        [4]
         >>> for i in locations:
         ...    print(i)
         ...
         (0, 0)
         (1, 0)
-        (2, 0)
 
         """
-        d1, u_dims = self.compressed_dimensions().popitem()
-
-        shapes = self.subarray_shapes(shapes)
+        from .utils import normalize_chunks
 
-        # The indices of the uncompressed array that correspond to
-        # each subarray, the shape of each uncompressed subarray, and
-        # the location of each subarray
-        locations, u_shapes, u_indices = self._uncompressed_descriptors(
-            u_dims, shapes
+        shapes = normalize_chunks(
+            self.subarray_shapes(shapes), shape=self.shape, dtype=self.dtype
         )
 
-        # The indices of the compressed array that correspond to each
-        # subarray
+        u_dims = self.get_compressed_axes()
+
+        # The index of the compressed dimension, and the number of
+        # elements of each feature, for each group of features
         c_indices = []
-        for d, size in enumerate(self.source().shape):
-            if d == d1:
-                index = np.array(self.get_index())
-                unique = np.unique(index).tolist()
-                c_indices.append([np.where(index == i)[0] for i in unique])
-            else:
-                if d < d1:
-                    c = shapes[d]
-                else:
-                    c = shapes[d + 1]
-
-                c = tuple(accumulate((0,) + c))
-                c_indices.append([slice(i, j) for i, j in zip(c[:-1], c[1:])])
-
-        return (
-            product(*u_indices),
-            product(*u_shapes),
-            product(*c_indices),
-            product(*locations),
-        )
+        counts = []
+        f = tuple(accumulate((0,) + shapes[u_dims[0]]))
+        for i, j in zip(f[:-1], f[1:]):
+            c_index, count = self._feature_descriptors(i, j)
+            c_indices.append(c_index)
+            counts.append(count)
+
+        return self._subarray_descriptors(shapes, c_indices, counts)
+
+    def _create_feature_offsets(self):
+        """Create the offsets index of the features.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `feature_offsets`
+
+        :Returns:
+
+            `dict`
+                The offsets index, with key ``'order'`` for the
+                permutation that sorts the compressed elements by
+                feature (retaining their original order within each
+                feature), and key ``'offsets'`` for where each feature
+                starts in the sorted elements, followed by the number
+                of elements.
+
+        """
+        n_features = self.shape[self.get_compressed_axes()[0]]
+        index = np.array(self.get_index()).astype(int, copy=False)
+        order = np.argsort(index, kind="stable")
+        offsets = np.searchsorted(index[order], np.arange(n_features + 1))
+        return {"order": order, "offsets": offsets}
+
+    def _feature_descriptors(self, start, stop):
+        """Locate a range of features in the compressed array.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `feature_offsets`, `subarrays`
+
+        :Parameters:
+
+            start: `int`
+                The position of the first feature.
+
+            stop: `int`
+                The position after the last feature.
+
+        :Returns:
+
+            2-`tuple`
+                The index of the compressed dimension of the
+                compressed array that selects the elements of the
+                features, and the number of elements of each feature.
+
+        **Examples**
+
+        >>> r.get_index().data.array
+        array([1, 0, 1, 1, 0])
+        >>> r._feature_descriptors(1, 2)
+        (array([0, 2, 3]), array([3]))
+        >>> r._feature_descriptors(0, 1)
+        (array([1, 4]), array([2]))
+
+        """
+        feature_offsets = self.feature_offsets()
+        offsets = feature_offsets["offsets"][start : stop + 1]
+        positions = feature_offsets["order"][offsets[0] : offsets[-1]]
+        return self._compressed_index(positions), np.diff(offsets)
@@ -1,12 +1,11 @@
-from itertools import accumulate, product
+from itertools import accumulate
 
 import numpy as np
 
 from .abstract import RaggedArray
-from .mixin import CompressedArrayMixin
 
 
-class RaggedIndexedContiguousArray(CompressedArrayMixin, RaggedArray):
+class RaggedIndexedContiguousArray(RaggedArray):
     """An underlying indexed contiguous ragged array.
 
     A collection of features, each of which is sequence of (vertical)
@@ -38,6 +37,7 @@ class RaggedIndexedContiguousArray(CompressedArrayMixin, RaggedArray):
         ndim=None,
         count_variable=None,
         index_variable=None,
+        feature_offsets=None,
         source=None,
         copy=True,
     ):
@@ -59,6 +59,14 @@ class RaggedIndexedContiguousArray(CompressedArrayMixin, RaggedArray):
                 The index variable required to uncompress the data,
                 corresponding to a CF-netCDF CF-netCDF index variable.
 
+            feature_offsets: `dict`, optional
+                The offsets index that locates each feature in the
+                compressed array, as returned by `feature_offsets`. If
+                not set then it is created from the count and index
+                variables when it is first needed.
+
+                .. versionadded:: (cfdm) NEXTVERSION
+
             {{init source: optional}}
 
                 .. versionadded:: (cfdm) 1.10.0.0
@@ -84,6 +92,7 @@ class RaggedIndexedContiguousArray(CompressedArrayMixin, RaggedArray):
             count_variable=count_variable,
             index_variable=index_variable,
             compressed_dimensions={0: (0, 1, 2)},
+            feature_offsets=feature_offsets,
             source=source,
             copy=copy,
         )
@@ -101,7 +110,7 @@ class RaggedIndexedContiguousArray(CompressedArrayMixin, RaggedArray):
 
         :Returns:
 
-             4-`tuple` of iterators
+             5-`tuple` of iterators
                 Each iterable iterates over a particular descriptor
                 from each subarray.
 
@@ -113,7 +122,10 @@ class RaggedIndexedContiguousArray(CompressedArrayMixin, RaggedArray):
                 3. The indices of the compressed array that correspond
                    to each subarray.
 
-                4. The location of each subarray on the uncompressed
+                4. The number of elements of each profile of each
+                   feature in each subarray.
+
+                5. The location of each subarray on the uncompressed
                    dimensions.
 
         **Examples**
@@ -126,103 +138,149 @@ class RaggedIndexedContiguousArray(CompressedArrayMixin, RaggedArray):
         feature has 1 profile with a count of 3 elements, at
         compressed locations (6, 7, 8).
 
-        >>> u_indices, u_shapes, c_indices, locations = x.subarrays()
+        >>> u_indices, u_shapes, c_indices, counts, locations = (
+        ...     x.subarrays(shapes=((1, 1), (3,), (4,)))
+        ... )
         >>> for i in u_indices:
         ...    print(i)
         ...
-        (slice(0, 1, None), slice(0, 1, None), slice(0, 4, None))
-        (slice(0, 1, None), slice(1, 2, None), slice(0, 4, None))
-        (slice(0, 1, None), slice(2, 3, None), slice(0, 4, None))
-        (slice(1, 2, None), slice(0, 1, None), slice(0, 4, None))
-        (slice(1, 2, None), slice(1, 2, None), slice(0, 4, None))
-        (slice(1, 2, None), slice(2, 3, None), slice(0, 4, None))
+        (slice(0, 1, None), slice(0, 3, None), slice(0, 4, None))
+        (slice(1, 2, None), slice(0, 3, None), slice(0, 4, None))
         >>> for i in u_shapes
         ...    print(i)
         ...
-        (1, 1, 4)
-        (1, 1, 4)
-        (1, 1, 4)
-        (1, 1, 4)
-        (1, 1, 4)
-        (1, 1, 4)
+        (1, 3, 4)
+        (1, 3, 4)
         >>> for i in c_indices:
         ...    print(i)
         ...
-        (slice(4, 6, None),)
-        (slice(0, 4, None),)
-        (slice(9, 12, None),)
+        (array([ 4,  5,  0,  1,  2,  3,  9, 10, 11]),)
         (slice(6, 9, None),)
-        (slice(0, 0, None),)
-        (slice(0, 0, None),)
+        >>> for i in counts:
+        ...    print(i)
+        ...
+        [[2 4 3]]
+        [[3 0 0]]
         >>> for i in locations:
         ...    print(i)
         ...
         (0, 0, 0)
-        (0, 1, 0)
-        (0, 2, 0)
         (1, 0, 0)
-        (1, 1, 0)
-        (1, 2, 0)
 
         """
-        d1, u_dims = self.compressed_dimensions().popitem()
+        from .utils import normalize_chunks
 
-        shapes = self.subarray_shapes(shapes)
-
-        # The indices of the uncompressed array that correspond to
-        # each subarray, the shape of each uncompressed subarray, and
-        # the location of each subarray
-        locations, u_shapes, u_indices = self._uncompressed_descriptors(
-            u_dims, shapes
+        shapes = normalize_chunks(
+            self.subarray_shapes(shapes), shape=self.shape, dtype=self.dtype
         )
 
-        # The indices of the compressed array that correspond to each
-        # subarray
+        u_dims = self.get_compressed_axes()
+
+        # The index of the compressed dimension, and the number of
+        # elements of each profile of each feature, for each group of
+        # features
         c_indices = []
-        for d, size in enumerate(self.source().shape):
-            if d == d1:
-                index = np.array(self.get_index())
-                unique = np.unique(index).tolist()
-                count_partial_sums = np.cumsum(
-                    np.array(self.get_count())
-                ).tolist()
-
-                max_n_profiles = self.shape[u_dims[1]]
-
-                ind = []
-                for i in unique:
-                    # find the locations in the count array for the profiles
-                    # in this feature.
-                    profile_locations = np.where(index == i)[0]
-
-                    for j in profile_locations:
-                        if not j:
-                            start = 0
-                        else:
-                            start = count_partial_sums[j - 1]
-
-                        ind.append(slice(start, count_partial_sums[j]))
-
-                    # Add zero-sized slices for this feature's "missing"
-                    # profiles
-                    ind.extend(
-                        (slice(0, 0),)
-                        * (max_n_profiles - profile_locations.size)
-                    )
-
-                c_indices.append(ind)
-            else:
-                if d < d1:
-                    c = shapes[d]
-                else:
-                    c = shapes[d + 1]
-
-                c = tuple(accumulate((0,) + c))
-                c_indices.append([slice(i, j) for i, j in zip(c[:-1], c[1:])])
-
-        return (
-            product(*u_indices),
-            product(*u_shapes),
-            product(*c_indices),
-            product(*locations),
+        counts = []
+        f = tuple(accumulate((0,) + shapes[u_dims[0]]))
+        for i, j in zip(f[:-1], f[1:]):
+            c_index, count = self._feature_descriptors(i, j)
+            c_indices.append(c_index)
+            counts.append(count)
+
+        return self._subarray_descriptors(shapes, c_indices, counts)
+
+    def _create_feature_offsets(self):
+        """Create the offsets index of the features.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `feature_offsets`
+
+        :Returns:
+
+            `dict`
+                The offsets index, with key ``'count'`` for the number
+                of elements in each profile, key ``'starts'`` for
+                where each profile starts in the compressed array, key
+                ``'order'`` for the permutation that sorts the
+                profiles by feature (retaining their original order
+                within each feature), and key ``'offsets'`` for where
+                each feature starts in the sorted profiles, followed
+                by the number of profiles.
+
+        """
+        count = np.array(self.get_count()).astype(int, copy=False)
+        starts = np.cumsum(count) - count
+
+        n_features = self.shape[self.get_compressed_axes()[0]]
+        index = np.array(self.get_index()).astype(int, copy=False)
+        order = np.argsort(index, kind="stable")
+        offsets = np.searchsorted(index[order], np.arange(n_features + 1))
+        return {
+            "count": count,
+            "starts": starts,
+            "order": order,
+            "offsets": offsets,
+        }
+
+    def _feature_descriptors(self, start, stop):
+        """Locate a range of features in the compressed array.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `feature_offsets`, `subarrays`
+
+        :Parameters:
+
+            start: `int`
+                The position of the first feature.
+
+            stop: `int`
+                The position after the last feature.
+
+        :Returns:
+
+            2-`tuple`
+                The index of the compressed dimension of the
+                compressed array that selects the elements of the
+                features, and the number of elements of each profile
+                of each feature.
+
+        **Examples**
+
+        >>> r.get_count().data.array
+        array([4, 2, 3, 3])
+        >>> r.get_index().data.array
+        array([0, 0, 1, 0])
+        >>> r._feature_descriptors(0, 1)
+        (array([ 0,  1,  2,  3,  4,  5,  9, 10, 11]), array([[4, 2, 3]]))
+        >>> r._feature_descriptors(1, 2)
+        (slice(6, 9, None), array([[3, 0, 0]]))
+
+        """
+        feature_offsets = self.feature_offsets()
+        count = feature_offsets["count"]
+        offsets = feature_offsets["offsets"][start : stop + 1]
+        profiles = feature_offsets["order"][offsets[0] : offsets[-1]]
+        n_profiles = np.diff(offsets)
+
+        # Profile counts, with zero counts for each feature's
+        # "missing" profiles
+        n = count[profiles]
+        counts = np.zeros(
+            (stop - start, self.shape[self.get_compressed_axes()[1]]),
+            dtype=int,
+        )
+        counts[
+            np.repeat(np.arange(stop - start), n_profiles),
+            np.arange(profiles.size)
+            - np.repeat(offsets[:-1] - offsets[0], n_profiles),
+        ] = n
+
+        # The positions in the compressed array of each element of
+        # each profile
+        ends = np.cumsum(n)
+        positions = np.arange(ends[-1] if ends.size else 0) + np.repeat(
+            feature_offsets["starts"][profiles] - (ends - n), n
         )
+        return self._compressed_index(positions), counts
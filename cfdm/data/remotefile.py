@@ -0,0 +1,1281 @@
+import hashlib
+import io
+import logging
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from tempfile import mkstemp
+from threading import RLock
+
+logger = logging.getLogger(__name__)
+
+# Disk cache config.
+CACHE_FORMAT_VERSION = 1
+
+
+def coalesce(ranges, gap=0):
+    """Coalesce byte ranges.
+
+    Overlapping byte ranges, and byte ranges that are separated by no
+    more than *gap* bytes, are merged.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    :Parameters:
+
+        ranges: sequence of 2-`tuple`
+            The byte ranges, as ``(start, stop)`` pairs, in any
+            order.
+
+        gap: `int`, optional
+            The maximum number of bytes between two ranges for them
+            to be merged. By default only overlapping and adjacent
+            ranges are merged.
+
+    :Returns:
+
+        `list` of 2-`tuple`
+            The sorted, merged byte ranges.
+
+    **Examples**
+
+    >>> coalesce([(10, 20), (0, 5), (5, 8), (18, 30)])
+    [(0, 8), (10, 30)]
+    >>> coalesce([(10, 20), (0, 5), (5, 8), (18, 30)], gap=2)
+    [(0, 30)]
+
+    """
+    out = []
+    for start, stop in sorted(ranges):
+        if stop <= start:
+            continue
+
+        if out and start <= out[-1][1] + gap:
+            if stop > out[-1][1]:
+                out[-1][1] = stop
+        else:
+            out.append([start, stop])
+
+    return [tuple(r) for r in out]
+
+
+class BlockCache:
+    """A process-wide, memory-bounded cache of remote dataset blocks.
+
+    Remote datasets that are opened as `RemoteFile` objects are read
+    in fixed-size blocks, which are stored in this cache so that
+    subsequent reads of the same bytes, from the same or any other
+    `RemoteFile` for the same dataset, don't need to access the
+    remote storage again.
+
+    Blocks are stored in least-recently-used order, and least
+    recently used blocks are evicted whenever the total size of the
+    cached blocks exceeds the maximum size of the cache, which is
+    given by `cfdm.remote_cache`.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    """
+
+    def __init__(self):
+        """**Initialisation**"""
+        self._lock = RLock()
+
+        # The cached blocks, in least-recently-used order, keyed by
+        # (dataset identifier, block number) tuples
+        self._blocks = OrderedDict()
+
+        # The total size in bytes of the cached blocks
+        self._nbytes = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._requests = 0
+        self._bytes_read = 0
+
+    def __len__(self):
+        """The number of blocks in the cache.
+
+        x.__len__() <==> len(x)
+
+        """
+        return len(self._blocks)
+
+    @property
+    def maxsize(self):
+        """The maximum total size in bytes of the cached blocks.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        from ..functions import remote_cache
+
+        return remote_cache().value
+
+    def get(self, key):
+        """Return a cached block.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            key: `tuple`
+                The block's dataset identifier and block number.
+
+        :Returns:
+
+            `bytes` or `None`
+                The block, or `None` if it is not in the cache.
+
+        """
+        with self._lock:
+            block = self._blocks.get(key)
+            if block is None:
+                self._misses += 1
+                return None
+
+            self._blocks.move_to_end(key)
+            self._hits += 1
+            return block
+
+    def put(self, key, block):
+        """Add a block to the cache.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            key: `tuple`
+                The block's dataset identifier and block number.
+
+            block: `bytes`
+                The block.
+
+        :Returns:
+
+            `None`
+
+        """
+        maxsize = self.maxsize
+        if len(block) > maxsize:
+            return
+
+        with self._lock:
+            old = self._blocks.pop(key, None)
+            if old is not None:
+                self._nbytes -= len(old)
+
+            self._blocks[key] = block
+            self._nbytes += len(block)
+            self._trim(maxsize)
+
+    def record(self, requests, nbytes):
+        """Record reads from remote storage.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            requests: `int`
+                The number of byte range requests.
+
+            nbytes: `int`
+                The total number of bytes read.
+
+        :Returns:
+
+            `None`
+
+        """
+        with self._lock:
+            self._requests += requests
+            self._bytes_read += nbytes
+
+    def discard(self):
+        """Remove all cached blocks.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Returns:
+
+            `None`
+
+        """
+        with self._lock:
+            self._blocks.clear()
+            self._nbytes = 0
+
+    def statistics(self, reset=False):
+        """Return the cache statistics.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            reset: `bool`, optional
+                If True then reset the counters to zero after they
+                have been returned.
+
+        :Returns:
+
+            `dict`
+                The number of hits, misses and evictions, the number
+                and total size of the cached blocks, the maximum size
+                of the cache, and the number of requests to, and
+                bytes read from, remote storage.
+
+        """
+        with self._lock:
+            out = {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "blocks": len(self._blocks),
+                "size": self._nbytes,
+                "maxsize": self.maxsize,
+                "requests": self._requests,
+                "bytes_read": self._bytes_read,
+            }
+            if reset:
+                self._hits = 0
+                self._misses = 0
+                self._evictions = 0
+                self._requests = 0
+                self._bytes_read = 0
+
+        return out
+
+    def _trim(self, maxsize):
+        """Evict least recently used blocks beyond a maximum size.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            maxsize: `int`
+                The maximum total size in bytes of the blocks to
+                retain.
+
+        :Returns:
+
+            `None`
+
+        """
+        with self._lock:
+            while self._blocks and self._nbytes > max(maxsize, 0):
+                _, block = self._blocks.popitem(last=False)
+                self._nbytes -= len(block)
+                self._evictions += 1
+
+
+block_cache = BlockCache()
+
+
+class DiskBlockCache:
+    """A persistent, size-bounded on-disk cache of remote blocks.
+
+    Blocks read from remote datasets are also stored in cache files,
+    so that subsequent reads of the same bytes, from any process,
+    don't need to access the remote storage again. This allows the
+    repeated reading of the same remote datasets by many jobs to run
+    at local disk speed.
+
+    A cache file is identified by the file system protocol, path,
+    size and version (i.e. the ETag or modification time) of its
+    remote dataset, and by the block size and block number. A
+    modified remote dataset therefore never matches an existing cache
+    file, and any stale cache files are eventually evicted. Blocks of
+    datasets whose version is not reported by their file system are
+    not stored.
+
+    The cache files are stored in the directory given by
+    `cfdm.remote_disk_cache_directory`. Whenever a new cache file is
+    created, the least recently used cache files are deleted until
+    the total size of all cache files is no greater than the maximum
+    size given by `cfdm.remote_disk_cache`. A maximum size of zero
+    disables the cache.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    """
+
+    def __init__(self):
+        """**Initialisation**"""
+        self._lock = RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        # The total size in bytes of the cache files, or `None` if
+        # it is not known
+        self._nbytes = None
+
+    @property
+    def directory(self):
+        """The directory in which the cache files are stored.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        from ..functions import remote_disk_cache_directory
+
+        return remote_disk_cache_directory().value
+
+    @property
+    def maxsize(self):
+        """The maximum total size in bytes of the cache files.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        from ..functions import remote_disk_cache
+
+        return remote_disk_cache().value
+
+    def _path(self, key):
+        """Return the path of the cache file for a key.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            key: `tuple`
+                The block's dataset identifier and block number.
+
+        :Returns:
+
+            `str`
+                The path of the cache file.
+
+        """
+        key = repr((CACHE_FORMAT_VERSION, key)).encode()
+        return os.path.join(
+            self.directory, f"{hashlib.sha256(key).hexdigest()}.block"
+        )
+
+    def get(self, key):
+        """Return a cached block.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            key: `tuple`
+                The block's dataset identifier and block number.
+
+        :Returns:
+
+            `bytes` or `None`
+                The block, or `None` if it is not in the cache.
+
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                block = f.read()
+        except OSError:
+            with self._lock:
+                self._misses += 1
+
+            return
+
+        try:
+            # Mark the cache file as recently used
+            os.utime(path)
+        except OSError:
+            pass
+
+        with self._lock:
+            self._hits += 1
+
+        return block
+
+    def put(self, key, block):
+        """Store a block in the cache.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            key: `tuple`
+                The block's dataset identifier and block number.
+
+            block: `bytes`
+                The block.
+
+        :Returns:
+
+            `bool`
+                Whether or not the block was stored.
+
+        """
+        maxsize = self.maxsize
+        if len(block) > maxsize:
+            return False
+
+        directory = self.directory
+        path = self._path(key)
+        try:
+            os.makedirs(directory, exist_ok=True)
+
+            # Write to a temporary file, and then rename it, so that
+            # concurrent readers never see a partial cache file
+            fd, tmp = mkstemp(suffix=".tmp", dir=directory)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(block)
+
+                os.replace(tmp, path)
+            except BaseException:
+                os.remove(tmp)
+                raise
+        except OSError as error:
+            logger.info(
+                f"Can't store remote block in disk cache: {error}"
+            )  # pragma: no cover
+            return False
+
+        with self._lock:
+            if self._nbytes is not None:
+                self._nbytes += len(block)
+
+            if self._nbytes is None or self._nbytes > maxsize:
+                self._trim(maxsize, keep=path)
+
+        return True
+
+    def clear(self):
+        """Delete all of the cache files.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Returns:
+
+            `None`
+
+        """
+        self._trim(0)
+
+    def statistics(self, reset=False):
+        """Return the cache statistics.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            reset: `bool`, optional
+                If True then reset the counters to zero after they
+                have been returned.
+
+        :Returns:
+
+            `dict`
+                The number of hits, misses and evictions, the number
+                and total size of the cache files, the maximum size
+                of the cache, and the cache directory.
+
+        """
+        files = self._files()
+        with self._lock:
+            out = {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "files": len(files),
+                "size": sum(size for _, size, _ in files),
+                "maxsize": self.maxsize,
+                "directory": self.directory,
+            }
+            if reset:
+                self._hits = 0
+                self._misses = 0
+                self._evictions = 0
+
+        return out
+
+    def _files(self):
+        """Return the cache files in least-recently-used order.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Returns:
+
+            `list`
+                Each element is a (path, size, modification time)
+                3-tuple.
+
+        """
+        files = []
+        try:
+            entries = os.scandir(self.directory)
+        except OSError:
+            return files
+
+        with entries:
+            for entry in entries:
+                if not entry.name.endswith(".block"):
+                    continue
+
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+
+                files.append((entry.path, st.st_size, st.st_mtime_ns))
+
+        files.sort(key=lambda x: x[2])
+        return files
+
+    def _trim(self, maxsize, keep=None):
+        """Delete least recently used cache files beyond a maximum.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            maxsize: `int`
+                The maximum total size in bytes of the cache files to
+                retain.
+
+            keep: `str`, optional
+                The path of a cache file that is not to be deleted.
+
+        :Returns:
+
+            `None`
+
+        """
+        with self._lock:
+            # Rescan the directory, since other processes may share
+            # the cache
+            files = self._files()
+            size = sum(size for _, size, _ in files)
+            for path, file_size, _ in files:
+                if size <= maxsize:
+                    break
+
+                if path == keep:
+                    continue
+
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+
+                size -= file_size
+                self._evictions += 1
+
+            self._nbytes = size
+
+
+disk_cache = DiskBlockCache()
+
+
+def remote_cache_enabled():
+    """Whether or not remote datasets are read via the block caches.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    .. seealso:: `cfdm.remote_cache`, `cfdm.remote_disk_cache`
+
+    :Returns:
+
+        `bool`
+            True if either the in-memory or the on-disk cache of
+            remote blocks is enabled.
+
+    """
+    return block_cache.maxsize > 0 or disk_cache.maxsize > 0
+
+
+class RemoteFile(io.RawIOBase):
+    """A read-only file-like object for a remote dataset.
+
+    The dataset is read from its file system in fixed-size blocks,
+    which are stored in the process-wide block cache (see
+    `cfdm.remote_cache`) and in the persistent on-disk block cache
+    (see `cfdm.remote_disk_cache`). A read of bytes that are not cached fetches
+    all of the missing blocks that contain them, plus a number of
+    following blocks as read-ahead, with one request for each run of
+    consecutive missing blocks. The requests are issued concurrently.
+
+    When the byte ranges that will be read are known in advance (for
+    instance, the storage chunks needed for a dask chunk), they may
+    be fetched with a single call to `prefetch` or `cat_ranges`. The
+    `cat_ranges` method has the same API as that of an `fsspec` file
+    system, and `fs` returns the `RemoteFile` itself, so that
+    libraries which read chunks in bulk with ``fh.fs.cat_ranges``
+    (such as `pyfive`) are also served from the block cache.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    **Examples**
+
+    >>> fs = fsspec.filesystem('s3', anon=True)
+    >>> fh = RemoteFile(fs, 'bucket/file.nc')
+    >>> nc = h5netcdf.File(fh, 'r')
+
+    """
+
+    #: The default block size in bytes
+    blocksize = 2**20
+
+    #: The default number of blocks to read ahead
+    readahead = 1
+
+    #: The maximum number of concurrent requests for file systems
+    #: that don't natively issue concurrent requests
+    max_workers = 8
+
+    def __init__(self, fs, path, blocksize=None, readahead=None):
+        """**Initialisation**
+
+        :Parameters:
+
+            fs: `fsspec.AbstractFileSystem`
+                The file system.
+
+            path: `str`
+                The path of the dataset on the file system.
+
+            blocksize: `int`, optional
+                The block size in bytes. By default the `blocksize`
+                class attribute is used.
+
+            readahead: `int`, optional
+                The number of blocks following a read that are also
+                fetched, if not already cached. By default the
+                `readahead` class attribute is used.
+
+        """
+        super().__init__()
+        self._fs = fs
+        self.path = path
+        if blocksize is not None:
+            self.blocksize = int(blocksize)
+
+        if readahead is not None:
+            self.readahead = int(readahead)
+
+        info = fs.info(path)
+        self.size = int(info["size"])
+        self._pos = 0
+
+        # Identify the dataset in the block cache by its file system,
+        # path, size, (if available) version, and block size, so that
+        # blocks are not reused after the dataset has changed.
+        version = None
+        for name in ("ETag", "etag", "mtime", "LastModified", "created"):
+            version = info.get(name)
+            if version is not None:
+                break
+
+        # Note that the file system is identified by its class and
+        # storage options, rather than by `fsspec`'s own instance
+        # token, which differs between threads.
+        from dask.base import tokenize
+
+        fs_id = tokenize(
+            type(fs).__module__,
+            type(fs).__qualname__,
+            getattr(fs, "storage_options", None),
+        )
+        self._id = (fs_id, path, self.size, str(version), self.blocksize)
+
+        # Identify the dataset in the disk cache, which may be shared
+        # between processes with different storage options (such as
+        # credentials), by its protocol and its stripped path
+        # instead. Blocks of datasets with no version are not stored
+        # on disk.
+        self._disk_id = None
+        if version is not None:
+            protocol = fs.protocol
+            if isinstance(protocol, (tuple, list)):
+                protocol = protocol[0]
+
+            self._disk_id = (
+                protocol,
+                fs._strip_protocol(path),
+                self.size,
+                str(version),
+                self.blocksize,
+            )
+
+    def __repr__(self):
+        """Called by the `repr` built-in function.
+
+        x.__repr__() <==> repr(x)
+
+        """
+        return f"<{self.__class__.__name__}: {self.path}>"
+
+    @property
+    def fs(self):
+        """The file system interface for bulk reads.
+
+        This is the `RemoteFile` itself, which provides the
+        `cat_ranges` method.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        return self
+
+    @staticmethod
+    def is_remote(fs):
+        """Whether or not a file system may be read via the cache.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            fs:
+                The file system.
+
+        :Returns:
+
+            `bool`
+                True if *fs* is a non-local `fsspec` file system,
+                otherwise False.
+
+        """
+        from fsspec import AbstractFileSystem
+        from fsspec.implementations.local import LocalFileSystem
+
+        return isinstance(fs, AbstractFileSystem) and not isinstance(
+            fs, LocalFileSystem
+        )
+
+    def cat_ranges(self, paths, starts, ends, **kwargs):
+        """Return byte ranges of the dataset.
+
+        All of the missing blocks are fetched with one concurrent
+        batch of coalesced requests, before any of the byte ranges
+        are returned.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            paths: `str` or sequence of `str`
+                The dataset path for each byte range, all of which
+                must be the path of this file.
+
+            starts, ends: sequence of `int`
+                The start and end of each byte range.
+
+            kwargs: optional
+                Other `fsspec` ``cat_ranges`` parameters, which are
+                ignored.
+
+        :Returns:
+
+            `list` of `bytes`
+                The contents of each byte range.
+
+        """
+        if isinstance(paths, str):
+            paths = [paths] * len(starts)
+
+        for path in set(paths):
+            if path != self.path:
+                raise ValueError(
+                    f"Can't read {path!r} from {self!r}: Different path"
+                )
+
+        ranges = list(zip(starts, ends))
+        blocks = self.prefetch(ranges)
+        return [self._read(start, end, blocks) for start, end in ranges]
+
+    def prefetch(self, ranges):
+        """Fetch the blocks that contain the given byte ranges.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            ranges: sequence of 2-`tuple`
+                The byte ranges, as ``(start, stop)`` pairs.
+
+        :Returns:
+
+            `dict`
+                The blocks that contain the byte ranges, keyed by
+                their block numbers.
+
+        """
+        blocksize = self.blocksize
+        numbers = set()
+        for start, stop in coalesce(ranges):
+            stop = min(stop, self.size)
+            if start < stop:
+                numbers.update(
+                    range(start // blocksize, (stop - 1) // blocksize + 1)
+                )
+
+        return self._blocks(sorted(numbers))
+
+    def readable(self):
+        """Whether or not the file can be read.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        return True
+
+    def readinto(self, b):
+        """Read bytes into a pre-allocated, writable buffer.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            b: writable bytes-like object
+                The buffer.
+
+        :Returns:
+
+            `int`
+                The number of bytes read.
+
+        """
+        start = self._pos
+        stop = min(start + len(b), self.size)
+        if stop <= start:
+            return 0
+
+        blocksize = self.blocksize
+        first = start // blocksize
+        last = (stop - 1) // blocksize
+        numbers = list(range(first, last + 1))
+
+        # Read ahead, unless beyond the end of the file
+        n_blocks = (self.size - 1) // blocksize + 1
+        numbers.extend(
+            range(last + 1, min(last + 1 + self.readahead, n_blocks))
+        )
+
+        data = self._read(start, stop, self._blocks(numbers))
+        n = len(data)
+        memoryview(b).cast("B")[:n] = data
+        self._pos = start + n
+        return n
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        """Change the stream position.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            offset: `int`
+                The offset in bytes.
+
+            whence: `int`, optional
+                The position that the offset is relative to: the
+                start of the file (`io.SEEK_SET`), the current
+                position (`io.SEEK_CUR`), or the end of the file
+                (`io.SEEK_END`).
+
+        :Returns:
+
+            `int`
+                The new absolute position.
+
+        """
+        match whence:
+            case io.SEEK_SET:
+                pos = offset
+            case io.SEEK_CUR:
+                pos = self._pos + offset
+            case io.SEEK_END:
+                pos = self.size + offset
+            case _:
+                raise ValueError(f"Invalid whence: {whence!r}")
+
+        if pos < 0:
+            raise ValueError(f"Negative seek position: {pos}")
+
+        self._pos = pos
+        return pos
+
+    def seekable(self):
+        """Whether or not the file supports random access.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        return True
+
+    def tell(self):
+        """Return the current stream position.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        return self._pos
+
+    def _blocks(self, numbers):
+        """Return blocks, fetching any that are not cached.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            numbers: sequence of `int`
+                The sorted block numbers.
+
+        :Returns:
+
+            `dict`
+                The blocks, keyed by their block numbers.
+
+        """
+        _id = self._id
+        disk_id = self._disk_id
+        if disk_id is not None and disk_cache.maxsize <= 0:
+            disk_id = None
+
+        memory = block_cache.maxsize > 0
+
+        blocks = {}
+        missing = []
+        for n in numbers:
+            block = block_cache.get((_id, n)) if memory else None
+            if block is None and disk_id is not None:
+                block = disk_cache.get((disk_id, n))
+                if block is not None and memory:
+                    block_cache.put((_id, n), block)
+
+            if block is None:
+                missing.append(n)
+            else:
+                blocks[n] = block
+
+        if missing:
+            blocks.update(self._fetch(missing))
+
+        return blocks
+
+    def _fetch(self, numbers):
+        """Fetch blocks from the file system.
+
+        Consecutive blocks are fetched with a single request, and
+        the requests are issued concurrently.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            numbers: sequence of `int`
+                The sorted block numbers.
+
+        :Returns:
+
+            `dict`
+                The blocks, keyed by their block numbers.
+
+        """
+        blocksize = self.blocksize
+        size = self.size
+        ranges = coalesce(
+            [(n * blocksize, min((n + 1) * blocksize, size)) for n in numbers]
+        )
+
+        fs = self._fs
+        path = self.path
+        starts = [start for start, _ in ranges]
+        ends = [end for _, end in ranges]
+
+        from fsspec.asyn import AsyncFileSystem
+
+        if isinstance(fs, AsyncFileSystem) or len(ranges) == 1:
+            # Asynchronous file systems issue concurrent requests
+            buffers = fs.cat_ranges([path] * len(ranges), starts, ends)
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(ranges))
+            ) as executor:
+                buffers = list(
+                    executor.map(
+                        lambda r: fs.cat_file(path, start=r[0], end=r[1]),
+                        ranges,
+                    )
+                )
+
+        block_cache.record(len(ranges), sum(len(b) for b in buffers))
+
+        _id = self._id
+        disk_id = self._disk_id
+        if disk_id is not None and disk_cache.maxsize <= 0:
+            disk_id = None
+
+        blocks = {}
+        for start, buffer in zip(starts, buffers):
+            if isinstance(buffer, Exception):
+                raise buffer
+
+            for offset in range(0, len(buffer), blocksize):
+                n = (start + offset) // blocksize
+                block = bytes(buffer[offset : offset + blocksize])
+                blocks[n] = block
+                block_cache.put((_id, n), block)
+                if disk_id is not None:
+                    disk_cache.put((disk_id, n), block)
+
+        return blocks
+
+    def _read(self, start, stop, blocks):
+        """Return a byte range from blocks.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            start, stop: `int`
+                The byte range.
+
+            blocks: `dict`
+                The blocks that contain the byte range, keyed by
+                their block numbers.
+
+        :Returns:
+
+            `bytes`
+                The contents of the byte range.
+
+        """
+        stop = min(stop, self.size)
+        if stop <= start:
+            return b""
+
+        blocksize = self.blocksize
+        first = start // blocksize
+        last = (stop - 1) // blocksize
+        offset = start - first * blocksize
+        if first == last:
+            return blocks[first][offset : offset + stop - start]
+
+        data = b"".join([blocks[n] for n in range(first, last + 1)])
+        return data[offset : offset + stop - start]
+
+
+class RemoteFileSystem:
+    """A read-only file system that reads via the remote block caches.
+
+    Provides the byte range reading methods of an `fsspec` file
+    system, for which all reads of a remote file are made via a
+    `RemoteFile` for that file, and so via the in-memory and on-disk
+    remote block caches. This allows reads that are made by a file
+    system, rather than through a file-like object (for instance, the
+    reads of the referenced byte ranges of a Kerchunk dataset), to
+    also be served from the caches.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    """
+
+    def __init__(self, fs):
+        """**Initialisation**
+
+        :Parameters:
+
+            fs: `fsspec.AbstractFileSystem`
+                The remote file system.
+
+        """
+        self.fs = fs
+        self._files = {}
+        self._lock = RLock()
+
+    def __getattr__(self, attr):
+        """Delegate other attributes to the remote file system.
+
+        x.__getattr__(attr) <==> x.attr
+
+        """
+        return getattr(self.fs, attr)
+
+    def cat_file(self, path, start=None, end=None, **kwargs):
+        """Return a byte range of a file.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            path: `str`
+                The path of the file.
+
+            start, end: `int` or `None`, optional
+                The start and end of the byte range. Negative values
+                are relative to the end of the file, and `None` means
+                the start or end of the file respectively.
+
+            kwargs: optional
+                Other `fsspec` ``cat_file`` parameters, which are
+                ignored.
+
+        :Returns:
+
+            `bytes`
+                The contents of the byte range.
+
+        """
+        return self.cat_ranges([path], [start], [end], on_error="raise")[0]
+
+    def cat_ranges(
+        self, paths, starts, ends, max_gap=None, on_error="return", **kwargs
+    ):
+        """Return byte ranges of files.
+
+        The blocks needed for all of the byte ranges of each file are
+        fetched with one concurrent batch of coalesced requests.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            paths: `str` or sequence of `str`
+                The file path for each byte range.
+
+            starts, ends: `int` or `None`, or sequence of these
+                The start and end of each byte range, as for
+                `cat_file`.
+
+            max_gap: optional
+                Ignored.
+
+            on_error: `str`, optional
+                If ``'raise'`` then raise any exception. Otherwise
+                return exceptions in place of the failed byte ranges.
+
+            kwargs: optional
+                Other `fsspec` ``cat_ranges`` parameters, which are
+                ignored.
+
+        :Returns:
+
+            `list`
+                The contents of each byte range.
+
+        """
+        if isinstance(paths, str):
+            paths = [paths]
+
+        n = len(paths)
+        if not isinstance(starts, (list, tuple)):
+            starts = [starts] * n
+
+        if not isinstance(ends, (list, tuple)):
+            ends = [ends] * n
+
+        # Group the byte ranges by file
+        ranges = {}
+        for i, (path, start, end) in enumerate(zip(paths, starts, ends)):
+            ranges.setdefault(path, []).append((i, start, end))
+
+        out = [None] * n
+        for path, path_ranges in ranges.items():
+            try:
+                fh = self._file(path)
+                size = fh.size
+                normalised = []
+                for i, start, end in path_ranges:
+                    start = 0 if start is None else start
+                    end = size if end is None else end
+                    if start < 0:
+                        start = max(size + start, 0)
+
+                    if end < 0:
+                        end = max(size + end, 0)
+
+                    normalised.append((i, start, min(end, size)))
+
+                blocks = fh.prefetch([(s, e) for _, s, e in normalised])
+                for i, start, end in normalised:
+                    out[i] = fh._read(start, end, blocks)
+            except Exception as error:
+                if on_error == "raise":
+                    raise
+
+                for i, _, _ in path_ranges:
+                    out[i] = error
+
+        return out
+
+    def _file(self, path):
+        """Return the `RemoteFile` for a path.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            path: `str`
+                The path of the file.
+
+        :Returns:
+
+            `RemoteFile`
+
+        """
+        with self._lock:
+            fh = self._files.get(path)
+            if fh is None:
+                fh = RemoteFile(self.fs, path)
+                self._files[path] = fh
+
+        return fh
+
+
+def cached_mapper(mapper):
+    """Return a Kerchunk mapper that reads via the remote block caches.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    :Parameters:
+
+        mapper:
+            The dataset. If it is a Kerchunk mapper (i.e. an `fsspec`
+            mapper on a reference file system) then a new mapper is
+            returned for which the referenced byte ranges of remote
+            files are read via `RemoteFileSystem` objects. The
+            original mapper is not changed. Anything else is returned
+            unchanged.
+
+    :Returns:
+
+            The new Kerchunk mapper, or the unchanged *mapper*.
+
+    """
+    from copy import copy
+
+    fs = getattr(mapper, "fs", None)
+    fss = getattr(fs, "fss", None)
+    if not isinstance(fss, dict) or getattr(fs, "asynchronous", False):
+        return mapper
+
+    from fsspec.implementations.asyn_wrapper import AsyncFileSystemWrapper
+    from fsspec.mapping import FSMap
+
+    new_fss = {}
+    for protocol, remote_fs in fss.items():
+        target = getattr(remote_fs, "sync_fs", remote_fs)
+        if RemoteFile.is_remote(target):
+            remote_fs = AsyncFileSystemWrapper(
+                RemoteFileSystem(target), asynchronous=False
+            )
+
+        new_fss[protocol] = remote_fs
+
+    if new_fss.keys() == fss.keys() and all(new_fss[k] is fss[k] for k in fss):
+        # No remote files
+        return mapper
+
+    # Zarr re-creates a synchronous reference file system from its
+    # JSON specification (which would lose the new remote file
+    # systems), so the new mapper is given an asynchronous one.
+    fs = copy(fs)
+    fs.fss = new_fss
+    fs.asynchronous = True
+    return FSMap(mapper.root, fs)
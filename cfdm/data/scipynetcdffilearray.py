@@ -1,4 +1,5 @@
 from .abstract import FileArray
+from .chunkcache import cached_chunks
 from .mixin import IndexMixin
 from .netcdfindexer import netcdf_indexer
 
@@ -44,6 +45,7 @@ class ScipyNetcdfFileArray(IndexMixin, FileArray):
 
         return attributes
 
+    @cached_chunks
     def _get_array(self, index=None):
         """Returns a subspace of the dataset variable.
 
@@ -65,33 +67,37 @@ class ScipyNetcdfFileArray(IndexMixin, FileArray):
             index = self.index()
 
         dataset, address = self.open()
-        variable = dataset.variables[address]
-
-        # Get the data, applying masking and scaling as required.
-        array = netcdf_indexer(
-            variable,
-            mask=self.get_mask(),
-            unpack=self.get_unpack(),
-            always_masked_array=False,
-            orthogonal_indexing=True,
-            attributes=self._attributes(variable),
-            copy=False,
-        )
-        array = array[index]
-
-        # Close the dataset.
-        #
-        # Before 'dataset' can be closed we must:
-        #
-        # 1. Replace 'array' (which is currently a memory map view of
-        #    the data on disk) with a copy of itself.
-        # 2. Delete references to 'variable'.
-        #
-        # These actions are necessary to allow the file to be closed.
-        # See the docs for `scipy.io.netcdf_file` for details.
-        array = array.copy()
-        del variable
-        self.close(dataset)
+        try:
+            variable = dataset.variables[address]
+
+            # Get the data, applying masking and scaling as required.
+            array = netcdf_indexer(
+                variable,
+                mask=self.get_mask(),
+                unpack=self.get_unpack(),
+                unpack_dtype=self.get_unpack_dtype(),
+                always_masked_array=False,
+                orthogonal_indexing=True,
+                attributes=self._attributes(variable),
+                copy=False,
+            )
+            array = array[index]
+
+            # Before 'dataset' can be closed we must:
+            #
+            # 1. Replace 'array' (which is currently a memory map view
+            #    of the data on disk) with a copy of itself.
+            # 2. Delete references to 'variable'.
+            #
+            # These actions are necessary to allow the file to be
+            # closed. See the docs for `scipy.io.netcdf_file` for
+            # details.
+            array = array.copy()
+            del variable
+        finally:
+            # Close the dataset, or return it to the file handle pool,
+            # even if the data could not be read
+            self.close(dataset)
 
         return array
 
@@ -111,7 +117,7 @@ class ScipyNetcdfFileArray(IndexMixin, FileArray):
 
         """
         if self._get_component("close"):
-            dataset.close()
+            self._close(dataset)
 
     def open(self, **kwargs):
         """Return a dataset file object and address.
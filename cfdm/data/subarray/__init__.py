@@ -14,3 +14,4 @@ from .quadraticlatitudelongitudesubarray import (
 )
 from .quadraticsubarray import QuadraticSubarray
 from .raggedsubarray import RaggedSubarray
+from .subsampledsubareassubarray import SubsampledSubareasSubarray
@@ -4,7 +4,8 @@ import numpy as np
 class PointTopology:
     """Mixin class for point topology array compressed by UGRID.
 
-    Subclasses must also inherit from `MeshSubarray`.
+    Subclasses must also inherit from `MeshSubarray`, and must define
+    a `_node_links` method.
 
     .. versionadded:: (cfdm) 1.11.0.0
 
@@ -20,11 +21,8 @@ class PointTopology:
         """
         from math import isnan
 
-        from scipy.sparse import csr_array
-
         from cfdm.functions import integer_dtype
 
-        start_index = self.start_index
         node_connectivity = self._select_data(check_mask=True)
 
         # ------------------------------------------------------------
@@ -49,53 +47,57 @@ class PointTopology:
         #       [4 6]]
         # ------------------------------------------------------------
 
-        masked = np.ma.isMA(node_connectivity)
-
-        largest_node_id = node_connectivity.max()
-        if not start_index:
-            # Add 1 to remove all zeros (0 is the fill value in the
-            # sparse array), first making sure that the datatpe can
-            # handle it.
-            if largest_node_id == np.iinfo(node_connectivity.dtype).max:
-                node_connectivity = node_connectivity.astype(int, copy=False)
-
-            node_connectivity = node_connectivity + 1
-            largest_node_id = largest_node_id + 1
-
-        p = 0
-        pointers = [0]
-        cols = []
-        u = []
-
-        pointers_append = pointers.append
-        cols_extend = cols.extend
-        u_extend = u.extend
-
-        unique_nodes = np.unique(node_connectivity)
-        if masked:
-            # Remove the missing value from unique nodes
-            unique_nodes = unique_nodes[:-1]
-
-        unique_nodes = unique_nodes.tolist()
-
-        # WARNING (TODO): This loop is a potential performance bottleneck.
-        for node in unique_nodes:
-            # Find the collection of all nodes that are joined to this
-            # node via links in the mesh, including this node itself
-            # (which will be at the start of the list).
-            nodes = self._connected_nodes(node, node_connectivity, masked)
-
-            n_nodes = len(nodes)
-            p += n_nodes
-            pointers_append(p)
-            cols_extend(range(n_nodes))
-            u_extend(nodes)
-
-        del unique_nodes
-
-        u = np.array(u, dtype=integer_dtype(largest_node_id))
-        u = csr_array((u, cols, pointers))
-        u = u.toarray()
+        # The unique nodes, each of which defines a row of the
+        # uncompressed array
+        unique_nodes = self._sorted_unique(np.ma.compressed(node_connectivity))
+        n_nodes = unique_nodes.size
+
+        # Find every pair of nodes that are joined by a link in the
+        # mesh, as positions in 'unique_nodes'
+        node0, node1 = self._node_links(node_connectivity)
+        node0 = np.searchsorted(unique_nodes, node0)
+        node1 = np.searchsorted(unique_nodes, node1)
+
+        # Build the node-node adjacency matrix in sparse row form,
+        # with the links in both directions, by encoding each link as
+        # a single integer so that one sort removes the duplicate
+        # links and orders the links by row and then by column
+        links = np.concatenate(
+            (
+                node0.astype(int, copy=False) * n_nodes + node1,
+                node1.astype(int, copy=False) * n_nodes + node0,
+            )
+        )
+        del node0, node1
+
+        links = self._sorted_unique(links)
+        rows, cols = np.divmod(links, n_nodes)
+        del links
+
+        # Remove any links from a node to itself
+        keep = rows != cols
+        if not keep.all():
+            rows = rows[keep]
+            cols = cols[keep]
+
+        del keep
+
+        # Emit the rows: each node, followed by the nodes that are
+        # joined to it
+        n_links = np.bincount(rows, minlength=n_nodes)
+        u = np.ma.masked_all(
+            (n_nodes, int(n_links.max(initial=0)) + 1),
+            dtype=integer_dtype(unique_nodes.max(initial=0)),
+        )
+        u[:, 0] = unique_nodes
+        u[
+            rows,
+            np.arange(1, rows.size + 1)
+            - np.repeat(np.cumsum(n_links) - n_links, n_links),
+        ] = unique_nodes[cols]
+
+        del rows, cols, n_links, unique_nodes
+
         if any(map(isnan, self.shape)):
             # Store the shape, now that is it known.
             self._set_component("shape", u.shape, copy=False)
@@ -103,9 +105,6 @@ class PointTopology:
         if indices is not Ellipsis:
             u = u[indices]
 
-        # Mask all zeros
-        u = np.ma.where(u == 0, np.ma.masked, u)
-
         # ------------------------------------------------------------
         # E.g. For either of the face and edge examples above, 'u'
         #      would now be:
@@ -119,9 +118,53 @@ class PointTopology:
         #       [7 2 4 -- --]]
         #
         # ------------------------------------------------------------
+        return u
 
-        if not start_index:
-            # Subtract 1 to get back to zero-based node identities
-            u -= 1
+    @staticmethod
+    def _sorted_unique(a):
+        """Return the sorted unique elements of a 1-d array.
 
-        return u
+        Equivalent to `numpy.unique`, but always sorts, which is
+        faster than hashing for the large arrays of node identifiers
+        found in meshes.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            a: `numpy.ndarray`
+                The 1-d array.
+
+        :Returns:
+
+            `numpy.ndarray`
+                The sorted unique elements.
+
+        """
+        a = np.sort(a)
+        if a.size:
+            a = a[np.concatenate(([True], a[1:] != a[:-1]))]
+
+        return a
+
+    @staticmethod
+    def _node_links(node_connectivity):
+        """Return the pairs of nodes that are joined by mesh links.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            node_connectivity: `numpy.ndarray`
+                A UGRID connectivity array.
+
+        :Returns:
+
+            2-`tuple` of `numpy.ndarray`
+                The first and second nodes of each link. A link may
+                appear more than once, in either direction.
+
+        """
+        raise NotImplementedError(
+            "Must implement _node_links"
+        )  # pragma: no cover
@@ -10,6 +10,12 @@ class QuadraticGeographicInterpolation(QuadraticInterpolation):
 
     See CF appendix J "Coordinate Interpolation Methods".
 
+    A three-dimensional cartesian vector is stored in a single
+    `numpy.ndarray` that has the x, y and z components along its
+    leading dimension, so that each vector operation is carried out
+    on all components at once. Scalar arrays, such as interpolation
+    coefficients and parameters, broadcast against vectors.
+
     .. versionadded:: (cfdm) 1.10.0.0
 
     """
@@ -36,9 +42,9 @@ class QuadraticGeographicInterpolation(QuadraticInterpolation):
 
         :Parameters:
 
-            va: `tuple` of `numpy.ndarray`
+            va: `numpy.ndarray`
 
-            vb: `tuple` of `numpy.ndarray`
+            vb: `numpy.ndarray`
 
             ce: `numpy.ndarray`
 
@@ -83,19 +89,21 @@ class QuadraticGeographicInterpolation(QuadraticInterpolation):
 
         :Parameters:
 
-            va: `tuple` of `numpy.ndarray`
+            va: `numpy.ndarray`
 
-            vb: `tuple` of `numpy.ndarray`
+            vb: `numpy.ndarray`
 
         :Returns:
 
-            `tuple` of `numpy.ndarray`
+            `numpy.ndarray`
 
         """
-        return (
-            va[y] * vb[z] - va[z] * vb[y],
-            va[z] * vb[x] - va[x] * vb[z],
-            va[x] * vb[y] - va[y] * vb[x],
+        return self._fstack(
+            (
+                va[y] * vb[z] - va[z] * vb[y],
+                va[z] * vb[x] - va[x] * vb[z],
+                va[x] * vb[y] - va[y] * vb[x],
+            )
         )
 
     def _fcv(self, va, vb, vp_i, d, s_i):
@@ -110,11 +118,11 @@ class QuadraticGeographicInterpolation(QuadraticInterpolation):
 
         :Parameters:
 
-            va, vb: `tuple` of `numpy.ndarray`
+            va, vb: `numpy.ndarray`
                 The vector representation of the tie point (latitude,
                 longitude).
 
-            vp_i: `tuple` of `numpy.ndarray`
+            vp_i: `numpy.ndarray`
                 The vector representation of the uncompressed value at
                 the same location as *s_i*.
 
@@ -124,12 +132,10 @@ class QuadraticGeographicInterpolation(QuadraticInterpolation):
 
         :Returns:
 
-            `tuple` of `numpy.ndarray`
+            `numpy.ndarray`
 
         """
-        return tuple(
-            self._fw(va[i], vb[i], vp_i[i], d, s_i) for i in (x, y, z)
-        )
+        return self._fw(va, vb, vp_i, d, s_i)
 
     def _fcv2cea(self, va, vb, cv):
         """Parametric representation interpolation coefficients.
@@ -152,11 +158,11 @@ class QuadraticGeographicInterpolation(QuadraticInterpolation):
 
         :Parameters:
 
-            va, vb: `tuple` of `numpy.ndarray`
+            va, vb: `numpy.ndarray`
                 The tie point vector representations of the tie point
                 latitude-longitude representations.
 
-            cv: `tuple` of `numpy.ndarray`
+            cv: `numpy.ndarray`
                 The three-dimensional cartesian interpolation
                 parameters.
 
@@ -185,7 +191,7 @@ class QuadraticGeographicInterpolation(QuadraticInterpolation):
 
         :Parameters:
 
-            va, vb: `tuple` of `numpy.ndarray`
+            va, vb: `numpy.ndarray`
                 The vector representations of the tie point (latitude,
                 longitude)
 
@@ -194,7 +200,7 @@ class QuadraticGeographicInterpolation(QuadraticInterpolation):
             `numpy.ndarray`
 
         """
-        return va[x] * vb[x] + va[y] * vb[y] + va[z] * vb[z]
+        return (va * vb).sum(axis=0)
 
     def _fll2v(self, lat, lon):
         """Vector representation of (latitude, longitude).
@@ -219,7 +225,7 @@ class QuadraticGeographicInterpolation(QuadraticInterpolation):
 
         :Returns:
 
-            `tuple` of `numpy.ndarray`
+            `numpy.ndarray`
 
         """
         lat = np.deg2rad(lat)
@@ -227,7 +233,9 @@ class QuadraticGeographicInterpolation(QuadraticInterpolation):
 
         cos_lat = np.cos(lat)
 
-        return (cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat))
+        return self._fstack(
+            (cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat))
+        )
 
     def _fminus(self, va, vb):
         """Vector difference.
@@ -241,16 +249,16 @@ class QuadraticGeographicInterpolation(QuadraticInterpolation):
 
         :Parameters:
 
-            va: `tuple` of `numpy.ndarray`
+            va: `numpy.ndarray`
 
-            vb: `tuple` of `numpy.ndarray`
+            vb: `numpy.ndarray`
 
         :Returns:
 
-            `tuple` of `numpy.ndarray`
+            `numpy.ndarray`
 
         """
-        return tuple(a - b for a, b in zip(va, vb))
+        return va - vb
 
     def _fmultiply(self, r, v):
         """Vector multiplied by scalar.
@@ -266,14 +274,14 @@ class QuadraticGeographicInterpolation(QuadraticInterpolation):
 
             r: scalar `numpy.ndarray`
 
-            v: `tuple` of `numpy.ndarray`
+            v: `numpy.ndarray`
 
         :Returns:
 
-            `tuple` of `numpy.ndarray`
+            `numpy.ndarray`
 
         """
-        return tuple(a * r for a in v)
+        return v * r
 
     def _fplus(self, *vectors):
         """Vector sum.
@@ -297,23 +305,19 @@ class QuadraticGeographicInterpolation(QuadraticInterpolation):
         :Parameters:
 
            vectors:
-               The vectors to be added, each defined by a `tuple` of
+               The vectors to be added, each defined by a
                `numpy.ndarray`.
 
         :Returns:
 
-            `tuple` of `numpy.ndarray`
+            `numpy.ndarray`
 
         """
-        out = []
-        for v in zip(*vectors):
-            s = v[0]
-            for a in v[1:]:
-                s = s + a
+        s = vectors[0]
+        for v in vectors[1:]:
+            s = s + v
 
-            out.append(s)
-
-        return tuple(out)
+        return s
 
     def _fqv(self, va, vb, wv, d, s=None):
         """Quadratically interpolate 3-d cartesian coordinates.
@@ -327,15 +331,15 @@ class QuadraticGeographicInterpolation(QuadraticInterpolation):
 
         :Parameters:
 
-            va: `tuple` of `numpy.ndarray`
+            va: `numpy.ndarray`
                 The three-dimensionsal (x, y, z) vector representation
                 of the first point along the subsampled dimension.
 
-            vb: `tuple` of `numpy.ndarray`
+            vb: `numpy.ndarray`
                 The three-dimensionsal (x, y, z) vector representation
                 of the second point along the subsampled dimension.
 
-            wv: `tuple` of `numpy.ndarray`
+            wv: `numpy.ndarray`
                 The three-dimensional cartesian representation of the
                 quadratic interpolation parameter ``w``.
 
@@ -345,13 +349,39 @@ class QuadraticGeographicInterpolation(QuadraticInterpolation):
 
         :Returns:
 
-            `tuple` of `numpy.ndarray`
+            `numpy.ndarray`
                 The three-dimensionsal (x, y, z) vector representation
                 of the interpolated points along the subsampled
                 dimension.
 
         """
-        return tuple(self._fq(va[i], vb[i], wv[i], d, s=s) for i in (x, y, z))
+        return self._fq(va, vb, wv, d, s=s)
+
+    def _fstack(self, components):
+        """Vector from its components.
+
+        (x, y, z) = fstack(x, y, z)
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            components: sequence of `numpy.ndarray`
+                The x, y and z components, which must all have the
+                same shape.
+
+        :Returns:
+
+            `numpy.ndarray`
+                The vector, with the components along a new leading
+                dimension. A masked array is returned if any of the
+                components are masked arrays.
+
+        """
+        if any(np.ma.isMA(c) for c in components):
+            return np.ma.stack(components)
+
+        return np.stack(components)
 
     def _fsqrt(self, t):
         """Square root.
@@ -382,7 +412,7 @@ class QuadraticGeographicInterpolation(QuadraticInterpolation):
 
         :Parameters:
 
-            v: `tuple` of `numpy.ndarray`
+            v: `numpy.ndarray`
                 The cartesian (x, y, z) coordinates.
 
         :Returns:
@@ -405,7 +435,7 @@ class QuadraticGeographicInterpolation(QuadraticInterpolation):
 
         :Parameters:
 
-            v: `tuple` of `numpy.ndarray`
+            v: `numpy.ndarray`
                 The cartesian (x, y), or (x, y, z), coordinates.
 
         :Returns:
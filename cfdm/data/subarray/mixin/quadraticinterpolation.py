@@ -98,8 +98,12 @@ class QuadraticInterpolation:
         s = self._s(d1, s=s)
 
         if w is not None:
-            u = ua + s * (ub - ua + 4 * w * (1 - s))
+            u = s * (ub - ua + 4 * w * (1 - s))
         else:
-            u = ua + s * (ub - ua)
+            u = s * (ub - ua)
 
+        # Add 'ua' in-place, which saves creating another array of
+        # the full interpolated size. 'u' already has a shape that 'ua'
+        # can be broadcast to.
+        u += ua
         return u
@@ -13,43 +13,33 @@ class PointTopologyFromEdgesSubarray(PointTopology, MeshSubarray):
 
     """
 
-    def _connected_nodes(self, node, node_connectivity, masked):
-        """Return the nodes that are joined to *node* by edges.
+    @staticmethod
+    def _node_links(node_connectivity):
+        """Return the pairs of nodes that are joined by edges.
 
-        The input *node* is included at the start of the returned
-        list.
-
-        .. versionadded:: (cfdm) 1.11.0.0
+        .. versionadded:: (cfdm) NEXTVERSION
 
         :Parameters:
 
-            node: `int`
-                A node identifier.
-
             node_connectivity: `numpy.ndarray`
                 A UGRID "edge_node_connectivity" array.
 
-            masked: `bool`, optional
-                Whether or not *node_connectivity* has masked
-                elements.
-
         :Returns:
 
-            `list`
-                All nodes that are joined to *node*, including *node*
-                itself at the start.
+            2-`tuple` of `numpy.ndarray`
+                The first and second nodes of each edge. Edges with
+                missing nodes are omitted.
+
+        **Examples**
+
+        >>> n = np.array([[2, 7], [4, 7], [4, 2]])
+        >>> p._node_links(n)
+        (array([2, 4, 4]), array([7, 7, 2]))
 
         """
-        nodes = sorted(
-            set(
-                node_connectivity[np.where(node_connectivity == node)[0]]
-                .flatten()
-                .tolist()
-            )
-        )
-
-        # Move 'node' to the front of the list
-        nodes.remove(node)
-        nodes.insert(0, node)
-
-        return nodes
+        mask = np.ma.getmaskarray(node_connectivity)
+        node_connectivity = np.ma.getdata(node_connectivity)
+        if mask.any():
+            node_connectivity = node_connectivity[~mask.any(axis=1)]
+
+        return node_connectivity[:, 0], node_connectivity[:, 1]
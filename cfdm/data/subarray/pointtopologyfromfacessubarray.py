@@ -13,6 +13,54 @@ class PointTopologyFromFacesSubarray(PointTopology, MeshSubarray):
 
     """
 
+    @staticmethod
+    def _node_links(node_connectivity):
+        """Return the pairs of nodes that are joined by face edges.
+
+        Each node of a face is joined to the next node of the face,
+        and the last node of the face is joined to the first.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            node_connectivity: `numpy.ndarray`
+                A UGRID "face_node_connectivity" array.
+
+        :Returns:
+
+            2-`tuple` of `numpy.ndarray`
+                The first and second nodes of each face edge. An edge
+                that is shared by two faces appears twice.
+
+        **Examples**
+
+        >>> n = np.ma.masked_values([[3, 4, 2, 1], [7, 2, 4, -1]], -1)
+        >>> p._node_links(n)
+        (array([3, 4, 2, 1, 7, 2, 4]), array([4, 2, 1, 3, 2, 4, 7]))
+
+        """
+        n_faces, max_n_nodes = node_connectivity.shape
+
+        # The nodes of all faces, one face after another, and the
+        # number of nodes in each face
+        mask = np.ma.getmaskarray(node_connectivity)
+        if mask.any():
+            nodes = np.ma.getdata(node_connectivity)[~mask]
+            n_nodes = max_n_nodes - mask.sum(axis=1)
+        else:
+            nodes = np.ma.getdata(node_connectivity).ravel()
+            n_nodes = np.full((n_faces,), max_n_nodes)
+
+        # Join each node to the next node of its face, and the last
+        # node of each face to the first
+        ends = np.cumsum(n_nodes)
+        starts = ends - n_nodes
+        faces = n_nodes > 0
+        following = np.arange(1, nodes.size + 1)
+        following[ends[faces] - 1] = starts[faces]
+        return nodes, nodes[following]
+
     @classmethod
     def _connected_nodes(self, node, node_connectivity, masked, edges=False):
         """Return nodes that are joined to *node* by face edges.
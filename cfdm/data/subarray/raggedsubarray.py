@@ -1,3 +1,5 @@
+from numbers import Integral
+
 import numpy as np
 
 from .abstract import Subarray
@@ -14,6 +16,80 @@ class RaggedSubarray(Subarray):
 
     """
 
+    def __init__(
+        self,
+        data=None,
+        indices=None,
+        shape=None,
+        compressed_dimensions=None,
+        counts=None,
+        source=None,
+        copy=True,
+        context_manager=None,
+    ):
+        """**Initialisation**
+
+        :Parameters:
+
+            data: array_like
+                The full compressed array spanning all subarrays, from
+                which the elements for this subarray are defined by
+                the *indices*.
+
+            indices: `tuple`
+                The indices of *data* that define this subarray.
+
+            shape: `tuple` of `int`
+                The shape of the uncompressed subarray.
+
+            {{init compressed_dimensions: `dict`}}
+
+                *Parameter example:*
+                  ``{0: (0, 1)}``
+
+                *Parameter example:*
+                  ``{0: (0, 1, 2)}``
+
+            counts: array_like, optional
+                The number of elements of each feature in the
+                subarray, or for an indexed contiguous ragged array,
+                of each profile of each feature, with the same shape
+                as the subarray's compressed dimensions other than the
+                last one. The elements defined by the *indices* are
+                assumed to be ordered by feature (and then by
+                profile). By default the subarray contains exactly one
+                feature (or profile).
+
+                .. versionadded:: (cfdm) NEXTVERSION
+
+            {{init source: optional}}
+
+            {{init copy: `bool`, optional}}
+
+            context_manager: function, optional
+                A context manager that provides a runtime context for
+                the conversion of *data* to a `numpy` array.
+
+        """
+        super().__init__(
+            data=data,
+            indices=indices,
+            shape=shape,
+            compressed_dimensions=compressed_dimensions,
+            source=source,
+            copy=copy,
+            context_manager=context_manager,
+        )
+
+        if source is not None:
+            try:
+                counts = source._get_component("counts", None)
+            except AttributeError:
+                counts = None
+
+        if counts is not None:
+            self._set_component("counts", counts, copy=False)
+
     def __getitem__(self, indices):
         """Return a subspace of the uncompressed subarray.
 
@@ -22,26 +98,92 @@ class RaggedSubarray(Subarray):
         Returns a subspace of the uncompressed subarray as an
         independent numpy array.
 
+        When *indices* select a range of features then only the
+        compressed elements of those features are read.
+
         .. versionadded:: (cfdm) 1.10.0.0
 
         """
         d1, u_dims = self.compressed_dimensions().popitem()
-        uncompressed_shape = self.shape
+        uncompressed_shape = list(self.shape)
+        c_indices = self.indices
 
-        data = self._select_data(check_mask=False)
+        counts = self.counts
+        if counts is not None:
+            counts = np.asanyarray(counts)
 
-        if data.size:
-            shape = list(data.shape)
-            u_indices0 = [slice(None)] * data.ndim
+            instance_dimension = u_dims[0]
+            n_features = uncompressed_shape[instance_dimension]
+            start, stop, indices = self._feature_range(
+                indices, instance_dimension, n_features
+            )
+            if stop - start < n_features:
+                # Only select the compressed elements of the
+                # requested features
+                ends = np.cumsum(counts.reshape(n_features, -1).sum(axis=1))
+                ends = [0] + ends.tolist()
+                e0 = ends[start]
+                e1 = ends[stop]
 
-            u_indices0[d1] = slice(0, shape[d1])
-            shape[d1] = uncompressed_shape[u_dims[-1]]
+                index = c_indices[d1]
+                if isinstance(index, slice):
+                    index = slice(index.start + e0, index.start + e1)
+                else:
+                    index = index[e0:e1]
 
-            u = np.ma.masked_all(shape, dtype=self.dtype)
+                c_indices = c_indices[:d1] + (index,) + c_indices[d1 + 1 :]
+                counts = counts[start:stop]
+                uncompressed_shape[instance_dimension] = stop - start
 
-            u[tuple(u_indices0)] = data
+            if not counts.any():
+                # There are no elements of the compressed data to
+                # select
+                c_indices = None
 
-            u = u.reshape(uncompressed_shape)
+        if c_indices is None:
+            data = None
+        else:
+            data = self._asanyarray(
+                self.data, indices=c_indices, check_mask=False
+            )
+
+        if data is not None and data.size:
+            if counts is None:
+                # The subarray contains exactly one feature (or
+                # profile)
+                counts = np.array([data.shape[d1]])
+            else:
+                counts = counts.ravel()
+
+            # Find the position of each compressed element in the
+            # flattened uncompressed dimensions, so that all of the
+            # features can be uncompressed with a single assignment
+            size = uncompressed_shape[u_dims[-1]]
+            ends = np.cumsum(counts)
+            positions = np.arange(ends[-1]) + np.repeat(
+                np.arange(counts.size) * size - (ends - counts), counts
+            )
+
+            shape = list(data.shape)
+            shape[d1] = counts.size * size
+
+            u_indices = [slice(None)] * data.ndim
+            u_indices[d1] = positions
+            u_indices = tuple(u_indices)
+
+            # Scatter the compressed elements into a preallocated
+            # array, and mask the uncompressed elements that were not
+            # set
+            u = np.empty(shape, dtype=self.dtype)
+            u[u_indices] = np.ma.getdata(data)
+            mask = np.ones(shape, dtype=bool)
+            mask[u_indices] = np.ma.getmaskarray(data)
+
+            u = np.ma.masked_array(
+                u.reshape(uncompressed_shape),
+                mask=mask.reshape(uncompressed_shape),
+                copy=False,
+            )
         else:
             # This subarray contains no elements of the compressed
             # data
@@ -52,6 +194,83 @@ class RaggedSubarray(Subarray):
 
         return u[indices]
 
+    @staticmethod
+    def _feature_range(indices, axis, size):
+        """Find the range of features selected by subspace indices.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            indices:
+                The indices of the uncompressed subarray.
+
+            axis: `int`
+                The position of the instance dimension.
+
+            size: `int`
+                The number of features.
+
+        :Returns:
+
+            3-`tuple`
+                The start and stop positions of the smallest range of
+                features that contains the selected features, and the
+                indices that select the same elements from only that
+                range of features. If the range can't be determined
+                then the range of all features and the unchanged
+                *indices* are returned.
+
+        **Examples**
+
+        >>> s._feature_range((slice(2, 5), slice(None)), 0, 10)
+        (2, 5, (slice(0, 3, 1), slice(None, None, None)))
+        >>> s._feature_range((7, slice(None)), 0, 10)
+        (7, 8, (0, slice(None, None, None)))
+        >>> s._feature_range(Ellipsis, 0, 10)
+        (0, 10, Ellipsis)
+
+        """
+        if (
+            not isinstance(indices, tuple)
+            or len(indices) <= axis
+            or any(i is Ellipsis for i in indices[: axis + 1])
+        ):
+            return 0, size, indices
+
+        index = indices[axis]
+        if isinstance(index, Integral):
+            start = index % size if -size <= index < size else index
+            stop = start + 1
+            index = 0
+        elif isinstance(index, slice):
+            start, stop, step = index.indices(size)
+            if step < 0:
+                return 0, size, indices
+
+            stop = max(start, stop)
+            index = slice(0, stop - start, step)
+        else:
+            return 0, size, indices
+
+        if not 0 <= start < stop <= size:
+            return 0, size, indices
+
+        return start, stop, indices[:axis] + (index,) + indices[axis + 1 :]
+
+    @property
+    def counts(self):
+        """The number of elements of each feature in the subarray.
+
+        For an indexed contiguous ragged array, the number of elements
+        of each profile of each feature. `None` means that the
+        subarray contains exactly one feature (or profile).
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        return self._get_component("counts", None)
+
     @property
     def dtype(self):
         """The data-type of the uncompressed data.
@@ -0,0 +1,415 @@
+from collections import defaultdict
+
+import numpy as np
+
+from .abstract import Subarray
+
+
+class SubsampledSubareasSubarray(Subarray):
+    """A subarray of a subsampled array with many interpolation subareas.
+
+    A subarray describes a unique part of the uncompressed array. This
+    subarray spans any number of interpolation subareas, each of which
+    is uncompressed by an interpolation subarray class, such as
+    `LinearSubarray`.
+
+    Interpolation subareas that have the same uncompressed shape, and
+    the same position relative to the start of their continuous
+    areas, are interpolated together. Their tie points, interpolation
+    parameters and dependent tie points are stacked along a new
+    leading dimension, which is treated by the interpolation method
+    as a non-interpolated dimension, so that each batch is
+    uncompressed with a single vectorised calculation.
+
+    See CF section 8.3 "Lossy Compression by Coordinate Subsampling"
+    and appendix J "Coordinate Interpolation Methods".
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    """
+
+    def __init__(
+        self,
+        data=None,
+        shape=None,
+        compressed_dimensions=None,
+        subareas=None,
+        Subarray=None,
+        parameters=None,
+        dependent_tie_points=None,
+        max_batch_size=None,
+        source=None,
+        copy=True,
+        context_manager=None,
+    ):
+        """**Initialisation**
+
+        :Parameters:
+
+            data: array_like
+                The full compressed tie points array spanning all
+                subarrays.
+
+            shape: `tuple` of `int`
+                The shape of the uncompressed subarray.
+
+            {{init compressed_dimensions: `dict`}}
+
+                *Parameter example:*
+                  ``{1: (1,)}``
+
+                *Parameter example:*
+                  ``{0: (0,), 2: (2,)}``
+
+            subareas: sequence of `tuple`
+                For each interpolation subarea in this subarray, its
+                indices of the uncompressed subarray, uncompressed
+                shape, indices of the tie points array, indices in
+                interpolation-subarea-space, and flags stating whether
+                it is the first along each dimension of its continuous
+                area. See `SubsampledArray.subarrays` for details.
+
+            Subarray: subclass of `SubsampledSubarray`
+                The class that uncompresses interpolation subareas.
+
+            parameters: `dict`, optional
+                The interpolation parameters required by the
+                interpolation method, each keyed by its parameter term
+                name. See `SubsampledSubarray` for details.
+
+            dependent_tie_points: `dict`, optional
+                The dependent tie point arrays required by the
+                interpolation method, each keyed by its identity. See
+                `SubsampledSubarray` for details.
+
+            max_batch_size: `int`, optional
+                The maximum number of uncompressed elements that are
+                interpolated in one batch of interpolation subareas.
+                A batch always contains at least one interpolation
+                subarea. By default there is no limit.
+
+            {{init source: optional}}
+
+            {{init copy: `bool`, optional}}
+
+            context_manager: function, optional
+                A context manager that provides a runtime context for
+                the conversion of *data*, *dependent_tie_points*, and
+                *parameters* to `numpy` arrays.
+
+        """
+        super().__init__(
+            data=data,
+            shape=shape,
+            compressed_dimensions=compressed_dimensions,
+            source=source,
+            copy=copy,
+            context_manager=context_manager,
+        )
+
+        if source is not None:
+            try:
+                subareas = source._get_component("subareas", None)
+            except AttributeError:
+                subareas = None
+
+            try:
+                Subarray = source._get_component("Subarray", None)
+            except AttributeError:
+                Subarray = None
+
+            try:
+                parameters = source._get_component("parameters", {})
+            except AttributeError:
+                parameters = {}
+
+            try:
+                dependent_tie_points = source._get_component(
+                    "dependent_tie_points", {}
+                )
+            except AttributeError:
+                dependent_tie_points = {}
+
+            try:
+                max_batch_size = source._get_component("max_batch_size", None)
+            except AttributeError:
+                max_batch_size = None
+
+        if subareas is not None:
+            self._set_component("subareas", tuple(subareas), copy=False)
+
+        if Subarray is not None:
+            self._set_component("Subarray", Subarray, copy=False)
+
+        if parameters is not None:
+            self._set_component("parameters", parameters.copy(), copy=False)
+
+        if dependent_tie_points is not None:
+            self._set_component(
+                "dependent_tie_points", dependent_tie_points.copy(), copy=False
+            )
+
+        self._set_component("max_batch_size", max_batch_size, copy=False)
+
+    def __getitem__(self, indices):
+        """Return a subspace of the uncompressed subarray.
+
+        x.__getitem__(indices) <==> x[indices]
+
+        Returns a subspace of the uncompressed subarray as an
+        independent numpy array.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        # The interpolation subareas tile the subarray, so every
+        # element is set by exactly one of them
+        u = np.empty(self.shape, dtype=self.dtype)
+        mask = None
+
+        for u_indices, subarray in self._batches():
+            batch = subarray[...]
+            if np.ma.is_masked(batch):
+                if mask is None:
+                    mask = np.zeros(self.shape, dtype=bool)
+
+                for u_index, m in zip(u_indices, np.ma.getmaskarray(batch)):
+                    mask[u_index] = m
+
+            for u_index, b in zip(u_indices, np.ma.getdata(batch)):
+                u[u_index] = b
+
+        if mask is not None:
+            u = np.ma.array(u, mask=mask)
+
+        if indices is Ellipsis:
+            return u
+
+        return u[indices]
+
+    def _batches(self):
+        """Return subarrays that each span many interpolation subareas.
+
+        Only the parts of the tie points, interpolation parameters
+        and dependent tie points that are needed by this subarray are
+        converted to `numpy` arrays.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Returns:
+
+            generator
+                For each batch, the indices of this subarray that
+                correspond to each of its interpolation subareas, and
+                the interpolation subarray whose uncompressed data
+                has a leading dimension that indexes those
+                interpolation subareas.
+
+        """
+        subareas = self.subareas
+        if not subareas:
+            return
+
+        Subarray = self.Subarray
+        data = self.data
+        tp_shape = data.shape
+        tp_ndim = len(tp_shape)
+        u_dims = tuple(self.compressed_dimensions())
+
+        # The extents of the tie points (c) and interpolation subarea
+        # (s) indices spanned by this subarray
+        c_extent = []
+        s_extent = []
+        for d in range(tp_ndim):
+            c = [subarea[2][d] for subarea in subareas]
+            c_extent.append((min(i.start for i in c), max(i.stop for i in c)))
+            if d in u_dims:
+                s = [subarea[3][d] for subarea in subareas]
+                s_extent.append(
+                    (min(i.start for i in s), max(i.stop for i in s))
+                )
+            else:
+                s_extent.append(None)
+
+        def kinds(array):
+            """How each dimension of an array is indexed.
+
+            A dimension is indexed by tie point position (``'c'``) if
+            it spans the tie points, by interpolation subarea position
+            (``'s'``) if it spans the interpolation subareas, or not at
+            all (``None``) if it has size 1 (see
+            `SubsampledSubarray._select_parameter`).
+
+            """
+            out = []
+            for d, size in enumerate(array.shape):
+                if size == tp_shape[d]:
+                    out.append("c")
+                elif size == 1 or d not in u_dims:
+                    out.append(None)
+                else:
+                    out.append("s")
+
+            return out
+
+        def load(array):
+            """Convert the part of an array spanned by the subarray."""
+            array_kinds = kinds(array)
+            indices = []
+            for kind, c, s in zip(array_kinds, c_extent, s_extent):
+                if kind == "c":
+                    indices.append(slice(*c))
+                elif kind == "s":
+                    indices.append(slice(*s))
+                else:
+                    indices.append(slice(None))
+
+            return self._asanyarray(array, tuple(indices)), array_kinds
+
+        def stack(loaded, c_indices, subarea_indices):
+            """Stack the values of each interpolation subarea."""
+            array, array_kinds = loaded
+            n = len(c_indices)
+            indices = []
+            for d, kind in enumerate(array_kinds):
+                shape = [1] * (tp_ndim + 1)
+                if kind is None:
+                    index = np.arange(array.shape[d])
+                    shape[d + 1] = index.size
+                elif d not in u_dims:
+                    # All of the interpolation subareas have the same
+                    # indices along a non-interpolated dimension
+                    start = c_indices[0][d].start - c_extent[d][0]
+                    stop = c_indices[0][d].stop - c_extent[d][0]
+                    index = np.arange(start, stop)
+                    shape[d + 1] = index.size
+                elif kind == "c":
+                    start = np.array([i[d].start for i in c_indices])
+                    start -= c_extent[d][0]
+                    shape[0] = n
+                    shape[d + 1] = 2
+                    index = start[:, np.newaxis] + np.arange(2)
+                else:
+                    start = np.array([i[d].start for i in subarea_indices])
+                    start -= s_extent[d][0]
+                    shape[0] = n
+                    index = start
+
+                indices.append(index.reshape(shape))
+
+            return array[tuple(indices)]
+
+        tie_points = load(data)
+        parameters = {
+            term: load(parameter)
+            for term, parameter in self.parameters.items()
+        }
+        dependent_tie_points = {
+            identity: load(tp)
+            for identity, tp in self.dependent_tie_points.items()
+        }
+
+        # The compressed dimensions of the batched subarrays, which
+        # have an extra leading dimension
+        compressed_dimensions = {
+            d + 1: tuple(i + 1 for i in dims)
+            for d, dims in self.compressed_dimensions().items()
+        }
+
+        # Group the interpolation subareas by their uncompressed
+        # shapes, relative positions, and indices along the
+        # non-interpolated dimensions
+        groups = defaultdict(list)
+        for u_indices, u_shape, c_indices, subarea_indices, first in subareas:
+            key = (
+                u_shape,
+                first,
+                tuple(
+                    (c_indices[d].start, c_indices[d].stop)
+                    for d in range(tp_ndim)
+                    if d not in u_dims
+                ),
+            )
+            groups[key].append((u_indices, c_indices, subarea_indices))
+
+        max_batch_size = self.max_batch_size
+        for (u_shape, first, _), members in groups.items():
+            if max_batch_size is None:
+                n = len(members)
+            else:
+                n = max(1, max_batch_size // int(np.prod(u_shape)))
+
+            for i in range(0, len(members), n):
+                batch = members[i : i + n]
+                u_indices, c_indices, subarea_indices = zip(*batch)
+                subarray = Subarray(
+                    data=stack(tie_points, c_indices, subarea_indices),
+                    indices=(slice(None),) * (tp_ndim + 1),
+                    shape=(len(batch),) + u_shape,
+                    compressed_dimensions=compressed_dimensions,
+                    first=(None,) + first,
+                    subarea_indices=(slice(None),) * (tp_ndim + 1),
+                    parameters={
+                        term: stack(parameter, c_indices, subarea_indices)
+                        for term, parameter in parameters.items()
+                    },
+                    dependent_tie_points={
+                        identity: stack(tp, c_indices, subarea_indices)
+                        for identity, tp in dependent_tie_points.items()
+                    },
+                )
+                yield u_indices, subarray
+
+    @property
+    def dependent_tie_points(self):
+        """Dependent tie points needed by the interpolation method.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        return self._get_component("dependent_tie_points")
+
+    @property
+    def dtype(self):
+        """The data-type of the uncompressed data.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        return np.dtype(float)
+
+    @property
+    def max_batch_size(self):
+        """The maximum number of elements in a batch of subareas.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        return self._get_component("max_batch_size")
+
+    @property
+    def parameters(self):
+        """Interpolation parameters needed by the interpolation method.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        return self._get_component("parameters")
+
+    @property
+    def Subarray(self):
+        """The class that uncompresses interpolation subareas.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        return self._get_component("Subarray")
+
+    @property
+    def subareas(self):
+        """The interpolation subareas spanned by this subarray.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        return self._get_component("subareas")
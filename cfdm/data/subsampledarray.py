@@ -16,6 +16,7 @@ from .subarray import (
     LinearSubarray,
     QuadraticLatitudeLongitudeSubarray,
     QuadraticSubarray,
+    SubsampledSubareasSubarray,
 )
 
 
@@ -87,6 +88,10 @@ class SubsampledArray(CompressedArrayMixin, CompressedArray):
 
     _flag_names = ("location_use_3d_cartesian",)
 
+    # The maximum number of uncompressed elements that are
+    # interpolated in one batch of interpolation subareas
+    _max_batch_size = 2**22
+
     def __new__(cls, *args, **kwargs):
         """Store subarray classes.
 
@@ -383,27 +388,18 @@ class SubsampledArray(CompressedArrayMixin, CompressedArray):
         # ------------------------------------------------------------
         # Method: Uncompress the entire array and then subspace it
         # ------------------------------------------------------------
-        # Initialise the un-sliced uncompressed array
-        u = np.ma.masked_all(self.shape, dtype=self.dtype)
-
-        Subarray = self.get_Subarray()
-        subarray_kwargs = {
-            **self.conformed_data(),
-            **self.subarray_parameters(),
-        }
-
-        # Interpolate the tie points for each interpolation subarea
-        for u_indices, u_shape, c_indices, subarea_indices, first, _ in zip(
-            *self.subarrays()
-        ):
-            subarray = Subarray(
-                indices=c_indices,
-                shape=u_shape,
-                first=first,
-                subarea_indices=subarea_indices,
-                **subarray_kwargs,
-            )
-            u[u_indices] = subarray[...]
+        conformed_data = self.conformed_data()
+        subarray = SubsampledSubareasSubarray(
+            data=conformed_data["data"],
+            shape=self.shape,
+            compressed_dimensions=self.compressed_dimensions(),
+            subareas=[subarea[:5] for subarea in zip(*self.subarrays())],
+            Subarray=self.get_Subarray(),
+            parameters=conformed_data["parameters"],
+            dependent_tie_points=conformed_data["dependent_tie_points"],
+            max_batch_size=self._max_batch_size,
+        )
+        u = subarray[...]
 
         u = netcdf_indexer(
             u,
@@ -951,6 +947,11 @@ class SubsampledArray(CompressedArrayMixin, CompressedArray):
     def subarray_shapes(self, shapes):
         """Create the subarray shapes along each uncompressed dimension.
 
+        Along an interpolated dimension, the subarray shapes are only
+        a guide, because each subarray must contain whole
+        interpolation subareas (see `to_dask_array`). Subarrays always
+        span the whole of a trailing bounds dimension.
+
         .. versionadded:: (cfdm) 1.10.0.0
 
         .. seealso:: `subarray`
@@ -969,35 +970,29 @@ class SubsampledArray(CompressedArrayMixin, CompressedArray):
         >>> a.compressed_dimensions()
         {1: (1,), 2: (2,)}
         >>> a.subarray_shapes(-1)
-        [(4,), None, None]
+        [(4,), (20,), (30,)]
         >>> a.subarray_shapes("auto")
-        ["auto", None, None]
+        ["auto", "auto", "auto"]
         >>> a.subarray_shapes(2)
-        [2, None, None]
+        [2, 2, 2]
         >>> a.subarray_shapes("60B")
-        ["60B", None, None]
-        >>> a.subarray_shapes((2, None, None))
-        [2, None, None]
+        ["60B", "60B", "60B"]
+        >>> a.subarray_shapes((2, None, 10))
+        [2, None, 10]
         >>> a.subarray_shapes(((1, 3), None, None))
         [(1, 3), None, None]
-        >>> a.subarray_shapes(("auto", None, None))
+        >>> a.subarray_shapes({0: "auto"})
         ["auto", None, None]
-        >>> a.subarray_shapes(("60B", None, None))
-        ["60B", None, None]
 
         """
-        u_dims = self.get_compressed_axes()
+        uncompressed_shape = self.shape
 
         if shapes == -1:
-            return [
-                None if i in u_dims else (size,)
-                for i, size in enumerate(self.shape)
-            ]
+            return [(size,) for size in uncompressed_shape]
 
         if isinstance(shapes, (str, Number)):
-            return [None if i in u_dims else shapes for i in range(self.ndim)]
-
-        if isinstance(shapes, dict):
+            shapes = [shapes] * self.ndim
+        elif isinstance(shapes, dict):
             shapes = [
                 shapes[i] if i in shapes else None for i in range(self.ndim)
             ]
@@ -1007,9 +1002,13 @@ class SubsampledArray(CompressedArrayMixin, CompressedArray):
                 f"Wrong number of 'shapes' elements in {shapes}: "
                 f"Got {len(shapes)}, expected {self.ndim}"
             )
+        else:
+            shapes = list(shapes)
+
+        if self.bounds:
+            shapes[-1] = (uncompressed_shape[-1],)
 
-        # chunks is a sequence
-        return [None if i in u_dims else c for i, c in enumerate(shapes)]
+        return shapes
 
     def subarrays(self, shapes=-1):
         """Return descriptors for every subarray.
@@ -1107,12 +1106,12 @@ class SubsampledArray(CompressedArrayMixin, CompressedArray):
         >>> for i in interpolation_subarea_indices:
         ...    print(i)
         ...
-        (slice(0, 1, None), slice(0, 12, None), slice(0, 1, None)
-        (slice(0, 1, None), slice(0, 12, None), slice(1, 2, None)
-        (slice(0, 1, None), slice(0, 12, None), slice(2, 3, None)
-        (slice(1, 2, None), slice(0, 12, None), slice(0, 1, None)
-        (slice(1, 2, None), slice(0, 12, None), slice(1, 2, None)
-        (slice(1, 2, None), slice(0, 12, None), slice(2, 3, None)
+        (slice(0, 1, None), slice(None, None, None), slice(0, 1, None)
+        (slice(0, 1, None), slice(None, None, None), slice(1, 2, None)
+        (slice(0, 1, None), slice(None, None, None), slice(2, 3, None)
+        (slice(1, 2, None), slice(None, None, None), slice(0, 1, None)
+        (slice(1, 2, None), slice(None, None, None), slice(1, 2, None)
+        (slice(1, 2, None), slice(None, None, None), slice(2, 3, None)
         >>> for i in new_continuous_area:
         ...    print(i)
         ...
@@ -1133,11 +1132,15 @@ class SubsampledArray(CompressedArrayMixin, CompressedArray):
         (1, 0, 2)
 
         """
+        from .utils import normalize_chunks
+
         tie_points = self.source()
         tie_point_indices = self.get_tie_point_indices()
         u_dims = tuple(tie_point_indices)
 
-        shapes = self.subarray_shapes(shapes)
+        shapes = normalize_chunks(
+            self.subarray_shapes(shapes), shape=self.shape, dtype=self.dtype
+        )
 
         # The indices of the uncompressed array that correspond to
         # each interpolation subarea.
@@ -1165,22 +1168,27 @@ class SubsampledArray(CompressedArrayMixin, CompressedArray):
         # u_shapes = [(n,) for n in self.shape]
 
         # The indices of the tie point array that correspond to each
-        # interpolation subarea.
-        #        c_indices = [(slice(None),)] * tp_ndim
-        c_indices = [(slice(0, size),) for size in tie_points.shape]
-
-        # The location of each subarray
-        # subarray_locations = [(0,)] * self.ndim
+        # interpolation subarea. Along a non-interpolated dimension
+        # these are the same as the indices of the uncompressed array.
+        c_indices = u_indices[: tie_points.ndim]
 
         # The index of each interpolation subarea along the
-        # interpolation subarea dimensions
-        interpolation_subarea_indices = c_indices[:]
+        # interpolation subarea dimensions. Along a non-interpolated
+        # dimension an interpolation parameter either spans the tie
+        # points, or else has size 1.
+        interpolation_subarea_indices = [
+            None if index is None else [slice(None)] * len(index)
+            for index in c_indices
+        ]
 
         # The flags which state, for each dimension, whether (`True`)
         # or not (`False`) an interpolation subarea is at the start of
         # a continuous area. Non-interpolated dimensions are given the
         # falsey flag `None`.
-        new_continuous_area = [(None,)] * tie_points.ndim
+        new_continuous_area = [
+            None if index is None else [None] * len(index)
+            for index in c_indices
+        ]
 
         for d, tie_point_index in tie_point_indices.items():
             u_index = []
@@ -1256,6 +1264,11 @@ class SubsampledArray(CompressedArrayMixin, CompressedArray):
     def to_dask_array(self, chunks="auto"):
         """Convert the data to a `dask` array.
 
+        Each dask chunk contains any number of whole interpolation
+        subareas, which are uncompressed together when the chunk is
+        computed, so that different chunks may be uncompressed in
+        parallel.
+
         .. versionadded:: (cfdm) 1.11.2.0
 
         :Parameters:
@@ -1266,9 +1279,13 @@ class SubsampledArray(CompressedArrayMixin, CompressedArray):
                 Any value accepted by the *chunks* parameter of the
                 `dask.array.from_array` function is allowed.
 
-                The chunk sizes implied by *chunks* for a dimension that
-                has been fragmented are ignored and replaced with values
-                that are implied by that dimensions fragment sizes.
+                The chunk sizes implied by *chunks* for an
+                interpolated dimension are adjusted so that chunk
+                boundaries coincide with interpolation subarea
+                boundaries, with each interpolation subarea being
+                assigned to the chunk that contains its first
+                element. A trailing bounds dimension is never split
+                between chunks.
 
         :Returns:
 
@@ -1278,10 +1295,11 @@ class SubsampledArray(CompressedArrayMixin, CompressedArray):
         """
         import dask.array as da
         from dask import config
-        from dask.array.core import getter, normalize_chunks
         from dask.base import tokenize
 
-        name = (f"{self.__class__.__name__}-{tokenize(self)}",)
+        from .utils import normalize_chunks
+
+        getter = da.core.getter
 
         dtype = self.dtype
 
@@ -1289,82 +1307,92 @@ class SubsampledArray(CompressedArrayMixin, CompressedArray):
 
         compressed_dimensions = self.compressed_dimensions()
         conformed_data = self.conformed_data()
-        compressed_data = conformed_data["data"]
-        parameters = conformed_data["parameters"]
-        dependent_tie_points = conformed_data["dependent_tie_points"]
 
         # Get the (cfdm) subarray class
         Subarray = self.get_Subarray()
-        subarray_name = Subarray().__class__.__name__
+        subarray_name = SubsampledSubareasSubarray().__class__.__name__
 
-        # Set the chunk sizes for the dask array
-        #
-        # Note: The chunks created here are incorrect for the
-        #       compressed dimensions, since these chunk sizes are a
-        #       function of the tie point indices which haven't yet
-        #       been accessed. Therefore, the chunks for the
-        #       compressed dimensions need to be redefined later.
+        # Set the requested chunk sizes for the dask array
         chunks = normalize_chunks(
             self.subarray_shapes(chunks),
             shape=self.shape,
             dtype=dtype,
         )
 
-        # Re-initialise the chunks
-        u_dims = list(compressed_dimensions)
-        chunks = [[] if i in u_dims else c for i, c in enumerate(chunks)]
+        subareas = list(zip(*self.subarrays(shapes=chunks)))
+
+        # For each interpolated dimension, find the position of the
+        # first element of each interpolation subarea
+        u_dims = [d for dims in compressed_dimensions.values() for d in dims]
+        starts = {d: {} for d in u_dims}
+        for u_indices, *_, location in subareas:
+            for d in u_dims:
+                starts[d][location[d]] = u_indices[d].start
+
+        # For each interpolated dimension, assign each interpolation
+        # subarea to the requested chunk that contains its first
+        # element, and then redefine the chunks so that their
+        # boundaries coincide with interpolation subarea boundaries.
+        chunk_locations = {}
+        origins = {}
+        chunks = list(chunks)
+        for d in u_dims:
+            start = np.array([starts[d][i] for i in range(len(starts[d]))])
+            boundaries = np.cumsum(chunks[d])[:-1]
+            chunk_index = np.searchsorted(boundaries, start, side="right")
+            _, first, chunk_index = np.unique(
+                chunk_index, return_index=True, return_inverse=True
+            )
+            chunk_locations[d] = chunk_index.tolist()
+            origins[d] = start[first].tolist()
+            chunks[d] = tuple(np.diff(origins[d] + [self.shape[d]]).tolist())
+
+        # Group the interpolation subareas by their chunks, with each
+        # interpolation subarea's uncompressed indices defined
+        # relative to the start of its chunk
+        groups = {}
+        for subarea in subareas:
+            u_indices, u_shape, c_indices, subarea_indices, first, location = (
+                subarea
+            )
+            chunk_location = list(location)
+            u_index = list(u_indices)
+            for d, index in enumerate(u_indices):
+                if d in u_dims:
+                    chunk_location[d] = chunk_locations[d][location[d]]
+                    origin = origins[d][chunk_location[d]]
+                else:
+                    origin = index.start
+
+                u_index[d] = slice(index.start - origin, index.stop - origin)
 
-        # For each dimension, initialise the index of the chunk
-        # previously created (prior to the chunk currently being
-        # created). The value -1 is an arbitrary negative value that is
-        # always less than any chunk index, which is always a natural
-        # number.
-        previous_chunk_location = [-1] * len(chunks)
+            groups.setdefault(tuple(chunk_location), []).append(
+                (tuple(u_index), u_shape, c_indices, subarea_indices, first)
+            )
+
+        # The name depends on the chunks, which are not implied by the
+        # subsampled array itself
+        name = (f"{self.__class__.__name__}-{tokenize(self, chunks)}",)
 
         dsk = {}
-        for (
-            u_indices,
-            u_shape,
-            c_indices,
-            subarea_indices,
-            first,
-            chunk_location,
-        ) in zip(*self.subarrays(shapes=chunks)):
-            subarray = Subarray(
-                data=compressed_data,
-                indices=c_indices,
-                shape=u_shape,
+        for chunk_location, chunk_subareas in groups.items():
+            subarray = SubsampledSubareasSubarray(
+                data=conformed_data["data"],
+                shape=tuple(c[i] for c, i in zip(chunks, chunk_location)),
                 compressed_dimensions=compressed_dimensions,
-                first=first,
-                subarea_indices=subarea_indices,
-                parameters=parameters,
-                dependent_tie_points=dependent_tie_points,
+                subareas=chunk_subareas,
+                Subarray=Subarray,
+                parameters=conformed_data["parameters"],
+                dependent_tie_points=conformed_data["dependent_tie_points"],
+                max_batch_size=self._max_batch_size,
                 context_manager=context,
             )
 
-            key = f"{subarray_name}-{tokenize(subarray)}"
+            # Tokenizing the name and chunk location is much faster
+            # than tokenizing a subarray with many subareas
+            key = f"{subarray_name}-{tokenize(name, chunk_location)}"
             dsk[key] = subarray
-            dsk[name + chunk_location] = (
-                getter,
-                key,
-                Ellipsis,
-                False,
-                False,
-            )
-
-            # Add correct chunk sizes for compressed dimensions
-            for d in u_dims[:]:
-                previous = previous_chunk_location[d]
-                new = chunk_location[d]
-                if new > previous:
-                    chunks[d].append(u_shape[d])
-                    previous_chunk_location[d] = new
-                elif new < previous:
-                    # No more chunk sizes required for this compressed
-                    # dimension
-                    u_dims.remove(d)
-
-        chunks = [tuple(c) for c in chunks]
+            dsk[name + chunk_location] = (getter, key, Ellipsis, False, False)
 
         # Return the dask array
         return da.Array(dsk, name[0], chunks=chunks, dtype=dtype)
@@ -1,4 +1,6 @@
 from . import abstract
+from .chunkcache import cached_chunks
+from .filehandlepool import handle_pool
 from .mixin import IndexMixin
 
 
@@ -12,6 +14,7 @@ class ZarrArray(IndexMixin, abstract.FileArray):
 
     """
 
+    @cached_chunks
     def _get_array(self, index=None):
         """Returns a subspace of the dataset variable.
 
@@ -35,25 +38,28 @@ class ZarrArray(IndexMixin, abstract.FileArray):
             index = self.index()
 
         zr, address = self.open()
+        try:
+            # Get the variable by name
+            variable = zr[address]
+
+            # Get the data, applying masking and scaling as required.
+            array = netcdf_indexer(
+                variable,
+                mask=self.get_mask(),
+                unpack=self.get_unpack(),
+                unpack_dtype=self.get_unpack_dtype(),
+                always_masked_array=False,
+                orthogonal_indexing=True,
+                copy=False,
+            )
+            array = array[index]
 
-        # Get the variable by name
-        variable = zr[address]
-
-        # Get the data, applying masking and scaling as required.
-        array = netcdf_indexer(
-            variable,
-            mask=self.get_mask(),
-            unpack=self.get_unpack(),
-            always_masked_array=False,
-            orthogonal_indexing=True,
-            copy=False,
-        )
-        array = array[index]
-
-        # Set the attributes, if they haven't been set already.
-        self._set_attributes(variable)
-
-        self.close(zr)
+            # Set the attributes, if they haven't been set already.
+            self._set_attributes(variable)
+        finally:
+            # Return the dataset to the file handle pool, even if the
+            # data could not be read
+            self.close(zr)
 
         return array
 
@@ -98,8 +104,10 @@ class ZarrArray(IndexMixin, abstract.FileArray):
             `None`
 
         """
-        # `zarr.Group` objects don't need closing
-        pass
+        # `zarr.Group` objects don't need closing, but they may need
+        # returning to the file handle pool
+        if self._get_component("close"):
+            handle_pool.release(dataset)
 
     def open(self, **kwargs):
         """Return a dataset object and address.
@@ -442,14 +442,21 @@ _docstring_substitution_definitions = {
                 'https://s3.fr-par.scw.cloud', 'client_kwargs':
                 {'region_name': 'fr-par'}}``""",
     # read cache
-    "{{read cache: `bool`, optional}}": """cache: `bool`, optional
+    "{{read cache: `bool` or `str`, optional}}": """cache: `bool` or `str`, optional
             If True, the default, then cache the first and last array
             elements of metadata constructs (not field constructs) for
             fast future access. In addition, the second and
             penultimate array elements will be cached from coordinate
             bounds when there are two bounds per cell. For remote
             data, setting *cache* to False may speed up the parsing of
-            the file.""",
+            the file.
+
+            If *cache* is ``'deferred'`` then the elements of each
+            variable are not read until they are first needed, for
+            instance when a construct is printed. This can speed up
+            the parsing of a dataset when the elements of only a few
+            constructs, if any, are needed, at the expense of
+            re-opening the dataset when they are.""",
     # read dask_chunks
     "{{read dask_chunks: `str`, `int`, `None`, or `dict`, optional}}": """dask_chunks: `str`, `int`, `None`, or `dict`, optional
             Specify the Dask chunking for data. May be one of the
@@ -605,6 +612,9 @@ _docstring_substitution_definitions = {
               equivalent to it being defined with a value of
               ``'auto'``.
 
+              For data arrays that are compressed by convention, the
+              file dimensions are those of the uncompressed data.
+
               *Example:*
                 ``{'T': '0.5 MiB', 'Z': 'auto', 'Y': [36, 37], 'X':
                 None}``
@@ -864,6 +874,105 @@ _docstring_substitution_definitions = {
                       named in a manner that is inconsistent with CF
                       rules defined by the CF conventions (section 2.7
                       Groups).""",
+    # read select
+    "{{read select: (sequence of) `str` or `re.Pattern`, optional}}": """select: (sequence of) `str` or `re.Pattern`, optional
+            Only create field or domain constructs from the netCDF data
+            or domain variables that match any of the given values. A
+            variable matches if any of the identities that its field
+            or domain construct would have (as returned by its
+            `!identities` method) matches one of the values, where the
+            identities are derived from the variable's netCDF
+            attributes and name alone. The bare netCDF variable name
+            is also accepted as an identity. By default, or if `None`,
+            all variables are selected.
+
+            A value may be any object that can match via the ``==``
+            operator, or a `re.Pattern` object that matches via its
+            `~re.Pattern.search` method.
+
+            The selection is applied before any constructs are
+            created, so only the selected variables, and the netCDF
+            variables that they reference (such as coordinates,
+            bounds, cell measures and ancillaries), are converted to
+            constructs. This is faster than reading all of the
+            variables and then selecting from the returned
+            constructs, but the same constructs are returned. Note
+            that the dataset-wide parsing that precedes construct
+            creation (of the attributes and dimensions of every
+            variable, and of any compression, geometry and UGRID
+            mesh variables) is still carried out in full, since it is
+            needed to find the variables that are referenced by the
+            selected ones. Extra constructs requested with
+            the *extra* parameter are only created from the netCDF
+            variables that are referenced by the selected variables.
+
+            *Parameter example:*
+              ``select='air_temperature'``
+
+            *Parameter example:*
+              ``select=['ncvar%tas', 'long_name=Precipitation']``
+
+            *Parameter example:*
+              ``select=re.compile('^ncvar%ta')``""",
+    # read parallel
+    "{{read parallel: `str`, `int`, `dict`, or `None`, optional}}": """parallel: `str`, `int`, `dict`, or `None`, optional
+            Whether or not to read multiple datasets concurrently. The
+            contents of each dataset are always parsed in a single
+            worker, and the returned constructs are identical to, and
+            in the same order as, those returned when the datasets are
+            read in sequence. If any dataset can not be read then the
+            error from the earliest such dataset is raised, as would
+            be the case when reading in sequence.
+
+            * `None`
+
+              This is the default. Read the datasets in sequence.
+
+            * ``'thread'``
+
+              Read the datasets in a pool of threads. The netCDF-C
+              library (see the *netcdf_backend* parameter) is not
+              thread-safe, so each call to it, such as reading the
+              attributes of a variable, is made whilst holding a
+              single lock that is shared with all other uses of the
+              library. The threads may parse their datasets
+              concurrently between such calls.
+
+            * ``'process'``
+
+              Read the datasets in a pool of processes. All of the
+              datasets and keyword parameters must be able to be
+              pickled, so, for instance, open file handles, CDL
+              strings, and *filesystem* objects may not be used.
+
+            * `int`
+
+              Read the datasets in a pool of this many processes.
+
+            * `dict`
+
+              A dictionary with key ``'executor'``, whose value is
+              one of ``'thread'`` or ``'process'``, and optional key
+              ``'max_workers'``, whose value is the maximum number of
+              workers in the pool. If ``'max_workers'`` is missing or
+              `None` then the default of `concurrent.futures` is used.
+
+            *Parameter example:*
+              ``parallel={'executor': 'thread', 'max_workers': 8}``""",
+    # read unpack_dtype
+    "{{read unpack_dtype: data-type or `None`, optional}}": """unpack_dtype: data-type or `None`, optional
+            The floating point data type of unpacked data. If `None`,
+            the default, then the data type is that given by applying
+            the ``scale_factor`` and ``add_offset`` attributes to the
+            packed data, according to the `numpy` type promotion
+            rules. Otherwise packed data are unpacked directly to the
+            given data type, which for instance allows data packed as
+            8 or 16-bit integers to be unpacked to ``float32`` rather
+            than ``float64`` values, halving their memory use. Ignored
+            if *unpack* is False.
+
+            *Parameter example:*
+              ``unpack_dtype='float32'``""",
     # persist
     "{{persist description}}": """Persisting turns an underlying lazy dask array into an
         equivalent chunked dask array, but now with the results fully
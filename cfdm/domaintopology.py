@@ -1,3 +1,5 @@
+import warnings
+
 import numpy as np
 
 from . import core, mixin
@@ -120,6 +122,75 @@ class DomainTopology(
 
     """
 
+    @classmethod
+    def _unique_edges(cls, node0, node1, sort=False):
+        """Return the unique edges defined by pairs of linked nodes.
+
+        Each edge is defined by its two nodes in increasing order, so
+        that links between the same two nodes in either direction
+        define the same edge. Links from a node to itself are
+        ignored.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `to_edge`
+
+        :Parameters:
+
+            node0, node1: `numpy.ndarray`
+                The first and second nodes of each link.
+
+            sort: `bool`, optional
+                If True then sort the edges by their first node, and
+                then by their second node. By default the edges are
+                in the order in which they first appear.
+
+        :Returns:
+
+            `numpy.ndarray`
+                The unique edges, with shape ``(n, 2)``.
+
+        **Examples**
+
+        >>> d._unique_edges(np.array([5, 2, 1, 2]), np.array([2, 1, 5, 5]))
+        array([[2, 5],
+               [1, 2],
+               [1, 5]])
+        >>> d._unique_edges(
+        ...     np.array([5, 2, 1, 2]), np.array([2, 1, 5, 5]), sort=True
+        ... )
+        array([[1, 2],
+               [1, 5],
+               [2, 5]])
+
+        """
+        lo = np.minimum(node0, node1)
+        hi = np.maximum(node0, node1)
+        keep = lo != hi
+        if not keep.all():
+            lo = lo[keep]
+            hi = hi[keep]
+
+        del keep
+
+        if not lo.size:
+            return np.empty((0, 2), dtype=lo.dtype)
+
+        # Encode each edge as a single integer, ordered by the first
+        # node and then by the second, so that one sort finds the
+        # unique edges
+        offset = lo.min()
+        base = int(hi.max() - offset) + 1
+        keys = (lo - offset).astype(int, copy=False) * base + (hi - offset)
+        _, index = np.unique(keys, return_index=True)
+        del keys
+
+        if not sort:
+            # Restore the order in which the edges first appear
+            index.sort()
+
+        return np.column_stack((lo[index], hi[index]))
+
     def creation_commands(
         self,
         representative_data=False,
@@ -418,10 +489,17 @@ class DomainTopology(
         data = d.array
 
         if cell in ("edge", "face"):
-            # Normalise node ids for edge or face cells.
-            mask = np.ma.getmaskarray(data)
-            n, b = np.where(~mask)
-            data[n, b] = np.unique(data[n, b], return_inverse=True)[1]
+            # Normalise node ids for edge or face cells, by replacing
+            # each node id with its position in the sorted unique node
+            # ids
+            if np.ma.is_masked(data):
+                valid = ~data.mask
+                _, inverse = np.unique(data.data[valid], return_inverse=True)
+                data[valid] = inverse
+            else:
+                data[...] = np.unique(data, return_inverse=True)[1].reshape(
+                    data.shape
+                )
 
             if remove_empty_columns:
                 # Discard columns that are all missing data
@@ -552,8 +630,9 @@ class DomainTopology(
         if cell == "edge":
             # Sort within each row
             data.sort(axis=1)
-            # Sort over rows
-            data = sorted(data.tolist())
+            # Sort over rows, by the first column and then by the
+            # second
+            data = data[np.lexsort((data[:, 1], data[:, 0]))]
 
         elif cell == "point":
             # Sort within each row from column 1
@@ -584,21 +663,18 @@ class DomainTopology(
             sort: `bool`
                 If True then sort output edges. This is equivalent to,
                 but faster than, setting *sort* to False and sorting
-                the returned `{{class}}` with its `sort` method.
+                the returned `{{class}}` with its `sort` method. By
+                default the edges are in the order in which they are
+                first defined by the original domain topology.
 
             face_nodes: `None` or sequence of `int`, optional
-                The unique node ids for 'face' cells. If `None` (the
-                default) then the node ids will be inferred from the
-                data, at some computational expense. The order of the
-                nodes is immaterial. Providing *face_nodes* is an
-                optimisation in the case that these are known
-                externally.
-
-                .. warning:: No checks are carried out to ensure that
-                             the given *face_nodes* match the actual
-                             node ids stored in the data, and a
-                             mis-match will result in an exception or,
-                             worse, an incorrect result.
+                Deprecated at version NEXTVERSION. A
+                `DeprecationWarning` is issued, and the node ids are
+                ignored, if set, since they are no longer needed to
+                find the edges of faces.
+
+                The unique node ids for 'face' cells. An exception is
+                raised if set for any other cell type.
 
         :Returns:
 
@@ -627,15 +703,15 @@ class DomainTopology(
         >>> edge
         <DomainTopology: cell:edge(9, 2) >
         >>> print(edge.array)
-        [[0 1]
-         [2 4]
-         [2 3]
+        [[2 3]
+         [1 3]
+         [0 1]
          [0 2]
          [4 5]
-         [3 6]
+         [3 5]
+         [2 4]
          [1 6]
-         [1 3]
-         [3 5]]
+         [3 6]]
         >>> print(dt.to_edge(sort=True).array)
         [[0 1]
          [0 2]
@@ -680,15 +756,21 @@ class DomainTopology(
          [4 5]]
 
         """
-        edges = []
-        edges_extend = edges.extend
-
         cell = self.get_cell(None)
         if face_nodes is not None and cell != "face":
             raise ValueError(
                 f"Can't set 'face_nodes' for {self!r} with {cell} cells"
             )
 
+        if face_nodes is not None:
+            warnings.warn(
+                "The 'face_nodes' parameter of to_edge was deprecated at "
+                "version NEXTVERSION and is ignored, since the node ids "
+                "are no longer needed to find the edges of faces",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+
         # Deal with simple "edge" case first
         if cell == "edge":
             if sort:
@@ -698,62 +780,33 @@ class DomainTopology(
 
             return edges
 
-        # Still here? Then deal with the other cell types.
+        # Still here? Then deal with the other cell types, by finding
+        # the node-pairs that define the edges.
         if cell == "point":
+            # Each node is linked to the other nodes in its row
             points = self.array
-            masked = np.ma.is_masked(points)
-
-            # Loop round the nodes, finding the node-pairs that define
-            # the edges.
-            for row in points:
-                if masked:
-                    row = row.compressed()
-
-                node = int(row[0])
-                row = row[1:].tolist()
-                edges_extend(
-                    [(node, n) if node < n else (n, node) for n in row]
-                )
-
-            del points, row
+            node1 = points[:, 1:]
+            node0 = np.broadcast_to(points[:, :1], node1.shape)
+            valid = ~np.ma.getmaskarray(node1)
+            node0 = np.ma.getdata(node0)[valid]
+            node1 = np.ma.getdata(node1)[valid]
+            del points, valid
 
         elif cell == "face":
+            # Each face node is linked to the next node of the face
             from cfdm.data.subarray import PointTopologyFromFacesSubarray
 
-            connected_nodes = PointTopologyFromFacesSubarray._connected_nodes
-
-            faces = self.array
-            masked = np.ma.is_masked(faces)
-
-            if face_nodes is None:
-                # Find the unique node ids
-                face_nodes = np.unique(faces).tolist()
-                if masked:
-                    face_nodes = face_nodes[:-1]
-
-            # Loop round the face nodes, finding the node-pairs that
-            # define the edges.
-            for n in face_nodes:
-                edges_extend(connected_nodes(n, faces, masked, edges=True))
-
-            del faces, face_nodes
+            node0, node1 = PointTopologyFromFacesSubarray._node_links(
+                self.array
+            )
 
         else:
             raise NotImplementedError(
                 f"Can't get edges from {self!r} with {cell} cells"
             )
 
-        # Remove duplicates to get the set of unique edges, because
-        # every edge currently appears twice in the 'edges' list.
-        #
-        # E.g. edge (1, 5) will appear once from processing node 1,
-        #      and once from processing node 5.
-        edges = set(edges)
-
-        if sort:
-            edges = sorted(edges)
-        else:
-            edges = list(edges)
+        edges = self._unique_edges(node0, node1, sort=sort)
+        del node0, node1
 
         edges = self._Data(edges, dtype=self.dtype)
 
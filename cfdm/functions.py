@@ -42,6 +42,12 @@ def configuration(
     chunksize=None,
     display_data=None,
     persist_data=None,
+    file_handle_pool=None,
+    metadata_cache=None,
+    chunk_cache=None,
+    remote_cache=None,
+    remote_disk_cache=None,
+    remote_disk_cache_directory=None,
 ):
     """Views and sets constants in the project-wide configuration.
 
@@ -54,6 +60,12 @@ def configuration(
     * `chunksize`
     * `display_data`
     * `persist_data`
+    * `file_handle_pool`
+    * `metadata_cache`
+    * `chunk_cache`
+    * `remote_cache`
+    * `remote_disk_cache`
+    * `remote_disk_cache_directory`
 
     These are all constants that apply throughout `cfdm`, except for
     in specific functions only if overridden by the corresponding
@@ -71,7 +83,9 @@ def configuration(
     .. versionadded:: (cfdm) 1.8.6
 
     .. seealso:: `atol`, `rtol`, `log_level`, `chunksize`,
-                 `display_data`, `persist_data`
+                 `display_data`, `persist_data`, `file_handle_pool`,
+                 `metadata_cache`, `chunk_cache`, `remote_cache`,
+                 `remote_disk_cache`, `remote_disk_cache_directory`
 
     :Parameters:
 
@@ -113,6 +127,48 @@ def configuration(
 
             .. versionadded:: (cfdm) 1.13.1.0
 
+        file_handle_pool: `int` or `Constant`, optional
+            The new maximum number of idle open datasets kept for
+            reuse. The default is to not change the current
+            behaviour.
+
+            .. versionadded:: (cfdm) NEXTVERSION
+
+        metadata_cache: `int` or `str` or `Constant`, optional
+            The new maximum size in bytes of the on-disk cache of
+            read datasets. The default is to not change the current
+            behaviour.
+
+            .. versionadded:: (cfdm) NEXTVERSION
+
+        chunk_cache: `int` or `str` or `Constant`, optional
+            The new maximum size in bytes of the in-memory cache of
+            decoded data chunks. The default is to not change the
+            current behaviour.
+
+            .. versionadded:: (cfdm) NEXTVERSION
+
+        remote_cache: `int` or `str` or `Constant`, optional
+            The new maximum size in bytes of the in-memory cache of
+            blocks read from remote datasets. The default is to not
+            change the current behaviour.
+
+            .. versionadded:: (cfdm) NEXTVERSION
+
+        remote_disk_cache: `int` or `str` or `Constant`, optional
+            The new maximum size in bytes of the persistent on-disk
+            cache of blocks read from remote datasets. The default
+            is to not change the current behaviour.
+
+            .. versionadded:: (cfdm) NEXTVERSION
+
+        remote_disk_cache_directory: `str` or `Constant`, optional
+            The new directory of the persistent on-disk cache of
+            blocks read from remote datasets. The default is to not
+            change the current behaviour.
+
+            .. versionadded:: (cfdm) NEXTVERSION
+
     :Returns:
 
         `Configuration`
@@ -130,14 +186,26 @@ def configuration(
                      'log_level': 'WARNING',
                      'chunksize': 134217728,
                      'display_data': True,
-                     'persist_data': False}>
+                     'persist_data': False,
+                     'file_handle_pool': 0,
+                     'metadata_cache': 0,
+                     'chunk_cache': 0,
+                     'remote_cache': 0,
+                     'remote_disk_cache': 0,
+                     'remote_disk_cache_directory': '/home/user/.cf/remote_cache'}>
     >>> print(cfdm.configuration())
     {'atol': 2.220446049250313e-16,
      'rtol': 2.220446049250313e-16,
      'log_level': 'WARNING',
      'chunksize': 134217728,
      'display_data': True,
-     'persist_data': False}
+     'persist_data': False,
+     'file_handle_pool': 0,
+     'metadata_cache': 0,
+     'chunk_cache': 0,
+     'remote_cache': 0,
+     'remote_disk_cache': 0,
+     'remote_disk_cache_directory': '/home/user/.cf/remote_cache'}
 
     Make a change to one constant and see that it is reflected in the
     configuration:
@@ -150,7 +218,13 @@ def configuration(
      'log_level': 'DEBUG',
      'chunksize': 134217728,
      'display_data': True,
-     'persist_data': False}
+     'persist_data': False,
+     'file_handle_pool': 0,
+     'metadata_cache': 0,
+     'chunk_cache': 0,
+     'remote_cache': 0,
+     'remote_disk_cache': 0,
+     'remote_disk_cache_directory': '/home/user/.cf/remote_cache'}
 
     Access specific values by key querying, noting the equivalency to
     using its bespoke function:
@@ -168,14 +242,26 @@ def configuration(
      'log_level': 'DEBUG',
      'chunksize': 134217728,
      'display_data': True,
-     'persist_data': False}
+     'persist_data': False,
+     'file_handle_pool': 0,
+     'metadata_cache': 0,
+     'chunk_cache': 0,
+     'remote_cache': 0,
+     'remote_disk_cache': 0,
+     'remote_disk_cache_directory': '/home/user/.cf/remote_cache'}
     >>> print(cfdm.configuration())
     {'atol': 5e-14,
      'rtol': 2.220446049250313e-16,
      'log_level': 'INFO',
      'chunksize': 134217728,
      'display_data': True,
-     'persist_data': False}
+     'persist_data': False,
+     'file_handle_pool': 0,
+     'metadata_cache': 0,
+     'chunk_cache': 0,
+     'remote_cache': 0,
+     'remote_disk_cache': 0,
+     'remote_disk_cache_directory': '/home/user/.cf/remote_cache'}
 
     Set a single constant without using its bespoke function:
 
@@ -185,14 +271,26 @@ def configuration(
      'log_level': 'INFO',
      'chunksize': 134217728,
      'display_data': True,
-     'persist_data': False}
+     'persist_data': False,
+     'file_handle_pool': 0,
+     'metadata_cache': 0,
+     'chunk_cache': 0,
+     'remote_cache': 0,
+     'remote_disk_cache': 0,
+     'remote_disk_cache_directory': '/home/user/.cf/remote_cache'}
     >>> cfdm.configuration()
     {'atol': 5e-14,
      'rtol': 1e-17,
      'log_level': 'INFO',
      'chunksize': 134217728,
      'display_data': True,
-     'persist_data': False}
+     'persist_data': False,
+     'file_handle_pool': 0,
+     'metadata_cache': 0,
+     'chunk_cache': 0,
+     'remote_cache': 0,
+     'remote_disk_cache': 0,
+     'remote_disk_cache_directory': '/home/user/.cf/remote_cache'}
 
     Use as a context manager:
 
@@ -202,7 +300,13 @@ def configuration(
      'log_level': 'WARNING',
      'chunksize': 134217728,
      'display_data': True,
-     'persist_data': False}
+     'persist_data': False,
+     'file_handle_pool': 0,
+     'metadata_cache': 0,
+     'chunk_cache': 0,
+     'remote_cache': 0,
+     'remote_disk_cache': 0,
+     'remote_disk_cache_directory': '/home/user/.cf/remote_cache'}
     >>> with cfdm.configuration(atol=9, rtol=10):
     ...     print(cfdm.configuration())
     ...
@@ -213,7 +317,13 @@ def configuration(
      'log_level': 'WARNING',
      'chunksize': 134217728,
      'display_data': True,
-     'persist_data': False}
+     'persist_data': False,
+     'file_handle_pool': 0,
+     'metadata_cache': 0,
+     'chunk_cache': 0,
+     'remote_cache': 0,
+     'remote_disk_cache': 0,
+     'remote_disk_cache_directory': '/home/user/.cf/remote_cache'}
 
     """
     return _configuration(
@@ -224,6 +334,12 @@ def configuration(
         new_chunksize=chunksize,
         new_display_data=display_data,
         new_persist_data=persist_data,
+        new_file_handle_pool=file_handle_pool,
+        new_metadata_cache=metadata_cache,
+        new_chunk_cache=chunk_cache,
+        new_remote_cache=remote_cache,
+        new_remote_disk_cache=remote_disk_cache,
+        new_remote_disk_cache_directory=remote_disk_cache_directory,
     )
 
 
@@ -264,6 +380,12 @@ def _configuration(_Configuration, **kwargs):
         "new_chunksize": chunksize,
         "new_display_data": display_data,
         "new_persist_data": persist_data,
+        "new_file_handle_pool": file_handle_pool,
+        "new_metadata_cache": metadata_cache,
+        "new_chunk_cache": chunk_cache,
+        "new_remote_cache": remote_cache,
+        "new_remote_disk_cache": remote_disk_cache,
+        "new_remote_disk_cache_directory": remote_disk_cache_directory,
     }
 
     # Make sure that the constants dictionary is fully populated
@@ -2138,6 +2260,836 @@ class persist_data(ConstantAccess):
         return bool(arg)
 
 
+class file_handle_pool(ConstantAccess):
+    """Control the reuse of open datasets.
+
+    Set the maximum number of idle open datasets that are kept for
+    reuse by file-based arrays (such as `{{package}}.NetCDF4Array`,
+    `{{package}}.H5netcdfArray`, `{{package}}.PyfiveArray`,
+    `{{package}}.ScipyNetcdfFileArray`, and
+    `{{package}}.ZarrArray`). If greater than zero then a dataset
+    that has been opened to read data is returned to a process-wide
+    pool, rather than being closed, so that subsequent reads from
+    the same dataset (e.g. those for other dask chunks) don't need
+    to open it again. When the pool is full, the least recently used
+    idle dataset is closed.
+
+    A dataset is identified in the pool by its backend library, its
+    name, and its storage options. Idle datasets for local files are
+    not reused if the file has been modified since it was opened.
+
+    Reducing the maximum size closes any excess idle datasets. If
+    zero, the default, then datasets are always closed after each
+    read.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    .. seealso:: `configuration`, `file_handle_pool_statistics`
+
+    :Parameters:
+
+        arg: `int` or `Constant`, optional
+            The new maximum number of idle open datasets. The default
+            is to not change the current value.
+
+    :Returns:
+
+        `Constant`
+            The value prior to the change, or the current value if no
+            new value was specified.
+
+    **Examples**
+
+    >>> {{package}}.file_handle_pool()
+    <{{repr}}Constant: 0>
+    >>> old = {{package}}.file_handle_pool(64)
+    >>> {{package}}.file_handle_pool()
+    <{{repr}}Constant: 64>
+    >>> {{package}}.file_handle_pool(old)
+    <{{repr}}Constant: 64>
+    >>> {{package}}.file_handle_pool()
+    <{{repr}}Constant: 0>
+
+    Use as a context manager:
+
+    >>> with {{package}}.file_handle_pool(16):
+    ...     print({{package}}.file_handle_pool())
+    ...
+    16
+    >>> print({{package}}.file_handle_pool())
+    0
+
+    """
+
+    _name = "file_handle_pool"
+    _default = 0
+
+    def _parse(cls, arg):
+        """Parse a new constant value.
+
+        .. versionaddedd:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            cls:
+                This class.
+
+            arg:
+                The given new constant value.
+
+        :Returns:
+
+                A version of the new constant value suitable for
+                insertion into the `_constants` dictionary.
+
+        """
+        from .data.filehandlepool import handle_pool
+
+        arg = int(arg)
+        if arg < 0:
+            raise ValueError(
+                "The file handle pool size must be a non-negative integer. "
+                f"Got: {arg!r}"
+            )
+
+        # Close any excess idle datasets
+        handle_pool._trim(arg)
+        return arg
+
+
+def file_handle_pool_statistics(reset=False):
+    """Return statistics on the reuse of open datasets.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    .. seealso:: `file_handle_pool`
+
+    :Parameters:
+
+        reset: `bool`, optional
+            If True then reset the hit, miss and eviction counters to
+            zero after they have been returned.
+
+    :Returns:
+
+        `dict`
+            The statistics, with keys:
+
+            * ``'hits'``: The number of times that an idle open
+              dataset was reused.
+            * ``'misses'``: The number of times that a dataset had
+              to be opened.
+            * ``'evictions'``: The number of idle open datasets that
+              were closed to make room in the pool.
+            * ``'idle'``: The number of idle open datasets currently
+              in the pool.
+            * ``'borrowed'``: The number of open datasets currently
+              in use.
+            * ``'maxsize'``: The maximum number of idle open
+              datasets, as given by `file_handle_pool`.
+
+    **Examples**
+
+    >>> with {{package}}.file_handle_pool(8):
+    ...     f = {{package}}.read('file.nc')[0]
+    ...     _ = f.data.array
+    ...     print({{package}}.file_handle_pool_statistics())
+    ...
+    {'hits': 11, 'misses': 1, 'evictions': 0, 'idle': 1, 'borrowed': 0, 'maxsize': 8}
+
+    """
+    from .data.filehandlepool import handle_pool
+
+    return handle_pool.statistics(reset=reset)
+
+
+class metadata_cache(ConstantAccess):
+    """Control the on-disk cache of read datasets.
+
+    Set the maximum total size in bytes of the persistent cache of
+    the field or domain constructs read from local netCDF files. If
+    greater than zero then the constructs read from a local netCDF
+    file are stored on disk, so that a subsequent read of the same,
+    unchanged file with the same read parameters returns them without
+    parsing the file again. The returned constructs are lazy in the
+    same way as newly read ones, so the file is not opened until
+    their data are accessed. This can be much faster for files which
+    are read repeatedly.
+
+    A cache entry is identified by the file's absolute path,
+    modification time and size (and those of any external variables
+    files), the `{{package}}` version, and the parameters of the read,
+    so an entry is never used after its file has changed. Datasets
+    that are not local netCDF files (e.g. CDL, Zarr, and remote
+    datasets), and reads that request warnings, are not cached.
+
+    The cache is stored in the ``~/.cf/metadata_cache`` directory.
+    When a new entry is stored, the least recently used entries are
+    deleted until the total size of the cache is no greater than the
+    maximum size. If zero, the default, then the cache is neither
+    used nor added to, but any existing entries are retained.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    .. seealso:: `configuration`, `metadata_cache_statistics`
+
+    :Parameters:
+
+        arg: `int` or `str` or `Constant`, optional
+            The new maximum cache size in bytes. Any size accepted
+            by `dask.utils.parse_bytes` is accepted, for instance
+            ``1000000``, ``'1MB'`` and ``'1MiB'`` are all equivalent
+            to 1000000 bytes. The default is to not change the
+            current value.
+
+    :Returns:
+
+        `Constant`
+            The value prior to the change, or the current value if no
+            new value was specified.
+
+    **Examples**
+
+    >>> {{package}}.metadata_cache()
+    <{{repr}}Constant: 0>
+    >>> old = {{package}}.metadata_cache('1GiB')
+    >>> {{package}}.metadata_cache()
+    <{{repr}}Constant: 1073741824>
+    >>> {{package}}.metadata_cache(old)
+    <{{repr}}Constant: 1073741824>
+    >>> {{package}}.metadata_cache()
+    <{{repr}}Constant: 0>
+
+    Use as a context manager:
+
+    >>> with {{package}}.metadata_cache(10**8):
+    ...     print({{package}}.metadata_cache())
+    ...
+    100000000
+    >>> print({{package}}.metadata_cache())
+    0
+
+    """
+
+    _name = "metadata_cache"
+    _default = 0
+
+    def _parse(cls, arg):
+        """Parse a new constant value.
+
+        .. versionaddedd:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            cls:
+                This class.
+
+            arg:
+                The given new constant value.
+
+        :Returns:
+
+                A version of the new constant value suitable for
+                insertion into the `_constants` dictionary.
+
+        """
+        from dask.utils import parse_bytes
+
+        arg = parse_bytes(arg)
+        if arg < 0:
+            raise ValueError(
+                "The metadata cache size must be non-negative. "
+                f"Got: {arg!r}"
+            )
+
+        return arg
+
+
+def metadata_cache_statistics(reset=False):
+    """Return statistics on the on-disk cache of read datasets.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    .. seealso:: `metadata_cache`
+
+    :Parameters:
+
+        reset: `bool`, optional
+            If True then reset the hit, miss and eviction counters to
+            zero after they have been returned.
+
+    :Returns:
+
+        `dict`
+            The statistics, with keys:
+
+            * ``'hits'``: The number of reads that were satisfied by
+              the cache.
+            * ``'misses'``: The number of reads that could have been,
+              but were not, satisfied by the cache.
+            * ``'evictions'``: The number of cache entries that were
+              deleted to make room in the cache.
+            * ``'files'``: The number of entries currently in the
+              cache.
+            * ``'size'``: The total size in bytes of the entries
+              currently in the cache.
+            * ``'maxsize'``: The maximum size in bytes of the cache,
+              as given by `metadata_cache`.
+
+    **Examples**
+
+    >>> with {{package}}.metadata_cache('1GiB'):
+    ...     f = {{package}}.read('file.nc')
+    ...     g = {{package}}.read('file.nc')
+    ...     print({{package}}.metadata_cache_statistics())
+    ...
+    {'hits': 1, 'misses': 1, 'evictions': 0, 'files': 1, 'size': 10264, 'maxsize': 1073741824}
+
+    """
+    from .read_write.netcdf.metadatacache import metadata_cache
+
+    return metadata_cache.statistics(reset=reset)
+
+
+class chunk_cache(ConstantAccess):
+    """Control the in-memory cache of decoded data chunks.
+
+    Set the maximum total size in bytes of the process-wide cache of
+    data read from datasets by file-based arrays (such as
+    `{{package}}.NetCDF4Array`, `{{package}}.H5netcdfArray`,
+    `{{package}}.PyfiveArray`, `{{package}}.ScipyNetcdfFileArray`,
+    and `{{package}}.ZarrArray`). If greater than zero then each
+    subspace that is read from a dataset variable (e.g. for one dask
+    chunk) is stored in memory after any masking and unpacking, so
+    that a subsequent read of the same subspace is satisfied without
+    accessing the dataset. This can be much faster when the same lazy
+    data are computed repeatedly, without having to hold entire
+    arrays in memory.
+
+    A subspace is identified in the cache by its dataset, its
+    variable, its index, and the masking and unpacking options.
+    Subspaces of local files are not reused if the file's
+    modification time or size have changed since they were cached,
+    which requires the file to be inspected (with `os.stat`) on every
+    read. Local directory stores (such as Zarr datasets) are never
+    cached, since overwriting a chunk in place does not change the
+    modification time or size of the directory.
+
+    When a new subspace is stored, the least recently used subspaces
+    are evicted until the total size of the cache is no greater than
+    the maximum size, and a subspace that is larger than the maximum
+    size is never stored. Reducing the maximum size evicts any excess
+    subspaces. If zero, the default, then the cache is not used.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    .. seealso:: `configuration`, `chunk_cache_statistics`
+
+    :Parameters:
+
+        arg: `int` or `str` or `Constant`, optional
+            The new maximum cache size in bytes. Any size accepted
+            by `dask.utils.parse_bytes` is accepted, for instance
+            ``1000000``, ``'1MB'`` and ``'1MiB'`` are all equivalent
+            to 1000000 bytes. The default is to not change the
+            current value.
+
+    :Returns:
+
+        `Constant`
+            The value prior to the change, or the current value if no
+            new value was specified.
+
+    **Examples**
+
+    >>> {{package}}.chunk_cache()
+    <{{repr}}Constant: 0>
+    >>> old = {{package}}.chunk_cache('1GiB')
+    >>> {{package}}.chunk_cache()
+    <{{repr}}Constant: 1073741824>
+    >>> {{package}}.chunk_cache(old)
+    <{{repr}}Constant: 1073741824>
+    >>> {{package}}.chunk_cache()
+    <{{repr}}Constant: 0>
+
+    Use as a context manager:
+
+    >>> with {{package}}.chunk_cache(10**8):
+    ...     print({{package}}.chunk_cache())
+    ...
+    100000000
+    >>> print({{package}}.chunk_cache())
+    0
+
+    """
+
+    _name = "chunk_cache"
+    _default = 0
+
+    def _parse(cls, arg):
+        """Parse a new constant value.
+
+        .. versionaddedd:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            cls:
+                This class.
+
+            arg:
+                The given new constant value.
+
+        :Returns:
+
+                A version of the new constant value suitable for
+                insertion into the `_constants` dictionary.
+
+        """
+        from dask.utils import parse_bytes
+
+        from .data.chunkcache import chunk_store
+
+        arg = parse_bytes(arg)
+        if arg < 0:
+            raise ValueError(
+                f"The chunk cache size must be non-negative. Got: {arg!r}"
+            )
+
+        # Evict any excess chunks
+        chunk_store._trim(arg)
+        return arg
+
+
+def chunk_cache_statistics(reset=False):
+    """Return statistics on the in-memory cache of decoded data chunks.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    .. seealso:: `chunk_cache`
+
+    :Parameters:
+
+        reset: `bool`, optional
+            If True then reset the hit, miss and eviction counters to
+            zero after they have been returned.
+
+    :Returns:
+
+        `dict`
+            The statistics, with keys:
+
+            * ``'hits'``: The number of reads that were satisfied by
+              the cache.
+            * ``'misses'``: The number of reads that were not
+              satisfied by the cache.
+            * ``'evictions'``: The number of chunks that were evicted
+              to make room in the cache.
+            * ``'chunks'``: The number of chunks currently in the
+              cache.
+            * ``'size'``: The total size in bytes of the chunks
+              currently in the cache.
+            * ``'maxsize'``: The maximum size in bytes of the cache,
+              as given by `chunk_cache`.
+
+    **Examples**
+
+    >>> with {{package}}.chunk_cache('1GiB'):
+    ...     f = {{package}}.read('file.nc')[0]
+    ...     _ = f.data.array
+    ...     _ = f.data.array
+    ...     print({{package}}.chunk_cache_statistics())
+    ...
+    {'hits': 1, 'misses': 1, 'evictions': 0, 'chunks': 1, 'size': 320, 'maxsize': 1073741824}
+
+    """
+    from .data.chunkcache import chunk_store
+
+    return chunk_store.statistics(reset=reset)
+
+
+class remote_cache(ConstantAccess):
+    """Control the in-memory cache of blocks read from remote datasets.
+
+    Set the maximum total size in bytes of the process-wide cache of
+    blocks read from datasets with a remote storage protocol (such as
+    ``s3`` or ``https``). If greater than zero then remote datasets
+    are read in fixed-size blocks, with one request for each run of
+    consecutive blocks that are not already cached, plus a
+    read-ahead block. The requests for a batch of byte ranges (such
+    as the storage chunks needed for a dask chunk) are issued
+    concurrently, and the blocks are stored in memory so that
+    subsequent reads of the same bytes, from any open instance of the
+    same dataset, don't need to access the remote storage again. This
+    can greatly reduce the number of requests to the remote storage.
+
+    A block is identified in the cache by its file system, its
+    dataset path, its block size and number, and the dataset's size
+    and (when reported by the file system) its version.
+
+    When a new block is stored, the least recently used blocks are
+    evicted until the total size of the cache is no greater than the
+    maximum size. Reducing the maximum size evicts any excess blocks.
+    If zero, the default, then the cache is not used and remote
+    datasets are opened with the file system's own caching.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    .. seealso:: `configuration`, `remote_cache_statistics`
+
+    :Parameters:
+
+        arg: `int` or `str` or `Constant`, optional
+            The new maximum cache size in bytes. Any size accepted
+            by `dask.utils.parse_bytes` is accepted, for instance
+            ``1000000``, ``'1MB'`` and ``'1MiB'`` are all equivalent
+            to 1000000 bytes. The default is to not change the
+            current value.
+
+    :Returns:
+
+        `Constant`
+            The value prior to the change, or the current value if no
+            new value was specified.
+
+    **Examples**
+
+    >>> {{package}}.remote_cache()
+    <{{repr}}Constant: 0>
+    >>> old = {{package}}.remote_cache('1GiB')
+    >>> {{package}}.remote_cache()
+    <{{repr}}Constant: 1073741824>
+    >>> {{package}}.remote_cache(old)
+    <{{repr}}Constant: 1073741824>
+    >>> {{package}}.remote_cache()
+    <{{repr}}Constant: 0>
+
+    Use as a context manager:
+
+    >>> with {{package}}.remote_cache(10**8):
+    ...     print({{package}}.remote_cache())
+    ...
+    100000000
+    >>> print({{package}}.remote_cache())
+    0
+
+    """
+
+    _name = "remote_cache"
+    _default = 0
+
+    def _parse(cls, arg):
+        """Parse a new constant value.
+
+        .. versionaddedd:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            cls:
+                This class.
+
+            arg:
+                The given new constant value.
+
+        :Returns:
+
+                A version of the new constant value suitable for
+                insertion into the `_constants` dictionary.
+
+        """
+        from dask.utils import parse_bytes
+
+        from .data.remotefile import block_cache
+
+        arg = parse_bytes(arg)
+        if arg < 0:
+            raise ValueError(
+                f"The remote cache size must be non-negative. Got: {arg!r}"
+            )
+
+        # Evict any excess blocks
+        block_cache._trim(arg)
+        return arg
+
+
+def remote_cache_statistics(reset=False):
+    """Return statistics on the in-memory cache of remote blocks.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    .. seealso:: `remote_cache`
+
+    :Parameters:
+
+        reset: `bool`, optional
+            If True then reset the hit, miss, eviction, request and
+            bytes read counters to zero after they have been
+            returned.
+
+    :Returns:
+
+        `dict`
+            The statistics, with keys:
+
+            * ``'hits'``: The number of block reads that were
+              satisfied by the cache.
+            * ``'misses'``: The number of block reads that were not
+              satisfied by the cache.
+            * ``'evictions'``: The number of blocks that were evicted
+              to make room in the cache.
+            * ``'blocks'``: The number of blocks currently in the
+              cache.
+            * ``'size'``: The total size in bytes of the blocks
+              currently in the cache.
+            * ``'maxsize'``: The maximum size in bytes of the cache,
+              as given by `remote_cache`.
+            * ``'requests'``: The number of byte range requests that
+              have been made to remote storage.
+            * ``'bytes_read'``: The total number of bytes that have
+              been read from remote storage.
+
+    **Examples**
+
+    >>> with {{package}}.remote_cache('1GiB'):
+    ...     f = {{package}}.read('s3://bucket/file.nc')[0]
+    ...     _ = f.data.array
+    ...     print({{package}}.remote_cache_statistics())
+    ...
+    {'hits': 14, 'misses': 3, 'evictions': 0, 'blocks': 3, 'size': 3145728, 'maxsize': 1073741824, 'requests': 2, 'bytes_read': 3145728}
+
+    """
+    from .data.remotefile import block_cache
+
+    return block_cache.statistics(reset=reset)
+
+
+class remote_disk_cache(ConstantAccess):
+    """Control the persistent on-disk cache of remote dataset blocks.
+
+    Set the maximum total size in bytes of the persistent on-disk
+    cache of blocks read from datasets with a remote storage protocol
+    (such as ``s3`` or ``https``). If greater than zero then each
+    block that is read from a remote dataset is also stored in a
+    cache file in the `remote_disk_cache_directory` directory, so
+    that subsequent reads of the same bytes, by any process that
+    shares the directory, are satisfied at local disk speed without
+    accessing the remote storage. This applies to all remote reads,
+    including the data of file-based arrays (such as
+    `{{package}}.H5netcdfArray`), aggregation fragments, and the
+    byte ranges referenced by Kerchunk datasets.
+
+    A block is identified in the cache by its dataset's protocol,
+    path, size and version (i.e. the ETag or modification time
+    reported by the file system), and by its block size and number.
+    Blocks are therefore never reused after their remote dataset has
+    changed, and blocks of datasets for which no version is reported
+    are not stored.
+
+    When a new block is stored, the least recently used blocks are
+    evicted until the total size of the cache is no greater than the
+    maximum size. Reducing the maximum size evicts any excess blocks.
+    If zero, the default, then the cache is not used.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    .. seealso:: `configuration`, `remote_cache`,
+                 `remote_disk_cache_directory`,
+                 `remote_disk_cache_statistics`
+
+    :Parameters:
+
+        arg: `int` or `str` or `Constant`, optional
+            The new maximum cache size in bytes. Any size accepted
+            by `dask.utils.parse_bytes` is accepted, for instance
+            ``1000000``, ``'1MB'`` and ``'1MiB'`` are all equivalent
+            to 1000000 bytes. The default is to not change the
+            current value.
+
+    :Returns:
+
+        `Constant`
+            The value prior to the change, or the current value if no
+            new value was specified.
+
+    **Examples**
+
+    >>> {{package}}.remote_disk_cache()
+    <{{repr}}Constant: 0>
+    >>> old = {{package}}.remote_disk_cache('10GiB')
+    >>> {{package}}.remote_disk_cache()
+    <{{repr}}Constant: 10737418240>
+    >>> {{package}}.remote_disk_cache(old)
+    <{{repr}}Constant: 10737418240>
+    >>> {{package}}.remote_disk_cache()
+    <{{repr}}Constant: 0>
+
+    Use as a context manager:
+
+    >>> with {{package}}.remote_disk_cache('10GiB'):
+    ...     f = {{package}}.read('s3://bucket/file.nc')
+    ...     print(f[0].data.array.sum())
+    ...
+    6823.5
+
+    """
+
+    _name = "remote_disk_cache"
+    _default = 0
+
+    def _parse(cls, arg):
+        """Parse a new constant value.
+
+        .. versionaddedd:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            cls:
+                This class.
+
+            arg:
+                The given new constant value.
+
+        :Returns:
+
+                A version of the new constant value suitable for
+                insertion into the `_constants` dictionary.
+
+        """
+        from dask.utils import parse_bytes
+
+        arg = parse_bytes(arg)
+        if arg < 0:
+            raise ValueError(
+                "The remote disk cache size must be non-negative. "
+                f"Got: {arg!r}"
+            )
+
+        if arg:
+            # Evict any excess blocks
+            from .data.remotefile import disk_cache
+
+            disk_cache._trim(arg)
+
+        return arg
+
+
+class remote_disk_cache_directory(ConstantAccess):
+    """The directory of the persistent on-disk cache of remote blocks.
+
+    The cache files of the persistent on-disk cache of blocks read
+    from remote datasets are stored in this directory, which is
+    created if it does not exist. The directory may be shared by
+    concurrent processes. The default directory is
+    ``~/.cf/remote_cache``.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    .. seealso:: `configuration`, `remote_disk_cache`,
+                 `remote_disk_cache_statistics`
+
+    :Parameters:
+
+        arg: `str` or `Constant`, optional
+            The new directory. Tilde and environment variable
+            expansions are applied. The default is to not change the
+            current value.
+
+    :Returns:
+
+        `Constant`
+            The value prior to the change, or the current value if no
+            new value was specified.
+
+    **Examples**
+
+    >>> {{package}}.remote_disk_cache_directory()
+    <{{repr}}Constant: '/home/user/.cf/remote_cache'>
+    >>> old = {{package}}.remote_disk_cache_directory('/scratch/cache')
+    >>> {{package}}.remote_disk_cache_directory()
+    <{{repr}}Constant: '/scratch/cache'>
+    >>> {{package}}.remote_disk_cache_directory(old)
+    <{{repr}}Constant: '/scratch/cache'>
+
+    """
+
+    _name = "remote_disk_cache_directory"
+    _default = join(os.path.expanduser("~"), ".cf", "remote_cache")
+
+    def _parse(cls, arg):
+        """Parse a new constant value.
+
+        .. versionaddedd:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            cls:
+                This class.
+
+            arg:
+                The given new constant value.
+
+        :Returns:
+
+                A version of the new constant value suitable for
+                insertion into the `_constants` dictionary.
+
+        """
+        if not isinstance(arg, str) or not arg:
+            raise ValueError(
+                "The remote disk cache directory must be a non-empty "
+                f"string. Got: {arg!r}"
+            )
+
+        return os.path.abspath(os.path.expanduser(os.path.expandvars(arg)))
+
+
+def remote_disk_cache_statistics(reset=False):
+    """Return statistics on the on-disk cache of remote blocks.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    .. seealso:: `remote_disk_cache`, `remote_disk_cache_directory`
+
+    :Parameters:
+
+        reset: `bool`, optional
+            If True then reset the hit, miss and eviction counters to
+            zero after they have been returned.
+
+    :Returns:
+
+        `dict`
+            The statistics, with keys:
+
+            * ``'hits'``: The number of block reads that were
+              satisfied by the cache.
+            * ``'misses'``: The number of block reads that were not
+              satisfied by the cache.
+            * ``'evictions'``: The number of cache files that were
+              deleted to make room in the cache.
+            * ``'files'``: The number of cache files currently in the
+              cache.
+            * ``'size'``: The total size in bytes of the cache files
+              currently in the cache.
+            * ``'maxsize'``: The maximum size in bytes of the cache,
+              as given by `remote_disk_cache`.
+            * ``'directory'``: The cache directory, as given by
+              `remote_disk_cache_directory`.
+
+    **Examples**
+
+    >>> with {{package}}.remote_disk_cache('10GiB'):
+    ...     f = {{package}}.read('s3://bucket/file.nc')[0]
+    ...     _ = f.data.array
+    ...     print({{package}}.remote_disk_cache_statistics())
+    ...
+    {'hits': 0, 'misses': 3, 'evictions': 0, 'files': 3, 'size': 3145728, 'maxsize': 10737418240, 'directory': '/home/user/.cf/remote_cache'}
+
+    """
+    from .data.remotefile import disk_cache
+
+    return disk_cache.statistics(reset=reset)
+
+
 def ATOL(*new_atol):
     """Alias for `cfdm.atol`."""
     return atol(*new_atol)
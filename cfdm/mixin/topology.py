@@ -74,25 +74,45 @@ class Topology:
             smallest_id = data[0, 0]
             largest_id = data[-1, 0]
         else:
-            # Remove negative values
-            #
-            # PERFORMANCE WARNING (TODO): A potentially slow loop
-            smallest_id = None
-            dmin = data.min()
-            if dmin < 0:
-                data -= dmin
-                ids = data[:, 0]
-
-            # Replace the non-negative cell ids (i) with negative
-            # numbers (j)
-            copyto = np.copyto
-            for i, j in zip(ids.tolist(), range(-n_cells, 0)):
-                copyto(data, j, where=data == i)
-
+            # Replace each cell id with the negative number (j) given
+            # by the position of its cell in the first column, minus
+            # the number of cells. Values that are not cell ids are
+            # set to zero, which is then treated as redundant.
+            ids = np.ma.getdata(ids)
+            values = np.ma.getdata(data)
             if masked:
-                # Re-mask the data, since np.copyto is not mask-aware.
-                data = np.ma.array(data, mask=mask)
+                # Replace the arbitrary values under the mask
+                values = np.where(mask, ids[0], values)
+
+            vmin = int(values.min())
+            vmax = int(values.max())
+            if vmax - vmin < 4 * values.size:
+                # The values span a small enough range to be replaced
+                # with a lookup table
+                j = np.zeros((vmax - vmin + 1,), dtype=int)
+                j[ids - vmin] = np.arange(-n_cells, 0)
+                j = j[values - vmin]
+            else:
+                # Find each value in the sorted cell ids
+                order = np.argsort(ids, kind="stable")
+                sorted_ids = ids[order]
+                position = np.searchsorted(sorted_ids, values)
+                position[position == n_cells] = 0
+                j = np.where(
+                    sorted_ids[position] == values,
+                    order[position] - n_cells,
+                    0,
+                )
+                del order, sorted_ids, position
+
+            j = j.astype(data.dtype, copy=False)
+            if masked:
+                data = np.ma.array(j, mask=mask)
+            else:
+                data = j
 
+            del values, j
+            smallest_id = None
             largest_id = -1
 
         # Remove redundant cell ids. These may occur when a previous
@@ -1,3 +1,4 @@
 from .abstract import IO, IORead, IOWrite
 from .read import read
+from .iread import iread
 from .write import write
@@ -153,7 +153,11 @@ class IORead(IO, metaclass=abc.ABCMeta):
         :Returns:
 
             file-like object
-                The open file handle for the dataset.
+                The open file handle for the dataset. If a remote
+                cache is enabled (see `cfdm.remote_cache` and
+                `cfdm.remote_disk_cache`) and *filesystem* is a
+                remote `fsspec` file system then this is a
+                `RemoteFile` that reads the dataset via the caches.
 
         """
         if open_options is None:
@@ -163,8 +167,18 @@ class IORead(IO, metaclass=abc.ABCMeta):
             open_options = open_options.copy()
             open_options["mode"] = "rb"
 
+        from ...data.remotefile import RemoteFile, remote_cache_enabled
+
         try:
-            fh = filesystem.open(dataset, **open_options)
+            if (
+                open_options == {"mode": "rb"}
+                and remote_cache_enabled()
+                and RemoteFile.is_remote(filesystem)
+            ):
+                # Read the remote dataset via the block caches
+                fh = RemoteFile(filesystem, dataset)
+            else:
+                fh = filesystem.open(dataset, **open_options)
         except AttributeError:
             raise AttributeError(
                 f"The file system object {filesystem!r} does not have "
@@ -0,0 +1,156 @@
+from logging import getLogger
+
+from cfdm.functions import is_log_level_info
+
+from .read import read
+
+logger = getLogger(__name__)
+
+
+class iread(read):
+    """Iterate over field or domain constructs read from datasets.
+
+    This is the iterator form of `{{package}}.read`, and accepts
+    exactly the same parameters. Rather than returning a list of all
+    of the constructs from all of the datasets, the constructs are
+    returned one at a time, dataset by dataset.
+
+    Each dataset is read only when the constructs of the previous
+    dataset have all been returned, and the internal state arising
+    from reading a dataset is released before the next dataset is
+    read. This means that memory usage remains bounded when iterating
+    over a large number of datasets, providing that the returned
+    constructs are not themselves retained.
+
+    The constructs from each dataset are sorted by the netCDF
+    variable names of their corresponding data or domain variables,
+    but the constructs are not sorted across datasets. So, when all
+    datasets contain only one construct, the constructs are returned
+    in the same order as the datasets.
+
+    The parameters are checked immediately, but no dataset is found
+    or read until the first construct is requested.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    .. seealso:: `{{package}}.read`
+
+    :Parameters:
+
+        The parameters are those of `{{package}}.read`. When reading
+        concurrently (see the *parallel* parameter), up to twice as
+        many datasets as there are workers may be read before the
+        constructs of earlier datasets have been returned.
+
+    :Returns:
+
+        generator
+            An iterator over the field or domain constructs read from
+            the datasets.
+
+    **Examples**
+
+    >>> for f in {{package}}.iread('file*.nc'):
+    ...     print(f.identity(), f.get_filenames())
+    ...
+    air_temperature {'/data/file1.nc'}
+    air_temperature {'/data/file2.nc'}
+
+    >>> g = {{package}}.iread('dir/', recursive=True)
+    >>> f = next(g)
+
+    """
+
+    def __new__(
+        cls,
+        datasets,
+        external=None,
+        extra=None,
+        verbose=None,
+        warnings=False,
+        warn_valid=False,
+        mask=True,
+        unpack=True,
+        domain=False,
+        netcdf_backend=None,
+        storage_options=None,
+        filesystem=None,
+        cache=True,
+        dask_chunks="storage-aligned",
+        store_dataset_chunks=True,
+        store_dataset_shards=True,
+        cfa=None,
+        cfa_write=None,
+        to_memory=False,
+        squeeze=False,
+        unsqueeze=False,
+        dataset_type=None,
+        recursive=False,
+        followlinks=False,
+        cdl_string=False,
+        extra_read_vars=None,
+        group_dimension_search="closest_ancestor",
+        select=None,
+        parallel=None,
+        unpack_dtype=None,
+        _noncompliance_report=False,
+        **kwargs,
+    ):
+        """Iterate over field or domain constructs read from datasets.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        kwargs = locals()
+        kwargs.update(kwargs.pop("kwargs"))
+
+        # Note: Bypass `read.__new__`, which would read all of the
+        #       datasets
+        self = super(read, cls).__new__(cls)
+
+        # Store the keyword arguments
+        self.kwargs = kwargs
+
+        # Actions to be taken before any datasets are been read
+        self._initialise()
+        self._check_initialisation()
+
+        return self._iread()
+
+    def _iread(self):
+        """Iterate over the constructs read from each dataset.
+
+        Called by `__new__`.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Returns:
+
+            generator
+                An iterator over the field or domain constructs.
+
+        """
+        n = 0
+        for dataset_contents in self._read_datasets():
+            # Apply the actions that would be taken after all
+            # datasets have been read to this dataset's contents
+            # alone
+            self.constructs = dataset_contents
+            self._finalise()
+            dataset_contents = self.constructs
+            self.constructs = []
+
+            n += len(dataset_contents)
+
+            # Hand over the dataset contents, without keeping any
+            # reference to them
+            dataset_contents.reverse()
+            while dataset_contents:
+                yield dataset_contents.pop()
+
+        if is_log_level_info(logger):
+            n_datasets = self.n_datasets
+            logger.info(
+                f"Read {n} {self.construct}{'s' if n != 1 else ''} "
+                f"from {n_datasets} dataset{'s' if n_datasets != 1 else ''}"
+            )  # pragma: no cover
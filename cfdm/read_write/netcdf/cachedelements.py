@@ -0,0 +1,235 @@
+from math import prod
+
+import numpy as np
+
+
+class CachedElements:
+    """Selected element values of a dataset variable.
+
+    The first, second, penultimate, and last element values (as
+    appropriate) of a dataset variable are found with as few reads of
+    the dataset as possible.
+
+    An instance is callable, and when called returns a dictionary of
+    the element values that is suitable for caching with
+    `Data._set_cached_elements`. If the element values have not
+    already been set, then they are found from the lazy array given at
+    initialisation, which is then discarded. This allows the reading
+    of the values to be deferred until they are first needed.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    """
+
+    def __init__(self, array=None, shape=None, one_chunk=False):
+        """**Initialisation**
+
+        :Parameters:
+
+            array: `Array`, optional
+                The lazy array from which to find the element values
+                when they are required.
+
+            shape: `tuple`, optional
+                The shape of the data. By default the shape of
+                *array* is used.
+
+            one_chunk: `bool`, optional
+                Whether or not the entire dataset variable is stored
+                in one dataset chunk, in which case the whole variable
+                is read once, rather than one read per element.
+
+        """
+        if shape is None and array is not None:
+            shape = array.shape
+
+        self.array = array
+        self.shape = shape
+        self.one_chunk = one_chunk
+        self.elements = None
+
+    def __call__(self):
+        """Return the element values.
+
+        x.__call__() <==> x()
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Returns:
+
+            `dict`
+                The element values, keyed by their positions, or an
+                empty dictionary if they have not been set and there
+                is no lazy array from which to find them.
+
+        """
+        elements = self.elements
+        if elements is None:
+            array = self.array
+            if array is None:
+                return {}
+
+            elements = self.find(
+                lambda index: array[index].array, self.shape, self.one_chunk
+            )
+            self.set_elements(elements)
+
+        return elements
+
+    def __getstate__(self):
+        """Return the state of the object for pickling.
+
+        The lazy array is omitted if the element values have already
+        been found.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        state = self.__dict__.copy()
+        if state["elements"] is not None:
+            state["array"] = None
+
+        return state
+
+    def set_elements(self, elements):
+        """Set the element values.
+
+        The lazy array is discarded, as it is no longer needed.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            elements: `dict`
+                The element values, keyed by their positions.
+
+        :Returns:
+
+            `None`
+
+        """
+        self.elements = elements
+        self.array = None
+
+    @staticmethod
+    def find(get, shape, one_chunk=False):
+        """Find the element values of a dataset variable.
+
+        The element values that are found are:
+
+        * The first, second, and last elements of 1-d data.
+
+        * The first two and last two elements of 2-d data with a
+          trailing dimension of size 2, on the assumption that it
+          contains coordinate bounds.
+
+        * The first and last elements of all other data, and also the
+          second element if there are exactly three elements.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            get: callable
+                A function that, given an index, returns the
+                corresponding subspace of the dataset variable as a
+                `numpy` array.
+
+            shape: `tuple`
+                The shape of the dataset variable.
+
+            one_chunk: `bool`, optional
+                Whether or not the entire dataset variable is stored
+                in one dataset chunk, in which case the variable is
+                read only once.
+
+        :Returns:
+
+            `dict`
+                The element values, keyed by their positions.
+
+        **Examples**
+
+        >>> a = np.arange(12.0)
+        >>> CachedElements.find(a.__getitem__, a.shape, one_chunk=True)
+        {0: 0.0, 1: 1.0, -1: 11.0}
+
+        """
+        size = prod(shape)
+        ndim = len(shape)
+
+        # Get the cached values, minimising the number of "gets" on
+        # the dataset by not accessing the same chunk twice, where
+        # possible.
+        if ndim == 1:
+            # Also cache the second element for 1-d data, on the
+            # assumption that they may well be dimension coordinate
+            # data.
+            if size == 1:
+                indices = (0, -1)
+                value = get(Ellipsis)
+                values = [value, value]
+            elif size == 2:
+                indices = (0, 1, -1)
+                values = get(Ellipsis).tolist()
+                values += [values[-1]]
+            elif size == 3:
+                indices = (0, 1, -1)
+                values = get(Ellipsis).tolist()
+            else:
+                indices = (0, 1, -1)
+                if one_chunk:
+                    values = get(list(indices)).tolist()
+                else:
+                    values = get(slice(0, 2)).tolist() + [get(slice(-1, None))]
+
+        elif ndim == 2 and shape[-1] == 2:
+            # Assume that 2-d data with a last dimension of size 2
+            # contains coordinate bounds, for which it is useful to
+            # cache the upper and lower bounds of the first and last
+            # cells.
+            indices = (0, 1, -2, -1)
+            ndim1 = ndim - 1
+            if one_chunk:
+                v = get(Ellipsis)
+                get = v.__getitem__
+
+            index = (slice(0, 1),) * ndim1 + (slice(0, 2),)
+            values = get(index).squeeze().tolist()
+            if size == 2:
+                values = values + values
+            else:
+                index = (slice(-1, None, 1),) * ndim1 + (slice(0, 2),)
+                values += get(index).squeeze().tolist()
+
+        elif size == 1:
+            # size 1, N-d (N>1)
+            indices = (0, -1)
+            value = get(Ellipsis)
+            values = [value, value]
+
+        elif size == 3:
+            # size 3, N-d (N>1)
+            indices = (0, 1, -1)
+            values = get(Ellipsis).flatten().tolist()
+        else:
+            # size M (M=2 or >3), N-d (N>1)
+            indices = (0, -1)
+            if one_chunk:
+                v = get(Ellipsis)
+                values = [v.item(0), v.item(-1)]
+                del v
+            else:
+                values = [
+                    get((slice(0, 1),) * ndim),
+                    get((slice(-1, None, 1),) * ndim),
+                ]
+
+        # Create a dictionary of the element values
+        #
+        # Note: some backends might give `None` for uninitialised
+        #       data, when we want `np.ma.masked` in this case.
+        return {
+            index: (value if value is not None else np.ma.masked)
+            for index, value in zip(indices, values)
+        }
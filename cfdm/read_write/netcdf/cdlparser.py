@@ -0,0 +1,1114 @@
+import re
+from dataclasses import dataclass, field
+from math import ceil, prod
+from typing import Any
+
+import numpy as np
+
+# The netCDF data types of CDL type names
+_types = {
+    "char": "S1",
+    "byte": "i1",
+    "ubyte": "u1",
+    "short": "i2",
+    "ushort": "u2",
+    "int": "i4",
+    "integer": "i4",
+    "long": "i4",
+    "uint": "u4",
+    "int64": "i8",
+    "uint64": "u8",
+    "float": "f4",
+    "real": "f4",
+    "double": "f8",
+    "string": "str",
+}
+
+# The data types of CDL numeric constant suffixes
+_suffixes = {
+    "b": "i1",
+    "ub": "u1",
+    "s": "i2",
+    "us": "u2",
+    "l": "i4",
+    "u": "u4",
+    "ul": "u4",
+    "ll": "i8",
+    "ull": "u8",
+    "f": "f4",
+    "d": "f8",
+}
+
+# Special variable attributes that are storage properties, rather
+# than attributes (as output by 'ncdump -s')
+_special_attributes = (
+    "_FillValue",
+    "_Storage",
+    "_ChunkSizes",
+    "_DeflateLevel",
+    "_Shuffle",
+    "_Fletcher32",
+    "_Endianness",
+    "_NoFill",
+    "_Filter",
+    "_Codecs",
+    "_QuantizeBitGroomNumberOfSignificantDigits",
+    "_QuantizeGranularBitRoundNumberOfSignificantDigits",
+    "_QuantizeBitRoundNumberOfSignificantBits",
+)
+
+# Special global attributes (as output by 'ncdump -s')
+_special_global_attributes = (
+    "_Format",
+    "_NCProperties",
+    "_IsNetcdf4",
+    "_SuperblockVersion",
+)
+
+# CDL section names
+_sections = ("dimensions", "variables", "data", "types")
+
+_tokens = re.compile(
+    r"""
+    (?P<space>\s+|//[^\n]*)
+   |(?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+   |(?P<number>
+        [+-]?0[xX][0-9a-fA-F]+
+       |[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?[a-zA-Z]*
+       |[+-]?(?:NaN|nan|Infinity|inf)[fF]?(?![\w.@+\-])
+    )
+   |(?P<name>(?:[A-Za-z_/]|\\.)(?:[\w.@+\-/]|\\.)*)
+   |(?P<punctuation>[{}(),;=:])
+    """,
+    re.VERBOSE,
+)
+
+_escapes = {
+    "n": "\n",
+    "t": "\t",
+    "r": "\r",
+    "b": "\b",
+    "f": "\f",
+    "v": "\v",
+    "a": "\a",
+    "0": "\0",
+}
+
+
+@dataclass()
+class CDLVariable:
+    """A variable parsed from CDL.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    """
+
+    # The variable name
+    name: str = None
+    # The data type, as a key of `_types`
+    datatype: str = None
+    # The dimension names
+    dimensions: tuple = ()
+    # The attributes, as (data type, value tokens) tuples. A data
+    # type of `None` means that it is to be inferred from the values.
+    attributes: dict = field(default_factory=dict)
+    # The data value tokens
+    data: Any = None
+
+
+@dataclass()
+class CDLGroup:
+    """A group parsed from CDL.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    """
+
+    # The group name
+    name: str = None
+    # The dimension sizes, with `None` for an unlimited dimension
+    dimensions: dict = field(default_factory=dict)
+    # The `CDLVariable` objects
+    variables: dict = field(default_factory=dict)
+    # The global or group attributes, as for `CDLVariable.attributes`
+    attributes: dict = field(default_factory=dict)
+    # The child `CDLGroup` objects
+    groups: dict = field(default_factory=dict)
+
+
+class CDLParser:
+    """A parser that converts CDL text to a netCDF-4 dataset.
+
+    CDL (network Common Data form Language) is the text notation for
+    netCDF datasets that is produced by ``ncdump`` and consumed by
+    ``ncgen``. Parsing CDL in-process avoids the cost of running
+    ``ncgen`` in a subprocess.
+
+    Dimensions, variables, attributes, data and groups are supported,
+    as are the special storage attributes that are output by ``ncdump
+    -s``. User-defined types are not supported, and raise
+    `NotImplementedError`, in which case ``ncgen`` may be used
+    instead.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    **Examples**
+
+    >>> p = CDLParser(open('file.cdl').read())
+    >>> p.to_netcdf('file.nc')
+
+    """
+
+    def __init__(self, cdl):
+        """**Initialisation**
+
+        :Parameters:
+
+            cdl: `str`
+                The CDL text.
+
+        """
+        self.cdl = cdl
+        self._tokens = self._tokenise(cdl)
+        self._position = 0
+
+    def __repr__(self):
+        """Called by the `repr` built-in function.
+
+        x.__repr__() <==> repr(x)
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        return f"<{self.__class__.__name__}: {len(self._tokens)} tokens>"
+
+    @classmethod
+    def _tokenise(cls, cdl):
+        """Split CDL text into tokens.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            cdl: `str`
+                The CDL text.
+
+        :Returns:
+
+            `list` of `tuple`
+                The ``(kind, text)`` tokens, where kind is one of
+                ``'string'``, ``'number'``, ``'name'``, or
+                ``'punctuation'``.
+
+        """
+        tokens = []
+        position = 0
+        end = len(cdl)
+        while position < end:
+            m = _tokens.match(cdl, position)
+            if m is None:
+                line = cdl.count("\n", 0, position) + 1
+                raise ValueError(
+                    f"Invalid CDL at line {line}: "
+                    f"{cdl[position:position + 20]!r}"
+                )
+
+            kind = m.lastgroup
+            if kind != "space":
+                tokens.append((kind, m.group()))
+
+            position = m.end()
+
+        return tokens
+
+    @staticmethod
+    def _unescape(text):
+        """Remove CDL escapes from a name or string.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            text: `str`
+                The escaped text.
+
+        :Returns:
+
+            `str`
+                The unescaped text.
+
+        """
+        if "\\" not in text:
+            return text
+
+        return re.sub(
+            r"\\(x[0-9a-fA-F]{2}|.)",
+            lambda m: (
+                chr(int(m.group(1)[1:], 16))
+                if m.group(1).startswith("x") and len(m.group(1)) == 3
+                else _escapes.get(m.group(1), m.group(1))
+            ),
+            text,
+            flags=re.DOTALL,
+        )
+
+    def _peek(self, offset=0):
+        """Return a token without consuming it.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            offset: `int`, optional
+                The position of the token relative to the current
+                token.
+
+        :Returns:
+
+            `tuple`
+                The ``(kind, text)`` token, or ``(None, None)`` if
+                there are no more tokens.
+
+        """
+        try:
+            return self._tokens[self._position + offset]
+        except IndexError:
+            return (None, None)
+
+    def _next(self):
+        """Consume and return the next token.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Returns:
+
+            `tuple`
+                The ``(kind, text)`` token.
+
+        """
+        token = self._peek()
+        if token[0] is None:
+            raise ValueError("Invalid CDL: Unexpected end of input")
+
+        self._position += 1
+        return token
+
+    def _expect(self, text):
+        """Consume the next token, which must have the given text.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            text: `str`
+                The expected token text.
+
+        :Returns:
+
+            `None`
+
+        """
+        kind, value = self._next()
+        if value != text:
+            raise ValueError(f"Invalid CDL: Expected {text!r}, got {value!r}")
+
+    def _name(self):
+        """Consume the next token, which must be a name.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Returns:
+
+            `str`
+                The unescaped name.
+
+        """
+        kind, value = self._next()
+        if kind != "name":
+            raise ValueError(f"Invalid CDL: Expected a name, got {value!r}")
+
+        return self._unescape(value)
+
+    def _at_section_end(self):
+        """Whether or not the current token ends a section.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Returns:
+
+            `bool`
+
+        """
+        kind, value = self._peek()
+        if value == "}" or kind is None:
+            return True
+
+        return (
+            kind == "name"
+            and (value in _sections or value == "group")
+            and self._peek(1)[1] == ":"
+        )
+
+    def parse(self):
+        """Parse the CDL text.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Returns:
+
+            `CDLGroup`
+                The root group.
+
+        """
+        self._position = 0
+        kind, value = self._next()
+        if value != "netcdf":
+            raise ValueError(f"Invalid CDL: Expected 'netcdf', got {value!r}")
+
+        root = self._group(self._name())
+        if self._peek()[0] is not None:
+            raise ValueError(
+                f"Invalid CDL: Unexpected {self._peek()[1]!r} after the "
+                "end of the dataset"
+            )
+
+        return root
+
+    def _group(self, name):
+        """Parse a group, from its opening brace.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            name: `str`
+                The group name.
+
+        :Returns:
+
+            `CDLGroup`
+
+        """
+        group = CDLGroup(name=name)
+
+        self._expect("{")
+        while True:
+            kind, value = self._next()
+            if value == "}":
+                break
+
+            if kind != "name" or self._peek()[1] != ":":
+                raise ValueError(
+                    f"Invalid CDL: Expected a section, got {value!r}"
+                )
+
+            self._next()
+            match value:
+                case "dimensions":
+                    self._dimensions(group)
+                case "variables":
+                    self._variables(group)
+                case "data":
+                    self._data(group)
+                case "group":
+                    child = self._group(self._name())
+                    group.groups[child.name] = child
+                case "types":
+                    raise NotImplementedError(
+                        "Can't parse CDL user-defined types"
+                    )
+                case _:
+                    raise ValueError(f"Invalid CDL: Unknown section {value!r}")
+
+        return group
+
+    def _dimensions(self, group):
+        """Parse a dimensions section.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            group: `CDLGroup`
+                The group that contains the section.
+
+        :Returns:
+
+            `None`
+
+        """
+        while not self._at_section_end():
+            name = self._name()
+            self._expect("=")
+            kind, value = self._next()
+            if kind == "name" and value.upper() == "UNLIMITED":
+                size = None
+            elif kind == "number":
+                size = int(self._number(value)[0])
+            else:
+                raise ValueError(
+                    f"Invalid CDL: Bad size for dimension {name!r}: "
+                    f"{value!r}"
+                )
+
+            group.dimensions[name] = size
+
+            kind, value = self._next()
+            if value not in (",", ";"):
+                raise ValueError(
+                    f"Invalid CDL: Expected ',' or ';', got {value!r}"
+                )
+
+    def _variables(self, group):
+        """Parse a variables section.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            group: `CDLGroup`
+                The group that contains the section.
+
+        :Returns:
+
+            `None`
+
+        """
+        variables = group.variables
+        while not self._at_section_end():
+            kind, value = self._peek()
+            datatype = None
+            if kind == "name" and value in _types:
+                self._next()
+                datatype = _types[value]
+                if self._peek()[1] != ":" and self._peek(1)[1] != ":":
+                    # Variable declarations, e.g. "double x(x), y ;"
+                    self._declarations(variables, datatype)
+                    continue
+
+            # An attribute, e.g. "x:units = ... ;", ":title = ... ;",
+            # or "string x:names = ... ;"
+            if self._peek()[1] == ":":
+                attributes = group.attributes
+            else:
+                name = self._name()
+                try:
+                    attributes = variables[name].attributes
+                except KeyError:
+                    raise ValueError(
+                        "Invalid CDL: Attribute of undeclared variable "
+                        f"{name!r}"
+                    )
+
+            self._expect(":")
+            attribute = self._name()
+            self._expect("=")
+            attributes[attribute] = (datatype, self._values())
+
+    def _declarations(self, variables, datatype):
+        """Parse variable declarations, after their data type.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            variables: `dict`
+                The variables of the group, which are updated in-place
+                with the new variables.
+
+            datatype: `str`
+                The data type of the declared variables.
+
+        :Returns:
+
+            `None`
+
+        """
+        while True:
+            name = self._name()
+            dimensions = []
+            if self._peek()[1] == "(":
+                self._next()
+                while True:
+                    dimensions.append(self._name())
+                    kind, value = self._next()
+                    if value == ")":
+                        break
+
+                    if value != ",":
+                        raise ValueError(
+                            f"Invalid CDL: Expected ',' or ')', got {value!r}"
+                        )
+
+            variables[name] = CDLVariable(
+                name=name, datatype=datatype, dimensions=tuple(dimensions)
+            )
+
+            kind, value = self._next()
+            if value == ";":
+                break
+
+            if value != ",":
+                raise ValueError(
+                    f"Invalid CDL: Expected ',' or ';', got {value!r}"
+                )
+
+    def _data(self, group):
+        """Parse a data section.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            group: `CDLGroup`
+                The group that contains the section.
+
+        :Returns:
+
+            `None`
+
+        """
+        while not self._at_section_end():
+            name = self._name()
+            try:
+                variable = group.variables[name]
+            except KeyError:
+                raise ValueError(
+                    f"Invalid CDL: Data for undeclared variable {name!r}"
+                )
+
+            self._expect("=")
+            variable.data = self._values()
+
+    def _values(self):
+        """Parse a list of values, up to and including its semicolon.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Returns:
+
+            `list` of `tuple`
+                The ``(kind, text)`` value tokens, where kind is one
+                of ``'string'``, ``'number'``, or ``'fill'``.
+
+        """
+        values = []
+        while True:
+            kind, value = self._next()
+            if kind == "name" and value == "_":
+                kind = "fill"
+            elif value == "{":
+                raise NotImplementedError(
+                    "Can't parse CDL user-defined type values"
+                )
+            elif kind not in ("string", "number"):
+                raise ValueError(
+                    f"Invalid CDL: Expected a value, got {value!r}"
+                )
+
+            values.append((kind, value))
+
+            kind, value = self._next()
+            if value == ";":
+                return values
+
+            if value != ",":
+                raise ValueError(
+                    f"Invalid CDL: Expected ',' or ';', got {value!r}"
+                )
+
+    @staticmethod
+    def _number(text):
+        """Convert a CDL numeric constant.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            text: `str`
+                The numeric constant, e.g. ``'1'``, ``'-2.5f'``,
+                ``'3s'``, ``'NaN'``, ``'0x1F'``.
+
+        :Returns:
+
+            2-`tuple`
+                The value and its inferred data type.
+
+        **Examples**
+
+        >>> CDLParser._number('1.5f')
+        (1.5, 'f4')
+        >>> CDLParser._number('-3s')
+        (-3, 'i2')
+
+        """
+        lower = text.lower()
+        unsigned = lower.lstrip("+-")
+        if unsigned.startswith("0x"):
+            value = int(lower, 16)
+            return value, "i4" if -(2**31) <= value < 2**31 else "i8"
+
+        for special, value in (("nan", np.nan), ("infinity", np.inf)):
+            if unsigned.startswith(special) or (
+                special == "infinity" and unsigned.startswith("inf")
+            ):
+                if lower.startswith("-"):
+                    value = -value
+
+                return value, "f4" if lower.endswith("f") else "f8"
+
+        m = re.match(r"([+-]?[\d.]+(?:e[+-]?\d+)?)([a-z]*)$", lower)
+        if m is None:
+            raise ValueError(f"Invalid CDL: Bad numeric constant {text!r}")
+
+        number, suffix = m.groups()
+        if suffix:
+            try:
+                datatype = _suffixes[suffix]
+            except KeyError:
+                raise ValueError(f"Invalid CDL: Bad numeric constant {text!r}")
+
+            if datatype[0] == "f":
+                return float(number), datatype
+
+            return int(number), datatype
+
+        if "." in number or "e" in number:
+            return float(number), "f8"
+
+        value = int(number)
+        return value, "i4" if -(2**31) <= value < 2**31 else "i8"
+
+    def _strings(self, values):
+        """Convert string value tokens.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            values: `list` of `tuple`
+                The ``(kind, text)`` value tokens.
+
+        :Returns:
+
+            `list` of `str`
+
+        """
+        strings = []
+        for kind, value in values:
+            match kind:
+                case "string":
+                    strings.append(self._unescape(value[1:-1]))
+                case "fill":
+                    strings.append("")
+                case _:
+                    raise ValueError(
+                        f"Invalid CDL: Expected a string, got {value!r}"
+                    )
+
+        return strings
+
+    def _numbers(self, values, datatype=None):
+        """Convert numeric value tokens.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            values: `list` of `tuple`
+                The ``(kind, text)`` value tokens.
+
+            datatype: `str`, optional
+                The data type of the numbers. By default it is
+                inferred from the values.
+
+        :Returns:
+
+            `numpy.ma.MaskedArray`
+                The numbers, with fill values masked.
+
+        """
+        numbers = []
+        datatypes = set()
+        mask = []
+        for kind, value in values:
+            match kind:
+                case "number":
+                    value, inferred = self._number(value)
+                    datatypes.add(inferred)
+                    mask.append(False)
+                case "fill":
+                    value = 0
+                    mask.append(True)
+                case _:
+                    raise ValueError(
+                        f"Invalid CDL: Expected a number, got {value!r}"
+                    )
+
+            numbers.append(value)
+
+        if datatype is None:
+            datatype = np.result_type(*datatypes) if datatypes else "i4"
+
+        return np.ma.array(numbers, mask=mask, dtype=datatype)
+
+    def _attribute(self, datatype, values, variable=None):
+        """Convert an attribute's value tokens.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            datatype: `str` or `None`
+                The attribute's declared data type, or `None` if it is
+                to be inferred from the values.
+
+            values: `list` of `tuple`
+                The ``(kind, text)`` value tokens.
+
+            variable: `CDLVariable`, optional
+                The variable of a ``_FillValue`` attribute, whose data
+                type is the attribute data type.
+
+        :Returns:
+
+            2-`tuple`
+                The attribute value, and whether or not it is of
+                netCDF string type.
+
+        """
+        if variable is not None:
+            datatype = variable.datatype
+
+        if datatype is None:
+            if all(kind == "string" for kind, _ in values):
+                datatype = "S1"
+        elif datatype == "str" and variable is None:
+            strings = self._strings(values)
+            if len(strings) == 1:
+                strings = strings[0]
+
+            return strings, True
+
+        if datatype in ("S1", "str"):
+            # Character strings are concatenated
+            return "".join(self._strings(values)), False
+
+        return self._numbers(values, datatype).filled(), False
+
+    def _find_dimension(self, nc, name):
+        """Find a dimension, in the group or one of its ancestors.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            nc: `netCDF4.Dataset` or `netCDF4.Group`
+                The group in which the dimension is referenced.
+
+            name: `str`
+                The dimension name, which may be an absolute or
+                relative path.
+
+        :Returns:
+
+            `netCDF4.Dimension`
+
+        """
+        if "/" in name:
+            if name.startswith("/"):
+                while nc.parent is not None:
+                    nc = nc.parent
+
+            *path, name = name.strip("/").split("/")
+            for group in path:
+                nc = nc.groups[group]
+
+        group = nc
+        while group is not None:
+            if name in group.dimensions:
+                return group.dimensions[name]
+
+            group = group.parent
+
+        raise ValueError(f"Invalid CDL: Undeclared dimension {name!r}")
+
+    def to_netcdf(self, filename):
+        """Write the parsed CDL to a netCDF-4 file.
+
+        The dataset is created in memory and written to disk in a
+        single operation when it is closed.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            filename: `str`
+                The name of the new netCDF file.
+
+        :Returns:
+
+            `None`
+
+        """
+        import netCDF4
+
+        root = self.parse()
+
+        nc = netCDF4.Dataset(
+            filename, "w", format="NETCDF4", diskless=True, persist=True
+        )
+        try:
+            self._write_group(nc, root)
+        finally:
+            nc.close()
+
+    def _write_group(self, nc, group):
+        """Write a parsed group to a netCDF dataset.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            nc: `netCDF4.Dataset` or `netCDF4.Group`
+                The netCDF group to write to.
+
+            group: `CDLGroup`
+                The parsed group.
+
+        :Returns:
+
+            `None`
+
+        """
+        for name, size in group.dimensions.items():
+            nc.createDimension(name, size)
+
+        for name, (datatype, values) in group.attributes.items():
+            if name in _special_global_attributes:
+                continue
+
+            self._set_attribute(nc, name, datatype, values)
+
+        for name, child in group.groups.items():
+            # Create child groups before any data are written, so
+            # that their dimensions may be referenced by this group
+            self._write_group(nc.createGroup(name), child)
+
+        for variable in group.variables.values():
+            self._write_variable(nc, variable)
+
+    def _set_attribute(self, x, name, datatype, values):
+        """Set an attribute of a netCDF variable or group.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            x: `netCDF4.Variable`, `netCDF4.Dataset` or `netCDF4.Group`
+                The object on which to set the attribute.
+
+            name: `str`
+                The attribute name.
+
+            datatype: `str` or `None`
+                The attribute's declared data type.
+
+            values: `list` of `tuple`
+                The ``(kind, text)`` value tokens.
+
+        :Returns:
+
+            `None`
+
+        """
+        value, string = self._attribute(datatype, values)
+        if string and isinstance(value, str):
+            x.setncattr_string(name, value)
+        else:
+            x.setncattr(name, value)
+
+    def _write_variable(self, nc, variable):
+        """Write a parsed variable to a netCDF dataset.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            nc: `netCDF4.Dataset` or `netCDF4.Group`
+                The netCDF group to write to.
+
+            variable: `CDLVariable`
+                The parsed variable.
+
+        :Returns:
+
+            `None`
+
+        """
+        attributes = variable.attributes.copy()
+
+        def special(name, default=None):
+            """Pop and return a special attribute value."""
+            try:
+                datatype, values = attributes.pop(name)
+            except KeyError:
+                return default
+
+            return self._attribute(datatype, values)[0]
+
+        kwargs = {}
+        storage = special("_Storage")
+        if storage == "contiguous":
+            kwargs["contiguous"] = True
+
+        chunksizes = special("_ChunkSizes")
+        if chunksizes is not None:
+            kwargs["chunksizes"] = np.atleast_1d(chunksizes).tolist()
+
+        complevel = special("_DeflateLevel")
+        if complevel is not None:
+            kwargs["zlib"] = True
+            kwargs["complevel"] = int(np.squeeze(complevel))
+
+        if special("_Shuffle") == "true":
+            kwargs["shuffle"] = True
+
+        if special("_Fletcher32") == "true":
+            kwargs["fletcher32"] = True
+
+        endian = special("_Endianness")
+        if endian in ("little", "big"):
+            kwargs["endian"] = endian
+
+        if "_FillValue" in attributes and variable.datatype != "str":
+            datatype, values = attributes.pop("_FillValue")
+            fill_value, _ = self._attribute(datatype, values, variable)
+            if variable.datatype == "S1":
+                fill_value = fill_value[:1].encode() or b"\0"
+            else:
+                fill_value = np.squeeze(fill_value)[()]
+
+            kwargs["fill_value"] = fill_value
+        elif special("_NoFill") == "true":
+            kwargs["fill_value"] = False
+
+        for name in _special_attributes:
+            attributes.pop(name, None)
+
+        datatype = variable.datatype
+        dimensions = [
+            self._find_dimension(nc, name) for name in variable.dimensions
+        ]
+
+        var = nc.createVariable(
+            variable.name,
+            str if datatype == "str" else datatype,
+            dimensions,
+            **kwargs,
+        )
+
+        # Data values are written exactly as given, so must not be
+        # scaled, nor converted from strings
+        var.set_auto_scale(False)
+        var.set_auto_chartostring(False)
+
+        for name, (attribute_datatype, values) in attributes.items():
+            self._set_attribute(var, name, attribute_datatype, values)
+
+        if variable.data is not None:
+            data = self._variable_data(variable, dimensions)
+            if np.ma.isMA(data):
+                # Replace "_" values with the fill value
+                fill_value = var.get_fill_value()
+                if fill_value is not None:
+                    data = data.filled(fill_value)
+
+            var[tuple(slice(0, n) for n in data.shape)] = data
+
+    def _variable_data(self, variable, dimensions):
+        """Convert a variable's data value tokens to an array.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            variable: `CDLVariable`
+                The parsed variable.
+
+            dimensions: `list` of `netCDF4.Dimension`
+                The variable's dimensions.
+
+        :Returns:
+
+            `numpy.ndarray`
+                The data, which is masked where there were fill
+                values.
+
+        """
+        datatype = variable.datatype
+        values = variable.data
+
+        if datatype == "S1":
+            if dimensions:
+                strlen = dimensions[-1]
+                if strlen.isunlimited():
+                    raise NotImplementedError(
+                        "Can't parse CDL character data with an "
+                        "unlimited trailing dimension"
+                    )
+
+                strlen = strlen.size
+            else:
+                strlen = 1
+
+            # Each string is padded to a whole number of strings of
+            # the trailing dimension size
+            chars = []
+            for string in self._strings(values):
+                string = string.encode()
+                n = max(ceil(len(string) / strlen), 1) * strlen
+                chars.append(string.ljust(n, b"\0"))
+
+            data = np.frombuffer(b"".join(chars), dtype="S1")
+        elif datatype == "str":
+            data = np.array(self._strings(values), dtype=object)
+        else:
+            data = self._numbers(values, datatype)
+
+        if not dimensions:
+            return data[:1].reshape(())
+
+        # Find the shape, including the size of any unlimited
+        # dimensions
+        sizes = [None if d.isunlimited() else d.size for d in dimensions]
+        unlimited = sizes.count(None)
+        if unlimited:
+            if unlimited > 1 and data.size:
+                raise NotImplementedError(
+                    "Can't parse CDL data with more than one unlimited "
+                    "dimension"
+                )
+
+            fixed = prod(n for n in sizes if n is not None)
+            size = ceil(data.size / fixed) if fixed else 0
+            sizes = [size if n is None else n for n in sizes]
+
+        size = prod(sizes)
+        if data.size < size:
+            # Pad missing trailing values with fill values
+            if datatype == "S1":
+                data = np.append(data, np.full(size - data.size, b""))
+            elif datatype == "str":
+                data = np.append(data, np.full(size - data.size, ""))
+            else:
+                data = np.ma.concatenate(
+                    (data, np.ma.masked_all((size - data.size,), data.dtype))
+                )
+        elif data.size > size:
+            raise ValueError(
+                f"Invalid CDL: Too many data values for variable "
+                f"{variable.name!r}"
+            )
+
+        return data.reshape(sizes)
@@ -56,6 +56,19 @@ NETCDF_MAGIC_NUMBERS = (
     88491075,
 )
 
+# The netCDF backends that can open a file with a given magic number
+NETCDF_MAGIC_NUMBER_BACKENDS = {
+    # netCDF-3 classic
+    21382211: ("netCDF4", "netcdf_file"),
+    1128547841: ("netCDF4", "netcdf_file"),
+    # netCDF-3 64-bit offset
+    38159427: ("netCDF4", "netcdf_file"),
+    # netCDF-3 64-bit data
+    88491075: ("netCDF4",),
+    # netCDF-4 (HDF5)
+    1178880137: ("h5netcdf-pyfive", "h5netcdf-h5py", "netCDF4"),
+}
+
 # NetCDF-3 file formats
 NETCDF3_FMTS = (
     "NETCDF3_CLASSIC",
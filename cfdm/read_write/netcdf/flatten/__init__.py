@@ -13,4 +13,5 @@ of the License at http://www.apache.org/licenses/LICENSE-2.0.
 
 """
 
+from .flatdataset import FlatDataset
 from .flatten import dataset_flatten
@@ -0,0 +1,373 @@
+"""A virtual flattened view of a grouped dataset.
+
+.. versionadded:: (cfdm) NEXTVERSION
+
+"""
+
+
+class _Attributes:
+    """Mixin for objects that store netCDF attributes in memory.
+
+    Provides the subset of the `netCDF4` attribute API that is used
+    when flattening a dataset, and when reading the flattened dataset.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    """
+
+    def __getattr__(self, attr):
+        """Return a netCDF attribute.
+
+        x.__getattr__(attr) <==> x.attr
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        try:
+            return self.__dict__["_attributes"][attr]
+        except KeyError:
+            raise AttributeError(
+                f"{self.__class__.__name__} has no attribute {attr!r}"
+            )
+
+    def getncattr(self, attr):
+        """Return a netCDF attribute.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        return self._attributes[attr]
+
+    def ncattrs(self):
+        """Return the netCDF attribute names.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        return list(self._attributes)
+
+    def setncattr(self, attr, value):
+        """Set a netCDF attribute.
+
+        As for a `netCDF4.Dataset`, a byte string value is stored as a
+        Unicode string.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        if isinstance(value, bytes):
+            value = value.decode(errors="replace")
+
+        self._attributes[attr] = value
+
+    def setncatts(self, attributes):
+        """Set netCDF attributes.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        for attr, value in attributes.items():
+            self.setncattr(attr, value)
+
+
+class FlatDimension:
+    """A dimension of a `FlatDataset`.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    """
+
+    def __init__(self, name, size=None):
+        """**Initialisation**
+
+        :Parameters:
+
+            name: `str`
+                The flattened name of the dimension.
+
+            size: `int` or `None`, optional
+                The size of the dimension, or `None` for an unlimited
+                dimension. As for a `netCDF4.Dataset` that contains
+                no data, the size of an unlimited dimension is 0.
+
+        """
+        self.name = name
+        self._unlimited = size is None
+        self.size = 0 if size is None else size
+
+    def __len__(self):
+        """The size of the dimension.
+
+        x.__len__() <==> len(x)
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        return self.size
+
+    def __repr__(self):
+        """Called by the `repr` built-in function.
+
+        x.__repr__() <==> repr(x)
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        return f"<{self.__class__.__name__}: {self.name}, size({self.size})>"
+
+    def isunlimited(self):
+        """Whether or not the dimension is unlimited.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        return self._unlimited
+
+
+class FlatVariable(_Attributes):
+    """A variable of a `FlatDataset`.
+
+    The variable has a flattened name, flattened dimension names, and
+    its own copy of the attributes, but its data are those of the
+    original variable in the grouped dataset, which are never copied.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    """
+
+    def __init__(self, name, datatype, dimensions, source, chunksizes=None):
+        """**Initialisation**
+
+        :Parameters:
+
+            name: `str`
+                The flattened name of the variable.
+
+            datatype: `numpy.dtype` or `str`
+                The data type of the variable.
+
+            dimensions: sequence of `str`
+                The flattened names of the variable's dimensions.
+
+            source:
+                The original variable in the grouped dataset.
+
+            chunksizes: sequence of `int`, optional
+                The storage chunk sizes, or `None` if the variable is
+                not chunked.
+
+        """
+        self._attributes = {}
+        self.name = name
+        self.dtype = datatype
+        self.dimensions = tuple(dimensions)
+        self.source = source
+        self._chunksizes = chunksizes
+
+    def __getitem__(self, index):
+        """Return a subspace of the original variable's data.
+
+        x.__getitem__(index) <==> x[index]
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        return self.source[index]
+
+    def __repr__(self):
+        """Called by the `repr` built-in function.
+
+        x.__repr__() <==> repr(x)
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        return (
+            f"<{self.__class__.__name__}: "
+            f"{self.name}({', '.join(self.dimensions)})>"
+        )
+
+    @property
+    def ndim(self):
+        """The number of dimensions.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        return len(self.dimensions)
+
+    @property
+    def shape(self):
+        """The shape of the original variable.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        return tuple(self.source.shape)
+
+    def chunking(self):
+        """Return the storage chunk sizes.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Returns:
+
+            `list` or `str`
+                The chunk sizes, or ``'contiguous'`` if the variable
+                is not chunked.
+
+        """
+        chunksizes = self._chunksizes
+        if chunksizes is None:
+            return "contiguous"
+
+        return list(chunksizes)
+
+
+class FlatDataset(_Attributes):
+    """A virtual flattened view of a grouped dataset.
+
+    A `FlatDataset` is populated by `dataset_flatten` in the same way
+    as a `netCDF4.Dataset`, and provides the subset of the
+    `netCDF4.Dataset` API that is needed to read it. However, it is
+    held entirely in memory, requires no temporary file or use of the
+    netCDF-C library, and its variables are views of the original
+    variables, so that no data are copied.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    **Examples**
+
+    >>> flat = FlatDataset()
+    >>> cfdm.dataset_flatten(nc, flat)
+    >>> flat.variables
+    {'x': <FlatVariable: x(x)>,
+     'forecast__y': <FlatVariable: forecast__y(forecast__y)>}
+
+    """
+
+    #: The data model, as for a `netCDF4.Dataset`
+    data_model = "NETCDF4"
+
+    def __init__(self):
+        """**Initialisation**"""
+        self._attributes = {}
+        self.dimensions = {}
+        self.variables = {}
+        self.groups = {}
+
+    def __repr__(self):
+        """Called by the `repr` built-in function.
+
+        x.__repr__() <==> repr(x)
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        return (
+            f"<{self.__class__.__name__}: {len(self.variables)} variables, "
+            f"{len(self.dimensions)} dimensions>"
+        )
+
+    def close(self):
+        """Close the dataset.
+
+        There is nothing to close, so this is a null operation.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        pass
+
+    def createDimension(self, name, size=None):
+        """Create a new dimension.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            name: `str`
+                The dimension name.
+
+            size: `int` or `None`, optional
+                The dimension size, or `None` for an unlimited
+                dimension.
+
+        :Returns:
+
+            `FlatDimension`
+
+        """
+        dimension = FlatDimension(name, size)
+        self.dimensions[name] = dimension
+        return dimension
+
+    def createVariable(
+        self,
+        varname,
+        datatype,
+        dimensions=(),
+        source=None,
+        chunksizes=None,
+        contiguous=False,
+        **kwargs,
+    ):
+        """Create a new variable.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            varname: `str`
+                The variable name.
+
+            datatype: `numpy.dtype` or `str`
+                The data type.
+
+            dimensions: sequence of `str`
+                The dimension names.
+
+            source:
+                The original variable that provides the data.
+
+            chunksizes: sequence of `int`, optional
+                The storage chunk sizes.
+
+            contiguous: `bool`, optional
+                Whether or not the variable is stored contiguously.
+
+            kwargs: optional
+                Other `netCDF4.Dataset.createVariable` parameters,
+                which are ignored.
+
+        :Returns:
+
+            `FlatVariable`
+
+        """
+        if contiguous:
+            chunksizes = None
+
+        variable = FlatVariable(
+            varname, datatype, dimensions, source, chunksizes=chunksizes
+        )
+        self.variables[varname] = variable
+        return variable
+
+    def filepath(self):
+        """Return the file path of the dataset.
+
+        A virtual dataset has no file, so `None` is returned.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        return None
+
+    def isopen(self):
+        """Whether or not the dataset is open.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        return True
@@ -28,6 +28,7 @@ from .config import (
     max_name_len,
     ref_not_found_error,
 )
+from .flatdataset import FlatDataset
 
 logger = logging.getLogger(__name__)
 
@@ -91,10 +92,17 @@ def dataset_flatten(
             object with the same API as `netCDF4.Dataset`,
             `h5netcdf.File`, or `zarr.Group`.
 
-        output_ds: `netCDF4.Dataset`
+        output_ds: `netCDF4.Dataset` or `FlatDataset`
             A container for the flattened dataset that will get
             updated in-place with the flattened input dataset.
 
+            If *output_ds* is a `FlatDataset` then it becomes a
+            virtual, in-memory view of *input_ds*, whose variables
+            provide the data of the original variables without
+            copying them, and *copy_data* is ignored.
+
+            .. versionadded:: (cfdm) NEXTVERSION
+
         strict: `bool`, optional
             If True, the default, then failing to resolve a reference
             raises an exception. If False, a warning is issued and
@@ -316,7 +324,7 @@ class _Flattener:
                 the same API as `netCDF4.Dataset` or
                 `h5netcdf.File`, or else a `zarr.Group` object.
 
-            output_ds: `netCDF4.Dataset`
+            output_ds: `netCDF4.Dataset` or `FlatDataset`
                 A container for the flattened dataset.
 
             strict: `bool`, optional
@@ -417,8 +425,12 @@ class _Flattener:
                 f"netCDF4.Dataset, or zarr.Group. Got {type(input_ds)}"
             )
 
+        # Whether or not the output dataset is a virtual view of the
+        # input dataset, in which case no data are ever copied
+        self._virtual = isinstance(output_ds, FlatDataset)
+
         self._strict = bool(strict)
-        self._copy_data = bool(copy_data)
+        self._copy_data = bool(copy_data) and not self._virtual
         self._group_dimension_search = group_dimension_search
 
         if (
@@ -1033,6 +1045,12 @@ class _Flattener:
         else:
             fill_value = False
 
+        kwargs = {}
+        if self._virtual:
+            # The flattened variable provides a view of the original
+            # variable's data
+            kwargs["source"] = var
+
         new_var = self._output_ds.createVariable(
             new_name,
             self.dtype(var),
@@ -1046,6 +1064,7 @@ class _Flattener:
             endian=self.endian(var),
             least_significant_digit=None,
             fill_value=fill_value,
+            **kwargs,
         )
 
         if copy_data:
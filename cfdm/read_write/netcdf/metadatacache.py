@@ -0,0 +1,441 @@
+import hashlib
+import logging
+import os
+import pickle
+from os.path import expanduser, join
+from tempfile import mkstemp
+from threading import RLock
+
+logger = logging.getLogger(__name__)
+
+# Cache config.
+CACHE_DIR = join(".cf", "metadata_cache")
+CACHE_FORMAT_VERSION = 1
+
+# The global configuration settings that affect the constructs that
+# are read, e.g. 'chunksize' sets the default dask chunks
+CONFIGURATION_KEYS = ("chunksize",)
+
+
+class MetadataCache:
+    """A persistent, size-bounded on-disk cache of read datasets.
+
+    The field or domain constructs read from a local netCDF file are
+    pickled to a cache file, so that a subsequent read of the same,
+    unchanged file with the same read parameters can be satisfied by
+    unpickling the constructs, rather than by parsing the netCDF
+    variables, attributes and dimensions again. The unpickled
+    constructs are lazy in the same way as newly read ones, and so
+    the netCDF file is not opened until their data are accessed.
+
+    A cache file is identified by the absolute path, modification
+    time and size of the netCDF file (and of any external variables
+    files); the version of `cfdm`; the class of the reader; the read
+    parameters; and those global configuration settings (see
+    `cfdm.configuration`) that affect the constructs. A modified
+    netCDF file therefore never matches an existing cache file, and
+    any stale cache files are eventually evicted.
+
+    The cache files are stored in the `directory` directory, which
+    defaults to ``~/.cf/metadata_cache``. Whenever a new cache file
+    is created, the least recently used cache files are deleted until
+    the total size of all cache files is no greater than the maximum
+    size given by `cfdm.metadata_cache`. A maximum size of zero
+    disables the cache.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    """
+
+    def __init__(self, directory=None):
+        """**Initialisation**
+
+        :Parameters:
+
+            directory: `str`, optional
+                The directory in which to store the cache files. By
+                default, ``~/.cf/metadata_cache`` is used.
+
+        """
+        if directory is None:
+            directory = join(expanduser("~"), CACHE_DIR)
+
+        self.directory = directory
+
+        self._lock = RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def maxsize(self):
+        """The maximum total size in bytes of the cache files.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        """
+        from ...functions import metadata_cache
+
+        return metadata_cache().value
+
+    @staticmethod
+    def _signature(filename):
+        """Return a signature that identifies a local file's contents.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            filename: `str`
+                The local file name.
+
+        :Returns:
+
+            `tuple` or `None`
+                The file's absolute path, modification time and size,
+                or `None` if the file is not a local file.
+
+        """
+        from ...functions import abspath
+
+        try:
+            filename = abspath(filename, uri=False)
+            st = os.stat(filename)
+        except (OSError, ValueError, TypeError):
+            return
+
+        if not os.path.isfile(filename):
+            return
+
+        return (filename, st.st_mtime_ns, st.st_size)
+
+    def _path(self, key):
+        """Return the path of the cache file for a key.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            key: `str`
+                The cache key.
+
+        :Returns:
+
+            `str`
+                The path of the cache file.
+
+        """
+        return join(self.directory, f"{key}.pickle")
+
+    def key(self, reader, filename, external=None, **kwargs):
+        """Return the cache key for a read of a local file.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            reader:
+                The object that reads the file, typically a
+                `NetCDFRead` instance.
+
+            filename: `str`
+                The name of the local file.
+
+            external: sequence of `str`, optional
+                The names of any external variables files.
+
+            kwargs: optional
+                The other parameters that define the read.
+
+        :Returns:
+
+            `str` or `None`
+                The cache key, or `None` if the cache is disabled or
+                the read can not be cached.
+
+        """
+        if self.maxsize <= 0:
+            return
+
+        from ... import __version__
+        from ...functions import configuration
+
+        signature = self._signature(filename)
+        if signature is None:
+            return
+
+        if isinstance(external, str):
+            external = (external,)
+
+        external_signatures = []
+        for e in external or ():
+            external_signature = self._signature(e)
+            if external_signature is None:
+                return
+
+            external_signatures.append(external_signature)
+
+        try:
+            key = pickle.dumps(
+                (
+                    CACHE_FORMAT_VERSION,
+                    __version__,
+                    f"{type(reader).__module__}.{type(reader).__qualname__}",
+                    signature,
+                    sorted(external_signatures),
+                    sorted(kwargs.items()),
+                    [configuration()[k] for k in CONFIGURATION_KEYS],
+                ),
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        except Exception:
+            # Some of the read parameters can't be pickled
+            return
+
+        return hashlib.sha256(key).hexdigest()
+
+    def get(self, key):
+        """Return the cached constructs for a key.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            key: `str` or `None`
+                The cache key, as returned by `key`.
+
+        :Returns:
+
+            `list` or `None`
+                The cached constructs, or `None` if there are none.
+
+        """
+        if key is None:
+            return
+
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                cache = pickle.load(f)
+        except Exception:
+            # Includes missing, truncated or otherwise invalid cache
+            # files
+            with self._lock:
+                self._misses += 1
+
+            return
+
+        if (
+            not isinstance(cache, dict)
+            or cache.get("cache_format_version") != CACHE_FORMAT_VERSION
+        ):
+            with self._lock:
+                self._misses += 1
+
+            return
+
+        try:
+            # Mark the cache file as recently used
+            os.utime(path)
+        except OSError:
+            pass
+
+        with self._lock:
+            self._hits += 1
+
+        logger.info(
+            f"Loaded dataset contents from metadata cache file {path}"
+        )  # pragma: no cover
+
+        return cache["constructs"]
+
+    def put(self, key, constructs):
+        """Store constructs in the cache.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            key: `str` or `None`
+                The cache key, as returned by `key`.
+
+            constructs: `list`
+                The field or domain constructs to store.
+
+        :Returns:
+
+            `bool`
+                Whether or not the constructs were stored.
+
+        """
+        if key is None:
+            return False
+
+        maxsize = self.maxsize
+        if maxsize <= 0:
+            return False
+
+        cache = {
+            "cache_format_version": CACHE_FORMAT_VERSION,
+            "constructs": constructs,
+        }
+
+        try:
+            cache = pickle.dumps(cache, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as error:
+            logger.info(
+                f"Can't store dataset contents in metadata cache: {error}"
+            )  # pragma: no cover
+            return False
+
+        if len(cache) > maxsize:
+            return False
+
+        path = self._path(key)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+
+            # Write to a temporary file, and then rename it, so that
+            # concurrent readers never see a partial cache file
+            fd, tmp = mkstemp(suffix=".tmp", dir=self.directory)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(cache)
+
+                os.replace(tmp, path)
+            except BaseException:
+                os.remove(tmp)
+                raise
+        except OSError as error:
+            logger.info(
+                f"Can't store dataset contents in metadata cache: {error}"
+            )  # pragma: no cover
+            return False
+
+        logger.info(
+            f"Stored dataset contents in metadata cache file {path}"
+        )  # pragma: no cover
+
+        self._trim(maxsize, keep=path)
+        return True
+
+    def clear(self):
+        """Delete all of the cache files.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Returns:
+
+            `None`
+
+        """
+        self._trim(0)
+
+    def statistics(self, reset=False):
+        """Return the cache statistics.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            reset: `bool`, optional
+                If True then reset the counters to zero after they
+                have been returned.
+
+        :Returns:
+
+            `dict`
+                The number of hits, misses and evictions, the number
+                and total size of the cache files, and the maximum
+                size of the cache.
+
+        """
+        files = self._files()
+        with self._lock:
+            out = {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "files": len(files),
+                "size": sum(size for _, size, _ in files),
+                "maxsize": self.maxsize,
+            }
+            if reset:
+                self._hits = 0
+                self._misses = 0
+                self._evictions = 0
+
+        return out
+
+    def _files(self):
+        """Return the cache files in least-recently-used order.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Returns:
+
+            `list`
+                Each element is a (path, size, modification time)
+                3-tuple.
+
+        """
+        files = []
+        try:
+            entries = os.scandir(self.directory)
+        except OSError:
+            return files
+
+        with entries:
+            for entry in entries:
+                if not entry.name.endswith(".pickle"):
+                    continue
+
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+
+                files.append((entry.path, st.st_size, st.st_mtime_ns))
+
+        files.sort(key=lambda x: x[2])
+        return files
+
+    def _trim(self, maxsize, keep=None):
+        """Delete least recently used cache files beyond a maximum.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            maxsize: `int`
+                The maximum total size in bytes of the cache files to
+                retain.
+
+            keep: `str`, optional
+                The path of a cache file that is not to be deleted.
+
+        :Returns:
+
+            `None`
+
+        """
+        with self._lock:
+            files = self._files()
+            size = sum(size for _, size, _ in files)
+            for path, file_size, _ in files:
+                if size <= maxsize:
+                    break
+
+                if path == keep:
+                    continue
+
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+
+                size -= file_size
+                self._evictions += 1
+
+
+metadata_cache = MetadataCache()
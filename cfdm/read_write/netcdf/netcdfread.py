@@ -1,10 +1,12 @@
 import logging
 import operator
+import os
 import struct
 import subprocess
 import tempfile
 from ast import literal_eval
 from collections.abc import Mapping
+from contextlib import nullcontext
 from copy import deepcopy
 from dataclasses import dataclass, field
 from functools import reduce
@@ -16,6 +18,7 @@ from typing import Any
 import numpy as np
 
 from ...conformance import FieldChecker, VariableNonConformance
+from ...data import locks
 from ...data.netcdfindexer import netcdf_indexer
 from ...decorators import _manage_log_level_via_verbosity
 from ...functions import abspath, is_log_level_debug, is_log_level_detail
@@ -24,23 +27,33 @@ from ..exceptions import DatasetTypeError, ReadError
 from .checker import NetCDFCheckerMixin
 from .constants import (
     CF_QUANTIZATION_PARAMETERS,
+    NETCDF_MAGIC_NUMBER_BACKENDS,
     NETCDF_MAGIC_NUMBERS,
     NETCDF_QUANTIZATION_PARAMETERS,
 )
+from .cachedelements import CachedElements
+from .cdlparser import CDLParser
 from .dimension import Dimension
-from .flatten import dataset_flatten
+from .flatten import FlatDataset, dataset_flatten
 from .flatten.config import (
     flattener_attribute_map,
     flattener_dimension_map,
     flattener_separator,
     flattener_variable_map,
+    flattening_rules,
 )
+from .metadatacache import metadata_cache
 from .zarr import ZarrDimension
 
 logger = logging.getLogger(__name__)
 
 _cached_temporary_files = {}
 
+# The magic numbers of local netCDF files, keyed by (path,
+# modification time, size). See `NetCDFRead._magic_number_key`.
+_magic_numbers = {}
+_max_magic_numbers = 4096
+
 
 @dataclass()
 class Mesh:
@@ -82,6 +95,11 @@ class Mesh:
     # The netCDF dimension spanned by the cells for each
     # location. E.g. {'node': 'nNodes', 'edge': 'nEdges'}
     ncdim: dict = field(default_factory=dict)
+    # The data of netCDF variables that are used by more than one
+    # location or construct of the mesh, keyed by the netCDF variable
+    # name and the `_create_data` keyword arguments. E.g.
+    # {('Mesh2_node_x', ('compression_index', True)): <Data(7): >}
+    data: dict = field(default_factory=dict)
 
 
 class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
@@ -467,6 +485,142 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
 
         return count
 
+    def _select_variables(self):
+        """Find the netCDF variables selected by the *select* parameter.
+
+        A netCDF variable is selected if any of its identities matches
+        any of the *select* values, and it is not referenced by any
+        other netCDF variable in the dataset (such as a coordinate,
+        bounds, or cell measure variable), in which case it could not
+        define a field or domain construct.
+
+        The identities of a netCDF variable are, in order: the value
+        of its ``standard_name`` attribute; its ``cf_role``,
+        ``axis``, and ``long_name`` attributes, followed by all of
+        its other attributes, each in the form ``'property=value'``;
+        its netCDF variable name preceded by ``'ncvar%'``; and its
+        netCDF variable name.
+
+        The selection only restricts which netCDF variables are
+        converted to field or domain constructs by
+        `_create_field_or_domain`. All of the dataset's variables
+        will already have been parsed (including their attributes,
+        and any compression, geometry and UGRID mesh variables) by
+        the time that this method is called.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Returns:
+
+            `set` or `None`
+                The names of the selected netCDF variables, or `None`
+                if all variables are selected.
+
+        **Examples**
+
+        >>> n.read_vars['select'] = 'air_temperature'
+        >>> n._select_variables()
+        {'ta'}
+
+        >>> n.read_vars['select'] = None
+        >>> print(n._select_variables())
+        None
+
+        """
+        import re
+
+        g = self.read_vars
+
+        select = g["select"]
+        if select is None:
+            return
+
+        if isinstance(select, (str, re.Pattern)):
+            select = (select,)
+
+        variables = g["variables"]
+        variable_attributes = g["variable_attributes"]
+        variable_dimensions = g["variable_dimensions"]
+
+        # ------------------------------------------------------------
+        # Find the netCDF variables that are referenced by other
+        # netCDF variables, without creating any constructs
+        # ------------------------------------------------------------
+        referenced = set()
+        for ncvar, attributes in variable_attributes.items():
+            for attr, value in attributes.items():
+                rules = flattening_rules.get(attr)
+                if (
+                    rules is None
+                    or not rules.ref_to_var
+                    or attr == "cell_methods"
+                    or not isinstance(value, str)
+                ):
+                    continue
+
+                key_is_not_a_variable = (
+                    rules.resolve_value and not rules.resolve_key
+                )
+                for token in value.split():
+                    if token.endswith(":"):
+                        if key_is_not_a_variable:
+                            continue
+
+                        token = token[:-1]
+
+                    if token != ncvar and token in variables:
+                        referenced.add(token)
+
+        # Coordinate variables are referenced by the variables that
+        # span their dimensions
+        spanned = set()
+        for ncvar, dimensions in variable_dimensions.items():
+            if len(dimensions) > 1 or dimensions != (ncvar,):
+                spanned.update(dimensions)
+
+        for ncvar, dimensions in variable_dimensions.items():
+            if dimensions == (ncvar,) and ncvar in spanned:
+                referenced.add(ncvar)
+
+        # ------------------------------------------------------------
+        # Match the identities of the unreferenced netCDF variables
+        # ------------------------------------------------------------
+        selected = set()
+        for ncvar in variables:
+            if ncvar in referenced and ncvar not in g["mesh"]:
+                continue
+
+            attributes = variable_attributes.get(ncvar, {})
+
+            identities = []
+            standard_name = attributes.get("standard_name")
+            if standard_name is not None:
+                identities.append(str(standard_name))
+
+            for prop in ("cf_role", "axis", "long_name"):
+                value = attributes.get(prop)
+                if value is not None:
+                    identities.append(f"{prop}={value}")
+
+            for prop, value in attributes.items():
+                if prop not in ("cf_role", "axis", "long_name"):
+                    identities.append(f"{prop}={value}")
+
+            identities.append(f"ncvar%{ncvar}")
+            identities.append(ncvar)
+
+            for value in select:
+                if isinstance(value, re.Pattern):
+                    match = any(value.search(i) for i in identities)
+                else:
+                    match = value in identities
+
+                if match:
+                    selected.add(ncvar)
+                    break
+
+        return selected
+
     def dataset_close(self):
         """Close all netCDF datasets that have been opened.
 
@@ -508,20 +662,21 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
                 # `scipy.io.netcdf_variable` objects.
                 nc._mm_buf = None
 
+            # Closing a dataset may call the netCDF-C or HDF5
+            # libraries. The datasets may have been opened with
+            # different backends (e.g. for external variables), so use
+            # the global lock for them all.
             try:
-                nc.close()
+                with locks.netcdf_lock:
+                    nc.close()
             except AttributeError:
                 pass
 
-        # Close temporary flattened datasets, which are
-        # netCDF4.Dataset
-        for flat_dataset in g["flat_datasets"]:
-            flat_dataset.close()
-
         # Close the original grouped file (v1.8.8.1)
         if "nc_grouped" in g:
             try:
-                g["nc_grouped"].close()
+                with locks.netcdf_lock:
+                    g["nc_grouped"].close()
             except AttributeError:
                 pass
 
@@ -672,31 +827,22 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
         # If the file has a group structure then flatten it (CF>=1.8)
         # ------------------------------------------------------------
         if flatten and self._dataset_has_groups(nc):
-            import netCDF4
-
-            # Create a diskless, non-persistent container for the
-            # flattened file
-            flat_dataset = tempfile.NamedTemporaryFile(
-                mode="wb",
-                dir=tempfile.gettempdir(),
-                prefix="cfdm_flat_",
-                suffix=".nc",
-                delete=True,
-            )
-
-            flat_nc = netCDF4.Dataset(
-                flat_dataset, "w", diskless=True, persist=False
-            )
-            flat_nc.set_fill_off()
-
-            # Flatten the file
-            dataset_flatten(
-                nc,
-                flat_nc,
-                strict=False,
-                copy_data=False,
-                group_dimension_search=g["group_dimension_search"],
-            )
+            # Create a virtual, in-memory flattened view of the
+            # grouped dataset. This requires no temporary file nor
+            # netCDF-C, and copies no data: the flattened variables'
+            # data are those of the original grouped variables.
+            flat_nc = FlatDataset()
+
+            # Flatten the file. This reads the metadata of the
+            # grouped dataset, but no data.
+            with self._dataset_lock():
+                dataset_flatten(
+                    nc,
+                    flat_nc,
+                    strict=False,
+                    copy_data=False,
+                    group_dimension_search=g["group_dimension_search"],
+                )
 
             # Store the original grouped file. This is primarily
             # because the unlimited dimensions in the flattened
@@ -706,10 +852,9 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
 
             nc = flat_nc
 
+            # The flattened dataset mimics the netCDF4 API
             g["nc_opened_with"] = "netCDF4"
             g["has_groups"] = True
-            g["flat_datasets"].append(flat_dataset)
-            g["nc_opened_with"] = "netCDF4"
         else:
             g["nc_opened_with"] = g["original_dataset_opened_with"]
 
@@ -754,7 +899,9 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
         """
         import netCDF4
 
-        nc = netCDF4.Dataset(filename, "r")
+        with self._dataset_lock("netCDF4"):
+            nc = netCDF4.Dataset(filename, "r")
+
         self.read_vars["original_dataset_opened_with"] = "netCDF4"
         return nc
 
@@ -781,15 +928,17 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
         """
         import h5netcdf
 
-        nc = h5netcdf.File(
-            filename,
-            "r",
-            decode_vlen_strings=True,
-            rdcc_nbytes=16777216,
-            rdcc_w0=0.75,
-            rdcc_nslots=4133,
-            phony_dims="sort",
-        )
+        with self._dataset_lock("h5netcdf-h5py"):
+            nc = h5netcdf.File(
+                filename,
+                "r",
+                decode_vlen_strings=True,
+                rdcc_nbytes=16777216,
+                rdcc_w0=0.75,
+                rdcc_nslots=4133,
+                phony_dims="sort",
+            )
+
         self.read_vars["original_dataset_opened_with"] = "h5netcdf-h5py"
         return nc
 
@@ -846,6 +995,13 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
             )
             raise
 
+        if self.read_vars["d_type"] == "Kerchunk":
+            from ...data.remotefile import cached_mapper, remote_cache_enabled
+
+            if remote_cache_enabled():
+                # Read the remote byte ranges via the block caches
+                dataset = cached_mapper(dataset)
+
         nc = zarr.open(dataset, mode="r")
         self.read_vars["original_dataset_opened_with"] = "zarr"
         return nc
@@ -853,6 +1009,10 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
     def cdl_to_netcdf(self, filename):
         """Create a temporary netCDF-4 file from a CDL text file.
 
+        The CDL is parsed in-process with `CDLParser`. If that is not
+        possible (e.g. because the CDL contains user-defined types)
+        then the file is converted with ``ncgen``, instead.
+
         :Parameters:
 
             filename: `str`
@@ -869,6 +1029,55 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
         )
         tmpfile = x.name
 
+        try:
+            with open(filename, "r") as f:
+                parser = CDLParser(f.read())
+
+            # The netCDF-C library is not thread-safe
+            with locks.netcdf_lock:
+                parser.to_netcdf(tmpfile)
+        except (ValueError, NotImplementedError, UnicodeDecodeError) as error:
+            if self.read_vars["debug"]:
+                logger.debug(
+                    f"Can't parse CDL file {filename} in-process "
+                    f"({error}), so using ncgen"
+                )  # pragma: no cover
+
+            self._ncgen(filename, tmpfile, error)
+        else:
+            if self.read_vars["debug"]:
+                logger.debug(
+                    f"Converted CDL file {filename} to netCDF file {tmpfile}"
+                )  # pragma: no cover
+
+        # Need to cache the TemporaryFile object so that it doesn't get
+        # deleted too soon
+        _cached_temporary_files[tmpfile] = x
+
+        return tmpfile
+
+    def _ncgen(self, filename, tmpfile, parse_error=None):
+        """Create a netCDF-4 file from a CDL text file with ``ncgen``.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            filename: `str`
+                The name of the CDL file.
+
+            tmpfile: `str`
+                The name of the new netCDF file.
+
+            parse_error: `Exception`, optional
+                The error raised by `CDLParser`, which is reported if
+                ``ncgen`` is not available.
+
+        :Returns:
+
+            `None`
+
+        """
         ncgen_command = ["ncgen", "-knc4", "-o", tmpfile, filename]
 
         if self.read_vars["debug"]:
@@ -879,6 +1088,14 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
 
         try:
             subprocess.run(ncgen_command, check=True)
+        except FileNotFoundError:
+            if parse_error is None:
+                raise
+
+            raise RuntimeError(
+                f"The CDL file {filename} cannot be converted to netCDF: "
+                f"{parse_error}"
+            )
         except subprocess.CalledProcessError as error:
             msg = str(error)
             if msg.startswith(
@@ -892,12 +1109,6 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
             else:
                 raise
 
-        # Need to cache the TemporaryFile object so that it doesn't get
-        # deleted too soon
-        _cached_temporary_files[tmpfile] = x
-
-        return tmpfile
-
     @classmethod
     def string_to_cdl(cls, cdl_string):
         """Create a temporary text CDL file from a CDL string.
@@ -989,6 +1200,13 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
         if representation is None:
             representation = cls.dataset_representation(dataset)
 
+        # A local file that has already been identified as netCDF
+        magic_number_key = cls._magic_number_key(
+            dataset, filesystem, representation
+        )
+        if magic_number_key in _magic_numbers:
+            return "netCDF"
+
         if cls.is_kerchunk(dataset, filesystem, representation):
             return "Kerchunk"
 
@@ -1028,6 +1246,12 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
             # Is it a netCDF-3 or netCDF-4 binary file?
             if magic_number in NETCDF_MAGIC_NUMBERS:
                 d_type = "netCDF"
+                if magic_number_key is not None:
+                    # Cache the magic number of a local file
+                    if len(_magic_numbers) >= _max_magic_numbers:
+                        _magic_numbers.clear()
+
+                    _magic_numbers[magic_number_key] = magic_number
             else:
                 # Is it a CDL text file?
                 try:
@@ -1118,6 +1342,8 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
         cdl_string=False,
         ignore_unknown_type=False,
         group_dimension_search="closest_ancestor",
+        select=None,
+        unpack_dtype=None,
         _noncompliance_report=False,
     ):
         """Reads a netCDF or Zarr dataset from file or OPenDAP URL.
@@ -1183,7 +1409,7 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
 
                 .. versionadded:: (cfdm) 1.11.2.0
 
-            cache: `bool`, optional
+            cache: `bool` or `str`, optional
                 Control array element caching. See `cfdm.read` for
                 details.
 
@@ -1291,6 +1517,18 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
 
                 .. versionadded:: (cfdm) 1.13.0.0
 
+            select: (sequence of) `str` or `re.Pattern`, optional
+                Only create constructs from the matching netCDF
+                variables. See `cfdm.read` for details.
+
+                .. versionadded:: (cfdm) NEXTVERSION
+
+            unpack_dtype: data-type or `None`, optional
+                The data type of unpacked data. See `cfdm.read` for
+                details.
+
+                .. versionadded:: (cfdm) NEXTVERSION
+
         :Returns:
 
             `list`
@@ -1419,6 +1657,49 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
         ):
             return []
 
+        # ------------------------------------------------------------
+        # Return the dataset contents from the metadata cache, if
+        # possible. Only local netCDF files are cached, and only when
+        # no warnings would need to be issued during parsing.
+        # ------------------------------------------------------------
+        cache_key = None
+        if (
+            d_type == "netCDF"
+            and not _scan_only
+            and internally_created_filesystem
+            and not (warnings or warn_valid or _noncompliance_report)
+        ):
+            cache_key = metadata_cache.key(
+                self,
+                dataset,
+                external=external,
+                extra=extra,
+                default_version=default_version,
+                extra_read_vars=extra_read_vars,
+                mask=mask,
+                unpack=unpack,
+                domain=domain,
+                storage_options=storage_options,
+                netcdf_backend=netcdf_backend,
+                cache=cache,
+                dask_chunks=dask_chunks,
+                store_dataset_chunks=store_dataset_chunks,
+                store_dataset_shards=store_dataset_shards,
+                cfa=cfa,
+                cfa_write=cfa_write,
+                to_memory=to_memory,
+                squeeze=squeeze,
+                unsqueeze=unsqueeze,
+                dataset_type=dataset_type,
+                ignore_unknown_type=ignore_unknown_type,
+                group_dimension_search=group_dimension_search,
+                select=select,
+                unpack_dtype=unpack_dtype,
+            )
+            out = metadata_cache.get(cache_key)
+            if out is not None:
+                return out
+
         # ------------------------------------------------------------
         # Parse the 'netcdf_backend' keyword parameter
         # ------------------------------------------------------------
@@ -1453,6 +1734,12 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
                     f"of {valid_netcdf_backends}"
                 )
 
+        if d_type == "netCDF":
+            # Only try the backends that can open the dataset's format
+            netcdf_backend = self._sniff_netcdf_backend(
+                dataset, netcdf_backend, filesystem, representation
+            )
+
         # ------------------------------------------------------------
         # Parse the 'external' keyword parameter
         # ------------------------------------------------------------
@@ -1500,6 +1787,29 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
                 f"dict. Got: {dask_chunks!r}"
             )
 
+        # ------------------------------------------------------------
+        # Parse 'unpack_dtype' keyword parameter
+        # ------------------------------------------------------------
+        if unpack_dtype is not None:
+            unpack_dtype = np.dtype(unpack_dtype)
+            if unpack_dtype.kind != "f":
+                raise ValueError(
+                    "The 'unpack_dtype' keyword must be a floating point "
+                    f"data type or None. Got: {unpack_dtype!r}"
+                )
+
+        # ------------------------------------------------------------
+        # Parse 'cache' keyword parameter
+        # ------------------------------------------------------------
+        if isinstance(cache, str):
+            if cache != "deferred":
+                raise ValueError(
+                    "The 'cache' keyword must be True, False, or "
+                    f"'deferred'. Got: {cache!r}"
+                )
+        else:
+            cache = bool(cache)
+
         # ------------------------------------------------------------
         # Parse the 'cfa' keyword parameter
         # ------------------------------------------------------------
@@ -1584,6 +1894,8 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
             "dataset_representation": representation,
             "cdl_string": bool(cdl_string),
             "ignore_unknown_type": bool(ignore_unknown_type),
+            # The number of times that the read lock has been acquired
+            # for datasets opened with netCDF-C
             # Compression
             "compression": {},
             # Conformance (CF-compliance)
@@ -1650,6 +1962,8 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
             # Auto mask and unpack?
             "mask": bool(mask),
             "unpack": bool(unpack),
+            # The data type of unpacked data
+            "unpack_dtype": unpack_dtype,
             # Warn for the presence of valid_[min|max|range]
             # attributes?
             "warn_valid": bool(warn_valid),
@@ -1658,14 +1972,18 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
             # structure
             "has_groups": False,
             "group_dimension_search": group_dimension_search,
-            # Keep a list of flattened dataset names
-            "flat_datasets": [],
             # --------------------------------------------------------
             # Domains (CF>=1.9)
             # --------------------------------------------------------
             "domain_ncdimensions": {},
             "domain": bool(domain),
             # --------------------------------------------------------
+            # Variable selection
+            # --------------------------------------------------------
+            # The values that select the netCDF variables from which
+            # to create fields or domains (see `_select_variables`)
+            "select": select,
+            # --------------------------------------------------------
             # UGRID mesh topologies
             # --------------------------------------------------------
             # The UGRID version. May be set by the "Conventions"
@@ -1703,7 +2021,7 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
             # --------------------------------------------------------
             # Array element caching
             # --------------------------------------------------------
-            "cache": bool(cache),
+            "cache": cache,
             # --------------------------------------------------------
             # Dask
             # --------------------------------------------------------
@@ -2108,11 +2426,13 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
                 # size from the original grouped dataset, because
                 # unlimited dimensions have size 0 in the flattened
                 # dataset (because it contains no data) (v1.8.8.1)
-                group, ncdim = self._netCDF4_group(
-                    g["nc_grouped"], flattener_dimensions[name]
-                )
-                internal_dimension_sizes[name] = group.dimensions[ncdim].size
-            else:
+                with self._dataset_lock():
+                    group, ncdim = self._netCDF4_group(
+                        g["nc_grouped"], flattener_dimensions[name]
+                    )
+                    dimension = group.dimensions[ncdim]
+
+            with self._dataset_lock():
                 internal_dimension_sizes[name] = dimension.size
 
         if g["has_groups"]:
@@ -2476,10 +2796,17 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
         all_fields_or_domains = {}
         domain = g["domain"]
 
+        # Find the variables that have been selected by the 'select'
+        # parameter (None means all of them)
+        selected = self._select_variables()
+
         for ncvar in g["variables"]:
             if ncvar in g["do_not_create_field"] or ncvar in g["mesh"]:
                 continue
 
+            if selected is not None and ncvar not in selected:
+                continue
+
             field_or_domain = self._create_field_or_domain(
                 ncvar, domain=domain
             )
@@ -2497,6 +2824,9 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
                 if mesh_ncvar not in g["mesh"]:
                     continue
 
+                if selected is not None and mesh_ncvar not in selected:
+                    continue
+
                 for location in locations:
                     # If any existing field or domain used this
                     # mesh/location combination, then we don't need to
@@ -2616,6 +2946,21 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
                         f
                     ).values():
                         ncvar = self.implementation.nc_get_variable(construct)
+                        if (
+                            selected is not None
+                            and ncvar not in all_fields_or_domains
+                            and ncvar in g["variables"]
+                            and ncvar not in g["do_not_create_field"]
+                        ):
+                            # Create a field from a variable that was
+                            # not selected, but which is referenced by
+                            # a selected one
+                            extra_field = self._create_field_or_domain(
+                                ncvar, domain=False
+                            )
+                            if extra_field is not None:
+                                all_fields_or_domains[ncvar] = extra_field
+
                         if ncvar not in all_fields_or_domains:
                             continue
 
@@ -2685,6 +3030,9 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
                 for f in out:
                     self.implementation.squeeze(f, inplace=True)
 
+        # Store the fields/domains in the metadata cache
+        metadata_cache.put(cache_key, out)
+
         # ------------------------------------------------------------
         # Return the fields/domains
         # ------------------------------------------------------------
@@ -6538,10 +6886,13 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
             dtype = None
 
         if dtype is not None and unpacked_dtype is not False:
-            dtype = np.result_type(dtype, unpacked_dtype)
+            if g["unpack"] and g["unpack_dtype"] is not None:
+                dtype = g["unpack_dtype"]
+            else:
+                dtype = np.result_type(dtype, unpacked_dtype)
 
         ndim = self._ndim(variable)
-        shape = variable.shape
+        shape = self._shape(variable)
         size = prod(shape)
 
         if size < 2:
@@ -6585,6 +6936,7 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
 
         if not self._cfa_is_aggregation_variable(ncvar):
             # Normal (non-aggregation) variable
+            kwargs["unpack_dtype"] = g["unpack_dtype"]
             if return_kwargs_only:
                 return kwargs
 
@@ -6824,7 +7176,9 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
                         uncompressed_shape=uncompressed_shape,
                         count_variable=c["count_variable"],
                         index_variable=c["index_variable"],
+                        feature_offsets=c.get("feature_offsets"),
                     )
+                    self._set_feature_offsets(c, array)
                     compressed = True
 
                 elif "ragged_contiguous" in c:
@@ -6847,7 +7201,9 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
                         ),
                         uncompressed_shape=uncompressed_shape,
                         count_variable=c["count_variable"],
+                        feature_offsets=c.get("feature_offsets"),
                     )
+                    self._set_feature_offsets(c, array)
                     compressed = True
 
                 elif "ragged_indexed" in c:
@@ -6870,7 +7226,9 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
                         ),
                         uncompressed_shape=uncompressed_shape,
                         index_variable=c["index_variable"],
+                        feature_offsets=c.get("feature_offsets"),
                     )
+                    self._set_feature_offsets(c, array)
                     compressed = True
 
                 elif (
@@ -6951,11 +7309,18 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
                 )
                 compressed = True
 
+        if compressed:
+            # The netCDF dimensions of the uncompressed data
+            ncdimensions = self._ncdimensions(ncvar, parent_ncvar=parent_ncvar)
+        else:
+            ncdimensions = None
+
         data = self._create_Data(
             array,
             units=units,
             calendar=calendar,
             ncvar=ncvar,
+            ncdimensions=ncdimensions,
             compressed=compressed,
             construct_type=construct_type,
         )
@@ -6980,7 +7345,7 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
             #
             # b) Cached values are never really required for
             #    compression index data.
-            self._cache_data_elements(data, ncvar, attributes)
+            self._cache_data_elements(data, ncvar, attributes, array)
 
         # ------------------------------------------------------------
         # Set data aggregation parameters
@@ -7892,6 +8257,7 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
         ragged_contiguous_array,
         uncompressed_shape=None,
         count_variable=None,
+        feature_offsets=None,
     ):
         """Creates Data for a contiguous ragged array variable.
 
@@ -7908,6 +8274,11 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
 
             count_variable: `Count`
 
+            feature_offsets: `dict`, optional
+                The offsets index of the features.
+
+                .. versionadded:: (cfdm) NEXTVERSION
+
         :Returns:
 
             `RaggedContiguousArray`
@@ -7917,6 +8288,7 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
             compressed_array=ragged_contiguous_array,
             shape=uncompressed_shape,
             count_variable=count_variable,
+            feature_offsets=feature_offsets,
         )
 
     def _create_ragged_indexed_array(
@@ -7924,11 +8296,19 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
         ragged_indexed_array,
         uncompressed_shape=None,
         index_variable=None,
+        feature_offsets=None,
     ):
         """Creates Data for an indexed ragged array variable.
 
         .. versionadded:: (cfdm) 1.7.0
 
+        :Parameters:
+
+            feature_offsets: `dict`, optional
+                The offsets index of the features.
+
+                .. versionadded:: (cfdm) NEXTVERSION
+
         :Returns:
 
             `RaggedIndexedArray`
@@ -7938,6 +8318,7 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
             compressed_array=ragged_indexed_array,
             shape=uncompressed_shape,
             index_variable=index_variable,
+            feature_offsets=feature_offsets,
         )
 
     def _create_ragged_indexed_contiguous_array(
@@ -7946,11 +8327,19 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
         uncompressed_shape=None,
         count_variable=None,
         index_variable=None,
+        feature_offsets=None,
     ):
         """Creates Data for an indexed contiguous ragged array variable.
 
         .. versionadded:: (cfdm) 1.7.0
 
+        :Parameters:
+
+            feature_offsets: `dict`, optional
+                The offsets index of the features.
+
+                .. versionadded:: (cfdm) NEXTVERSION
+
         :Returns:
 
             `RaggedIndexedContiguousArray`
@@ -7961,8 +8350,42 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
             shape=uncompressed_shape,
             count_variable=count_variable,
             index_variable=index_variable,
+            feature_offsets=feature_offsets,
         )
 
+    def _set_feature_offsets(self, compression, array):
+        """Store the offsets index of a ragged array.
+
+        The offsets index, which locates each feature in the
+        compressed array, is created once from the count and/or index
+        variables (which have already been read to find the
+        uncompressed shape) and is then shared by every data variable
+        that is compressed in the same way. Creating it at read time
+        also means that it is saved to, and restored from, the
+        metadata cache.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            compression: `dict`
+                The ragged array description from
+                ``read_vars['compression']``, in which the offsets
+                index is stored with key ``'feature_offsets'``.
+
+            array: `RaggedArray`
+                The ragged array.
+
+        :Returns:
+
+            `None`
+
+        """
+        if "feature_offsets" not in compression:
+            compression["feature_offsets"] = (
+                self.implementation.get_feature_offsets(array)
+            )
+
     def _create_subsampled_array(
         self,
         interpolation_name=None,
@@ -8077,10 +8500,11 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
             case "h5netcdf-pyfive" | "h5netcdf-h5py" | "netCDF4":
                 if array.dtype is None:
                     if g["has_groups"]:
-                        group, name = self._netCDF4_group(
-                            g["variable_grouped_dataset"][ncvar], ncvar
-                        )
-                        variable = group.variables.get(name)
+                        with self._dataset_lock():
+                            group, name = self._netCDF4_group(
+                                g["variable_grouped_dataset"][ncvar], ncvar
+                            )
+                            variable = group.variables.get(name)
                     else:
                         variable = g["variables"].get(ncvar)
 
@@ -8093,7 +8517,7 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
                         # numpy array.
                         array = np.array(array, dtype=f"U{len(array)}")
 
-                    if not variable.ndim:
+                    if not self._ndim(variable):
                         # NetCDF4 has a thing for making scalar size 1
                         # variables into 1d arrays
                         array = array.squeeze()
@@ -8116,7 +8540,11 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
 
         # Set the dask chunking strategy
         chunks = self._dask_chunks(
-            array, ncvar, compressed, construct_type=construct_type
+            array,
+            ncvar,
+            compressed,
+            construct_type=construct_type,
+            ncdimensions=ncdimensions,
         )
 
         # Set whether or not to read the data into memory
@@ -9365,13 +9793,14 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
 
         connectivity_attr = f"{location}_node_connectivity"
         connectivity_ncvar = mesh.mesh_attributes[connectivity_attr]
-        node_connectivity = self._create_data(
+        node_connectivity = self._ugrid_create_data(
+            mesh,
             connectivity_ncvar,
             uncompress_override=True,
             compression_index=True,
         )
-        node_coordinates = self._create_data(
-            node_ncvar, compression_index=True
+        node_coordinates = self._ugrid_create_data(
+            mesh, node_ncvar, compression_index=True
         )
         start_index = g["variable_attributes"][connectivity_ncvar].get(
             "start_index", 0
@@ -9413,6 +9842,45 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
 
         return aux
 
+    def _ugrid_create_data(self, mesh, ncvar, **kwargs):
+        """Create a data object for a UGRID mesh variable.
+
+        The data for each combination of netCDF variable and keyword
+        arguments is only created once per mesh, and is stored in
+        ``mesh.data``. Each call returns a new copy of the stored
+        data, which shares its underlying dask array with the stored
+        data, so that all of the constructs derived from the mesh
+        share the same arrays, but modifying one of them does not
+        affect the others.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            mesh: `Mesh`
+                The mesh description, as stored in
+                ``self.read_vars['mesh']``.
+
+            ncvar: `str`
+                The netCDF name of the variable that contains the
+                data.
+
+            kwargs: optional
+                Keyword arguments to `_create_data`.
+
+        :Returns:
+
+            `Data`
+
+        """
+        key = (ncvar,) + tuple(sorted(kwargs.items()))
+        data = mesh.data.get(key)
+        if data is None:
+            data = self._create_data(ncvar, **kwargs)
+            mesh.data[key] = data
+
+        return data.copy()
+
     def _ugrid_create_domain_topology(self, parent_ncvar, f, mesh, location):
         """Create a domain topology construct.
 
@@ -9483,7 +9951,12 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
         # Create data
         if cell == "point":
             properties["long_name"] = "Maps every node to its connected nodes"
-            indices, kwargs = self._create_netcdfarray(connectivity_ncvar)
+            indices = self._ugrid_create_data(
+                mesh,
+                connectivity_ncvar,
+                uncompress_override=True,
+                compression_index=True,
+            )
             n_nodes = self.read_vars["internal_dimension_sizes"][
                 mesh.ncdim[location]
             ]
@@ -9494,7 +9967,9 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
                 copy=False,
                 **{connectivity_attr: indices},
             )
-            attributes = kwargs["attributes"]
+            attributes = self.read_vars["variable_attributes"][
+                connectivity_ncvar
+            ]
             data = self._create_Data(
                 array,
                 units=attributes.get("units"),
@@ -9504,8 +9979,11 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
             )
         else:
             # Edge or face cells
-            data = self._create_data(
-                connectivity_ncvar, compression_index=True
+            data = self._ugrid_create_data(
+                mesh,
+                connectivity_ncvar,
+                uncompress_override=True,
+                compression_index=True,
             )
             if cell_dimension == 1:
                 data = data.transpose()
@@ -9711,6 +10189,50 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
 
         return group, path[-1]
 
+    def _dataset_lock(self, backend=None):
+        """Return the lock for calls to a dataset's backend library.
+
+        The lock is only held around the calls that access the
+        dataset (such as reading its attributes), rather than for the
+        whole parse. So datasets may be parsed concurrently (see the
+        *parallel* parameter of `cfdm.read`), but a library that is
+        not thread-safe, such as netCDF-C, is never called by more
+        than one thread at a time, including by dask computations of
+        data that have already been read.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `cfdm.data.locks.dataset_lock`
+
+        :Parameters:
+
+            backend: `str` or `None`, optional
+                The backend with which the dataset was opened, one of
+                the keys of the *netcdf_backend* dictionary of
+                `dataset_open`. By default, the backend of the dataset
+                being read is used.
+
+        :Returns:
+
+                The lock, or a null context manager if no lock is
+                required. The lock is not reentrant, so must not be
+                held whilst data are computed with dask.
+
+        """
+        g = self.read_vars
+        if backend is None:
+            backend = g["original_dataset_opened_with"]
+
+        dataset = g["dataset"]
+        if isinstance(dataset, str):
+            dataset = abspath(dataset)
+
+        lock = locks.dataset_lock(backend, dataset)
+        if lock is None:
+            return nullcontext()
+
+        return lock
+
     def _dataset_has_groups(self, nc):
         """True if the dataset has a groups other than the root group.
 
@@ -9729,7 +10251,8 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
         """
         match self.read_vars["original_dataset_opened_with"]:
             case "h5netcdf-pyfive" | "h5netcdf-h5py" | "netCDF4":
-                return bool(nc.groups)
+                with self._dataset_lock():
+                    return bool(nc.groups)
 
             case "zarr":
                 return bool(tuple(nc.group_keys()))
@@ -9758,10 +10281,12 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
         """
         match self.read_vars["nc_opened_with"]:
             case "h5netcdf-pyfive" | "h5netcdf-h5py" | "zarr":
-                return nc.attrs[attr]
+                with self._dataset_lock():
+                    return nc.attrs[attr]
 
             case "netCDF4":
-                return nc.getncattr(attr)
+                with self._dataset_lock():
+                    return nc.getncattr(attr)
 
             case "netcdf_file":
                 return nc._attributes[attr]
@@ -9786,10 +10311,12 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
         """
         match self.read_vars["nc_opened_with"]:
             case "h5netcdf-pyfive" | "h5netcdf-h5py" | "zarr":
-                return nc.attrs
+                with self._dataset_lock():
+                    return dict(nc.attrs)
 
             case "netCDF4":
-                return {attr: nc.getncattr(attr) for attr in nc.ncattrs()}
+                with self._dataset_lock():
+                    return {attr: nc.getncattr(attr) for attr in nc.ncattrs()}
 
             case "netcdf_file":
                 return nc._attributes
@@ -9812,7 +10339,8 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
         """
         match self.read_vars["original_dataset_opened_with"]:
             case "h5netcdf-pyfive" | "h5netcdf-h5py" | "netCDF4":
-                return group.variables
+                with self._dataset_lock():
+                    return dict(group.variables)
 
             case "zarr":
                 return dict(group.arrays())
@@ -9837,7 +10365,8 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
         """
         match self.read_vars["nc_opened_with"]:
             case "h5netcdf-pyfive" | "h5netcdf-h5py" | "netCDF4":
-                dimensions = dict(nc.dimensions)
+                with self._dataset_lock():
+                    dimensions = dict(nc.dimensions)
 
             case "zarr":
                 dimensions = {}
@@ -9904,7 +10433,9 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
         """
         match self.read_vars["nc_opened_with"]:
             case "h5netcdf-pyfive" | "h5netcdf-h5py" | "netCDF4":
-                return self._file_dimension(nc, dim_name).isunlimited()
+                dimension = self._file_dimension(nc, dim_name)
+                with self._dataset_lock():
+                    return dimension.isunlimited()
 
             case "zarr" | "netcdf_file":
                 return False
@@ -9929,7 +10460,9 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
                 The dimension size.
 
         """
-        return self._file_dimension(nc, dim_name).size
+        dimension = self._file_dimension(nc, dim_name)
+        with self._dataset_lock():
+            return dimension.size
 
     def _file_variables(self, nc):
         """Return all variables in the root group.
@@ -9953,7 +10486,8 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
             case (
                 "h5netcdf-pyfive" | "h5netcdf-h5py" | "netCDF4" | "netcdf_file"
             ):
-                return nc.variables
+                with self._dataset_lock():
+                    return dict(nc.variables)
 
             case "zarr":
                 return dict(nc.arrays())
@@ -10001,10 +10535,14 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
         """
         match self.read_vars["nc_opened_with"]:
             case "h5netcdf-pyfive" | "h5netcdf-h5py":
-                return dict(var.attrs)
+                with self._dataset_lock():
+                    return dict(var.attrs)
 
             case "netCDF4":
-                return {attr: var.getncattr(attr) for attr in var.ncattrs()}
+                with self._dataset_lock():
+                    return {
+                        attr: var.getncattr(attr) for attr in var.ncattrs()
+                    }
 
             case "zarr":
                 attrs = dict(var.attrs)
@@ -10040,7 +10578,8 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
             case (
                 "h5netcdf-pyfive" | "h5netcdf-h5py" | "netCDF4" | "netcdf_file"
             ):
-                return var.dimensions
+                with self._dataset_lock():
+                    return var.dimensions
 
             case "zarr":
                 match var.metadata.zarr_format:
@@ -10077,11 +10616,33 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
         """
         try:
             # h5netcdf, netCDF4, zarr
-            return var.ndim
+            with self._dataset_lock():
+                return var.ndim
         except AttributeError:
             # scipy
             return len(var.shape)
 
+    def _shape(self, var):
+        """Return the shape of a variable's array.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            var:
+                The variable. One of `netCDF4.Variable`,
+               `scipy.io.netcdf_variable`, `h5netcdf.Variable`,
+               `zarr.Array`
+
+        :Returns:
+
+            `tuple`
+                The array shape.
+
+        """
+        with self._dataset_lock():
+            return tuple(var.shape)
+
     def _dtype(self, var):
         """Return the data type of a dataset variable.
 
@@ -10103,7 +10664,8 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
         """
         try:
             # h5netcdf, netCDF4, zarr
-            dtype = var.dtype
+            with self._dataset_lock():
+                dtype = var.dtype
         except AttributeError:
             # scipy: Need to get the datatype from the memory-mapped
             # array.
@@ -10136,7 +10698,9 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
                 The array subspace.
 
         """
-        array = var[index]
+        with self._dataset_lock():
+            array = var[index]
+
         if self.read_vars["nc_opened_with"] == "netcdf_file":
             # Need to copy the numpy array returned by
             # scipy.io.netcdf_file with mmap=True. See `dataset_close`
@@ -10185,14 +10749,18 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
 
         match self.read_vars["nc_opened_with"]:
             case "h5netcdf-pyfive" | "h5netcdf-h5py":
-                var = nc.variables[ncvar]
-                chunks = var.chunks
+                with self._dataset_lock():
+                    var = nc.variables[ncvar]
+                    chunks = var.chunks
+
                 if chunks is None:
                     chunks = "contiguous"
 
             case "netCDF4":
-                var = nc.variables[ncvar]
-                chunks = var.chunking()
+                with self._dataset_lock():
+                    var = nc.variables[ncvar]
+                    chunks = var.chunking()
+
                 if chunks is None:
                     chunks = "contiguous"
 
@@ -10204,9 +10772,11 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
                 var = nc.variables[ncvar]
                 chunks = "contiguous"
 
-        return chunks, var.shape
+        return chunks, self._shape(var)
 
-    def _dask_chunks(self, array, ncvar, compressed, construct_type=None):
+    def _dask_chunks(
+        self, array, ncvar, compressed, construct_type=None, ncdimensions=None
+    ):
         """Set the Dask chunking strategy for a netCDF variable.
 
         .. versionadded:: (cfdm) 1.11.2.0
@@ -10229,6 +10799,15 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
                 The type of the construct that contains *array*. Set
                 to `None` if the array does not belong to a construct.
 
+            ncdimensions: sequence of `str`, optional
+                The netCDF dimensions spanned by *array*. By default,
+                or if `None`, the dimensions of the netCDF variable
+                are used. Must be set to the implied uncompressed
+                dimensions if the netCDF variable is compressed by
+                convention.
+
+                .. versionadded:: (cfdm) NEXTVERSION
+
         :Returns:
 
             `str` or `int` or `list`
@@ -10521,9 +11100,12 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
             if not dask_chunks:
                 return "auto"
 
+            if ncdimensions is None:
+                ncdimensions = g["variable_dimensions"][ncvar]
+
             attributes = g["variable_attributes"]
             chunks = []
-            for ncdim in g["variable_dimensions"][ncvar]:
+            for ncdim in ncdimensions:
                 key = f"ncdim%{ncdim}"
                 if key in dask_chunks:
                     chunks.append(dask_chunks[key])
@@ -10550,7 +11132,7 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
         # ------------------------------------------------------------
         return dask_chunks
 
-    def _cache_data_elements(self, data, ncvar, attributes):
+    def _cache_data_elements(self, data, ncvar, attributes, array=None):
         """Cache selected element values.
 
         Updates *data* in-place to store its first, second,
@@ -10567,6 +11149,14 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
         doesn't scale well with array size (i.e. it takes
         disproportionally longer for larger arrays).
 
+        When the element values are read depends on the *cache*
+        parameter of `read`:
+
+        * ``True``: They are read immediately.
+
+        * ``'deferred'``: They are not read until they are first
+          required by *data* (see `Data._get_cached_elements`).
+
         .. versionadded:: (cfdm) 1.11.2.0
 
         :Parameters:
@@ -10583,6 +11173,13 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
 
                 .. versionadded:: (cfdm) 1.13.0.0
 
+            array: `Array`, optional
+                The lazy array that contains the data, from which the
+                element values are read if their reading has been
+                deferred.
+
+                .. versionadded:: (cfdm) NEXTVERSION
+
         :Returns:
 
             `None`
@@ -10595,15 +11192,6 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
 
         g = self.read_vars
 
-        # Get the netCDF4.Variable for the data
-        if g["has_groups"]:
-            group, name = self._netCDF4_group(
-                g["variable_grouped_dataset"][ncvar], ncvar
-            )
-            variable = self._file_group_variables(group).get(name)
-        else:
-            variable = g["variables"].get(ncvar)
-
         # Check for cached data elements and use them if they exist
         elements = g["cached_data_elements"].get(ncvar)
         if elements is not None:
@@ -10615,17 +11203,64 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
         # Still here? Then there were no cached data elements, so we
         # have to create them.
         # ------------------------------------------------------------
+        variable = self._original_dataset_variable(ncvar)
 
         # Include optimisations for the common case that the entire
         # array is stored in one dataset chunk (which does *not*
         # include netCDF contiguous arrays), that prevent the reading
         # of that chunk multiple times.
-        one_chunk = self._variable_chunksizes(variable) == variable.shape
+        one_chunk = self._variable_chunksizes(variable) == self._shape(
+            variable
+        )
+
+        match g["cache"]:
+            case "deferred" if array is not None:
+                # Read the elements from the data's lazy array when
+                # they are first needed
+                elements = CachedElements(
+                    array, shape=data.shape, one_chunk=one_chunk
+                )
+            case _:
+                elements = self._find_data_elements(
+                    variable, attributes, data.shape, one_chunk
+                )
+
+        # Cache the cached data elements for this variable
+        g["cached_data_elements"][ncvar] = elements
+
+        # Store the elements in the data object
+        data._set_cached_elements(elements)
+
+    def _find_data_elements(self, variable, attributes, shape, one_chunk):
+        """Read selected element values from a dataset variable.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `_cache_data_elements`
+
+        :Parameters:
+
+            variable:
+                The dataset variable, one of `netCDF4.Variable`,
+                `scipy.io.netcdf_variable`, `h5netcdf.Variable`,
+                `zarr.Array`.
+
+            attributes: `dict`
+                The attributes of the netCDF variable.
+
+            shape: `tuple`
+                The shape of the data.
+
+            one_chunk: `bool`
+                Whether or not the entire variable is stored in one
+                dataset chunk.
 
-        # Get the required element values
-        size = data.size
-        ndim = data.ndim
+        :Returns:
+
+            `dict`
+                The element values, keyed by their positions.
 
+        """
         # Get the values using `netcdf_indexer`, as this conveniently
         # deals with different type of indexing, string and character
         # arrays, etc.
@@ -10639,92 +11274,9 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
             copy=False,
         )
 
-        # Get the cached values, minimising the number of "gets" on
-        # the dataset by not accessing the same chunk twice, where
-        # possible.
-        if ndim == 1:
-            # Also cache the second element for 1-d data, on the
-            # assumption that they may well be dimension coordinate
-            # data.
-            if size == 1:
-                indices = (0, -1)
-                value = self._index(variable, Ellipsis)
-                values = [value, value]
-            elif size == 2:
-                indices = (0, 1, -1)
-                values = self._index(variable, Ellipsis).tolist()
-                values += [values[-1]]
-            elif size == 3:
-                indices = (0, 1, -1)
-                values = self._index(variable, Ellipsis).tolist()
-            else:
-                indices = (0, 1, -1)
-                if one_chunk:
-                    values = self._index(variable, list(indices)).tolist()
-                else:
-                    values = self._index(variable, slice(0, 2)).tolist() + [
-                        self._index(variable, slice(-1, None))
-                    ]
-
-        elif ndim == 2 and data.shape[-1] == 2:
-            # Assume that 2-d data with a last dimension of size 2
-            # contains coordinate bounds, for which it is useful to
-            # cache the upper and lower bounds of the first and last
-            # cells.
-            indices = (0, 1, -2, -1)
-            ndim1 = ndim - 1
-            if one_chunk:
-                v = self._index(variable, Ellipsis)
-            else:
-                v = variable
-            index = (slice(0, 1),) * ndim1 + (slice(0, 2),)
-            values = self._index(v, index).squeeze().tolist()
-            if data.size == 2:
-                values = values + values
-            else:
-                index = (slice(-1, None, 1),) * ndim1 + (slice(0, 2),)
-                values += self._index(v, index).squeeze().tolist()
-
-            del v
-
-        elif size == 1:
-            # size 1, N-d (N>1)
-            indices = (0, -1)
-            value = self._index(variable, Ellipsis)
-            values = [value, value]
-
-        elif size == 3:
-            # size 3, N-d (N>1)
-            v = self._index(variable, Ellipsis)
-            indices = (0, 1, -1)
-            values = self._index(variable, Ellipsis).flatten().tolist()
-        else:
-            # size M (M=2 or >3), N-d (N>1)
-            indices = (0, -1)
-            if one_chunk:
-                v = self._index(variable, Ellipsis)
-                values = [v.item(0), v.item(-1)]
-                del v
-            else:
-                values = [
-                    self._index(variable, (slice(0, 1),) * ndim),
-                    self._index(variable, (slice(-1, None, 1),) * ndim),
-                ]
-
-        # Create a dictionary of the element values
-        #
-        # Note: some backends might give `None` for uninitialised
-        #       data, when we want `np.ma.masked` in this case.
-        elements = {
-            index: (value if value is not None else np.ma.masked)
-            for index, value in zip(indices, values)
-        }
-
-        # Cache the cached data elements for this variable
-        g["cached_data_elements"][ncvar] = elements
-
-        # Store the elements in the data object
-        data._set_cached_elements(elements)
+        return CachedElements.find(
+            lambda index: self._index(variable, index), shape, one_chunk
+        )
 
     def _variable_chunksizes(self, variable):
         """Return the dataset variable chunk size.
@@ -10755,12 +11307,16 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
         """
         match self.read_vars["original_dataset_opened_with"]:
             case "h5netcdf-pyfive" | "h5netcdf-h5py" | "zarr":
-                chunks = variable.chunks
+                with self._dataset_lock():
+                    chunks = variable.chunks
+
                 if not chunks:
                     chunks = None
 
             case "netCDF4":
-                chunks = variable.chunking()
+                with self._dataset_lock():
+                    chunks = variable.chunking()
+
                 if chunks == "contiguous":
                     chunks = None
 
@@ -11088,15 +11644,130 @@ class NetCDFRead(IORead, FieldChecker, NetCDFCheckerMixin):
         """
         g = self.read_vars
         if g["has_groups"]:
-            group, name = self._netCDF4_group(
-                g["variable_grouped_dataset"][ncvar], ncvar
-            )
+            with self._dataset_lock():
+                group, name = self._netCDF4_group(
+                    g["variable_grouped_dataset"][ncvar], ncvar
+                )
+
             variable = self._file_group_variables(group).get(name)
         else:
             variable = g["variables"].get(ncvar)
 
         return variable
 
+    @classmethod
+    def _magic_number_key(cls, dataset, filesystem=None, representation=None):
+        """Return the magic number cache key of a dataset.
+
+        Only local files have a key, which includes the file's
+        modification time and size so that a file that has been
+        overwritten is sniffed again.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            dataset:
+                The dataset. May be a string-valued path, a file-like
+                object, or a directory-like object.
+
+            filesystem: file system, optional
+                The file system of the dataset. If `None` then the
+                path is assumed to be local.
+
+            representation: `str` or `None`, optional
+                The dataset representation. If `None` (the default),
+                then it will be determined by calling
+                `dataset_representation`.
+
+        :Returns:
+
+            `tuple` or `None`
+                The key, or `None` if the dataset is not a local file.
+
+        """
+        if filesystem is not None:
+            return None
+
+        if representation is None:
+            representation = cls.dataset_representation(dataset)
+
+        if representation != "path":
+            return None
+
+        try:
+            stat = os.stat(dataset)
+        except (OSError, ValueError):
+            return None
+
+        # Key on the absolute path, so that a relative path is not
+        # confused with the same relative path from another working
+        # directory
+        return (os.path.abspath(dataset), stat.st_mtime_ns, stat.st_size)
+
+    def _sniff_netcdf_backend(
+        self, dataset, netcdf_backend, filesystem=None, representation=None
+    ):
+        """Select the netCDF backends that can open a dataset.
+
+        The backends are selected according to the dataset's magic
+        number, if it is known from a previous call to
+        `dataset_type`. This avoids failed attempts to open, for
+        instance, a netCDF-3 file with an HDF5 backend.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            dataset:
+                The dataset. May be a string-valued path, a file-like
+                object, or a directory-like object.
+
+            netcdf_backend: sequence of `str`
+                The netCDF backends, in the order in which they are to
+                be tried.
+
+            filesystem: file system, optional
+                The file system of the dataset.
+
+            representation: `str` or `None`, optional
+                The dataset representation.
+
+        :Returns:
+
+            `tuple` of `str`
+                The backends from *netcdf_backend* that can open the
+                dataset, in their original order. If none can, or the
+                magic number is not known, then *netcdf_backend* is
+                returned unchanged, so that every backend still gets a
+                chance to report an error.
+
+        **Examples**
+
+        >>> r._sniff_netcdf_backend(
+        ...     'file3.nc', ('h5netcdf-pyfive', 'netCDF4', 'netcdf_file')
+        ... )
+        ('netCDF4', 'netcdf_file')
+
+        """
+        key = self._magic_number_key(dataset, filesystem, representation)
+        magic_number = _magic_numbers.get(key)
+        if magic_number is None:
+            return tuple(netcdf_backend)
+
+        backends = NETCDF_MAGIC_NUMBER_BACKENDS.get(magic_number, ())
+        sniffed = tuple(b for b in netcdf_backend if b in backends)
+        if not sniffed:
+            return tuple(netcdf_backend)
+
+        if is_log_level_debug(logger):
+            logger.debug(
+                f"    Selected netCDF backends {sniffed} for {dataset} "
+                f"from its magic number {magic_number}"
+            )  # pragma: no cover
+
+        return sniffed
+
     @classmethod
     def get_magic_number(cls, dataset, filesystem=None, representation=None):
         """Get the magic number of a dataset in a file.
@@ -3693,10 +3693,13 @@ class NetCDFWrite(NetCDFWriteUgrid, IOWrite):
                 fill_value=fill_value,
             )
 
-        if lock:
+        if lock and not zarr:
             # We need to define the dataset lock for data writing from
-            # Dask
-            from cfdm.data.locks import netcdf_lock as lock
+            # Dask. This is the global netCDF-C lock for 'netCDF4',
+            # and a lock on just the output dataset for 'h5netcdf'.
+            from cfdm.data.locks import dataset_lock
+
+            lock = dataset_lock(backend, abspath(g["dataset_name"]))
 
         # Set the current size of unlimited dimensions
         self.set_unlimited_dimension_sizes(g["nc"][ncvar], data.shape)
@@ -5300,6 +5303,13 @@ class NetCDFWrite(NetCDFWriteUgrid, IOWrite):
         if mode == "w" and g["overwrite"]:
             self.dataset_remove()
 
+        if g["write_to_disk"] and dataset_name is not None:
+            # Close any idle open handles to the dataset that are
+            # being kept for reuse by file-based arrays
+            from cfdm.data.filehandlepool import handle_pool
+
+            handle_pool.discard(dataset_name)
+
         match g["backend"]:
             case "h5netcdf-h5py":
                 import h5netcdf
@@ -5792,6 +5802,12 @@ class NetCDFWrite(NetCDFWriteUgrid, IOWrite):
             # UGRID:
             # --------------------------------------------------------
             "meshes": {},
+            # Index of the meshes in 'meshes', keyed by their
+            # fingerprints, and the names of the meshes which have
+            # been indexed by their implied edges
+            "mesh_fingerprints": {},
+            "edge_indexed_meshes": set(),
+            # --------------------------------------------------------
             # Cache selected (field, coordinate reference, dimension
             # coordinate) triples
             # --------------------------------------------------------
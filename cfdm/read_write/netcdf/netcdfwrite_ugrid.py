@@ -301,27 +301,246 @@ class NetCDFWriteUgrid:
             # Parent is not UGRID
             return
 
-        for ncvar, mesh in g["meshes"].items():
-            if self._ugrid_linked_meshes(mesh, mesh_new):
-                # The mesh is either A) identical to another parent's
-                # mesh, or B) represents a different location (node,
-                # edge, face, or volume) of another parent's mesh.
-                #
-                # In both cases we can assign that other parent's mesh
-                # to the current parent; but in case B), we first
-                # update the other parent's mesh to include the new
-                # location. In case A), `_ugrid_update_mesh` makes no
-                # change to the other parent's mesh.
-                self._ugrid_update_mesh(mesh, mesh_new)
-                return ncvar
+        # Find the previously saved meshes which might be linked to
+        # the new mesh. These are firstly those which have the same
+        # cell connectivity as the new mesh, and secondly (if none
+        # of those is linked) those which imply the same edges as the
+        # new mesh. Only these candidate meshes need to be compared
+        # in full with the new mesh.
+        fingerprints = g["mesh_fingerprints"]
+        fingerprint = self._ugrid_mesh_fingerprint(mesh_new)
+        edge_fingerprint = None
+        candidates = fingerprints.get(fingerprint, [])
+        ncvar = self._ugrid_find_linked_mesh(mesh_new, candidates)
+        if ncvar is None and g["meshes"]:
+            edge_fingerprint = self._ugrid_edge_fingerprint(mesh_new)
+            for ncvar1, mesh in g["meshes"].items():
+                if ncvar1 not in g["edge_indexed_meshes"]:
+                    self._ugrid_add_fingerprint(
+                        ncvar1, self._ugrid_edge_fingerprint(mesh)
+                    )
+                    g["edge_indexed_meshes"].add(ncvar1)
+
+            ncvar = self._ugrid_find_linked_mesh(
+                mesh_new,
+                [
+                    ncvar1
+                    for ncvar1 in fingerprints.get(edge_fingerprint, ())
+                    if ncvar1 not in candidates
+                ],
+            )
+
+        if ncvar is not None:
+            # The mesh is either A) identical to another parent's
+            # mesh, or B) represents a different location (node,
+            # edge, face, or volume) of another parent's mesh.
+            #
+            # In both cases we can assign that other parent's mesh
+            # to the current parent; but in case B), we first
+            # update the other parent's mesh to include the new
+            # location. In case A), `_ugrid_update_mesh` makes no
+            # change to the other parent's mesh.
+            self._ugrid_update_mesh(g["meshes"][ncvar], mesh_new)
+            self._ugrid_add_fingerprint(ncvar, fingerprint)
+            return ncvar
 
         # Still here? Then this parent's UGRID mesh is not the same
         # as, nor linked to, any other parent's mesh, so we save
         # it as a new mesh.
         g["meshes"][ncvar_new] = mesh_new
+        self._ugrid_add_fingerprint(ncvar_new, fingerprint)
+        if edge_fingerprint is not None:
+            self._ugrid_add_fingerprint(ncvar_new, edge_fingerprint)
+            g["edge_indexed_meshes"].add(ncvar_new)
 
         return ncvar_new
 
+    def _ugrid_find_linked_mesh(self, mesh, ncvars):
+        """Find the first of the given meshes that is linked to a mesh.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `_ugrid_linked_meshes`
+
+        :Parameters:
+
+            mesh: `dict`
+                The mesh description.
+
+            ncvars: sequence of `str`
+                The netCDF variable names of the candidate meshes, in
+                the order in which they are to be tested.
+
+        :Returns:
+
+            `str` or `None`
+                The netCDF variable name of the first candidate mesh
+                that is linked to *mesh*, or `None` if there is no
+                such mesh.
+
+        """
+        meshes = self.write_vars["meshes"]
+        for ncvar in ncvars:
+            if self._ugrid_linked_meshes(meshes[ncvar], mesh):
+                return ncvar
+
+        return None
+
+    def _ugrid_add_fingerprint(self, ncvar, fingerprint):
+        """Add a mesh fingerprint to the index of saved meshes.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `_ugrid_edge_fingerprint`,
+                     `_ugrid_mesh_fingerprint`
+
+        :Parameters:
+
+            ncvar: `str`
+                The netCDF variable name of the saved mesh.
+
+            fingerprint: `tuple`
+                The mesh fingerprint.
+
+        :Returns:
+
+            `None`
+
+        """
+        ncvars = self.write_vars["mesh_fingerprints"].setdefault(
+            fingerprint, []
+        )
+        if ncvar not in ncvars:
+            ncvars.append(ncvar)
+
+    @classmethod
+    def _ugrid_digest(cls, construct, dtype=None):
+        """Return a hash of the data of a mesh construct.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Parameters:
+
+            construct:
+                The construct with data.
+
+            dtype: data-type, optional
+                If set then cast the data to this type before it is
+                hashed.
+
+        :Returns:
+
+            `tuple`
+                The data shape, and the hexadecimal SHA-1 digest of
+                the data values and missing value mask.
+
+        """
+        import hashlib
+
+        import numpy as np
+
+        a = construct.array
+        h = hashlib.sha1()
+        if np.ma.is_masked(a):
+            h.update(np.ma.getmaskarray(a))
+            a = np.ma.filled(a, 0)
+
+        a = np.ascontiguousarray(a, dtype=dtype)
+        h.update(a)
+        return a.shape, h.hexdigest()
+
+    def _ugrid_mesh_fingerprint(self, mesh):
+        """Return the fingerprint of a new mesh's cell connectivity.
+
+        The fingerprint is a hash of the cell connectivity. A new
+        mesh can only be identical to a saved mesh with an equal
+        fingerprint, so comparing fingerprints is a fast way to
+        exclude the saved meshes that are different. A mesh that is
+        linked to a saved mesh with an equal fingerprint is then
+        confirmed with `_ugrid_linked_meshes`, which compares the
+        node coordinates to within the numerical tolerance.
+
+        The node coordinates are not hashed, since node coordinates
+        that are equal to within the numerical tolerance, but are not
+        identical, would then have different fingerprints.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `_ugrid_edge_fingerprint`
+
+        :Parameters:
+
+            mesh: `dict`
+                The mesh description, as created by
+                `_ugrid_create_mesh`.
+
+        :Returns:
+
+            `tuple`
+                The fingerprint.
+
+        """
+        for key in (
+            "node_node_connectivity",
+            "edge_node_connectivity",
+            "face_node_connectivity",
+            "volume_node_connectivity",
+        ):
+            if key in mesh:
+                break
+
+        return (key, self._ugrid_digest(mesh[key][0], "int64"))
+
+    def _ugrid_edge_fingerprint(self, mesh):
+        """Return the fingerprint of the edges implied by a mesh.
+
+        The fingerprint is a hash of the sorted unique edges implied
+        by the mesh, which is the same for all of the locations
+        (node, edge, and face) of a mesh. A new
+        mesh can only be linked to a saved mesh with an equal
+        fingerprint, which is then confirmed with
+        `_ugrid_linked_meshes`.
+
+        The sorted unique edges are stored in the mesh's
+        'sorted_edges' dictionary, so that they do not need to be
+        recalculated by `_ugrid_linked_meshes`.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        .. seealso:: `_ugrid_mesh_fingerprint`
+
+        :Parameters:
+
+            mesh: `dict`
+                The mesh description.
+
+        :Returns:
+
+            `tuple`
+                The fingerprint.
+
+        """
+        sorted_edges = mesh["sorted_edges"]
+        edges = sorted_edges.get("edge_node_connectivity")
+        if edges is None:
+            if "edge_node_connectivity" in mesh:
+                edges = mesh["edge_node_connectivity"][0].sort()
+            else:
+                for location in ("node", "face"):
+                    key = f"{location}_node_connectivity"
+                    if key in mesh:
+                        edges = mesh[key][0].to_edge(sort=True)
+                        sorted_edges[key] = edges
+                        break
+                else:
+                    raise NotImplementedError(
+                        "Can't write a UGRID mesh of volume cells"
+                    )
+
+            sorted_edges["edge_node_connectivity"] = edges
+
+        return ("sorted_edges", self._ugrid_digest(edges, "int64"))
+
     def _ugrid_create_mesh(self, parent):
         """Create a mesh description from a parent Field or Domain.
 
@@ -543,7 +762,7 @@ class NetCDFWriteUgrid:
 
             if ncvar_cell_coordinates:
                 key = f"{cell}_coordinates"
-                mesh[key] = cell_coordinates
+                mesh[key] = list(cell_coordinates.values())
                 mesh["attributes"][key] = ncvar_cell_coordinates
 
         # Add mesh description keys for normalised cell connectivities
@@ -766,10 +985,7 @@ class NetCDFWriteUgrid:
         # Find the set of unique edges that are implied by the faces
         face_edges = face["sorted_edges"].get("face_node_connectivity")
         if face_edges is None:
-            n_nodes = face["node_coordinates"][0].size
-            face_edges = face["face_node_connectivity"][0].to_edge(
-                sort=True, face_nodes=range(n_nodes)
-            )
+            face_edges = face["face_node_connectivity"][0].to_edge(sort=True)
             face["sorted_edges"]["face_node_connectivity"] = face_edges
             face["sorted_edges"]["edge_node_connectivity"] = face_edges
 
@@ -809,10 +1025,7 @@ class NetCDFWriteUgrid:
         # Find the set of unique edges that are implied by the faces
         face_edges = face["sorted_edges"].get("face_node_connectivity")
         if face_edges is None:
-            n_nodes = face["node_coordinates"][0].size
-            face_edges = face["face_node_connectivity"][0].to_edge(
-                face_nodes=range(n_nodes), sort=True
-            )
+            face_edges = face["face_node_connectivity"][0].to_edge(sort=True)
             face["sorted_edges"]["face_node_connectivity"] = face_edges
             face["sorted_edges"]["edge_node_connectivity"] = face_edges
 
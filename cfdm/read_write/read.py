@@ -1,6 +1,10 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
 from functools import partial
 from glob import iglob
 from logging import getLogger
+from numbers import Integral
 from os import walk
 from os.path import expanduser, expandvars, isdir, join
 
@@ -160,7 +164,7 @@ class read(ReadWrite):
 
             .. versionadded:: (cfdm) 1.11.2.0
 
-        {{read cache: `bool`, optional}}
+        {{read cache: `bool` or `str`, optional}}
 
             .. versionadded:: (cfdm) 1.11.2.0
 
@@ -200,6 +204,18 @@ class read(ReadWrite):
 
             .. versionadded:: (cfdm) 1.13.0.0
 
+        {{read select: (sequence of) `str` or `re.Pattern`, optional}}
+
+            .. versionadded:: (cfdm) NEXTVERSION
+
+        {{read parallel: `str`, `int`, `dict`, or `None`, optional}}
+
+            .. versionadded:: (cfdm) NEXTVERSION
+
+        {{read unpack_dtype: data-type or `None`, optional}}
+
+            .. versionadded:: (cfdm) NEXTVERSION
+
         _noncompliance_report: `bool`, optional
             If True then return a warning when any data read in are
             not fully compliant by the CF Conventions, with a dictionary
@@ -290,6 +306,9 @@ class read(ReadWrite):
         cdl_string=False,
         extra_read_vars=None,
         group_dimension_search="closest_ancestor",
+        select=None,
+        parallel=None,
+        unpack_dtype=None,
         _noncompliance_report=False,
         **kwargs,
     ):
@@ -310,27 +329,12 @@ class read(ReadWrite):
         # include initialising 'self.constructs' attribute to an empty
         # list).
         self._initialise()
-
-        dataset_type = self.dataset_type
-        if not (
-            dataset_type is None
-            or self.dataset_type.issubset(self.allowed_dataset_types)
-        ):
-            raise ValueError(
-                "'dataset_type' keyword must be None, or a subset of "
-                f"{self.allowed_dataset_types}"
-            )
+        self._check_initialisation()
 
         # Loop round the input datasets
-        for dataset in self._datasets():
-            # Read the dataset
-            self._pre_read(dataset)
-            self._read(dataset)
-            self._post_read(dataset)
-
+        for dataset_contents in self._read_datasets():
             # Add the dataset contents to the output list
-            self.n_datasets += 1
-            self.constructs.extend(self.dataset_contents)
+            self.constructs.extend(dataset_contents)
 
         # Actions to be taken after all datasets have been read
         self._finalise()
@@ -346,6 +350,28 @@ class read(ReadWrite):
         # Return the field or domain constructs
         return self.constructs
 
+    def _check_initialisation(self):
+        """Check the parameters that were parsed by `_initialise`.
+
+        Called by `__new__`.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Returns:
+
+            `None`
+
+        """
+        dataset_type = self.dataset_type
+        if not (
+            dataset_type is None
+            or dataset_type.issubset(self.allowed_dataset_types)
+        ):
+            raise ValueError(
+                "'dataset_type' keyword must be None, or a subset of "
+                f"{self.allowed_dataset_types}"
+            )
+
     def _datasets(self):
         """Find all of the datasets.
 
@@ -541,10 +567,132 @@ class read(ReadWrite):
         # Initialise the set of different dataset categories.
         self.unique_dataset_categories = set()
 
+        # Parse the 'parallel' keyword parameter
+        parallel = kwargs.get("parallel")
+        if parallel is not None:
+            max_workers = None
+            if isinstance(parallel, dict):
+                parallel = parallel.copy()
+                executor = parallel.pop("executor", None)
+                max_workers = parallel.pop("max_workers", None)
+                if parallel:
+                    raise ValueError(
+                        "Invalid key(s) in 'parallel' dictionary: "
+                        f"{tuple(parallel)}"
+                    )
+            elif isinstance(parallel, str):
+                executor = parallel
+            elif isinstance(parallel, Integral) and not isinstance(
+                parallel, bool
+            ):
+                executor = "process"
+                max_workers = parallel
+            else:
+                executor = None
+
+            if executor not in ("thread", "process"):
+                raise ValueError(
+                    "'parallel' keyword must be None, 'thread', 'process', "
+                    f"an integer, or a dictionary. Got: {kwargs['parallel']!r}"
+                )
+
+            if max_workers is not None:
+                max_workers = int(max_workers)
+                if max_workers < 1:
+                    raise ValueError(
+                        "The maximum number of parallel workers must be "
+                        f"positive. Got: {max_workers!r}"
+                    )
+
+            parallel = (executor, max_workers)
+
+        self.parallel = parallel
+
+    def _parallel_read(self):
+        """Read the datasets concurrently.
+
+        Each dataset is read by `_read_dataset` in a worker of a
+        thread or process pool, as defined by the `parallel`
+        attribute. At most twice as many datasets as there are
+        workers are submitted to the pool ahead of the dataset whose
+        contents are next to be returned.
+
+        Called by `_read_datasets`.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Returns:
+
+            generator
+                An iterator over the contents of each dataset, in the
+                same order as the datasets given by `_datasets`. Each
+                element is a 2-tuple containing the `list` of field or
+                domain constructs, and the `set` of dataset categories
+                that were read.
+
+        """
+        executor, max_workers = self.parallel
+        if executor == "thread":
+            Executor = ThreadPoolExecutor
+        else:
+            Executor = ProcessPoolExecutor
+
+        # Each worker reads with its own copy of this instance, and in
+        # particular its own netCDF read object, which is not
+        # thread-safe.
+        state = {
+            key: value
+            for key, value in self.__dict__.items()
+            if key not in ("netcdf", "netcdf_read")
+        }
+        read_dataset = partial(_read_dataset, type(self), state)
+
+        with Executor(max_workers=max_workers) as pool:
+            # Keep at most two datasets per worker in flight, so that
+            # the contents of only a bounded number of datasets are
+            # held in memory at any one time
+            max_in_flight = 2 * pool._max_workers
+
+            futures = deque()
+            datasets = self._datasets()
+            datasets_error = None
+            try:
+                while True:
+                    while datasets is not None and (
+                        len(futures) < max_in_flight
+                    ):
+                        try:
+                            dataset = next(datasets)
+                        except StopIteration:
+                            datasets = None
+                        except Exception as error:
+                            # Defer an error from finding the datasets
+                            # (such as a missing file) until all of
+                            # the preceding datasets have been read,
+                            # as would be the case when reading in
+                            # sequence.
+                            datasets_error = error
+                            datasets = None
+                        else:
+                            futures.append(pool.submit(read_dataset, dataset))
+
+                    if not futures:
+                        break
+
+                    # Return the results in the order of the datasets,
+                    # re-raising the first read error in that order
+                    yield futures.popleft().result()
+            except BaseException:
+                pool.shutdown(wait=True, cancel_futures=True)
+                raise
+
+            if datasets_error is not None:
+                raise datasets_error
+
     def _post_read(self, dataset):
         """Actions to take immediately after reading a dataset.
 
-        Called by `__new__`.
+        Called by `_read_datasets`.
 
         .. versionadded:: (cfdm) 1.12.2.0
 
@@ -570,7 +718,7 @@ class read(ReadWrite):
     def _pre_read(self, dataset):
         """Actions to take immediately before reading a dataset.
 
-        Called by `__new__`.
+        Called by `_read_datasets`.
 
         .. versionadded:: (cfdm) 1.12.2.0
 
@@ -604,7 +752,7 @@ class read(ReadWrite):
 
         The constructs are stored in the `dataset_contents` attribute.
 
-        Called by `__new__`.
+        Called by `_read_datasets`.
 
         .. versionadded:: (cfdm) 1.12.2.0
 
@@ -656,13 +804,14 @@ class read(ReadWrite):
                         "cdl_string",
                         "extra_read_vars",
                         "group_dimension_search",
+                        "select",
+                        "unpack_dtype",
                         "_noncompliance_report",
                     )
                 }
 
-                self.netcdf_read = partial(
-                    NetCDFRead(self.implementation).read, **netcdf_kwargs
-                )
+                self.netcdf = NetCDFRead(self.implementation)
+                self.netcdf_read = partial(self.netcdf.read, **netcdf_kwargs)
 
             try:
                 # Try to read the dataset
@@ -677,3 +826,109 @@ class read(ReadWrite):
         if self.dataset_contents is not None:
             # Successfully read the dataset
             return
+
+    def _read_datasets(self):
+        """Read each dataset in turn.
+
+        The datasets are read in sequence, or concurrently if
+        requested by the `parallel` attribute. Either way, the
+        contents of each dataset are returned in the order given by
+        `_datasets`, and the internal state arising from reading a
+        dataset is released before the next dataset's contents are
+        returned.
+
+        Called by `__new__`.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Returns:
+
+            generator
+                An iterator over the `list` of field or domain
+                constructs read from each dataset.
+
+        """
+        if self.parallel is None:
+            for dataset in self._datasets():
+                # Read the dataset
+                self._pre_read(dataset)
+                self._read(dataset)
+                self._post_read(dataset)
+
+                dataset_contents = self.dataset_contents
+                self._release()
+
+                self.n_datasets += 1
+                yield dataset_contents
+        else:
+            # Read the datasets concurrently
+            for dataset_contents, categories in self._parallel_read():
+                self.n_datasets += 1
+                self.unique_dataset_categories.update(categories)
+                yield dataset_contents
+
+    def _release(self):
+        """Release the internal state of the most recent dataset read.
+
+        Called by `_read_datasets`.
+
+        .. versionadded:: (cfdm) NEXTVERSION
+
+        :Returns:
+
+            `None`
+
+        """
+        self.dataset_contents = None
+        netcdf = getattr(self, "netcdf", None)
+        if netcdf is not None:
+            netcdf.read_vars = {}
+
+
+def _read_dataset(cls, state, dataset):
+    """Read a single dataset in a worker of a parallel read.
+
+    Called by `read._parallel_read`.
+
+    .. versionadded:: (cfdm) NEXTVERSION
+
+    :Parameters:
+
+        cls: subclass of `read`
+            The class of the parent `read` instance.
+
+        state: `dict`
+            The attributes of the parent `read` instance.
+
+        dataset:
+            The dataset to be read.
+
+    :Returns:
+
+        `tuple`
+            The `list` of field or domain constructs read from the
+            dataset, and the `set` of its dataset categories.
+
+    """
+    # Create a new instance without calling 'cls.__new__', which
+    # would start a new read
+    self = object.__new__(cls)
+    self.__dict__.update(state)
+    self.unique_dataset_categories = set()
+
+    if self.parallel[0] == "process":
+        # A forked worker process inherits dask's threaded scheduler
+        # pool, but not its threads, so any computations made whilst
+        # parsing the dataset must be run synchronously
+        from dask import config as dask_config
+
+        scheduler = dask_config.set(scheduler="synchronous")
+    else:
+        scheduler = nullcontext()
+
+    with scheduler:
+        self._pre_read(dataset)
+        self._read(dataset)
+        self._post_read(dataset)
+
+    return self.dataset_contents, self.unique_dataset_categories
@@ -0,0 +1,83 @@
+"""Benchmark the per-file latency of opening netCDF datasets.
+
+Compares trying each of the default netCDF backends in turn until one
+succeeds (the behaviour before backend sniffing) with only trying the
+backends that can open the file's format, as selected from its
+(cached) magic number.
+
+Usage::
+
+   python benchmark_dataset_open.py [number of repeats]
+
+"""
+
+import os
+import sys
+import tempfile
+import timeit
+
+import cfdm
+from cfdm.read_write.netcdf.netcdfread import NetCDFRead
+
+# The default order in which netCDF backends are tried
+backends = ("h5netcdf-pyfive", "h5netcdf-h5py", "netCDF4", "netcdf_file")
+
+
+def open_dataset(r, filename, netcdf_backend):
+    """Open and close a dataset with the first backend that works."""
+    openers = {
+        "h5netcdf-pyfive": r._open_h5netcdf_pyfive,
+        "h5netcdf-h5py": r._open_h5netcdf_h5py,
+        "netCDF4": r._open_netCDF4,
+        "netcdf_file": r._open_netcdf_file,
+    }
+    r.read_vars["dataset"] = filename
+    for backend in netcdf_backend:
+        try:
+            nc = openers[backend](filename)
+        except Exception:
+            continue
+
+        nc.close()
+        return backend
+
+    raise RuntimeError(f"Can't open {filename}")
+
+
+def before(r, filename):
+    """Open a dataset by trying every backend in turn."""
+    return open_dataset(r, filename, backends)
+
+
+def after(r, filename):
+    """Open a dataset with the backends selected by sniffing."""
+    NetCDFRead.dataset_type(filename, None)
+    netcdf_backend = r._sniff_netcdf_backend(filename, backends)
+    return open_dataset(r, filename, netcdf_backend)
+
+
+if __name__ == "__main__":
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+
+    r = NetCDFRead(cfdm.implementation())
+    r.read_vars = {}
+
+    f = cfdm.example_field(0)
+    tmpdir = tempfile.mkdtemp()
+
+    print(f"Mean open latency over {number} repeats:")
+    for fmt in ("NETCDF3_CLASSIC", "NETCDF3_64BIT_DATA", "NETCDF4"):
+        filename = os.path.join(tmpdir, f"{fmt}.nc")
+        cfdm.write(f, filename, fmt=fmt)
+
+        for function in (before, after):
+            backend = function(r, filename)
+            t = timeit.timeit(lambda: function(r, filename), number=number)
+            print(
+                f"  {fmt:<20} {function.__name__:<7}: "
+                f"{1000 * t / number:8.3f} ms  (opened with {backend})"
+            )
+
+        os.remove(filename)
+
+    os.rmdir(tmpdir)
@@ -0,0 +1,107 @@
+"""Benchmark domain topology normalisation, sorting and edges.
+
+Creates the face, edge and point domain topologies of synthetic
+cubed-sphere meshes of increasing resolution (with ``6 * n**2``
+quadrilateral faces), with randomly permuted node identities, and
+reports the time taken by `DomainTopology.normalise`,
+`DomainTopology.sort` and `DomainTopology.to_edge`, which are used
+when comparing and writing UGRID meshes.
+
+Usage::
+
+   python benchmark_domain_topology.py [largest n]
+
+"""
+
+import sys
+import time
+
+import numpy as np
+
+import cfdm
+
+
+def cubed_sphere(n, rng):
+    """Return the face, edge and point topologies of a cubed sphere.
+
+    The mesh nodes are the integer points on the surface of the cube
+    ``[0, n]**3``, and each panel of the cube is divided into ``n *
+    n`` quadrilateral faces.
+
+    """
+    i, j = np.meshgrid(np.arange(n + 1), np.arange(n + 1), indexing="ij")
+    zero = np.zeros_like(i)
+    panels = []
+    for axis in range(3):
+        for side in (zero, zero + n):
+            xyz = [i, j]
+            xyz.insert(axis, side)
+            panels.append(np.stack(xyz, axis=-1))
+
+    # Identify the nodes that are shared between panels from their
+    # coordinates
+    xyz = np.stack(panels)
+    keys = (xyz[..., 0] * (n + 1) + xyz[..., 1]) * (n + 1) + xyz[..., 2]
+    _, ids = np.unique(keys, return_inverse=True)
+    ids = ids.reshape(keys.shape)
+
+    # Randomly permute the node identities
+    ids = rng.permutation(ids.max() + 1)[ids]
+
+    faces = np.stack(
+        (
+            ids[:, :-1, :-1],
+            ids[:, :-1, 1:],
+            ids[:, 1:, 1:],
+            ids[:, 1:, :-1],
+        ),
+        axis=-1,
+    ).reshape(-1, 4)
+
+    face = cfdm.DomainTopology(cell="face", data=cfdm.Data(faces))
+    edge = face.to_edge()
+    points = cfdm.PointTopologyArray(
+        face_node_connectivity=faces, start_index=0, cell_dimension=0
+    ).array
+
+    # Randomly permute the point cells, so that they need relabelling
+    points = points[rng.permutation(points.shape[0])]
+    point = cfdm.DomainTopology(cell="point", data=cfdm.Data(points))
+    return face, edge, point
+
+
+def timeit(func):
+    """Return the time taken to call a function."""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    max_n = int(sys.argv[1]) if len(sys.argv) > 1 else 384
+
+    cfdm.log_level("DISABLE")
+    rng = np.random.default_rng(0)
+
+    n = 24
+    while n <= max_n:
+        face, edge, point = cubed_sphere(n, rng)
+        print(
+            f"C{n}: {face.data.shape[0]} faces, {edge.data.shape[0]} edges, "
+            f"{point.data.shape[0]} nodes"
+        )
+        for name, d in (("face", face), ("edge", edge), ("point", point)):
+            results = {"normalise": timeit(d.normalise)}
+            if name != "face":
+                results["sort"] = timeit(d.sort)
+
+            results["to_edge"] = timeit(d.to_edge)
+            results["to_edge(sort=True)"] = timeit(
+                lambda: d.to_edge(sort=True)
+            )
+            print(
+                f"  {name:<5} "
+                + ", ".join(f"{k} {t:7.3f} s" for k, t in results.items())
+            )
+
+        n *= 2
@@ -0,0 +1,70 @@
+"""Benchmark the masking and unpacking of packed data.
+
+Compares masking the whole array and then unpacking it (the behaviour
+before fused masking and unpacking) with masking and unpacking each
+block of the array in turn, reporting the time taken and the peak
+memory allocated for each, for ``int16`` data packed with ``float64``
+attributes.
+
+Usage::
+
+   python benchmark_netcdf_indexer.py [number of elements]
+
+"""
+
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+import cfdm
+
+
+class before(cfdm.netcdf_indexer):
+    """Mask the whole array and then unpack it."""
+
+    def _mask_and_unpack(self, data, dtype, attributes, dtype_unsigned_int):
+        if self.mask:
+            data = self._mask(data, dtype, attributes, dtype_unsigned_int)
+
+        if self.unpack:
+            data = self._unpack(data, attributes)
+
+        return data
+
+
+class after(cfdm.netcdf_indexer):
+    """Mask and unpack the array in a single pass."""
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000_000
+
+    rng = np.random.default_rng(0)
+    packed = rng.integers(-32767, 32767, size, dtype="int16")
+    packed[::1000] = -32767
+    attributes = {
+        "_FillValue": np.int16(-32767),
+        "missing_value": np.int16(-999),
+        "valid_min": np.int16(-32000),
+        "valid_max": np.int16(32000),
+        "scale_factor": 0.01,
+        "add_offset": 273.15,
+    }
+
+    print(f"Masking and unpacking {packed.nbytes / 2**20:.0f} MiB of int16:")
+    for unpack_dtype in (None, "float32"):
+        for klass in (before, after):
+            x = klass(packed, attributes=attributes, unpack_dtype=unpack_dtype)
+            tracemalloc.start()
+            start = time.perf_counter()
+            a = x[...]
+            t = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(
+                f"  {klass.__name__:<6} ({a.dtype}): {t:6.2f} s, "
+                f"peak {peak / 2**20:7.0f} MiB"
+            )
+            del a
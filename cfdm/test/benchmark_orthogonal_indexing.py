@@ -0,0 +1,87 @@
+"""Benchmark orthogonal indexing of chunked variables.
+
+Compares emulating orthogonal indexing by applying each list index in
+turn (the behaviour before chunk-aware indexing) with reading only
+the storage chunks that contain selected elements, for a sparse
+selection of stations from a chunked (time, lat, lon) variable, read
+with `h5py`, `pyfive`, and `zarr`.
+
+Usage::
+
+   python benchmark_orthogonal_indexing.py [number of repeats]
+
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+
+import h5py
+import numpy as np
+import pyfive
+import zarr
+
+import cfdm
+
+
+class before(cfdm.netcdf_indexer):
+    """Apply each list index in turn."""
+
+    @staticmethod
+    def _storage_chunks(data):
+        return None
+
+
+class after(cfdm.netcdf_indexer):
+    """Read only the storage chunks that contain selected elements."""
+
+
+if __name__ == "__main__":
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+
+    shape = (365, 180, 360)
+    chunks = (365, 30, 30)
+    rng = np.random.default_rng(0)
+    array = rng.random(shape, dtype="float32")
+
+    # A sparse selection of stations
+    index = (
+        slice(None),
+        np.sort(rng.choice(shape[1], 6, replace=False)),
+        np.sort(rng.choice(shape[2], 6, replace=False)),
+    )
+
+    tmpdir = tempfile.mkdtemp()
+    h5 = os.path.join(tmpdir, "file.nc")
+    with h5py.File(h5, "w") as f:
+        f.create_dataset("x", data=array, chunks=chunks)
+
+    zarr_path = os.path.join(tmpdir, "file.zarr")
+    z = zarr.create_array(
+        zarr_path, shape=shape, chunks=chunks, dtype=array.dtype
+    )
+    z[...] = array
+
+    variables = {
+        "h5py": h5py.File(h5, "r")["x"],
+        "pyfive": pyfive.File(h5)["x"],
+        "zarr": zarr.open_array(zarr_path, mode="r"),
+    }
+
+    print(
+        f"Mean time to select {index[1].size} x {index[2].size} stations "
+        f"from {shape} with chunks {chunks}:"
+    )
+    for name, variable in variables.items():
+        for klass in (before, after):
+            x = klass(variable, orthogonal_indexing=True)
+            assert (x[index] == array[:, index[1]][:, :, index[2]]).all()
+            t = timeit.timeit(lambda: x[index], number=number)
+            print(
+                f"  {name:<7} {klass.__name__:<6}: "
+                f"{1000 * t / number:9.1f} ms"
+            )
+
+    shutil.rmtree(tmpdir)
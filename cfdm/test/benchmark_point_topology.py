@@ -0,0 +1,100 @@
+"""Benchmark the creation of point topology from face connectivity.
+
+Creates the point topology (each node followed by the nodes that are
+joined to it) of regular quadrilateral meshes of increasing size,
+from both their UGRID "face_node_connectivity" and
+"edge_node_connectivity" arrays, and reports the time taken. For the
+smaller meshes, the time taken by finding the neighbours of each node
+in turn (the behaviour before the sparse adjacency construction) is
+also reported.
+
+Usage::
+
+   python benchmark_point_topology.py [largest number of faces]
+
+"""
+
+import sys
+import time
+
+import numpy as np
+
+import cfdm
+from cfdm.data.subarray import PointTopologyFromFacesSubarray
+
+# Meshes with more faces than this are not benchmarked with the
+# node-by-node method, which scales with the product of the numbers
+# of nodes and faces
+BEFORE_MAX_FACES = 40_000
+
+
+def quadrilateral_mesh(n):
+    """Return the face and edge connectivity of an n by n mesh."""
+    nodes = np.arange((n + 1) ** 2).reshape(n + 1, n + 1)
+    faces = np.stack(
+        (nodes[:-1, :-1], nodes[:-1, 1:], nodes[1:, 1:], nodes[1:, :-1]),
+        axis=-1,
+    ).reshape(-1, 4)
+    edges = np.concatenate(
+        (
+            np.stack((nodes[:, :-1], nodes[:, 1:]), axis=-1).reshape(-1, 2),
+            np.stack((nodes[:-1, :], nodes[1:, :]), axis=-1).reshape(-1, 2),
+        )
+    )
+    return faces, edges
+
+
+def before(faces):
+    """Find the nodes joined to each node, one node at a time."""
+    connected_nodes = PointTopologyFromFacesSubarray._connected_nodes
+    rows = [connected_nodes(node, faces, False) for node in np.unique(faces)]
+    u = np.ma.masked_all((len(rows), max(map(len, rows))), dtype=faces.dtype)
+    for i, row in enumerate(rows):
+        u[i, : len(row)] = row
+
+    return u
+
+
+def after(connectivity, edges=False):
+    """Find the nodes joined to each node with a sparse adjacency."""
+    if edges:
+        kwargs = {"edge_node_connectivity": connectivity}
+    else:
+        kwargs = {"face_node_connectivity": connectivity}
+
+    return cfdm.PointTopologyArray(
+        start_index=0, cell_dimension=0, **kwargs
+    ).array
+
+
+if __name__ == "__main__":
+    max_faces = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+
+    n = 10
+    while n * n <= max_faces:
+        faces, edges = quadrilateral_mesh(n)
+        results = {}
+        if faces.shape[0] <= BEFORE_MAX_FACES:
+            start = time.perf_counter()
+            expected = before(faces)
+            results["before"] = time.perf_counter() - start
+        else:
+            expected = None
+
+        for name, connectivity, edges_ in (
+            ("from faces", faces, False),
+            ("from edges", edges, True),
+        ):
+            start = time.perf_counter()
+            u = after(connectivity, edges=edges_)
+            results[name] = time.perf_counter() - start
+            if expected is not None:
+                assert (u == expected).all()
+
+            del u
+
+        print(
+            f"{faces.shape[0]:>10} faces: "
+            + ", ".join(f"{k} {t:8.3f} s" for k, t in results.items())
+        )
+        n *= 3
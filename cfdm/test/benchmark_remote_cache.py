@@ -0,0 +1,120 @@
+"""Benchmark reading remote datasets via the remote block cache.
+
+Reads a chunked netCDF-4 variable from a stand-in for a remote
+(e.g. HTTP) file system, on which every read is a byte range request
+with a fixed latency, with the remote cache disabled (the file
+system's own read-ahead buffering), and with the remote cache enabled
+for both a cold and a warm cache. Reports the number of requests, the
+number of bytes transferred, and the throughput.
+
+Usage::
+
+   python benchmark_remote_cache.py [latency in milliseconds]
+
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import fsspec
+import netCDF4
+import numpy as np
+from rangerequestfilesystem import RangeRequestFileSystem
+
+import cfdm
+
+
+def run(fs, path, netcdf_backend):
+    """Read the remote dataset and return its data and statistics.
+
+    :Parameters:
+
+        fs: `RangeRequestFileSystem`
+            The file system containing the dataset.
+
+        path: `str`
+            The path of the dataset.
+
+        netcdf_backend: `str`
+            The netCDF backend with which to read the dataset.
+
+    :Returns:
+
+        4-`tuple`
+            The data array, the time taken in seconds, the number of
+            requests, and the number of bytes transferred.
+
+    """
+    RangeRequestFileSystem.requests = 0
+    RangeRequestFileSystem.nbytes = 0
+    start = time.perf_counter()
+    f = cfdm.read(path, filesystem=fs, netcdf_backend=netcdf_backend)[0]
+    array = f.data.array
+    t = time.perf_counter() - start
+    return (
+        array,
+        t,
+        RangeRequestFileSystem.requests,
+        RangeRequestFileSystem.nbytes,
+    )
+
+
+if __name__ == "__main__":
+    fsspec.register_implementation(
+        "rangerequest", RangeRequestFileSystem, clobber=True
+    )
+
+    RangeRequestFileSystem.latency = 0.02
+    if len(sys.argv) > 1:
+        RangeRequestFileSystem.latency = float(sys.argv[1]) / 1000
+
+    cfdm.log_level("DISABLE")
+
+    rng = np.random.default_rng(0)
+    shape = (120, 150, 240)
+
+    # A chunked (time, lat, lon) netCDF-4 file
+    tmpfile = tempfile.mkstemp("_benchmark_remote_cache.nc")[1]
+    with netCDF4.Dataset(tmpfile, "w") as nc:
+        for name, size in zip(("time", "lat", "lon"), shape):
+            nc.createDimension(name, size)
+
+        x = nc.createVariable(
+            "x", "f4", ("time", "lat", "lon"), chunksizes=(30, 50, 60)
+        )
+        x.standard_name = "air_temperature"
+        x.units = "K"
+        x[...] = rng.random(shape, dtype="float32")
+
+    with open(tmpfile, "rb") as fh:
+        raw = fh.read()
+
+    os.remove(tmpfile)
+
+    fs = RangeRequestFileSystem()
+    path = "/remote/benchmark_remote_cache.nc"
+    fs.pipe(path, raw)
+
+    print(
+        f"Read {len(raw) / 2**20:.1f} MiB {shape} variable with "
+        f"{1000 * RangeRequestFileSystem.latency:.0f} ms request latency:"
+    )
+    expected = None
+    for netcdf_backend in ("h5netcdf-h5py", "h5netcdf-pyfive"):
+        results = {"no cache": run(fs, path, netcdf_backend)}
+        with cfdm.remote_cache("1GiB"):
+            results["cold cache"] = run(fs, path, netcdf_backend)
+            results["warm cache"] = run(fs, path, netcdf_backend)
+
+        for name, (array, t, requests, nbytes) in results.items():
+            if expected is None:
+                expected = array
+
+            assert (array == expected).all()
+            print(
+                f"  {netcdf_backend:<15} {name:<10}: {requests:5d} requests, "
+                f"{nbytes / 2**20:6.1f} MiB transferred, {t:6.2f} s, "
+                f"{len(raw) / 2**20 / t:7.1f} MiB/s"
+            )
@@ -0,0 +1,154 @@
+"""Benchmark the uncompression of subsampled coordinates.
+
+Creates subsampled 2-d coordinates, similar to those of a satellite
+swath, with increasing numbers of interpolation subareas, and reports
+the time taken to uncompress them with `SubsampledArray.__getitem__`
+for the "bi_linear", "quadratic", "quadratic_latitude_longitude" and
+"bi_quadratic_latitude_longitude" interpolation methods.
+
+Usage::
+
+   python benchmark_subsampled_array.py [largest number of subareas]
+
+"""
+
+import sys
+import time
+
+import numpy as np
+
+import cfdm
+
+
+def subsampled_arrays(n, step=5):
+    """Return subsampled arrays with about n interpolation subareas.
+
+    The tie points are every *step* elements along each dimension
+    of the uncompressed array.
+
+    """
+    m = int(round(np.sqrt(n)))
+    size = m * step + 1
+    tie_point_index = np.arange(0, size, step)
+    x, y = np.meshgrid(
+        np.linspace(-60, 60, m + 1), np.linspace(0, 90, m + 1), indexing="ij"
+    )
+    tie_points = cfdm.Data(x + y**2 / 100)
+
+    bi_linear = cfdm.SubsampledArray(
+        interpolation_name="bi_linear",
+        compressed_array=tie_points,
+        shape=(size, size),
+        tie_point_indices={
+            0: cfdm.TiePointIndex(data=tie_point_index),
+            1: cfdm.TiePointIndex(data=tie_point_index),
+        },
+    )
+
+    # Quadratic interpolation along dimension 1, with an
+    # interpolation parameter for each interpolation subarea
+    w = cfdm.InterpolationParameter(
+        data=np.random.default_rng(0).uniform(-1, 1, (m + 1, m))
+    )
+    quadratic = cfdm.SubsampledArray(
+        interpolation_name="quadratic",
+        compressed_array=tie_points,
+        shape=(m + 1, size),
+        tie_point_indices={1: cfdm.TiePointIndex(data=tie_point_index)},
+        parameters={"w": w},
+        parameter_dimensions={"w": (0, 1)},
+    )
+
+    # Latitude-longitude interpolation, with a random mixture of
+    # interpolation subareas that are interpolated in three-dimensional
+    # cartesian and latitude-longitude coordinates
+    rng = np.random.default_rng(1)
+    lat = cfdm.Data(x)
+    lon = cfdm.Data(y * 3 - 135)
+
+    def parameter(shape, scale=1e-5):
+        return cfdm.InterpolationParameter(
+            data=rng.uniform(-scale, scale, shape)
+        )
+
+    def flags(shape):
+        return cfdm.InterpolationParameter(
+            data=rng.integers(0, 2, shape, dtype="int8"),
+            properties={
+                "flag_meanings": "location_use_3d_cartesian",
+                "flag_masks": np.array([1], dtype="int8"),
+            },
+        )
+
+    quadratic_latitude_longitude = cfdm.SubsampledArray(
+        interpolation_name="quadratic_latitude_longitude",
+        compressed_array=lat,
+        shape=(m + 1, size),
+        tie_point_indices={1: cfdm.TiePointIndex(data=tie_point_index)},
+        parameters={
+            "ce": parameter((m + 1, m)),
+            "ca": parameter((m + 1, m)),
+            "interpolation_subarea_flags": flags((m + 1, m)),
+        },
+        parameter_dimensions={
+            "ce": (0, 1),
+            "ca": (0, 1),
+            "interpolation_subarea_flags": (0, 1),
+        },
+        dependent_tie_points={"longitude": lon},
+        dependent_tie_point_dimensions={"longitude": (0, 1)},
+    )
+
+    bi_quadratic_latitude_longitude = cfdm.SubsampledArray(
+        interpolation_name="bi_quadratic_latitude_longitude",
+        compressed_array=lat,
+        shape=(size, size),
+        tie_point_indices={
+            0: cfdm.TiePointIndex(data=tie_point_index),
+            1: cfdm.TiePointIndex(data=tie_point_index),
+        },
+        parameters={
+            "ce1": parameter((m + 1, m)),
+            "ca1": parameter((m + 1, m)),
+            "ce2": parameter((m, m + 1)),
+            "ca2": parameter((m, m + 1)),
+            "ce3": parameter((m, m)),
+            "ca3": parameter((m, m)),
+            "interpolation_subarea_flags": flags((m, m)),
+        },
+        parameter_dimensions={
+            term: (0, 1)
+            for term in (
+                "ce1",
+                "ca1",
+                "ce2",
+                "ca2",
+                "ce3",
+                "ca3",
+                "interpolation_subarea_flags",
+            )
+        },
+        dependent_tie_points={"longitude": lon},
+        dependent_tie_point_dimensions={"longitude": (0, 1)},
+    )
+
+    return {
+        "bi_linear": bi_linear,
+        "quadratic": quadratic,
+        "quadratic_latitude_longitude": quadratic_latitude_longitude,
+        "bi_quadratic_latitude_longitude": bi_quadratic_latitude_longitude,
+    }
+
+
+if __name__ == "__main__":
+    max_n = int(sys.argv[1]) if len(sys.argv) > 1 else 40_000
+
+    n = 100
+    while n <= max_n:
+        print(f"{n} subareas")
+        for name, array in subsampled_arrays(n).items():
+            start = time.perf_counter()
+            array[...]
+            print(f"  {name:<32} {time.perf_counter() - start:8.3f} s")
+
+        n *= 4
@@ -0,0 +1,81 @@
+"""An in-memory stand-in for a remote file system.
+
+Used by the tests and benchmarks of reading remote datasets.
+
+"""
+
+import threading
+import time
+from unittest import mock
+
+from fsspec.implementations.memory import MemoryFileSystem
+from fsspec.registry import _registry
+from fsspec.spec import AbstractBufferedFile
+
+
+class RangeRequestFile(AbstractBufferedFile):
+    """A file that is read with byte range requests."""
+
+    def _fetch_range(self, start, end):
+        """Return a byte range of the file."""
+        return self.fs.cat_file(self.path, start=start, end=end)
+
+
+class RangeRequestFileSystem(MemoryFileSystem):
+    """An in-memory stand-in for a remote (e.g. HTTP) file system.
+
+    Every read is a byte range request, with a latency of `latency`
+    seconds. The number of requests and the number of bytes
+    transferred are counted in the `requests` and `nbytes` class
+    attributes.
+
+    """
+
+    protocol = "rangerequest"
+    latency = 0
+    lock = threading.Lock()
+    requests = 0
+    nbytes = 0
+
+    def cat_file(self, path, start=None, end=None, **kwargs):
+        """Return a byte range of a file, counting the request."""
+        if self.latency:
+            time.sleep(self.latency)
+
+        out = super().cat_file(path, start=start, end=end, **kwargs)
+        with self.lock:
+            type(self).requests += 1
+            type(self).nbytes += len(out)
+
+        return out
+
+    def _open(self, path, mode="rb", **kwargs):
+        """Open a file, reading with byte range requests."""
+        if mode != "rb":
+            return super()._open(path, mode=mode, **kwargs)
+
+        return RangeRequestFile(self, path, mode, **kwargs)
+
+
+def registered():
+    """Register `RangeRequestFileSystem` with `fsspec` temporarily.
+
+    The registration is undone on exit, leaving the global `fsspec`
+    registry unchanged.
+
+    :Returns:
+
+        context manager
+            The context manager within which the file system is
+            registered.
+
+    **Examples**
+
+    >>> with registered():
+    ...     fs = fsspec.filesystem("rangerequest")
+
+    """
+    return mock.patch.dict(
+        _registry,
+        {RangeRequestFileSystem.protocol: RangeRequestFileSystem},
+    )
@@ -2934,6 +2934,14 @@ class DataTest(unittest.TestCase):
         self.assertIsNone(d._del_cached_elements())
         self.assertFalse(d.get_cached_elements())
 
+        # Deferred cached elements
+        d._set_cached_elements(lambda: {0: 1, -1: 1})
+        e = d.copy()
+        self.assertTrue(callable(e._get_component("cached_elements")))
+        self.assertEqual(e.get_cached_elements(), {0: 1, -1: 1})
+        self.assertEqual(d.get_cached_elements(), {0: 1, -1: 1})
+        d._del_cached_elements()
+
         # Test via __init__, which calls `cache_elements`
         for array in (np.ma.masked, True, "x"):
             d = cfdm.Data(array)
@@ -268,6 +268,58 @@ class DomainTopologyTest(unittest.TestCase):
         self.assertIsInstance(e, cfdm.DomainTopology)
         self.assertTrue(e.data.equals(self.edge.sort().data))
 
+        # Unsorted edges are in order of their first appearance
+        self.assertEqual(
+            d.to_edge().array.tolist(),
+            [
+                [2, 3],
+                [1, 3],
+                [0, 1],
+                [0, 2],
+                [4, 5],
+                [3, 5],
+                [2, 4],
+                [1, 6],
+                [3, 6],
+            ],
+        )
+
+        # Deprecated 'face_nodes' is ignored, with a warning, for
+        # "face" cells, and not allowed for other cells
+        with self.assertWarns(DeprecationWarning):
+            edge = d.to_edge(sort=True, face_nodes=[0, 1, 2, 3, 4, 5, 6])
+
+        self.assertTrue(edge.equals(e))
+        for d in (self.edge, self.point):
+            with self.assertRaises(ValueError):
+                d.to_edge(face_nodes=[0, 1, 2, 3, 4, 5, 6])
+
+    def test_DomainTopology_point_relabel(self):
+        """Test normalisation of point topology with unordered ids."""
+        # Permute the rows, so that each node id is replaced by the
+        # position of its row
+        rng = np.random.default_rng(0)
+        a = self.point.array
+        a = a[rng.permutation(a.shape[0])]
+        position = {node: i for i, node in enumerate(a[:, 0].tolist())}
+        expected = [
+            sorted(position[node] for node in row.compressed()[1:])
+            for row in a
+        ]
+
+        # Shift the node ids by amounts that are both small and large
+        # compared with the number of nodes
+        for shift in (0, 5, 10**9):
+            e = cfdm.DomainTopology(
+                cell="point", data=cfdm.Data(a + shift)
+            ).normalise()
+            e = e.array
+            self.assertEqual(e[:, 0].tolist(), list(range(a.shape[0])))
+            self.assertEqual(
+                [sorted(row.compressed()[1:].tolist()) for row in e],
+                expected,
+            )
+
 
 if __name__ == "__main__":
     print("Run date:", datetime.datetime.now())
@@ -364,6 +364,132 @@ class NetCDF4ArrayTest(unittest.TestCase):
         self.assertEqual(n.get_storage_protocol(), "s3")
         self.assertTrue(n.has_remote_storage_protocol())
 
+    def test_NetCDF4Array_file_handle_pool(self):
+        """Test NetCDF4Array with the file handle pool."""
+        f = cfdm.example_field(0)
+        cfdm.write(f, tmpfile)
+        array = f.array
+
+        n = cfdm.NetCDF4Array(tmpfile, f.nc_get_variable(), shape=f.shape)
+
+        with cfdm.file_handle_pool(4):
+            cfdm.file_handle_pool_statistics(reset=True)
+            for i in range(3):
+                self.assertTrue((np.asanyarray(n[i]) == array[i]).all())
+
+            stats = cfdm.file_handle_pool_statistics(reset=True)
+            self.assertEqual(stats["misses"], 1)
+            self.assertEqual(stats["hits"], 2)
+            self.assertEqual(stats["idle"], 1)
+            self.assertEqual(stats["borrowed"], 0)
+
+            # A failed read returns its borrowed handle to the pool
+            bad = cfdm.NetCDF4Array(tmpfile, "bad_ncvar", shape=f.shape)
+            with self.assertRaises(KeyError):
+                np.asanyarray(bad[...])
+
+            stats = cfdm.file_handle_pool_statistics(reset=True)
+            self.assertEqual(stats["hits"], 1)
+            self.assertEqual(stats["idle"], 1)
+            self.assertEqual(stats["borrowed"], 0)
+
+            # Writing to the file closes the idle handle
+            cfdm.write(f, tmpfile)
+            self.assertEqual(cfdm.file_handle_pool_statistics()["idle"], 0)
+            self.assertTrue((np.asanyarray(n[...]) == array).all())
+
+        # Disabling the pool closes all idle handles
+        stats = cfdm.file_handle_pool_statistics()
+        self.assertEqual(stats["idle"], 0)
+        self.assertEqual(stats["maxsize"], 0)
+
+        cfdm.file_handle_pool_statistics(reset=True)
+        self.assertTrue((np.asanyarray(n[...]) == array).all())
+        stats = cfdm.file_handle_pool_statistics()
+        self.assertEqual(stats["hits"], 0)
+        self.assertEqual(stats["misses"], 0)
+
+    def test_NetCDF4Array_chunk_cache(self):
+        """Test NetCDF4Array with the chunk cache."""
+        f = cfdm.example_field(0)
+        cfdm.write(f, tmpfile)
+        array = f.array
+
+        n = cfdm.NetCDF4Array(tmpfile, f.nc_get_variable(), shape=f.shape)
+
+        with cfdm.chunk_cache(2 * array.nbytes):
+            cfdm.chunk_cache_statistics(reset=True)
+            for i in range(2):
+                a = np.asanyarray(n[...])
+                self.assertTrue((a == array).all())
+
+            stats = cfdm.chunk_cache_statistics(reset=True)
+            self.assertEqual(stats["misses"], 1)
+            self.assertEqual(stats["hits"], 1)
+            self.assertEqual(stats["chunks"], 1)
+            self.assertGreaterEqual(stats["size"], array.nbytes)
+
+            # In-place changes to a returned array don't affect the
+            # cache
+            a[...] = -1
+            self.assertTrue((np.asanyarray(n[...]) == array).all())
+
+            # A different subspace is a different chunk
+            self.assertTrue((np.asanyarray(n[0]) == array[0]).all())
+            self.assertEqual(cfdm.chunk_cache_statistics()["chunks"], 2)
+
+            # Modifying the file invalidates its cached chunks
+            g = f.copy()
+            g.data[...] = 1
+            cfdm.write(g, tmpfile)
+            self.assertTrue((np.asanyarray(n[...]) == 1).all())
+
+            # Reducing the maximum size evicts the least recently used
+            # chunks
+            cfdm.chunk_cache(array.nbytes)
+            stats = cfdm.chunk_cache_statistics()
+            self.assertLessEqual(stats["size"], array.nbytes)
+            self.assertGreater(stats["evictions"], 0)
+
+        # Disabling the cache bypasses it
+        cfdm.chunk_cache_statistics(reset=True)
+        self.assertTrue((np.asanyarray(n[...]) == 1).all())
+        stats = cfdm.chunk_cache_statistics()
+        self.assertEqual(stats["hits"], 0)
+        self.assertEqual(stats["misses"], 0)
+        self.assertEqual(stats["chunks"], 0)
+
+    def test_NetCDF4Array_lock(self):
+        """Test NetCDF4Array dataset locks."""
+        from cfdm.data import locks
+        from cfdm.data.locks import netcdf_lock
+
+        h1 = cfdm.H5netcdfArray("/data/file1.nc", "tas")
+        h2 = cfdm.H5netcdfArray("/data/file2.nc", "tas")
+
+        netCDF4_in_use = locks._netCDF4_in_use
+        try:
+            # Before netCDF-C has been used, h5py allows different
+            # datasets to be read concurrently
+            locks._netCDF4_in_use = False
+            self.assertIsNot(h1._lock, netcdf_lock)
+            self.assertIsNot(h1._lock, h2._lock)
+            self.assertIs(h1._lock, h1.copy()._lock)
+
+            # netCDF-C requires a single lock for all datasets
+            n1 = cfdm.NetCDF4Array("/data/file1.nc", "tas")
+            n2 = cfdm.NetCDF4Array("/data/file2.nc", "tas")
+            self.assertIs(n1._lock, netcdf_lock)
+            self.assertIs(n2._lock, netcdf_lock)
+
+            # Once netCDF-C has been used, h5py shares its lock, since
+            # both may call the same non-thread-safe HDF5 library
+            self.assertTrue(locks._netCDF4_in_use)
+            self.assertIs(h1._lock, netcdf_lock)
+            self.assertIs(h2._lock, netcdf_lock)
+        finally:
+            locks._netCDF4_in_use = netCDF4_in_use
+
 
 if __name__ == "__main__":
     print("Run date:", datetime.datetime.now())
@@ -177,6 +177,119 @@ class UGRIDTest(unittest.TestCase):
         )
         self.assertTrue(cell_connectivity1.equals(face2.cell_connectivity()))
 
+    def test_UGRID_shared_data(self):
+        """Test that UGRID constructs share their mesh data."""
+        _, face, edge = cfdm.read(self.filename1)
+
+        def assert_shared(data0, data1):
+            """Assert that two Data objects share their file array."""
+            dx0 = data0.to_dask_array()
+            dx1 = data1.to_dask_array()
+            layers = [k for k in dx0.dask.layers if k.startswith("original-")]
+            self.assertTrue(layers)
+            for layer in layers:
+                self.assertIs(dx0.dask.layers[layer], dx1.dask.layers[layer])
+
+        # The domain topology and the bounds of the coordinates of
+        # the face and edge fields are created from the same
+        # connectivity variable
+        node_coordinates = {}
+        for f in (face, edge):
+            domain_topology = f.domain_topology()
+            for aux in f.auxiliary_coordinates().values():
+                c = aux.bounds.data.source().conformed_data()
+                assert_shared(c["data"], domain_topology.data)
+                if f is face:
+                    self.assertEqual(
+                        c["data"].to_dask_array().__dask_keys__(),
+                        domain_topology.data.to_dask_array().__dask_keys__(),
+                    )
+                node_coordinates.setdefault(aux.identity(), []).append(
+                    c["node_coordinates"]
+                )
+
+        # The bounds of the face and edge coordinates are created from
+        # the same "node_coordinates" variables
+        self.assertEqual(len(node_coordinates), 2)
+        for face_nodes, edge_nodes in node_coordinates.values():
+            assert_shared(face_nodes, edge_nodes)
+
+        # Changing one construct in-place does not affect the others
+        edge_bounds = [
+            aux.bounds.array for aux in edge.auxiliary_coordinates().values()
+        ]
+        domain_topology = face.domain_topology()
+        connectivity = domain_topology.array
+        domain_topology.data[0, 0] = 1
+        self.assertEqual(domain_topology.array[0, 0], 1)
+        for aux in face.auxiliary_coordinates().values():
+            c = aux.bounds.data.source().conformed_data()
+            self.assertTrue((c["data"].array == connectivity).all())
+
+        for face_nodes, _ in node_coordinates.values():
+            face_nodes[...] = -1
+            self.assertTrue((face_nodes.array == -1).all())
+
+        for aux, b in zip(edge.auxiliary_coordinates().values(), edge_bounds):
+            self.assertTrue((aux.bounds.array == b).all())
+
+    def test_UGRID_point_topology(self):
+        """Test the creation of point topology from connectivity."""
+        # Two quadrilaterals and one triangle, and their nine edges
+        faces = np.ma.masked_values(
+            [[3, 4, 2, 1], [5, 6, 4, 3], [7, 2, 4, -99]], -99
+        )
+        edges = np.array(
+            [
+                [2, 7],
+                [4, 7],
+                [4, 2],
+                [1, 2],
+                [3, 1],
+                [3, 4],
+                [3, 5],
+                [6, 5],
+                [4, 6],
+            ]
+        )
+        expected = np.ma.masked_values(
+            [
+                [1, 2, 3, -99, -99],
+                [2, 1, 4, 7, -99],
+                [3, 1, 4, 5, -99],
+                [4, 2, 3, 6, 7],
+                [5, 3, 6, -99, -99],
+                [6, 4, 5, -99, -99],
+                [7, 2, 4, -99, -99],
+            ],
+            -99,
+        )
+
+        for start_index in (1, 0):
+            offset = 1 - start_index
+            for kwargs in (
+                {"face_node_connectivity": faces - offset},
+                {"edge_node_connectivity": edges - offset},
+            ):
+                p = cfdm.PointTopologyArray(
+                    start_index=start_index, cell_dimension=0, **kwargs
+                )
+                a = p.array
+                self.assertEqual(a.shape, (7, 5))
+                self.assertEqual(p.shape, (7, 5))
+                self.assertTrue((a.mask == expected.mask).all(), f"{kwargs}")
+                self.assertTrue((a == expected - offset).all(), f"{kwargs}")
+
+        # Non-contiguous node identities, and repeated edges
+        edges = np.array([[10, 30], [30, 10], [30, 20], [10, 30]])
+        a = cfdm.PointTopologyArray(
+            edge_node_connectivity=edges, start_index=0, cell_dimension=0
+        ).array
+        self.assertEqual(
+            a.tolist(fill_value=-1),
+            [[10, 30, -1], [20, 30, -1], [30, 10, 20]],
+        )
+
     def test_read_UGRID_domain(self):
         """Test reading of UGRID files into domains."""
         d1 = cfdm.read(self.filename1, domain=True)
@@ -306,6 +419,52 @@ class UGRIDTest(unittest.TestCase):
                 elif u.domain_topology().get_cell() == "face":
                     face = i
 
+    def test_write_UGRID_shared_mesh(self):
+        """Test cfdm.write with many UGRID fields on the same mesh."""
+        ugrid = cfdm.example_fields(8, 9, 10)
+        face = ugrid[0]
+
+        # A face mesh with the same topology, but different node
+        # locations
+        moved = face.copy()
+        moved.nc_set_variable("moved")
+        for aux in moved.auxiliary_coordinates().values():
+            aux.data[...] = aux.array + 1
+            aux.bounds.data[...] = aux.bounds.array + 1
+
+        f = [g.copy() for g in ugrid * 3] + [moved, moved.copy()]
+        cfdm.write(f, tmpfile)
+        self.assertEqual(n_mesh_variables(tmpfile), 2)
+
+        g = cfdm.read(tmpfile)
+        self.assertEqual(len(g), len(f))
+        nc = netCDF4.Dataset(tmpfile, "r")
+        meshes = set(nc.variables[h.nc_get_variable()].mesh for h in g)
+        nc.close()
+        self.assertEqual(len(meshes), 2)
+
+        moved = [h for h in g if h.nc_get_variable().startswith("moved")]
+        self.assertEqual(len(moved), 2)
+        self.assertTrue(moved[0].equals(moved[1]))
+
+    def test_write_UGRID_near_equal_mesh(self):
+        """Test cfdm.write with UGRID nodes equal within tolerance."""
+        face = cfdm.example_field(8)
+
+        # A face mesh with the same topology, and node locations that
+        # differ only by one unit in the last place
+        near = face.copy()
+        near.nc_set_variable("near")
+        for aux in near.auxiliary_coordinates().values():
+            a = aux.bounds.array
+            aux.bounds.data[...] = np.nextafter(a, np.inf)
+            self.assertFalse((aux.bounds.array == a).all())
+
+        self.assertTrue(near.equals(face))
+
+        cfdm.write([face, near], tmpfile)
+        self.assertEqual(n_mesh_variables(tmpfile), 1)
+
 
 if __name__ == "__main__":
     print("Run date:", datetime.datetime.now())
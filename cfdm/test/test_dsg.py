@@ -292,6 +292,126 @@ class DSGTest(unittest.TestCase):
             q.get_original_filenames(), set([self.indexed_contiguous])
         )
 
+    def test_DSG_feature_chunks(self):
+        """Test the chunking of ragged arrays by groups of features."""
+        for f, expected in zip(
+            (self.c, self.i, self.ic), (self.a, self.a, self.b)
+        ):
+            q = [
+                g
+                for g in f
+                if g.get_property("standard_name") == "specific_humidity"
+            ][0]
+            array = q.data.source()
+            n_features = array.shape[0]
+
+            for chunks, numblocks in zip(
+                (1, 3, -1, {0: (1, n_features - 1)}),
+                (n_features, -(-n_features // 3), 1, 2),
+            ):
+                dx = array.to_dask_array(chunks)
+                self.assertEqual(dx.numblocks[0], numblocks)
+                self.assertEqual(dx.numblocks[1:], (1,) * (dx.ndim - 1))
+                self.assertTrue(q._equals(dx.compute(), expected))
+
+            # Each 'auto' chunk contains the number of features that
+            # fit into the chunk size
+            size = int(np.prod(array.shape[1:])) * array.dtype.itemsize
+            with cfdm.chunksize(2 * size):
+                dx = array.to_dask_array("auto")
+                self.assertEqual(dx.chunks[0][0], 2)
+                self.assertTrue(q._equals(dx.compute(), expected))
+
+            self.assertTrue(q._equals(array[...], expected))
+
+    def test_DSG_feature_subspace(self):
+        """Test the uncompression of selected ragged array features."""
+        for f, expected in zip(
+            (self.c, self.i, self.ic), (self.a, self.a, self.b)
+        ):
+            q = [
+                g
+                for g in f
+                if g.get_property("standard_name") == "specific_humidity"
+            ][0]
+            array = q.data.source()
+            expected = cfdm.netcdf_indexer(expected, orthogonal_indexing=True)
+
+            for indices in (
+                1,
+                -1,
+                slice(1, 3),
+                slice(0, 4, 2),
+                slice(None, None, -1),
+                [0, 2],
+                (slice(1, 3), [1, 3]),
+                (2, slice(1, 5)),
+            ):
+                self.assertTrue(
+                    q._equals(array[indices], expected[indices]),
+                    f"indices={indices!r}",
+                )
+
+            # Subarrays of groups of features
+            subarrays = [
+                x
+                for x in array.to_dask_array(2).dask.values()
+                if isinstance(x, cfdm.data.subarray.RaggedSubarray)
+            ]
+            self.assertEqual(len(subarrays), 2)
+            for subarray in subarrays:
+                u = subarray[...]
+                self.assertTrue(q._equals(subarray[(slice(1, None),)], u[1:]))
+                self.assertTrue(q._equals(subarray[(0,)], u[0]))
+
+    def test_DSG_feature_offsets(self):
+        """Test the offsets index of ragged arrays."""
+        for f in (self.c, self.i, self.ic):
+            arrays = [g.data.source() for g in f]
+            offsets = arrays[0].feature_offsets()
+
+            # The offsets index is created at read time, and is
+            # shared by all data compressed in the same way and by
+            # copies
+            for array in arrays:
+                self.assertIs(array.feature_offsets(), offsets)
+
+            self.assertIs(arrays[0].copy().feature_offsets(), offsets)
+
+        # Contiguous: a single feature is one slice of the compressed
+        # array
+        array = self.c[0].data.source()
+        count = array.get_count().data.array
+        offsets = np.cumsum([0] + count.tolist())
+        self.assertTrue((array.feature_offsets()["offsets"] == offsets).all())
+        for i in range(count.size):
+            c_index, counts = array._feature_descriptors(i, i + 1)
+            self.assertEqual(c_index, slice(offsets[i], offsets[i + 1]))
+            self.assertEqual(counts.tolist(), [count[i]])
+
+        # Indexed: a single feature is the elements with its index
+        array = self.i[0].data.source()
+        index = array.get_index().data.array
+        for i in range(array.shape[0]):
+            c_index, counts = array._feature_descriptors(i, i + 1)
+            self.assertEqual(
+                np.arange(index.size)[c_index].tolist(),
+                np.where(index == i)[0].tolist(),
+            )
+            self.assertEqual(counts.tolist(), [(index == i).sum()])
+
+        # An offsets index is created when it is first needed
+        array = cfdm.RaggedContiguousArray(
+            compressed_array=cfdm.Data([1, 3, 4, 3, 6]),
+            shape=(2, 3),
+            count_variable=cfdm.Count(data=cfdm.Data([2, 3])),
+        )
+        self.assertIsNone(array._get_component("feature_offsets", None))
+        self.assertEqual(
+            array.feature_offsets()["offsets"].tolist(), [0, 2, 5]
+        )
+        self.assertEqual(array[1].tolist(), [4, 3, 6])
+
     def test_DSG_create_contiguous(self):
         """Test the creation of a contiguous ragged array."""
         # Define the ragged array values
@@ -179,6 +179,23 @@ class ExternalVariableTest(unittest.TestCase):
         for i in range(len(h)):
             self.assertTrue(external[i].equals(h[i], verbose=3))
 
+    def test_EXTERNAL_read_lock(self):
+        """Test the netCDF-C lock with external datasets."""
+        from cfdm.data.locks import netcdf_lock
+
+        f = cfdm.read(
+            self.parent_file,
+            external=self.external_file,
+            netcdf_backend="netCDF4",
+        )
+        self.assertEqual(len(f), 1)
+
+        # The lock is only held whilst netCDF-C is being called, so
+        # is not held after the parent and external datasets have
+        # been read
+        self.assertFalse(netcdf_lock.locked())
+        self.assertEqual(f[0].array.shape, f[0].shape)
+
 
 if __name__ == "__main__":
     print("Run date:", datetime.datetime.now())
@@ -314,7 +314,7 @@ class FunctionsTest(unittest.TestCase):
         # Test getting of all config. and store original values to test on:
         org = cfdm.configuration()
         self.assertIsInstance(org, dict)
-        self.assertEqual(len(org), 6)
+        self.assertEqual(len(org), 12)
         org_atol = org["atol"]
         self.assertIsInstance(org_atol, float)
         org_rtol = org["rtol"]
@@ -327,6 +327,18 @@ class FunctionsTest(unittest.TestCase):
         self.assertIsInstance(org_display_data, bool)
         org_persist_data = org["persist_data"]
         self.assertIsInstance(org_persist_data, bool)
+        org_file_handle_pool = org["file_handle_pool"]
+        self.assertIsInstance(org_file_handle_pool, int)
+        org_metadata_cache = org["metadata_cache"]
+        self.assertIsInstance(org_metadata_cache, int)
+        org_chunk_cache = org["chunk_cache"]
+        self.assertIsInstance(org_chunk_cache, int)
+        org_remote_cache = org["remote_cache"]
+        self.assertIsInstance(org_remote_cache, int)
+        org_remote_disk_cache = org["remote_disk_cache"]
+        self.assertIsInstance(org_remote_disk_cache, int)
+        org_remote_disk_cache_directory = org["remote_disk_cache_directory"]
+        self.assertIsInstance(org_remote_disk_cache_directory, str)
 
         # Store some sensible values to reset items to for testing,
         # ensure these are kept to be different to the defaults:
@@ -349,6 +361,15 @@ class FunctionsTest(unittest.TestCase):
         self.assertEqual(post_set["chunksize"], org_chunksize)
         self.assertEqual(post_set["display_data"], org_display_data)
         self.assertEqual(post_set["persist_data"], org_persist_data)
+        self.assertEqual(post_set["file_handle_pool"], org_file_handle_pool)
+        self.assertEqual(post_set["metadata_cache"], org_metadata_cache)
+        self.assertEqual(post_set["chunk_cache"], org_chunk_cache)
+        self.assertEqual(post_set["remote_cache"], org_remote_cache)
+        self.assertEqual(post_set["remote_disk_cache"], org_remote_disk_cache)
+        self.assertEqual(
+            post_set["remote_disk_cache_directory"],
+            org_remote_disk_cache_directory,
+        )
         # don't reset to org this time to test change persisting...
 
         # Note setting of previous items persist, e.g. atol above
@@ -406,6 +427,18 @@ class FunctionsTest(unittest.TestCase):
             cfdm.configuration(rtol="bad")
         with self.assertRaises(ValueError):
             cfdm.configuration(log_level=7)
+        with self.assertRaises(ValueError):
+            cfdm.configuration(file_handle_pool=-1)
+        with self.assertRaises(ValueError):
+            cfdm.configuration(metadata_cache=-1)
+        with self.assertRaises(ValueError):
+            cfdm.configuration(chunk_cache=-1)
+        with self.assertRaises(ValueError):
+            cfdm.configuration(remote_cache=-1)
+        with self.assertRaises(ValueError):
+            cfdm.configuration(remote_disk_cache=-1)
+        with self.assertRaises(ValueError):
+            cfdm.configuration(remote_disk_cache_directory="")
 
         # 4. Check invalid kwarg given logic processes **kwargs:
         with self.assertRaises(TypeError):
@@ -12,7 +12,7 @@ import numpy as np
 
 import cfdm
 
-n_tmpfiles = 10
+n_tmpfiles = 11
 tmpfiles = [
     tempfile.mkstemp("_test_groups.nc", dir=os.getcwd())[1]
     for i in range(n_tmpfiles)
@@ -28,6 +28,7 @@ tmpfiles = [
     grouped_file4,
     grouped_file5,
     grouped_file6,
+    grouped_file7,
 ) = tmpfiles
 
 
@@ -574,6 +575,42 @@ class GroupsTest(unittest.TestCase):
         # This should not raise an exception
         cfdm.write(file_content, grouped_file6)
 
+    def test_groups_flat_dataset(self):
+        """Test the virtual flattening of hierarchical groups."""
+        from cfdm.read_write.netcdf.flatten import FlatDataset
+
+        f = self.f0.copy()
+        f.nc_set_variable_groups(["forecast"])
+        cfdm.write(f, grouped_file7)
+
+        nc = netCDF4.Dataset(grouped_file7, "r")
+        flat = FlatDataset()
+        cfdm.dataset_flatten(nc, flat)
+
+        self.assertIn("forecast__q", flat.variables)
+        self.assertEqual(flat.filepath(), None)
+        self.assertEqual(flat.Conventions, nc.Conventions)
+        self.assertIn("_flattener_variable_map", flat.ncattrs())
+
+        # The flattened variable's data is that of the original
+        # variable
+        var = flat.variables["forecast__q"]
+        original = nc.groups["forecast"].variables["q"]
+        self.assertIs(var.source, original)
+        self.assertEqual(var.shape, original.shape)
+        self.assertEqual(var.dimensions, ("lat", "lon"))
+        self.assertTrue((var[...] == original[...]).all())
+        self.assertEqual(var.units, original.units)
+
+        # References to variables in other groups have been resolved
+        self.assertEqual(var.coordinates, "time")
+        nc.close()
+
+        for backend in ("netCDF4", "h5netcdf-pyfive"):
+            g = cfdm.read(grouped_file7, netcdf_backend=backend)
+            self.assertEqual(len(g), 1)
+            self.assertTrue(g[0].equals(f))
+
 
 if __name__ == "__main__":
     print("Run date:", datetime.datetime.now())
@@ -3,8 +3,11 @@ import faulthandler
 import json
 import os
 import unittest
+from unittest import mock
 
 import fsspec
+from fsspec.implementations.memory import MemoryFileSystem
+from fsspec.registry import _registry
 
 faulthandler.enable()  # to debug seg faults and timeouts
 
@@ -22,6 +25,26 @@ fs = fsspec.filesystem("reference", fo=kerchunk_file)
 kerchunk_mapper = fs.get_mapper()
 
 
+class CountingFileSystem(MemoryFileSystem):
+    """An in-memory stand-in for a remote file system."""
+
+    protocol = "countingmemory"
+    requests = 0
+
+    @classmethod
+    def _strip_protocol(cls, path):
+        """Remove the protocol from a path."""
+        if path.startswith("countingmemory://"):
+            path = path[len("countingmemory://") :]
+
+        return super()._strip_protocol(path)
+
+    def cat_file(self, path, start=None, end=None, **kwargs):
+        """Return a byte range of a file, counting the request."""
+        type(self).requests += 1
+        return super().cat_file(path, start=start, end=end, **kwargs)
+
+
 class read_writeTest(unittest.TestCase):
     """Test the reading and writing of field constructs from/to disk."""
 
@@ -42,6 +65,14 @@ class read_writeTest(unittest.TestCase):
         # < ... test code ... >
         # cfdm.log_level('DISABLE')
 
+        # Register the stand-in for a remote file system for the
+        # duration of the test only
+        registration = mock.patch.dict(
+            _registry, {"countingmemory": CountingFileSystem}
+        )
+        registration.start()
+        self.addCleanup(registration.stop)
+
     def test_kerchunk_read(self):
         """Test cfdm.read with Kerchunk."""
         f = cfdm.read(self.netcdf)[0]
@@ -93,6 +124,50 @@ class read_writeTest(unittest.TestCase):
         kerchunk = fs.get_mapper()
         self.assertEqual(len(cfdm.read(kerchunk)), 1)
 
+    def test_kerchunk_remote_cache(self):
+        """Test cfdm.read with Kerchunk and the remote caches."""
+        from cfdm.data.remotefile import cached_mapper
+
+        f = cfdm.read(self.netcdf)[0]
+
+        # Reference the netCDF file on a stand-in remote file system
+        remote = "/remote/example_field_0.nc"
+        with open(self.netcdf, "rb") as fh:
+            CountingFileSystem().pipe(remote, fh.read())
+
+        with open(kerchunk_file, "r") as fh:
+            d = json.load(fh)
+
+        for key, value in d["refs"].items():
+            if isinstance(value, list):
+                d["refs"][key] = [f"countingmemory://{remote}"] + value[1:]
+
+        kerchunk = fsspec.filesystem(
+            "reference", fo=d, remote_protocol="countingmemory"
+        ).get_mapper()
+
+        # Non-remote references are unchanged
+        self.assertIs(cached_mapper(self.kerchunk), self.kerchunk)
+
+        with cfdm.remote_cache("1MiB"):
+            cfdm.remote_cache_statistics(reset=True)
+            CountingFileSystem.requests = 0
+
+            k = cfdm.read(kerchunk)[0]
+            self.assertTrue(k.equals(f))
+            self.assertEqual(CountingFileSystem.requests, 1)
+
+            k = cfdm.read(kerchunk)[0]
+            self.assertTrue(k.equals(f))
+            self.assertEqual(CountingFileSystem.requests, 1)
+            self.assertGreater(cfdm.remote_cache_statistics()["hits"], 0)
+
+        # The original mapper is not changed
+        CountingFileSystem.requests = 0
+        k = cfdm.read(kerchunk)[0]
+        self.assertTrue(k.equals(f))
+        self.assertGreater(CountingFileSystem.requests, 0)
+
 
 if __name__ == "__main__":
     print("Run date:", datetime.datetime.now())
@@ -145,6 +145,90 @@ class netcdf_indexerTest(unittest.TestCase):
 
         nc.close()
 
+    def test_netcdf_indexer_mask_and_unpack(self):
+        """Test netcdf_indexer for fused masking and unpacking."""
+        packed = np.arange(-10, 30, dtype="int16").reshape(5, 8)
+        attributes = {
+            "_FillValue": np.int16(-1),
+            "missing_value": np.int16(3),
+            "valid_max": np.int16(25),
+            "scale_factor": 0.5,
+            "add_offset": 10.0,
+        }
+
+        mask = (packed == -1) | (packed == 3) | (packed > 25)
+        unpacked = np.ma.masked_where(mask, packed * 0.5 + 10.0)
+
+        # Compare blockwise processing with processing the whole
+        # array at once
+        for block_size in (7, 40):
+            x = cfdm.netcdf_indexer(packed, attributes=attributes)
+            x._block_size = block_size
+            a = x[...]
+            self.assertEqual(a.dtype, unpacked.dtype)
+            self.assertTrue((a.mask == unpacked.mask).all())
+            self.assertTrue((a == unpacked).all())
+            self.assertEqual(a.fill_value, 3)
+
+            a = x[1:3, [0, 5]]
+            self.assertTrue((a.mask == unpacked.mask[1:3, [0, 5]]).all())
+            self.assertTrue((a == unpacked[1:3, [0, 5]]).all())
+
+        # The original data are unchanged
+        self.assertTrue((packed == np.arange(-10, 30).reshape(5, 8)).all())
+
+        # Unpacked data type
+        x = cfdm.netcdf_indexer(
+            packed, attributes=attributes, unpack_dtype="float32"
+        )
+        a = x[...]
+        self.assertEqual(a.dtype, np.dtype("float32"))
+        self.assertTrue((a.mask == unpacked.mask).all())
+        self.assertTrue((a == unpacked).all())
+
+        # In-place unpacking of a float array
+        x = cfdm.netcdf_indexer(
+            packed.astype("float64"), attributes=attributes
+        )
+        a = x[[0, 1, 2, 3, 4]]
+        self.assertEqual(a.dtype, unpacked.dtype)
+        self.assertTrue((a.mask == unpacked.mask).all())
+        self.assertTrue((a == unpacked).all())
+
+        # Masked scalar
+        x = cfdm.netcdf_indexer(
+            np.array(3, dtype="int16"), attributes=attributes
+        )
+        self.assertIs(x[...], np.ma.masked)
+
+    def test_netcdf_indexer_0d(self):
+        """Test netcdf_indexer for 0-d results."""
+        for attributes, value in (
+            ({"scale_factor": np.float32(2)}, 6),
+            ({"scale_factor": 2.0, "add_offset": 1.0}, 7),
+            ({"_FillValue": np.int16(-1), "valid_max": np.int16(9)}, 3),
+            ({"_FillValue": np.int16(-1), "scale_factor": 0.5}, 1.5),
+        ):
+            unpacked = "scale_factor" in attributes
+            for always_masked_array in (False, True):
+                for array, index in (
+                    (np.array(3, dtype="int16"), ...),
+                    (np.array([3, 4], dtype="int16"), 0),
+                ):
+                    x = cfdm.netcdf_indexer(
+                        array,
+                        attributes=attributes,
+                        always_masked_array=always_masked_array,
+                    )
+                    a = x[index]
+                    self.assertEqual(a, value)
+                    self.assertEqual(np.ndim(a), 0)
+                    if unpacked:
+                        # Unpacked data are a numpy scalar
+                        self.assertIsInstance(a, np.generic)
+                    elif always_masked_array:
+                        self.assertIsInstance(a, np.ma.MaskedArray)
+
     def test_netcdf_indexer_numpy(self):
         """Test netcdf_indexer for numpy."""
         array = np.ma.arange(9)
@@ -177,6 +261,38 @@ class netcdf_indexerTest(unittest.TestCase):
         a = a[1, ...]
         self.assertTrue((y == a).all())
 
+    def test_netcdf_indexer_orthogonal_indexing_chunked(self):
+        """Test netcdf_indexer orthogonal indexing of chunked data."""
+        import h5py
+        import pyfive
+
+        array = np.arange(12 * 20 * 30).reshape(12, 20, 30)
+        with h5py.File(tmpfile, "w") as f:
+            f.create_dataset("x", data=array, chunks=(5, 4, 7))
+
+        self.assertEqual(
+            cfdm.netcdf_indexer._chunk_runs([25, 3, 2, 9, 3], 30, 4)[2],
+            [(2, 4, 0, 2), (9, 10, 2, 3), (25, 26, 3, 4)],
+        )
+
+        indices = (
+            ([1, 5, 11], slice(None), [0, 29, 3, 3]),
+            (slice(2, 9, 3), [19, 0, 7, 8], [4]),
+            (4, [1, 2, 3], [28, 1]),
+            ([-1, -12], [1], slice(None)),
+            (slice(None), [19, 0, 0, 7], slice(1, 3)),
+        )
+
+        for variable in (
+            h5py.File(tmpfile, "r")["x"],
+            pyfive.File(tmpfile)["x"],
+        ):
+            x = cfdm.netcdf_indexer(variable, orthogonal_indexing=True)
+            self.assertEqual(x._storage_chunks(variable), (5, 4, 7))
+            y = cfdm.netcdf_indexer(array, orthogonal_indexing=True)
+            for index in indices:
+                self.assertTrue((x[index] == y[index]).all())
+
     def test_netcdf_indexer_non_orthogonal_indexing(self):
         """Test netcdf_indexer for numpy non-orthogonal indexing."""
         array = np.ma.arange(120).reshape(2, 3, 4, 5)
@@ -1,16 +1,21 @@
 import atexit
 import datetime
 import faulthandler
+import importlib
 import os
 import platform
+import re
 import shutil
 import subprocess
 import tempfile
+import types
 import unittest
+from unittest import mock
 
 import fsspec
 import netCDF4
 import numpy as np
+from rangerequestfilesystem import RangeRequestFileSystem, registered
 
 faulthandler.enable()  # to debug seg faults and timeouts
 
@@ -115,6 +120,12 @@ class read_writeTest(unittest.TestCase):
         # < ... test code ... >
         # cfdm.log_level('DISABLE')
 
+        # Register the stand-in for a remote file system for the
+        # duration of the test only
+        registration = registered()
+        registration.start()
+        self.addCleanup(registration.stop)
+
     def test_write_filename(self):
         """Test the writing of a named netCDF file."""
         f = self.f0
@@ -759,6 +770,185 @@ class read_writeTest(unittest.TestCase):
         with self.assertRaises(RuntimeError):
             cfdm.read(tmpfilec3)
 
+    def test_read_CDL_parser(self):
+        """Test the in-process parsing of CDL."""
+        cdl = """netcdf example_field_0 {
+dimensions:
+\tlat = 5 ;
+\tbounds2 = 2 ;
+\tlon = UNLIMITED ; // (8 currently)
+variables:
+\tdouble lat_bnds(lat, bounds2) ;
+\tdouble lat(lat) ;
+\t\tlat:units = "degrees_north" ;
+\t\tlat:standard_name = "latitude" ;
+\t\tlat:bounds = "lat_bnds" ;
+\tdouble lon_bnds(lon, bounds2) ;
+\tdouble lon(lon) ;
+\t\tlon:units = "degrees_east" ;
+\t\tlon:standard_name = "longitude" ;
+\t\tlon:bounds = "lon_bnds" ;
+\tdouble time ;
+\t\ttime:units = "days since 2018-12-01" ;
+\t\ttime:standard_name = "time" ;
+\tfloat q(lat, lon) ;
+\t\tq:_FillValue = -1.e+30f ;
+\t\tq:project = "research" ;
+\t\tq:standard_name = "specific_humidity" ;
+\t\tq:units = "1" ;
+\t\tq:coordinates = "time" ;
+\t\tq:cell_methods = "area: mean" ;
+\t\tshort q:flag_values = 1s, 2s ;
+\t\tstring q:comment = "a\\"b" ;
+
+// global attributes:
+\t\t:Conventions = "CF-1.12" ;
+\t\t:history = "line 1\\n",
+\t\t\t"line 2" ;
+data:
+
+ lat_bnds =
+  -90, -60,
+  -60, -30,
+  -30, 30,
+  30, 60,
+  60, 90 ;
+
+ lat = -75, -45, 0, 45, 75 ;
+
+ lon_bnds =
+  0, 45,
+  45, 90,
+  90, 135,
+  135, 180,
+  180, 225,
+  225, 270,
+  270, 315,
+  315, 360 ;
+
+ lon = 22.5, 67.5, 112.5, 157.5, 202.5, 247.5, 292.5, 337.5 ;
+
+ time = 31 ;
+
+ q =
+  0.007, 0.034, 0.003, 0.014, 0.018, 0.037, 0.024, 0.029,
+  0.023, 0.036, 0.045, 0.062, 0.046, 0.073, 0.006, 0.066,
+  0.11, 0.131, 0.124, 0.146, 0.087, 0.103, 0.057, 0.011,
+  0.029, 0.059, 0.039, 0.07, 0.058, 0.072, 0.009, 0.017,
+  0.006, 0.036, 0.019, 0.035, 0.018, 0.037, 0.034, _ ;
+}
+"""
+        f0 = cfdm.example_field(0)
+
+        f = cfdm.read(cdl, cdl_string=True)
+        self.assertEqual(len(f), 1)
+        f = f[0]
+        self.assertTrue(f.domain_axis("longitude").nc_is_unlimited())
+        self.assertEqual(f.dtype, np.dtype("float32"))
+        self.assertEqual(f.get_property("flag_values").tolist(), [1, 2])
+        self.assertEqual(f.get_property("flag_values").dtype, np.dtype("i2"))
+        self.assertEqual(f.get_property("comment"), 'a"b')
+        self.assertEqual(f.get_property("history"), "line 1\nline 2")
+        self.assertEqual(f.data.mask.sum(), 1)
+        self.assertTrue(f.data.mask.array[-1, -1])
+        self.assertTrue(
+            np.allclose(f.array[:-1, :-1], f0.array[:-1, :-1], atol=1e-7)
+        )
+        for identity in ("latitude", "longitude", "time"):
+            self.assertTrue(
+                f.dimension_coordinate(identity).equals(
+                    f0.dimension_coordinate(identity)
+                )
+            )
+
+        # Groups
+        grouped_cdl = """netcdf grouped {
+dimensions:
+\tx = 2 ;
+variables:
+\tdouble x(x) ;
+\t\tx:standard_name = "projection_x_coordinate" ;
+\t\tx:units = "m" ;
+
+// global attributes:
+\t\t:Conventions = "CF-1.12" ;
+data:
+
+ x = 1, 2 ;
+
+group: forecast {
+  variables:
+  \tdouble q(x) ;
+  \t\tq:standard_name = "specific_humidity" ;
+  data:
+
+   q = 0.5, NaN ;
+  } // group forecast
+}
+"""
+        f = cfdm.read(grouped_cdl, cdl_string=True)
+        self.assertEqual(len(f), 1)
+        f = f[0]
+        self.assertEqual(f.nc_variable_groups(), ("forecast",))
+        self.assertTrue(np.isnan(f.array[1]))
+        self.assertEqual(
+            f.coordinate("projection_x_coordinate").array.tolist(), [1, 2]
+        )
+
+        # Invalid CDL
+        for bad in (
+            "netcdf test_file {\n  add badness\n}",
+            "netcdf test_file {\ndimensions:\n  x = 2 ;\n}\n}",
+            "netcdf test_file {\nvariables:\n  double x(y) ;\n}",
+            'netcdf test_file {\nvariables:\n  x:units = "m" ;\n}',
+        ):
+            with self.assertRaises(RuntimeError):
+                cfdm.read(bad, cdl_string=True)
+
+    def test_read_sniff_netcdf_backend(self):
+        """Test the selection of netCDF backends by magic number."""
+        from cfdm.read_write.netcdf.netcdfread import NetCDFRead
+
+        f = self.f0
+        r = NetCDFRead(cfdm.implementation())
+        backends = ("h5netcdf-pyfive", "h5netcdf-h5py", "netCDF4")
+        for fmt, sniffed in (
+            ("NETCDF3_CLASSIC", ("netCDF4",)),
+            ("NETCDF3_64BIT_DATA", ("netCDF4",)),
+            ("NETCDF4", backends),
+            ("NETCDF4_CLASSIC", backends),
+        ):
+            cfdm.write(f, tmpfile, fmt=fmt)
+
+            # The magic number isn't known until the dataset type has
+            # been found
+            self.assertEqual(
+                r._sniff_netcdf_backend(tmpfile, backends[:2]), backends[:2]
+            )
+            self.assertEqual(NetCDFRead.dataset_type(tmpfile, None), "netCDF")
+            self.assertEqual(
+                r._sniff_netcdf_backend(tmpfile, backends), sniffed
+            )
+
+            g = cfdm.read(tmpfile)
+            self.assertEqual(len(g), 1)
+            self.assertTrue(g[0].equals(f))
+
+        # No backend can open the file's format, so none are removed
+        cfdm.write(f, tmpfile, fmt="NETCDF3_CLASSIC")
+        NetCDFRead.dataset_type(tmpfile, None)
+        self.assertEqual(
+            r._sniff_netcdf_backend(tmpfile, backends[:2]), backends[:2]
+        )
+        with self.assertRaises(DatasetTypeError):
+            cfdm.read(tmpfile, netcdf_backend="h5netcdf-pyfive")
+
+        # Relative and absolute paths have the same key
+        self.assertEqual(
+            NetCDFRead._magic_number_key(os.path.relpath(tmpfile)),
+            NetCDFRead._magic_number_key(tmpfile),
+        )
+
     def test_read_write_string(self):
         """Test the `string` keyword argument to `read` and `write`."""
         fN = cfdm.read(self.string_filename, netcdf_backend="netCDF4")
@@ -1395,6 +1585,332 @@ class read_writeTest(unittest.TestCase):
         f = cfdm.read("ugrid_[12].nc")
         self.assertEqual(len(f), 6)
 
+    def test_read_parallel(self):
+        """Test the cfdm.read 'parallel' keyword."""
+        datasets = [
+            "example_field_0.nc",
+            "ugrid_[12].nc",
+            "geometry_1.nc",
+            "string_char.nc",
+        ]
+        f = cfdm.read(datasets)
+        n = len(f)
+        self.assertGreater(n, 6)
+
+        for parallel in (
+            "thread",
+            "process",
+            2,
+            {"executor": "thread", "max_workers": 3},
+        ):
+            for netcdf_backend in (None, "netCDF4"):
+                g = cfdm.read(
+                    datasets,
+                    parallel=parallel,
+                    netcdf_backend=netcdf_backend,
+                )
+                self.assertEqual(len(g), n)
+                for a, b in zip(f, g):
+                    self.assertTrue(b.equals(a))
+
+        # Domains
+        d = cfdm.read(datasets, domain=True)
+        e = cfdm.read(datasets, domain=True, parallel="thread")
+        self.assertEqual(len(e), len(d))
+        for a, b in zip(d, e):
+            self.assertTrue(b.equals(a))
+
+        # Errors are raised as for a sequential read
+        with self.assertRaises(DatasetTypeError):
+            cfdm.read(
+                ["example_field_0.nc", "create_test_files.py"],
+                parallel="thread",
+            )
+
+        with self.assertRaises(FileNotFoundError):
+            cfdm.read("file_does_not_exist.nc", parallel="thread")
+
+        for parallel in ("bad", True, 0, {"executor": "thread", "bad": 1}):
+            with self.assertRaises(ValueError):
+                cfdm.read(datasets, parallel=parallel)
+
+    def test_read_netcdf_lock(self):
+        """Test that parsing with netCDF-C shares the netCDF-C lock."""
+        import threading
+
+        from cfdm.data.locks import netcdf_lock
+
+        f = cfdm.read(self.filename, netcdf_backend="netCDF4")
+        n = len(f)
+        f = f[0]
+        array = f.array
+        g = []
+
+        def parse():
+            """Parse a dataset with the netCDF-C library."""
+            g.extend(
+                cfdm.read(self.filename, netcdf_backend="netCDF4", cache=False)
+            )
+
+        # Parsing (which here reads no data) waits whilst another
+        # thread (e.g. one computing data with dask) is calling
+        # netCDF-C
+        thread = threading.Thread(target=parse)
+        with netcdf_lock:
+            thread.start()
+            thread.join(3)
+            self.assertTrue(thread.is_alive())
+            self.assertFalse(g)
+
+        thread.join(60)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(len(g), n)
+
+        # Data can be computed from a dask graph whilst another thread
+        # is parsing a dataset
+        g.clear()
+        thread = threading.Thread(target=parse)
+        thread.start()
+        for _ in range(20):
+            self.assertTrue((f.array == array).all())
+
+        thread.join(60)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(len(g), n)
+        self.assertFalse(netcdf_lock.locked())
+
+    def test_iread(self):
+        """Test cfdm.iread."""
+        datasets = ["example_field_0.nc", "ugrid_[12].nc", "geometry_1.nc"]
+
+        g = cfdm.iread(datasets)
+        self.assertIsInstance(g, types.GeneratorType)
+
+        # Same constructs as cfdm.read, sorted within each dataset
+        f = cfdm.read(datasets)
+        g = list(g)
+        self.assertEqual(len(g), len(f))
+        for a in g:
+            self.assertTrue(any(a.equals(b) for b in f))
+
+        for dataset in ("ugrid_1.nc", "ugrid_2.nc"):
+            f = cfdm.read(dataset)
+            g = list(cfdm.iread(dataset))
+            self.assertEqual(len(g), len(f))
+            for a, b in zip(f, g):
+                self.assertTrue(b.equals(a))
+
+        # Dataset order is preserved
+        g = cfdm.iread(["geometry_1.nc", "example_field_0.nc"])
+        self.assertTrue(next(g).equals(cfdm.read("geometry_1.nc")[0]))
+
+        # Keywords
+        d = list(cfdm.iread(datasets, domain=True, parallel="thread"))
+        self.assertEqual(len(d), len(cfdm.read(datasets, domain=True)))
+        for x in d:
+            self.assertIsInstance(x, cfdm.Domain)
+
+        # Only a bounded number of datasets are read ahead
+        read_module = importlib.import_module("cfdm.read_write.read")
+        read_dataset = read_module._read_dataset
+        n_read = []
+
+        def counting_read_dataset(*args):
+            """Count the datasets read by the workers."""
+            n_read.append(1)
+            return read_dataset(*args)
+
+        with mock.patch.object(
+            read_module, "_read_dataset", counting_read_dataset
+        ):
+            g = cfdm.iread(
+                ["example_field_0.nc"] * 6,
+                parallel={"executor": "thread", "max_workers": 1},
+            )
+            self.assertIsInstance(next(g), cfdm.Field)
+            self.assertLessEqual(len(n_read), 2)
+            self.assertEqual(len(list(g)), 5)
+            self.assertEqual(len(n_read), 6)
+
+        # Invalid keywords are detected before iteration starts
+        with self.assertRaises(ValueError):
+            cfdm.iread(datasets, dataset_type="bad")
+
+        # Dataset errors are raised during iteration
+        g = cfdm.iread(["example_field_0.nc", "file_does_not_exist.nc"])
+        self.assertIsInstance(next(g), cfdm.Field)
+        with self.assertRaises(FileNotFoundError):
+            list(g)
+
+    def test_read_unpack_dtype(self):
+        """Test the 'unpack_dtype' keyword of cfdm.read."""
+        # Create a dataset with packed data
+        with netCDF4.Dataset(tmpfile, "w") as nc:
+            nc.createDimension("x", 4)
+            x = nc.createVariable("x", "i2", ("x",))
+            x.set_auto_maskandscale(False)
+            x.standard_name = "air_temperature"
+            x.units = "K"
+            x.scale_factor = 0.5
+            x.add_offset = 273.15
+            x[...] = np.arange(4, dtype="i2")
+
+        f = cfdm.read(tmpfile)[0]
+        self.assertEqual(f.dtype, np.dtype("float64"))
+
+        for backend in ("netCDF4", "h5netcdf-h5py", "h5netcdf-pyfive"):
+            g = cfdm.read(
+                tmpfile, unpack_dtype="float32", netcdf_backend=backend
+            )[0]
+            self.assertEqual(g.dtype, np.dtype("float32"))
+            self.assertEqual(g.array.dtype, np.dtype("float32"))
+            self.assertTrue(np.allclose(g.array, f.array))
+
+        # Ignored when the data are not unpacked
+        g = cfdm.read(tmpfile, unpack=False, unpack_dtype="float32")[0]
+        self.assertEqual(g.array.dtype, np.dtype("i2"))
+
+        with self.assertRaises(ValueError):
+            cfdm.read(tmpfile, unpack_dtype="int32")
+
+    def test_read_select(self):
+        """Test the 'select' keyword of cfdm.read."""
+        for dataset in ("ugrid_1.nc", "DSG_timeSeries_contiguous.nc"):
+            f = cfdm.read(dataset)
+            for x in f:
+                ncvar = x.nc_get_variable()
+                for select in (ncvar, f"ncvar%{ncvar}", [ncvar, "bad"]):
+                    g = cfdm.read(dataset, select=select)
+                    self.assertEqual(len(g), 1)
+                    self.assertTrue(g[0].equals(x))
+
+        f = cfdm.read(self.filename)
+        g = cfdm.read(self.filename, select=f[0].identity())
+        self.assertEqual(len(g), 1)
+        self.assertTrue(g[0].equals(f[0]))
+
+        g = cfdm.read("ugrid_1.nc", select=re.compile("^ncvar%(pa|ta)$"))
+        self.assertEqual(len(g), 2)
+
+        self.assertEqual(len(cfdm.read(self.filename, select=None)), len(f))
+        self.assertEqual(len(cfdm.read(self.filename, select="bad")), 0)
+
+        # Variables referenced by other variables are not selected
+        for select in ("x", "ncvar%x", "ncvar%bounds", "ncvar%areacella"):
+            self.assertEqual(len(cfdm.read(self.filename, select=select)), 0)
+
+        # Extra constructs are created from the selected variables
+        f = cfdm.read(self.filename, extra="cell_measure")
+        g = cfdm.read(
+            self.filename, extra="cell_measure", select="ncvar%eastward_wind"
+        )
+        self.assertEqual(len(g), len(f))
+        for x in g:
+            self.assertTrue(any(x.equals(y) for y in f))
+
+        # Domains
+        f = cfdm.read("ugrid_1.nc", domain=True)
+        g = cfdm.read("ugrid_1.nc", domain=True, select="ncvar%Mesh2")
+        self.assertEqual(len(g), len(f))
+
+    def test_read_cache(self):
+        """Test the 'cache' keyword of cfdm.read."""
+        f = cfdm.read(self.filename)[0]
+        g = cfdm.read(self.filename, cache="deferred")[0]
+        for key, c in f.constructs.filter_by_data().items():
+            cache0 = c.data.get_cached_elements()
+            d = g.constructs[key].data
+            # Not yet read
+            self.assertTrue(
+                callable(d._get_component("cached_elements", None))
+            )
+
+            for e in (d.copy(), d):
+                cache1 = e.get_cached_elements()
+                self.assertEqual(cache1.keys(), cache0.keys())
+                for i, x in cache0.items():
+                    self.assertTrue(np.ma.allequal(cache1[i], x))
+
+        g = cfdm.read(self.filename, cache=False)[0]
+        for c in g.dimension_coordinates().values():
+            self.assertFalse(c.data.get_cached_elements())
+
+        for cache in ("bad", "after-parse"):
+            with self.assertRaises(ValueError):
+                cfdm.read(self.filename, cache=cache)
+
+    def test_read_metadata_cache(self):
+        """Test the on-disk metadata cache of cfdm.read."""
+        from cfdm.read_write.netcdf.metadatacache import metadata_cache
+
+        directory = metadata_cache.directory
+        metadata_cache.directory = tmpdir1
+        try:
+            metadata_cache.clear()
+            cfdm.metadata_cache_statistics(reset=True)
+
+            f = cfdm.read(self.filename)
+
+            # Disabled by default
+            self.assertEqual(cfdm.metadata_cache_statistics()["files"], 0)
+
+            with cfdm.metadata_cache("1GiB"):
+                g = cfdm.read(self.filename)
+                stats = cfdm.metadata_cache_statistics()
+                self.assertEqual(stats["misses"], 1)
+                self.assertEqual(stats["files"], 1)
+
+                g = cfdm.read(self.filename)
+                self.assertEqual(cfdm.metadata_cache_statistics()["hits"], 1)
+                self.assertEqual(len(g), len(f))
+                for a, b in zip(f, g):
+                    self.assertTrue(b.equals(a))
+
+                # Different read parameters
+                g = cfdm.read(self.filename, extra="cell_measure")
+                self.assertEqual(len(g), 2)
+                self.assertEqual(cfdm.metadata_cache_statistics()["files"], 2)
+
+                # A modified file is not read from the cache
+                cfdm.write(self.f0, tmpfile)
+                g = cfdm.read(tmpfile)
+                cfdm.write(self.f1, tmpfile, mode="w")
+                g = cfdm.read(tmpfile)
+                self.assertTrue(g[0].equals(self.f1))
+                stats = cfdm.metadata_cache_statistics()
+                self.assertEqual(stats["hits"], 1)
+                self.assertEqual(stats["files"], 4)
+
+                # Warnings are never cached
+                cfdm.read(self.filename, warnings=True)
+                self.assertEqual(cfdm.metadata_cache_statistics()["hits"], 1)
+
+                # A different default chunk size is not read from the
+                # cache
+                with cfdm.chunksize(1024):
+                    g = cfdm.read(self.filename)
+                    self.assertEqual(
+                        g[0].data.chunks, f[0].data.rechunk(1024).chunks
+                    )
+
+                self.assertEqual(cfdm.metadata_cache_statistics()["hits"], 1)
+
+            # Eviction
+            size = cfdm.metadata_cache_statistics()["size"]
+            with cfdm.metadata_cache(size - 1):
+                cfdm.read(self.filename, extra="field_ancillary")
+                stats = cfdm.metadata_cache_statistics()
+                self.assertGreater(stats["evictions"], 0)
+                self.assertLessEqual(stats["size"], size - 1)
+
+            metadata_cache.clear()
+            self.assertEqual(cfdm.metadata_cache_statistics()["files"], 0)
+        finally:
+            metadata_cache.directory = directory
+
+        with self.assertRaises(ValueError):
+            cfdm.metadata_cache(-1)
+
     def test_write_chunk_cache(self):
         """Test the cfdm.write 'chunk_cache' keyword."""
         f = self.f0
@@ -1585,6 +2101,152 @@ class read_writeTest(unittest.TestCase):
         f = cfdm.read("ugrid_[12].nc", filesystem=local_fs)
         self.assertEqual(len(f), 6)
 
+    def test_read_remote_cache(self):
+        """Test the remote block cache of cfdm.read."""
+        from cfdm.data.remotefile import RemoteFile, block_cache, coalesce
+
+        self.assertEqual(
+            coalesce([(10, 20), (0, 5), (5, 8), (18, 30)]), [(0, 8), (10, 30)]
+        )
+        self.assertEqual(
+            coalesce([(10, 20), (0, 5), (5, 8), (18, 30)], gap=2), [(0, 30)]
+        )
+
+        fs = RangeRequestFileSystem()
+        with open(self.filename, "rb") as fh:
+            raw = fh.read()
+
+        path = "/remote/test_file.nc"
+        fs.pipe(path, raw)
+
+        expected = cfdm.read(self.filename)
+        for netcdf_backend in ("h5netcdf-h5py", "h5netcdf-pyfive"):
+            # Disabled by default
+            block_cache.discard()
+            cfdm.remote_cache_statistics(reset=True)
+            RangeRequestFileSystem.requests = 0
+            f = cfdm.read(path, filesystem=fs, netcdf_backend=netcdf_backend)
+            self.assertTrue(f[0].equals(expected[0]))
+            self.assertGreater(RangeRequestFileSystem.requests, 0)
+            self.assertEqual(cfdm.remote_cache_statistics()["requests"], 0)
+
+            with cfdm.remote_cache("64MiB"):
+                RangeRequestFileSystem.requests = 0
+                f = cfdm.read(
+                    path, filesystem=fs, netcdf_backend=netcdf_backend
+                )
+                self.assertTrue(f[0].equals(expected[0]))
+
+                # The whole file fits in one block
+                stats = cfdm.remote_cache_statistics()
+                self.assertEqual(stats["requests"], 1)
+                self.assertEqual(stats["bytes_read"], len(raw))
+                self.assertEqual(stats["blocks"], 1)
+                self.assertEqual(RangeRequestFileSystem.requests, 1)
+
+                # A second read is satisfied by the cache
+                f = cfdm.read(
+                    path, filesystem=fs, netcdf_backend=netcdf_backend
+                )
+                self.assertTrue(f[0].equals(expected[0]))
+                self.assertEqual(RangeRequestFileSystem.requests, 1)
+                self.assertGreater(cfdm.remote_cache_statistics()["hits"], 0)
+
+            # Reducing the size evicts the blocks
+            self.assertEqual(cfdm.remote_cache_statistics()["blocks"], 0)
+
+        # Coalesced, concurrent byte range requests
+        with cfdm.remote_cache("1MiB"):
+            cfdm.remote_cache_statistics(reset=True)
+            RangeRequestFileSystem.requests = 0
+            fh = RemoteFile(fs, path, blocksize=1024, readahead=0)
+            ranges = [(100, 200), (1500, 2500), (2600, 2700), (9000, 9001)]
+            self.assertEqual(
+                fh.cat_ranges(
+                    path, [r[0] for r in ranges], [r[1] for r in ranges]
+                ),
+                [raw[start:stop] for start, stop in ranges],
+            )
+
+            # Blocks 0-2 in one request and block 8 in another
+            stats = cfdm.remote_cache_statistics()
+            self.assertEqual(stats["requests"], 2)
+            self.assertEqual(stats["blocks"], 4)
+            self.assertEqual(RangeRequestFileSystem.requests, 2)
+
+            # File-like access
+            fh.seek(-10, 2)
+            self.assertEqual(fh.read(), raw[-10:])
+            fh.seek(1000)
+            self.assertEqual(fh.read(100), raw[1000:1100])
+            self.assertEqual(fh.tell(), 1100)
+            self.assertEqual(RangeRequestFileSystem.requests, 3)
+
+            # A different path
+            with self.assertRaises(ValueError):
+                fh.cat_ranges("/remote/other.nc", [0], [10])
+
+        with self.assertRaises(ValueError):
+            cfdm.remote_cache(-1)
+
+    def test_read_remote_disk_cache(self):
+        """Test the remote disk cache of cfdm.read."""
+        from cfdm.data.remotefile import RemoteFile, block_cache, disk_cache
+
+        fs = RangeRequestFileSystem()
+        with open(self.filename, "rb") as fh:
+            raw = fh.read()
+
+        path = "/remote/test_file_disk_cache.nc"
+        fs.pipe(path, raw)
+
+        expected = cfdm.read(self.filename)
+        directory = os.path.join(tmpdir1, "remote_cache")
+        with cfdm.configuration(
+            remote_disk_cache="1GiB", remote_disk_cache_directory=directory
+        ):
+            disk_cache.clear()
+            cfdm.remote_disk_cache_statistics(reset=True)
+            RangeRequestFileSystem.requests = 0
+
+            f = cfdm.read(path, filesystem=fs)
+            self.assertTrue(f[0].equals(expected[0]))
+            self.assertEqual(RangeRequestFileSystem.requests, 1)
+            stats = cfdm.remote_disk_cache_statistics()
+            self.assertEqual(stats["files"], 1)
+            self.assertEqual(stats["size"], len(raw))
+            self.assertEqual(stats["directory"], directory)
+
+            # The in-memory cache is disabled, so a second read (e.g.
+            # by another process) is satisfied by the disk cache
+            self.assertEqual(len(block_cache), 0)
+            f = cfdm.read(path, filesystem=fs)
+            self.assertTrue(f[0].equals(expected[0]))
+            self.assertEqual(RangeRequestFileSystem.requests, 1)
+            self.assertGreater(cfdm.remote_disk_cache_statistics()["hits"], 0)
+
+            # A modified remote dataset is not read from the cache
+            fs.pipe(path, raw[:-1] + b"\0")
+            fh = RemoteFile(fs, path)
+            self.assertEqual(fh.read(), raw[:-1] + b"\0")
+            self.assertEqual(RangeRequestFileSystem.requests, 2)
+            self.assertEqual(cfdm.remote_disk_cache_statistics()["files"], 2)
+
+            # Eviction
+            cfdm.remote_disk_cache(len(raw))
+            stats = cfdm.remote_disk_cache_statistics()
+            self.assertEqual(stats["files"], 1)
+            self.assertGreater(stats["evictions"], 0)
+
+            disk_cache.clear()
+            self.assertEqual(cfdm.remote_disk_cache_statistics()["files"], 0)
+
+        # Disabled by default
+        RangeRequestFileSystem.requests = 0
+        f = cfdm.read(path, filesystem=fs)
+        self.assertGreater(RangeRequestFileSystem.requests, 0)
+        self.assertFalse(os.listdir(directory))
+
     def test_read_file_handle(self):
         """Test cfdm.read with an open file handle."""
         local_fs = fsspec.filesystem("local")
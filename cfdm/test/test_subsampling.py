@@ -5,6 +5,8 @@ import os
 import tempfile
 import unittest
 
+import numpy as np
+
 faulthandler.enable()  # to debug seg faults and timeouts
 
 import cfdm
@@ -241,6 +243,178 @@ class SubsamplingTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             a_2d.array
 
+    def test_quadratic_geographic_vectors(self):
+        """Test the vector operations of geographic interpolation."""
+        q = cfdm.data.subarray.mixin.QuadraticGeographicInterpolation()
+
+        rng = np.random.default_rng(0)
+        lat = rng.uniform(-90, 90, (4, 5))
+        lon = rng.uniform(-180, 180, (4, 5))
+
+        va = q._fll2v(lat, lon)
+        vb = q._fll2v(lat[::-1], lon[::-1])
+        self.assertEqual(va.shape, (3, 4, 5))
+
+        # Compare with component-wise calculations
+        rlat, rlon = np.deg2rad(lat), np.deg2rad(lon)
+        self.assertTrue((va[0] == np.cos(rlat) * np.cos(rlon)).all())
+        self.assertTrue((va[1] == np.cos(rlat) * np.sin(rlon)).all())
+        self.assertTrue((va[2] == np.sin(rlat)).all())
+
+        dot = va[0] * vb[0] + va[1] * vb[1] + va[2] * vb[2]
+        self.assertTrue((q._fdot(va, vb) == dot).all())
+        cross = np.cross(va, vb, axis=0)
+        self.assertTrue((q._fcross(va, vb) == cross).all())
+        self.assertTrue((q._fplus(va, vb, va) == va + vb + va).all())
+        self.assertTrue((q._fmultiply(lat, va) == va * lat).all())
+
+        self.assertTrue(np.allclose(q._fv2lat(va), lat))
+        self.assertTrue(np.allclose(q._fv2lon(va), lon))
+
+        # Masked values
+        lat = np.ma.masked_where(lat > 0, lat)
+        va = q._fll2v(lat, lon)
+        self.assertTrue(np.ma.isMA(va))
+        self.assertTrue((np.ma.getmaskarray(va) == lat.mask).all())
+        self.assertTrue((np.ma.getmaskarray(q._fv2lat(va)) == lat.mask).all())
+
+    def test_quadratic_latitude_longitude_interpolation(self):
+        """Test quadratic latitude longitude interpolation."""
+        lat = cfdm.Data([[10.0, 11.0, 12.5], [20.0, 20.5, 21.5]])
+        lon = cfdm.Data([[30.0, 31.5, 32.0], [40.0, 42.0, 43.0]])
+        tie_point_index = cfdm.TiePointIndex(data=[0, 4, 8])
+
+        for flag in (0, 1):
+            flags = cfdm.InterpolationParameter(
+                data=np.full((2, 2), flag, dtype="int8"),
+                properties={
+                    "flag_meanings": "location_use_3d_cartesian",
+                    "flag_masks": np.array([1], dtype="int8"),
+                },
+            )
+
+            u = {}
+            for name, x, y, identity in (
+                ("latitude", lat, lon, "longitude"),
+                ("longitude", lon, lat, "latitude"),
+            ):
+                a = cfdm.SubsampledArray(
+                    interpolation_name="quadratic_latitude_longitude",
+                    compressed_array=x,
+                    shape=(2, 9),
+                    tie_point_indices={1: tie_point_index},
+                    parameters={"interpolation_subarea_flags": flags},
+                    parameter_dimensions={
+                        "interpolation_subarea_flags": (0, 1)
+                    },
+                    dependent_tie_points={identity: y},
+                    dependent_tie_point_dimensions={identity: (0, 1)},
+                )
+                u[name] = a[...]
+
+            # The tie points are reproduced
+            self.assertTrue(np.allclose(u["latitude"][:, ::4], lat.array))
+            self.assertTrue(np.allclose(u["longitude"][:, ::4], lon.array))
+
+            # Interpolated points lie close to the great circle
+            # through each pair of tie points
+            rlat = np.deg2rad(u["latitude"])
+            rlon = np.deg2rad(u["longitude"])
+            v = np.stack(
+                (
+                    np.cos(rlat) * np.cos(rlon),
+                    np.cos(rlat) * np.sin(rlon),
+                    np.sin(rlat),
+                )
+            )
+            for i in (0, 4):
+                normal = np.cross(v[:, :, i], v[:, :, i + 4], axis=0)
+                normal /= np.linalg.norm(normal, axis=0)
+                distance = np.einsum("ij,ijk->jk", normal, v[:, :, i : i + 5])
+                self.assertTrue(np.allclose(distance, 0, atol=1e-6))
+
+    def test_subsampled_array_batches(self):
+        """Test interpolation in batches of interpolation subareas."""
+        # Exclude the field with non-standardised interpolation, which
+        # can't be uncompressed
+        f = cfdm.read(self.biquadratic)
+        f.extend(cfdm.read(self.linear)[:15])
+
+        subsampled = [
+            c
+            for q in f
+            for c in q.auxiliary_coordinates().values()
+            if c.data.get_compression_type() == "subsampled"
+        ]
+        self.assertTrue(subsampled)
+        arrays = [c.array for c in subsampled]
+
+        max_batch_size = cfdm.SubsampledArray._max_batch_size
+        try:
+            # Interpolate each interpolation subarea separately
+            cfdm.SubsampledArray._max_batch_size = 1
+            for c, a in zip(subsampled, arrays):
+                self.assertTrue((c.array == a).all())
+        finally:
+            cfdm.SubsampledArray._max_batch_size = max_batch_size
+
+    def test_subsampled_array_dask_chunks(self):
+        """Test the dask chunks of subsampled arrays."""
+        rng = np.random.default_rng(0)
+        quadratic = cfdm.SubsampledArray(
+            interpolation_name="quadratic",
+            compressed_array=cfdm.Data(rng.uniform(0, 10, (6, 3))),
+            shape=(6, 9),
+            tie_point_indices={1: cfdm.TiePointIndex(data=[0, 4, 8])},
+            parameters={
+                "w": cfdm.InterpolationParameter(data=np.ones((6, 2)))
+            },
+            parameter_dimensions={"w": (0, 1)},
+        )
+
+        f = cfdm.read(self.linear)[:15]
+        c = f[13].auxiliary_coordinate("ncvar%a_2d")
+        self.assertEqual(c.data.get_compression_type(), "subsampled")
+
+        for a in (quadratic, c.data.source(), c.bounds.data.source()):
+            array = a[...]
+            for chunks in ("auto", -1, 1, 2, {0: 4}, {1: 3}):
+                dx = a.to_dask_array(chunks)
+                self.assertTrue((dx.compute() == array).all())
+
+        # Non-interpolated dimensions have the requested chunks, and
+        # interpolated dimension chunk boundaries coincide with
+        # interpolation subarea boundaries
+        self.assertEqual(
+            quadratic.to_dask_array({0: 4, 1: 3}).chunks, ((4, 2), (5, 4))
+        )
+        self.assertEqual(quadratic.to_dask_array(1).chunks[1], (5, 4))
+
+        a = c.bounds.data.source()
+        self.assertEqual(a.to_dask_array(1).chunks, ((9, 9), (5, 3, 4), (4,)))
+        self.assertEqual(a.to_dask_array({1: 6}).chunks[1], (8, 4))
+        self.assertEqual(a.to_dask_array(-1).chunks, ((18,), (12,), (4,)))
+
+        # Reading with different dask chunks gives the same values,
+        # with dictionary chunks referring to uncompressed dimensions
+        for dask_chunks in (3, {"ncdim%lat": 2, "ncdim%lon": 4}):
+            g = cfdm.read(self.linear, dask_chunks=dask_chunks)[:15]
+            for q0, q1 in zip(f, g):
+                self.assertTrue(q0.equals(q1))
+
+            c = g[13].auxiliary_coordinate("ncvar%a_2d")
+            self.assertEqual(c.data.chunks, ((9, 9), (5, 3, 4)))
+
+        # Coordinates with dependent tie points (latitude and
+        # longitude, which are interpolated together) also have the
+        # chunks of their subsampled array
+        i = cfdm.read(self.biquadratic, dask_chunks=1)[-3]
+        for c in (i.construct("latitude"), i.construct("longitude")):
+            a = c.data.source()
+            self.assertTrue(a.get_dependent_tie_points())
+            self.assertEqual(c.data.chunks, a.to_dask_array(1).chunks)
+            self.assertEqual(c.data.chunks, ((16, 16, 16), (16, 16)))
+
 
 if __name__ == "__main__":
     print("Run date:", datetime.datetime.now())
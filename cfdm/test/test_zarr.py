@@ -358,6 +358,25 @@ class read_writeTest(unittest.TestCase):
 
         self.assertTrue(np.allclose(f.get_property("np_ndarray"), y))
 
+    def test_zarr_chunk_cache(self):
+        """Test that Zarr directory stores are not chunk cached."""
+        f = self.f0.copy()
+        cfdm.write(f, tmpdir1, fmt="ZARR3")
+        z = cfdm.read(tmpdir1)[0]
+
+        with cfdm.chunk_cache("1GiB"):
+            cfdm.chunk_cache_statistics(reset=True)
+            self.assertTrue((z.array == f.array).all())
+
+            # Overwrite the chunks in place
+            f.data[...] = -1
+            cfdm.write(f, tmpdir1, fmt="ZARR3")
+            self.assertTrue((z.array == -1).all())
+
+            stats = cfdm.chunk_cache_statistics()
+            self.assertEqual(stats["hits"], 0)
+            self.assertEqual(stats["chunks"], 0)
+
 
 if __name__ == "__main__":
     print("Run date:", datetime.datetime.now())